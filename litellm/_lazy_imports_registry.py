@@ -66,7 +66,10 @@ UTILS_NAMES = (
 )
 
 # Token counter names that support lazy loading via _lazy_import_token_counter
-TOKEN_COUNTER_NAMES = ("get_modified_max_tokens",)
+TOKEN_COUNTER_NAMES = (
+    "get_modified_max_tokens",
+    "batch_token_counter",
+)
 
 # LLM client cache names that support lazy loading via _lazy_import_llm_client_cache
 LLM_CLIENT_CACHE_NAMES = (
@@ -486,6 +489,10 @@ _TOKEN_COUNTER_IMPORT_MAP = {
         "litellm.litellm_core_utils.token_counter",
         "get_modified_max_tokens",
     ),
+    "batch_token_counter": (
+        "litellm.litellm_core_utils.token_counter",
+        "batch_token_counter",
+    ),
 }
 
 _BEDROCK_TYPES_IMPORT_MAP = {
@@ -20,11 +20,15 @@ if TYPE_CHECKING:
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
-from litellm.constants import DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE
+from litellm.constants import (
+    DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+    SHARED_MEMORY_CACHE_INVALIDATION_GRACE_SECONDS,
+)
 
 from .base_cache import BaseCache
 from .in_memory_cache import InMemoryCache
 from .redis_cache import RedisCache
+from .shared_memory_cache import SharedMemoryCache
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -53,6 +57,11 @@ class DualCache(BaseCache):
     DualCache is a cache implementation that updates both Redis and an in-memory cache simultaneously.
     When data is updated or inserted, it is written to both the in-memory cache + Redis.
     This ensures that even if Redis hasn't been updated yet, the in-memory cache reflects the most recent data.
+
+    If a `shared_memory_cache` is set, it is checked between the in-memory cache and Redis.
+    It is shared by all worker processes on the host. Its entries expire with the
+    in-memory TTL, and are dropped earlier when the key changes in Redis (requires Redis
+    keyspace notifications, e.g. `notify-keyspace-events KA`).
     """
 
     def __init__(
@@ -63,12 +72,20 @@ class DualCache(BaseCache):
         default_redis_ttl: Optional[float] = None,
         default_redis_batch_cache_expiry: Optional[float] = None,
         default_max_redis_batch_cache_size: int = DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+        shared_memory_cache: Optional[SharedMemoryCache] = None,
     ) -> None:
         super().__init__()
         # If in_memory_cache is not provided, use the default InMemoryCache
         self.in_memory_cache = in_memory_cache or InMemoryCache()
         # If redis_cache is not provided, use the default RedisCache
         self.redis_cache = redis_cache
+        # Optional cross-process tier, shared by workers on the same host
+        self.shared_memory_cache = shared_memory_cache
+        self.redis_invalidation_task: Optional[asyncio.Task] = None
+        # key -> time this process last wrote it to redis, so our own writes don't invalidate us
+        self.last_redis_write_time = LimitedSizeOrderedDict(
+            max_size=default_max_redis_batch_cache_size
+        )
         self.last_redis_batch_access_time = LimitedSizeOrderedDict(
             max_size=default_max_redis_batch_cache_size
         )
@@ -92,6 +109,20 @@ class DualCache(BaseCache):
         if default_redis_ttl is not None:
             self.default_redis_ttl = default_redis_ttl
 
+    def _get_shared_memory_cache_kwargs(self, kwargs: dict) -> dict:
+        """
+        Shared memory entries never outlive the in-memory TTL.
+
+        Without Redis keyspace notifications nothing invalidates them, so they must
+        be as short-lived as the per-process copies.
+        """
+        if self.default_in_memory_ttl is None:
+            return kwargs
+        ttl = kwargs.get("ttl")
+        if ttl is not None and float(ttl) <= self.default_in_memory_ttl:
+            return kwargs
+        return {**kwargs, "ttl": self.default_in_memory_ttl}
+
     def set_cache(self, key, value, local_only: bool = False, **kwargs):
         # Update both Redis and in-memory cache
         try:
@@ -101,6 +132,12 @@ class DualCache(BaseCache):
 
                 self.in_memory_cache.set_cache(key, value, **kwargs)
 
+            if self.shared_memory_cache is not None and local_only is False:
+                self._record_redis_write(key)
+                self.shared_memory_cache.set_cache(
+                    key, value, **self._get_shared_memory_cache_kwargs(kwargs)
+                )
+
             if self.redis_cache is not None and local_only is False:
                 self.redis_cache.set_cache(key, value, **kwargs)
         except Exception as e:
@@ -121,6 +158,10 @@ class DualCache(BaseCache):
             if self.in_memory_cache is not None:
                 result = self.in_memory_cache.increment_cache(key, value, **kwargs)
 
+            if self.shared_memory_cache is not None and local_only is False:
+                self._record_redis_write(key)
+                self.shared_memory_cache.delete_cache(key)
+
             if self.redis_cache is not None and local_only is False:
                 result = self.redis_cache.increment_cache(key, value, **kwargs)
 
@@ -145,6 +186,15 @@ class DualCache(BaseCache):
                 if in_memory_result is not None:
                     result = in_memory_result
 
+            if (
+                result is None
+                and self.shared_memory_cache is not None
+                and local_only is False
+            ):
+                result = self.shared_memory_cache.get_cache(key)
+                if result is not None:
+                    self.in_memory_cache.set_cache(key, result, **kwargs)
+
             if result is None and self.redis_cache is not None and local_only is False:
                 # If not found in in-memory cache, try fetching from Redis
                 redis_result = self.redis_cache.get_cache(
@@ -154,6 +204,12 @@ class DualCache(BaseCache):
                 if redis_result is not None:
                     # Update in-memory cache with the value from Redis
                     self.in_memory_cache.set_cache(key, redis_result, **kwargs)
+                    if self.shared_memory_cache is not None:
+                        self.shared_memory_cache.set_cache(
+                            key,
+                            redis_result,
+                            **self._get_shared_memory_cache_kwargs(kwargs),
+                        )
 
                 result = redis_result
 
@@ -219,6 +275,16 @@ class DualCache(BaseCache):
                 if in_memory_result is not None:
                     result = in_memory_result
 
+            if (
+                result is None
+                and self.shared_memory_cache is not None
+                and local_only is False
+            ):
+                self._start_redis_invalidation_listener()
+                result = self.shared_memory_cache.get_cache(key)
+                if result is not None:
+                    await self.in_memory_cache.async_set_cache(key, result, **kwargs)
+
             if result is None and self.redis_cache is not None and local_only is False:
                 # If not found in in-memory cache, try fetching from Redis
                 redis_result = await self.redis_cache.async_get_cache(
@@ -230,6 +296,12 @@ class DualCache(BaseCache):
                     await self.in_memory_cache.async_set_cache(
                         key, redis_result, **kwargs
                     )
+                    if self.shared_memory_cache is not None:
+                        self.shared_memory_cache.set_cache(
+                            key,
+                            redis_result,
+                            **self._get_shared_memory_cache_kwargs(kwargs),
+                        )
 
                 result = redis_result
 
@@ -296,6 +368,22 @@ class DualCache(BaseCache):
                 if in_memory_result is not None:
                     result = in_memory_result
 
+            if (
+                None in result
+                and self.shared_memory_cache is not None
+                and local_only is False
+            ):
+                self._start_redis_invalidation_listener()
+                for i, key in enumerate(keys):
+                    if result[i] is not None:
+                        continue
+                    shared_value = self.shared_memory_cache.get_cache(key)
+                    if shared_value is not None:
+                        result[i] = shared_value
+                        await self.in_memory_cache.async_set_cache(
+                            key, shared_value, **kwargs
+                        )
+
             if None in result and self.redis_cache is not None and local_only is False:
                 """
                 - for the none values in the result
@@ -335,6 +423,12 @@ class DualCache(BaseCache):
                             await self.in_memory_cache.async_set_cache(
                                 key, value, **kwargs
                             )
+                        if value is not None and self.shared_memory_cache is not None:
+                            self.shared_memory_cache.set_cache(
+                                key,
+                                value,
+                                **self._get_shared_memory_cache_kwargs(kwargs),
+                            )
 
             return result
         except Exception:
@@ -348,6 +442,12 @@ class DualCache(BaseCache):
             if self.in_memory_cache is not None:
                 await self.in_memory_cache.async_set_cache(key, value, **kwargs)
 
+            if self.shared_memory_cache is not None and local_only is False:
+                self._record_redis_write(key)
+                self.shared_memory_cache.set_cache(
+                    key, value, **self._get_shared_memory_cache_kwargs(kwargs)
+                )
+
             if self.redis_cache is not None and local_only is False:
                 await self.redis_cache.async_set_cache(key, value, **kwargs)
         except Exception as e:
@@ -371,6 +471,14 @@ class DualCache(BaseCache):
                     cache_list=cache_list, **kwargs
                 )
 
+            if self.shared_memory_cache is not None and local_only is False:
+                for cache_key, _ in cache_list:
+                    self._record_redis_write(cache_key)
+                await self.shared_memory_cache.async_set_cache_pipeline(
+                    cache_list=cache_list,
+                    **self._get_shared_memory_cache_kwargs(kwargs),
+                )
+
             if self.redis_cache is not None and local_only is False:
                 await self.redis_cache.async_set_cache_pipeline(
                     cache_list=cache_list, ttl=kwargs.pop("ttl", None), **kwargs
@@ -402,6 +510,10 @@ class DualCache(BaseCache):
                     key, value, **kwargs
                 )
 
+            if self.shared_memory_cache is not None and local_only is False:
+                self._record_redis_write(key)
+                self.shared_memory_cache.delete_cache(key)
+
             if self.redis_cache is not None and local_only is False:
                 result = await self.redis_cache.async_increment(
                     key,
@@ -429,6 +541,11 @@ class DualCache(BaseCache):
                     parent_otel_span=parent_otel_span,
                 )
 
+            if self.shared_memory_cache is not None and local_only is False:
+                for increment in increment_list:
+                    self._record_redis_write(increment["key"])
+                    self.shared_memory_cache.delete_cache(increment["key"])
+
             if self.redis_cache is not None and local_only is False:
                 result = await self.redis_cache.async_increment_pipeline(
                     increment_list=increment_list,
@@ -457,6 +574,10 @@ class DualCache(BaseCache):
                     key, value, ttl=kwargs.get("ttl", None)
                 )
 
+            if self.shared_memory_cache is not None and local_only is False:
+                self._record_redis_write(key)
+                self.shared_memory_cache.delete_cache(key)
+
             if self.redis_cache is not None and local_only is False:
                 _ = await self.redis_cache.async_set_cache_sadd(
                     key, value, ttl=kwargs.get("ttl", None)
@@ -469,6 +590,8 @@ class DualCache(BaseCache):
     def flush_cache(self):
         if self.in_memory_cache is not None:
             self.in_memory_cache.flush_cache()
+        if self.shared_memory_cache is not None:
+            self.shared_memory_cache.flush_cache()
         if self.redis_cache is not None:
             self.redis_cache.flush_cache()
 
@@ -478,6 +601,8 @@ class DualCache(BaseCache):
         """
         if self.in_memory_cache is not None:
             self.in_memory_cache.delete_cache(key)
+        if self.shared_memory_cache is not None:
+            self.shared_memory_cache.delete_cache(key)
         if self.redis_cache is not None:
             self.redis_cache.delete_cache(key)
 
@@ -487,6 +612,8 @@ class DualCache(BaseCache):
         """
         if self.in_memory_cache is not None:
             self.in_memory_cache.delete_cache(key)
+        if self.shared_memory_cache is not None:
+            self.shared_memory_cache.delete_cache(key)
         if self.redis_cache is not None:
             await self.redis_cache.async_delete_cache(key)
 
@@ -498,3 +625,76 @@ class DualCache(BaseCache):
         if ttl is None and self.redis_cache is not None:
             ttl = await self.redis_cache.async_get_ttl(key)
         return ttl
+
+    def _start_redis_invalidation_listener(self) -> None:
+        """
+        Start the keyspace-notification listener for this process, if not running.
+        """
+        if self.redis_cache is None:
+            return
+        if (
+            self.redis_invalidation_task is None
+            or self.redis_invalidation_task.done()
+        ):
+            self.redis_invalidation_task = asyncio.create_task(
+                self._listen_for_redis_invalidations()
+            )
+
+    def _record_redis_write(self, key: str) -> None:
+        self.last_redis_write_time[key] = time.time()
+
+    def _invalidate_local_key(self, key: str) -> None:
+        """
+        Handle a redis keyspace notification for `key`.
+
+        Notifications caused by this process's own writes are ignored. Shared memory entries
+        freshly written by another worker on this host are kept - that worker caused the
+        notification - but the per-process copy is dropped, so the next read picks up the
+        shared value.
+        """
+        now = time.time()
+        last_write_time = self.last_redis_write_time.get(key)
+        if (
+            last_write_time is not None
+            and now - last_write_time < SHARED_MEMORY_CACHE_INVALIDATION_GRACE_SECONDS
+        ):
+            return
+        self.in_memory_cache.delete_cache(key)
+        if self.shared_memory_cache is not None:
+            self.shared_memory_cache.delete_cache(
+                key, written_before=now - SHARED_MEMORY_CACHE_INVALIDATION_GRACE_SECONDS
+            )
+
+    async def _listen_for_redis_invalidations(self) -> None:
+        """
+        Drop local copies of keys that changed in Redis (written by another host, expired, deleted).
+
+        Uses Redis keyspace notifications - `notify-keyspace-events` must include `K` and the
+        relevant event classes (e.g. `KA`) on the Redis server.
+        """
+        if self.redis_cache is None:
+            return
+        namespace_prefix = (
+            self.redis_cache.namespace + ":"
+            if self.redis_cache.namespace is not None
+            else ""
+        )
+        try:
+            _redis_client: Any = self.redis_cache.init_async_client()
+            pubsub = _redis_client.pubsub()
+            await pubsub.psubscribe("__keyspace@*__:{}*".format(namespace_prefix))
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                redis_key = channel.split(":", 1)[1]
+                self._invalidate_local_key(redis_key[len(namespace_prefix) :])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # entries still expire through their ttl
+            verbose_logger.debug(
+                f"DualCache: redis keyspace subscription failed - {str(e)}"
+            )
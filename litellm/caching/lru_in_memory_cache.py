@@ -0,0 +1,322 @@
+"""
+LRU In-Memory Cache implementation
+
+Alternative to `InMemoryCache` for hot-path caches (e.g. `user_api_key_cache`, router state):
+    - true LRU eviction, amortized O(1) per operation
+    - optional TinyLFU admission (`eviction_policy="tinylfu"`), so one-off keys don't evict frequently used ones
+    - total memory budget (`max_memory_bytes`) in addition to the item-count bound
+    - hit / miss / eviction counters, exported to Prometheus
+"""
+
+import json
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel
+
+from litellm.constants import (
+    IN_MEMORY_CACHE_BACKEND,
+    IN_MEMORY_CACHE_MAX_MEMORY_MB,
+)
+
+from .in_memory_cache import InMemoryCache
+
+EvictionPolicy = Literal["lru", "tinylfu"]
+
+# name -> cache, read by the prometheus collector
+_registered_lru_caches: "weakref.WeakValueDictionary[str, LRUInMemoryCache]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_registered_lru_caches() -> Dict[str, "LRUInMemoryCache"]:
+    return dict(_registered_lru_caches.items())
+
+
+def estimate_size_in_bytes(value: Any, _depth: int = 0) -> int:
+    """
+    Cheap estimate of the memory held by a cached value.
+
+    Containers are walked up to 3 levels deep; deeper values are counted with
+    their shallow size.
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return sys.getsizeof(value)
+    if isinstance(value, BaseModel):
+        return sys.getsizeof(value) + estimate_size_in_bytes(
+            value.__dict__, _depth + 1
+        )
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size_in_bytes(k, _depth + 1)
+            size += estimate_size_in_bytes(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size_in_bytes(item, _depth + 1)
+    return size
+
+
+class FrequencySketch:
+    """
+    4-bit count-min sketch used for TinyLFU admission.
+
+    Counters are halved every `sample_size` increments so that the sketch tracks
+    recent popularity instead of all-time counts.
+    """
+
+    DEPTH = 4
+    MAX_COUNT = 15
+    # odd multipliers - one independent multiplicative hash per row
+    ROW_SEEDS = (
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0x27D4EB2F165667C5,
+    )
+    _MASK_64 = (1 << 64) - 1
+
+    def __init__(self, capacity: int):
+        width = 64
+        while width < capacity * 4:
+            width *= 2
+        self.width_shift = 64 - (width.bit_length() - 1)
+        self.table: List[bytearray] = [bytearray(width) for _ in range(self.DEPTH)]
+        self.sample_size = width * 10
+        self.additions = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        key_hash = hash(key) & self._MASK_64
+        return [
+            ((key_hash * seed) & self._MASK_64) >> self.width_shift
+            for seed in self.ROW_SEEDS
+        ]
+
+    def increment(self, key: str) -> None:
+        for row, index in zip(self.table, self._indexes(key)):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._reset()
+
+    def frequency(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self.table, self._indexes(key)))
+
+    def _reset(self) -> None:
+        for row in self.table:
+            for index in range(len(row)):
+                row[index] >>= 1
+        self.additions //= 2
+
+
+class LRUInMemoryCache(InMemoryCache):
+    def __init__(
+        self,
+        max_size_in_memory: Optional[int] = 200,
+        default_ttl: Optional[int] = 600,
+        max_size_per_item: Optional[int] = 1024,  # 1MB = 1024KB
+        max_memory_bytes: Optional[int] = None,
+        eviction_policy: EvictionPolicy = "lru",
+        cache_name: Optional[str] = None,
+    ):
+        """
+        max_size_in_memory [int]: Maximum number of items in cache.
+        max_memory_bytes [int]: Maximum estimated bytes held by cached values. None = only bound by item count.
+        eviction_policy: "lru" or "tinylfu" (LRU eviction + frequency-based admission of new keys)
+        cache_name [str]: If set, the cache counters are exported to prometheus under this name.
+        """
+        super().__init__(
+            max_size_in_memory=max_size_in_memory,
+            default_ttl=default_ttl,
+            max_size_per_item=max_size_per_item,
+        )
+        # least recently used key first
+        self.cache_dict: "OrderedDict[str, Any]" = OrderedDict()
+        self.size_dict: Dict[str, int] = {}
+        self.max_memory_bytes = max_memory_bytes
+        self.current_memory_bytes = 0
+        self.eviction_policy: EvictionPolicy = eviction_policy
+        self.frequency_sketch: Optional[FrequencySketch] = (
+            FrequencySketch(capacity=self.max_size_in_memory)
+            if eviction_policy == "tinylfu"
+            else None
+        )
+
+        # counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected_admissions = 0
+
+        self.cache_name = cache_name
+        if cache_name is not None:
+            _registered_lru_caches[cache_name] = self
+
+    def _remove_key(self, key: str) -> None:
+        self.cache_dict.pop(key, None)
+        self.ttl_dict.pop(key, None)
+        self.current_memory_bytes -= self.size_dict.pop(key, 0)
+
+    def _is_over_budget(self, incoming_items: int = 0, incoming_bytes: int = 0) -> bool:
+        if len(self.cache_dict) + incoming_items > self.max_size_in_memory:
+            return True
+        if (
+            self.max_memory_bytes is not None
+            and self.current_memory_bytes + incoming_bytes > self.max_memory_bytes
+        ):
+            return True
+        return False
+
+    def evict_cache(self, incoming_items: int = 0, incoming_bytes: int = 0):
+        """
+        Evict least recently used items until the incoming item fits.
+
+        Each item is evicted at most once, so eviction is amortized O(1) per set.
+        """
+        while self.cache_dict and self._is_over_budget(incoming_items, incoming_bytes):
+            key = next(iter(self.cache_dict))
+            if self._is_key_expired(key):
+                self.expirations += 1
+            else:
+                self.evictions += 1
+            self._remove_key(key)
+
+    def _admit(self, key: str) -> bool:
+        """
+        TinyLFU admission: a new key only replaces the LRU victim if it is used more often.
+        """
+        if self.frequency_sketch is None or not self.cache_dict:
+            return True
+        victim = next(iter(self.cache_dict))
+        if self._is_key_expired(victim):
+            return True
+        return self.frequency_sketch.frequency(key) >= self.frequency_sketch.frequency(
+            victim
+        )
+
+    def set_cache(self, key, value, **kwargs):
+        # Handle the edge case where max_size_in_memory is 0
+        if self.max_size_in_memory == 0:
+            return  # Don't cache anything if max size is 0
+        if not self.check_value_size(value):
+            return
+
+        if self.frequency_sketch is not None:
+            self.frequency_sketch.increment(key)
+
+        value_size = estimate_size_in_bytes(value)
+        if self.max_memory_bytes is not None and value_size > self.max_memory_bytes:
+            return
+
+        is_new_key = key not in self.cache_dict
+        previous_size = self.size_dict.get(key, 0)
+        if self._is_over_budget(
+            incoming_items=1 if is_new_key else 0,
+            incoming_bytes=value_size - previous_size,
+        ):
+            if is_new_key and not self._admit(key):
+                self.rejected_admissions += 1
+                return
+            if not is_new_key:
+                self.cache_dict.move_to_end(key)  # never evict the key being updated
+            self.evict_cache(
+                incoming_items=1 if is_new_key else 0,
+                incoming_bytes=value_size - self.size_dict.get(key, 0),
+            )
+
+        self.cache_dict[key] = value
+        self.cache_dict.move_to_end(key)
+        self.current_memory_bytes += value_size - self.size_dict.get(key, 0)
+        self.size_dict[key] = value_size
+
+        if self.allow_ttl_override(key):
+            if "ttl" in kwargs and kwargs["ttl"] is not None:
+                self.ttl_dict[key] = time.time() + float(kwargs["ttl"])
+            else:
+                self.ttl_dict[key] = time.time() + self.default_ttl
+
+    def get_cache(self, key, **kwargs):
+        if self.frequency_sketch is not None:
+            self.frequency_sketch.increment(key)
+        if key not in self.cache_dict:
+            self.misses += 1
+            return None
+        if self._is_key_expired(key):
+            self._remove_key(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.cache_dict.move_to_end(key)
+        original_cached_response = self.cache_dict[key]
+        try:
+            cached_response = json.loads(original_cached_response)
+        except Exception:
+            cached_response = original_cached_response
+        return cached_response
+
+    def flush_cache(self):
+        super().flush_cache()
+        self.size_dict.clear()
+        self.current_memory_bytes = 0
+
+    async def async_get_oldest_n_keys(self, n: int) -> List[str]:
+        """
+        Get the n least recently used keys in the cache
+        """
+        keys: List[str] = []
+        for key in self.cache_dict:
+            if len(keys) >= n:
+                break
+            keys.append(key)
+        return keys
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "rejected_admissions": self.rejected_admissions,
+            "items": len(self.cache_dict),
+            "memory_bytes": self.current_memory_bytes,
+        }
+
+
+def create_in_memory_cache(
+    cache_name: str,
+    stateful: bool = False,
+    **kwargs,
+) -> InMemoryCache:
+    """
+    Return the in-memory cache backend configured via `LITELLM_IN_MEMORY_CACHE_BACKEND`.
+
+    - "default": `InMemoryCache`
+    - "lru" / "tinylfu": `LRUInMemoryCache` with a `LITELLM_IN_MEMORY_CACHE_MAX_MEMORY_MB` budget
+
+    `stateful` caches hold state rather than re-fetchable entries (e.g. router
+    cooldowns and tpm/rpm counters). TinyLFU admission can reject a write, so they
+    always use "lru".
+    """
+    if IN_MEMORY_CACHE_BACKEND in ("lru", "tinylfu"):
+        eviction_policy: EvictionPolicy = (
+            "lru" if stateful else IN_MEMORY_CACHE_BACKEND  # type: ignore
+        )
+        return LRUInMemoryCache(
+            max_memory_bytes=(
+                int(IN_MEMORY_CACHE_MAX_MEMORY_MB * 1024 * 1024)
+                if IN_MEMORY_CACHE_MAX_MEMORY_MB
+                else None
+            ),
+            eviction_policy=eviction_policy,
+            cache_name=cache_name,
+            **kwargs,
+        )
+    return InMemoryCache(**kwargs)
@@ -15,14 +15,17 @@ import inspect
 import json
 import time
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.constants import DEFAULT_REDIS_MAJOR_VERSION
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
 from litellm.litellm_core_utils.coroutine_checker import coroutine_checker
-from litellm.types.caching import RedisPipelineIncrementOperation
+from litellm.types.caching import (
+    RedisPipelineHashIncrementOperation,
+    RedisPipelineIncrementOperation,
+)
 from litellm.types.services import ServiceTypes
 
 from .base_cache import BaseCache
@@ -1242,6 +1245,163 @@ class RedisCache(BaseCache):
             )
             raise e
 
+    def increment_hash_pipeline(
+        self, increment_list: List[RedisPipelineHashIncrementOperation]
+    ) -> None:
+        """
+        Sync version of `async_increment_hash_pipeline`.
+        """
+        if len(increment_list) == 0:
+            return
+
+        _redis_client: Any = self.redis_client
+        start_time = time.time()
+        try:
+            with _redis_client.pipeline(transaction=False) as pipe:
+                for increment_op in increment_list:
+                    cache_key = self.check_and_fix_namespace(key=increment_op["key"])
+                    for field, value in increment_op["increments"].items():
+                        pipe.hincrbyfloat(cache_key, field, value)
+                    if increment_op["ttl"] is not None:
+                        pipe.expire(cache_key, timedelta(seconds=increment_op["ttl"]))
+                pipe.execute()
+
+            ## LOGGING ##
+            end_time = time.time()
+            self.service_logger_obj.service_success_hook(
+                service=ServiceTypes.REDIS,
+                duration=end_time - start_time,
+                call_type=f"increment_hash_pipeline <- {_get_call_stack_info()}",
+                start_time=start_time,
+                end_time=end_time,
+            )
+        except Exception as e:
+            verbose_logger.error(
+                "LiteLLM Redis Caching: increment_hash_pipeline() - Got exception from REDIS %s",
+                str(e),
+            )
+            raise e
+
+    async def async_increment_hash_pipeline(
+        self,
+        increment_list: List[RedisPipelineHashIncrementOperation],
+        parent_otel_span: Optional[Span] = None,
+    ) -> None:
+        """
+        Atomically increment fields of Redis hashes (HINCRBYFLOAT), in one round trip.
+
+        Increments from several instances add up, so all instances see the same totals.
+        """
+        if len(increment_list) == 0:
+            return
+
+        _redis_client: Any = self.init_async_client()
+        start_time = time.time()
+        try:
+            async with _redis_client.pipeline(transaction=False) as pipe:
+                for increment_op in increment_list:
+                    cache_key = self.check_and_fix_namespace(key=increment_op["key"])
+                    for field, value in increment_op["increments"].items():
+                        pipe.hincrbyfloat(cache_key, field, value)
+                    if increment_op["ttl"] is not None:
+                        pipe.expire(cache_key, timedelta(seconds=increment_op["ttl"]))
+                await pipe.execute()
+
+            ## LOGGING ##
+            end_time = time.time()
+            asyncio.create_task(
+                self.service_logger_obj.async_service_success_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=end_time - start_time,
+                    call_type=f"async_increment_hash_pipeline <- {_get_call_stack_info()}",
+                    start_time=start_time,
+                    end_time=end_time,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
+        except Exception as e:
+            ## LOGGING ##
+            end_time = time.time()
+            asyncio.create_task(
+                self.service_logger_obj.async_service_failure_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=end_time - start_time,
+                    error=e,
+                    call_type=f"async_increment_hash_pipeline <- {_get_call_stack_info()}",
+                    start_time=start_time,
+                    end_time=end_time,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
+            verbose_logger.error(
+                "LiteLLM Redis Caching: async increment_hash_pipeline() - Got exception from REDIS %s",
+                str(e),
+            )
+            raise e
+
+    async def async_batch_get_hash(
+        self,
+        keys: List[str],
+        parent_otel_span: Optional[Span] = None,
+    ) -> List[Dict[str, float]]:
+        """
+        Get all fields of several Redis hashes of numbers (HGETALL), in one round trip.
+
+        Missing keys are returned as empty dicts.
+        """
+        if len(keys) == 0:
+            return []
+
+        _redis_client: Any = self.init_async_client()
+        start_time = time.time()
+        try:
+            async with _redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hgetall(self.check_and_fix_namespace(key=key))
+                results = await pipe.execute()
+
+            ## LOGGING ##
+            end_time = time.time()
+            asyncio.create_task(
+                self.service_logger_obj.async_service_success_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=end_time - start_time,
+                    call_type=f"async_batch_get_hash <- {_get_call_stack_info()}",
+                    start_time=start_time,
+                    end_time=end_time,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
+        except Exception as e:
+            ## LOGGING ##
+            end_time = time.time()
+            asyncio.create_task(
+                self.service_logger_obj.async_service_failure_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=end_time - start_time,
+                    error=e,
+                    call_type=f"async_batch_get_hash <- {_get_call_stack_info()}",
+                    start_time=start_time,
+                    end_time=end_time,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
+            verbose_logger.error(
+                "LiteLLM Redis Caching: async batch_get_hash() - Got exception from REDIS %s",
+                str(e),
+            )
+            raise e
+
+        return [
+            {
+                (
+                    field.decode("utf-8") if isinstance(field, bytes) else field
+                ): float(value)
+                for field, value in (result or {}).items()
+            }
+            for result in results
+        ]
+
     async def async_get_ttl(self, key: str) -> Optional[int]:
         """
         Get the remaining TTL of a key in Redis
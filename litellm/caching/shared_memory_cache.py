@@ -0,0 +1,393 @@
+"""
+Shared Memory Cache implementation
+
+Fixed-size hash table in an mmap-backed file, shared by all worker processes on
+one host (e.g. `litellm --num_workers 4`). `DualCache` uses it as a tier between
+the per-process in-memory cache and Redis, so a value one worker read from Redis
+is served to the other workers without another Redis GET.
+
+- readers are lock-free: every slot carries a sequence number that is odd while a
+  write is in progress; a read that overlaps a write is discarded
+- writers serialize with an fcntl range lock on the bucket they write to
+- values are stored JSON encoded, like in Redis. Values that are not JSON
+  serializable or don't fit in a slot are skipped.
+
+The table is scoped to one proxy instance (see `get_shared_memory_namespace`) and
+removed on shutdown, so two proxies on a host never share counters.
+"""
+
+import atexit
+import glob
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from litellm.constants import SHARED_MEMORY_CACHE_SLOT_SIZE, SHARED_MEMORY_CACHE_SLOTS
+
+from .base_cache import BaseCache
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - windows
+    fcntl = None  # type: ignore
+
+_MAGIC = b"LLSM"
+_LAYOUT_VERSION = 2
+# magic, layout version, num_slots, slot_size
+_FILE_HEADER = struct.Struct("<4sIII")
+_FILE_HEADER_SIZE = 64
+# seq, key_hash, expires_at, written_at, key_len, value_len
+_SLOT_HEADER = struct.Struct("<IQddHI")
+_SEQ = struct.Struct("<I")
+# a key lives in one of `_BUCKET_SIZE` consecutive slots
+_BUCKET_SIZE = 8
+_READ_RETRIES = 3
+
+
+def _hash_key(key_bytes: bytes) -> int:
+    # stable across processes (unlike hash()); 0 marks an empty slot
+    return (
+        int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), "little")
+        | 1
+    )
+
+
+def get_default_shared_memory_path(name: str) -> str:
+    """
+    Prefer tmpfs (/dev/shm) so the table never hits disk.
+    """
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, name)
+
+
+def get_shared_memory_namespace() -> str:
+    """
+    Processes with the same namespace share tables.
+
+    `LITELLM_SHARED_MEMORY_CACHE_NAMESPACE` if set - the proxy CLI sets it to its own
+    pid before starting workers. Otherwise the pid of this process.
+    """
+    return os.getenv("LITELLM_SHARED_MEMORY_CACHE_NAMESPACE") or str(os.getpid())
+
+
+def remove_shared_memory_files(namespace: str) -> None:
+    """
+    Unlink every table of `namespace`. Processes that still have one mapped keep
+    their copy until they exit.
+    """
+    for path in glob.glob(
+        get_default_shared_memory_path("litellm_{}_*".format(glob.escape(namespace)))
+    ):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+class SharedMemoryCache(BaseCache):
+    def __init__(
+        self,
+        name: str = "litellm_shared_cache",
+        num_slots: int = 4096,
+        slot_size: int = 1024,
+        default_ttl: int = 60,
+        path: Optional[str] = None,
+    ):
+        """
+        name [str]: processes using the same name (and path) share the table
+        num_slots [int]: number of entries the table can hold
+        slot_size [int]: bytes per entry, including the key. Larger values are not cached.
+        path [str]: backing file. Default /dev/shm/<name>
+        """
+        if fcntl is None:
+            raise ValueError("SharedMemoryCache requires a POSIX platform")
+        super().__init__(default_ttl=default_ttl)
+        self.path = path or get_default_shared_memory_path(name)
+        self.num_slots = max(num_slots, _BUCKET_SIZE)
+        self.slot_size = max(slot_size, _SLOT_HEADER.size + 16)
+        self._thread_lock = threading.Lock()
+        self._fd = self._open_file()
+        self._mmap = mmap.mmap(self._fd, self._file_size())
+
+        # per-process counters
+        self.hits = 0
+        self.misses = 0
+
+    def _file_size(self) -> int:
+        return _FILE_HEADER_SIZE + self.num_slots * self.slot_size
+
+    def _open_file(self) -> int:
+        """
+        First process creates the table; later processes adopt its layout.
+        """
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.lockf(fd, fcntl.LOCK_EX)
+            try:
+                if self._init_file(fd):
+                    return fd
+            finally:
+                fcntl.lockf(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _init_file(self, fd: int) -> bool:
+        """
+        Returns False if `fd` is no longer the table at `self.path` and must be
+        reopened.
+
+        A file with an unknown layout is unlinked and replaced, never truncated -
+        other processes may still have it mapped, and would crash on their next access.
+        """
+        try:
+            path_stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        fd_stat = os.fstat(fd)
+        if (path_stat.st_dev, path_stat.st_ino) != (fd_stat.st_dev, fd_stat.st_ino):
+            return False  # replaced by another process while waiting for the lock
+
+        if fd_stat.st_size > 0:
+            header = os.pread(fd, _FILE_HEADER.size, 0)
+            if len(header) == _FILE_HEADER.size:
+                magic, version, num_slots, slot_size = _FILE_HEADER.unpack(header)
+                table_size = _FILE_HEADER_SIZE + num_slots * slot_size
+                if (
+                    magic == _MAGIC
+                    and version == _LAYOUT_VERSION
+                    and fd_stat.st_size >= table_size
+                ):
+                    self.num_slots = num_slots
+                    self.slot_size = slot_size
+                    return True
+            os.unlink(self.path)
+            return False
+
+        os.ftruncate(fd, self._file_size())
+        os.pwrite(
+            fd,
+            _FILE_HEADER.pack(_MAGIC, _LAYOUT_VERSION, self.num_slots, self.slot_size),
+            0,
+        )
+        return True
+
+    def _bucket_start(self, key_hash: int) -> int:
+        return key_hash % (self.num_slots - _BUCKET_SIZE + 1)
+
+    def _slot_offset(self, index: int) -> int:
+        return _FILE_HEADER_SIZE + index * self.slot_size
+
+    def _lock_bucket(self, start: int, lock_type: int) -> None:
+        fcntl.lockf(
+            self._fd,
+            lock_type,
+            _BUCKET_SIZE * self.slot_size,
+            self._slot_offset(start),
+            os.SEEK_SET,
+        )
+
+    def _encode_key(self, key: Any) -> Tuple[bytes, int]:
+        key_bytes = str(key).encode("utf-8")
+        return key_bytes, _hash_key(key_bytes)
+
+    def _read_slot(
+        self, offset: int, key_hash: int, key_bytes: bytes, now: float
+    ) -> Optional[bytes]:
+        for _ in range(_READ_RETRIES):
+            seq, slot_hash, expires_at, _, key_len, value_len = (
+                _SLOT_HEADER.unpack_from(self._mmap, offset)
+            )
+            if seq & 1:
+                continue  # write in progress
+            if slot_hash != key_hash:
+                return None
+            start = offset + _SLOT_HEADER.size
+            end = start + key_len + value_len
+            if end > offset + self.slot_size:
+                continue  # torn header
+            payload = self._mmap[start:end]
+            if _SEQ.unpack_from(self._mmap, offset)[0] != seq:
+                continue
+            if payload[:key_len] != key_bytes or expires_at < now:
+                return None
+            return payload[key_len:]
+        return None
+
+    def _write_slot(
+        self,
+        offset: int,
+        key_hash: int,
+        expires_at: float,
+        written_at: float,
+        key_bytes: bytes,
+        value_bytes: bytes,
+    ) -> None:
+        seq = _SEQ.unpack_from(self._mmap, offset)[0] | 1
+        _SLOT_HEADER.pack_into(
+            self._mmap,
+            offset,
+            seq,
+            key_hash,
+            expires_at,
+            written_at,
+            len(key_bytes),
+            len(value_bytes),
+        )
+        start = offset + _SLOT_HEADER.size
+        self._mmap[start : start + len(key_bytes) + len(value_bytes)] = (
+            key_bytes + value_bytes
+        )
+        _SEQ.pack_into(self._mmap, offset, (seq + 1) & 0xFFFFFFFF)
+
+    def _slot_matches(self, offset: int, key_hash: int, key_bytes: bytes) -> bool:
+        _, slot_hash, _, _, key_len, _ = _SLOT_HEADER.unpack_from(self._mmap, offset)
+        if slot_hash != key_hash:
+            return False
+        start = offset + _SLOT_HEADER.size
+        return self._mmap[start : start + key_len] == key_bytes
+
+    def _get_bytes(self, key) -> Optional[bytes]:
+        key_bytes, key_hash = self._encode_key(key)
+        now = time.time()
+        start = self._bucket_start(key_hash)
+        for index in range(start, start + _BUCKET_SIZE):
+            value = self._read_slot(self._slot_offset(index), key_hash, key_bytes, now)
+            if value is not None:
+                return value
+        return None
+
+    def set_cache(self, key, value, **kwargs):
+        try:
+            value_bytes = json.dumps(value).encode("utf-8")
+        except (TypeError, ValueError):
+            return
+        key_bytes, key_hash = self._encode_key(key)
+        if _SLOT_HEADER.size + len(key_bytes) + len(value_bytes) > self.slot_size:
+            return
+
+        ttl = kwargs.get("ttl")
+        now = time.time()
+        expires_at = now + (float(ttl) if ttl is not None else self.default_ttl)
+        start = self._bucket_start(key_hash)
+        with self._thread_lock:
+            self._lock_bucket(start, fcntl.LOCK_EX)
+            try:
+                # same key > empty / expired slot > slot expiring soonest
+                target: Optional[int] = None
+                target_expires_at = float("inf")
+                for index in range(start, start + _BUCKET_SIZE):
+                    offset = self._slot_offset(index)
+                    if self._slot_matches(offset, key_hash, key_bytes):
+                        target = offset
+                        break
+                    _, slot_hash, slot_expires_at, _, _, _ = (
+                        _SLOT_HEADER.unpack_from(self._mmap, offset)
+                    )
+                    if slot_hash == 0 or slot_expires_at < now:
+                        slot_expires_at = -1.0
+                    if slot_expires_at < target_expires_at:
+                        target, target_expires_at = offset, slot_expires_at
+                if target is not None:
+                    self._write_slot(
+                        target, key_hash, expires_at, now, key_bytes, value_bytes
+                    )
+            finally:
+                self._lock_bucket(start, fcntl.LOCK_UN)
+
+    def get_cache(self, key, **kwargs):
+        value = self._get_bytes(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    def batch_get_cache(self, keys: list, **kwargs) -> List[Any]:
+        return [self.get_cache(key) for key in keys]
+
+    def delete_cache(self, key, written_before: Optional[float] = None):
+        """
+        written_before [float]: only delete the entry if it was written before this timestamp
+        """
+        key_bytes, key_hash = self._encode_key(key)
+        start = self._bucket_start(key_hash)
+        with self._thread_lock:
+            self._lock_bucket(start, fcntl.LOCK_EX)
+            try:
+                for index in range(start, start + _BUCKET_SIZE):
+                    offset = self._slot_offset(index)
+                    if not self._slot_matches(offset, key_hash, key_bytes):
+                        continue
+                    written_at = _SLOT_HEADER.unpack_from(self._mmap, offset)[3]
+                    if written_before is None or written_at < written_before:
+                        self._write_slot(offset, 0, 0.0, 0.0, b"", b"")
+            finally:
+                self._lock_bucket(start, fcntl.LOCK_UN)
+
+    def flush_cache(self):
+        with self._thread_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                for index in range(self.num_slots):
+                    offset = self._slot_offset(index)
+                    if _SLOT_HEADER.unpack_from(self._mmap, offset)[1] != 0:
+                        self._write_slot(offset, 0, 0.0, 0.0, b"", b"")
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    async def async_set_cache(self, key, value, **kwargs):
+        self.set_cache(key=key, value=value, **kwargs)
+
+    async def async_set_cache_pipeline(self, cache_list, **kwargs):
+        for cache_key, cache_value in cache_list:
+            self.set_cache(key=cache_key, value=cache_value, **kwargs)
+
+    async def async_get_cache(self, key, **kwargs):
+        return self.get_cache(key=key, **kwargs)
+
+    async def async_batch_get_cache(self, keys: list, **kwargs) -> List[Any]:
+        return self.batch_get_cache(keys=keys, **kwargs)
+
+    async def async_delete_cache(self, key):
+        self.delete_cache(key)
+
+    def close(self) -> None:
+        self._mmap.close()
+        os.close(self._fd)
+
+    def unlink(self) -> None:
+        """
+        Remove the backing file. Processes that still have it mapped keep their copy.
+        """
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def disconnect(self):
+        self.close()
+
+
+def create_shared_memory_cache(cache_name: str) -> Optional[SharedMemoryCache]:
+    """
+    Return a SharedMemoryCache if enabled via `LITELLM_SHARED_MEMORY_CACHE_SLOTS`, else None.
+
+    The table is `/dev/shm/litellm_<namespace>_<cache_name>`. If the namespace is this
+    process' pid, the table is removed when the process exits.
+    """
+    if SHARED_MEMORY_CACHE_SLOTS <= 0 or fcntl is None:
+        return None
+    namespace = get_shared_memory_namespace()
+    cache = SharedMemoryCache(
+        name="litellm_{}_{}".format(namespace, cache_name),
+        num_slots=SHARED_MEMORY_CACHE_SLOTS,
+        slot_size=SHARED_MEMORY_CACHE_SLOT_SIZE,
+    )
+    if namespace == str(os.getpid()):
+        atexit.register(cache.unlink)
+    return cache
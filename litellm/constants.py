@@ -13,6 +13,18 @@ AZURE_DEFAULT_RESPONSES_API_VERSION = str(
 ROUTER_MAX_FALLBACKS = int(os.getenv("ROUTER_MAX_FALLBACKS", 5))
 DEFAULT_BATCH_SIZE = int(os.getenv("DEFAULT_BATCH_SIZE", 512))
 DEFAULT_FLUSH_INTERVAL_SECONDS = int(os.getenv("DEFAULT_FLUSH_INTERVAL_SECONDS", 5))
+CUSTOM_BATCH_LOGGER_ADAPTIVE_BATCHING = os.getenv(
+    "CUSTOM_BATCH_LOGGER_ADAPTIVE_BATCHING", "False"
+).lower() in ["true", "1"]
+DEFAULT_BATCH_MAX_BYTES = int(os.getenv("DEFAULT_BATCH_MAX_BYTES", 5_000_000))
+DEFAULT_BATCH_MIN_SIZE = int(os.getenv("DEFAULT_BATCH_MIN_SIZE", 10))
+DEFAULT_BATCH_MAX_CONCURRENT_FLUSHES = int(
+    os.getenv("DEFAULT_BATCH_MAX_CONCURRENT_FLUSHES", 4)
+)
+DEFAULT_BATCH_MAX_FLUSH_RETRIES = int(os.getenv("DEFAULT_BATCH_MAX_FLUSH_RETRIES", 3))
+DEFAULT_BATCH_TARGET_FLUSH_LATENCY_SECONDS = float(
+    os.getenv("DEFAULT_BATCH_TARGET_FLUSH_LATENCY_SECONDS", 2.0)
+)
 DEFAULT_S3_FLUSH_INTERVAL_SECONDS = int(
     os.getenv("DEFAULT_S3_FLUSH_INTERVAL_SECONDS", 10)
 )
@@ -41,6 +53,9 @@ DEFAULT_MAX_TOKENS = int(os.getenv("DEFAULT_MAX_TOKENS", 4096))
 DEFAULT_ALLOWED_FAILS = int(os.getenv("DEFAULT_ALLOWED_FAILS", 3))
 DEFAULT_REDIS_SYNC_INTERVAL = int(os.getenv("DEFAULT_REDIS_SYNC_INTERVAL", 1))
 DEFAULT_COOLDOWN_TIME_SECONDS = int(os.getenv("DEFAULT_COOLDOWN_TIME_SECONDS", 5))
+HEALTHY_DEPLOYMENTS_SNAPSHOT_TTL_SECONDS = float(
+    os.getenv("HEALTHY_DEPLOYMENTS_SNAPSHOT_TTL_SECONDS", 1.0)
+)
 DEFAULT_REPLICATE_POLLING_RETRIES = int(
     os.getenv("DEFAULT_REPLICATE_POLLING_RETRIES", 5)
 )
@@ -63,6 +78,15 @@ DEFAULT_IMAGE_HEIGHT = int(os.getenv("DEFAULT_IMAGE_HEIGHT", 300))
 # Maps to OpenAI's 50 MB payload limit - requests with images exceeding this size will be rejected
 # Set MAX_IMAGE_URL_DOWNLOAD_SIZE_MB=0 to disable image URL handling entirely
 MAX_IMAGE_URL_DOWNLOAD_SIZE_MB = float(os.getenv("MAX_IMAGE_URL_DOWNLOAD_SIZE_MB", 50))
+IMAGE_METADATA_CACHE_SIZE = int(
+    os.getenv("IMAGE_METADATA_CACHE_SIZE", 10000)
+)  # number of image URLs / data URIs whose dimensions are cached for token counting
+IMAGE_FETCH_MAX_CONCURRENCY = int(
+    os.getenv("IMAGE_FETCH_MAX_CONCURRENCY", 16)
+)  # max concurrent image downloads per process
+IMAGE_HEADER_MAX_BYTES = int(
+    os.getenv("IMAGE_HEADER_MAX_BYTES", 512 * 1024)
+)  # stop reading an image after this many bytes if its dimensions weren't found
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 1024)
 )  # 1MB = 1024KB
@@ -170,6 +194,11 @@ AIOHTTP_CONNECTOR_LIMIT_PER_HOST = int(
 )
 AIOHTTP_KEEPALIVE_TIMEOUT = int(os.getenv("AIOHTTP_KEEPALIVE_TIMEOUT", 120))
 AIOHTTP_TTL_DNS_CACHE = int(os.getenv("AIOHTTP_TTL_DNS_CACHE", 300))
+# Per-deployment connection pools (litellm_params.max_connections, http2, ...)
+CONNECTION_POOL_WARMUP_TIMEOUT = float(
+    os.getenv("CONNECTION_POOL_WARMUP_TIMEOUT", 5.0)
+)
+CONNECTION_POOL_CLOSE_TIMEOUT = float(os.getenv("CONNECTION_POOL_CLOSE_TIMEOUT", 60.0))
 # enable_cleanup_closed is only needed for Python versions with the SSL leak bug
 # Fixed in Python 3.12.7+ and 3.13.1+ (see https://github.com/python/cpython/pull/118960)
 # Reference: https://github.com/aio-libs/aiohttp/blob/master/aiohttp/connector.py#L74-L78
@@ -259,6 +288,12 @@ MAX_LONG_SIDE_FOR_IMAGE_HIGH_RES = int(
 )
 MAX_TILE_WIDTH = int(os.getenv("MAX_TILE_WIDTH", 512))
 MAX_TILE_HEIGHT = int(os.getenv("MAX_TILE_HEIGHT", 512))
+TOKEN_COUNTER_CACHE_SIZE = int(
+    os.getenv("TOKEN_COUNTER_CACHE_SIZE", 4096)
+)  # token counts of recently seen system prompts / tool schemas / history messages. 0 = disabled
+TOKEN_COUNTER_CACHE_MIN_TEXT_LENGTH = int(
+    os.getenv("TOKEN_COUNTER_CACHE_MIN_TEXT_LENGTH", 256)
+)  # shorter texts are cheaper to tokenize than to hash
 OPENAI_FILE_SEARCH_COST_PER_1K_CALLS = float(
     os.getenv("OPENAI_FILE_SEARCH_COST_PER_1K_CALLS", 2.5 / 1000)
 )
@@ -290,6 +325,9 @@ REPEATED_STREAMING_CHUNK_LIMIT = int(
 # Shared maxsize for functools.lru_cache usage across hot paths.
 # Defaulted to 64 to avoid cache thrash in multi-model production workloads.
 DEFAULT_MAX_LRU_CACHE_SIZE = int(os.getenv("DEFAULT_MAX_LRU_CACHE_SIZE", 64))
+PROVIDER_CHAT_CONFIG_CACHE_SIZE = int(
+    os.getenv("PROVIDER_CHAT_CONFIG_CACHE_SIZE", 1000)
+)
 _REALTIME_BODY_CACHE_SIZE = 1000  # Keep realtime helper caches bounded; workloads rarely exceed 1k models/intents
 INITIAL_RETRY_DELAY = float(os.getenv("INITIAL_RETRY_DELAY", 0.5))
 MAX_RETRY_DELAY = float(os.getenv("MAX_RETRY_DELAY", 8.0))
@@ -297,12 +335,30 @@ JITTER = float(os.getenv("JITTER", 0.75))
 DEFAULT_IN_MEMORY_TTL = int(
     os.getenv("DEFAULT_IN_MEMORY_TTL", 5)
 )  # default time to live for the in-memory cache
+IN_MEMORY_CACHE_BACKEND = os.getenv(
+    "LITELLM_IN_MEMORY_CACHE_BACKEND", "default"
+)  # "default", "lru" or "tinylfu" - backend for proxy/router in-memory caches
+IN_MEMORY_CACHE_MAX_MEMORY_MB = float(
+    os.getenv("LITELLM_IN_MEMORY_CACHE_MAX_MEMORY_MB", 0)
+)  # total memory budget per lru/tinylfu in-memory cache, 0 = only bound by item count
 DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE = int(
     os.getenv("DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE", 1000)
 )  # default max size for redis batch cache
+SHARED_MEMORY_CACHE_SLOTS = int(
+    os.getenv("LITELLM_SHARED_MEMORY_CACHE_SLOTS", 0)
+)  # entries in the cross-worker shared memory cache tier, 0 = disabled
+SHARED_MEMORY_CACHE_SLOT_SIZE = int(
+    os.getenv("LITELLM_SHARED_MEMORY_CACHE_SLOT_SIZE", 1024)
+)  # max bytes per shared memory cache entry (key + json value)
+SHARED_MEMORY_CACHE_INVALIDATION_GRACE_SECONDS = float(
+    os.getenv("LITELLM_SHARED_MEMORY_CACHE_INVALIDATION_GRACE_SECONDS", 1)
+)  # redis keyspace notifications for keys written on this host within this window don't invalidate
 DEFAULT_POLLING_INTERVAL = float(
     os.getenv("DEFAULT_POLLING_INTERVAL", 0.03)
 )  # default polling interval for the scheduler
+SCHEDULER_QUEUE_UPDATE_TIMEOUT = float(
+    os.getenv("SCHEDULER_QUEUE_UPDATE_TIMEOUT", 1)
+)  # fallback wakeup for the in_memory / redis scheduler backends
 AZURE_OPERATION_POLLING_TIMEOUT = int(os.getenv("AZURE_OPERATION_POLLING_TIMEOUT", 120))
 AZURE_DOCUMENT_INTELLIGENCE_API_VERSION = str(
     os.getenv("AZURE_DOCUMENT_INTELLIGENCE_API_VERSION", "2024-11-30")
@@ -400,6 +456,25 @@ MAX_TIME_TO_CLEAR_QUEUE = float(os.getenv("MAX_TIME_TO_CLEAR_QUEUE", 5.0))
 LOGGING_WORKER_AGGRESSIVE_CLEAR_COOLDOWN_SECONDS = float(
     os.getenv("LOGGING_WORKER_AGGRESSIVE_CLEAR_COOLDOWN_SECONDS", 0.5)
 )  # Cooldown time in seconds before allowing another aggressive clear (default: 0.5s)
+LOGGING_WORKER_SHARDED = os.getenv("LOGGING_WORKER_SHARDED", "False").lower() in [
+    "true",
+    "1",
+]  # run each callback's success logging on its own queue
+LOGGING_WORKER_PER_CALLBACK_CONCURRENCY = int(
+    os.getenv("LOGGING_WORKER_PER_CALLBACK_CONCURRENCY", 20)
+)  # Must be above 0
+LOGGING_WORKER_PER_CALLBACK_MAX_QUEUE_SIZE = int(
+    os.getenv("LOGGING_WORKER_PER_CALLBACK_MAX_QUEUE_SIZE", 10_000)
+)
+LOGGING_WORKER_OFFLOAD_PAYLOAD_BUILD = os.getenv(
+    "LOGGING_WORKER_OFFLOAD_PAYLOAD_BUILD", "False"
+).lower() in [
+    "true",
+    "1",
+]  # build the standard logging payload on the thread pool
+LOGGING_WORKER_METRICS_INTERVAL_SECONDS = float(
+    os.getenv("LOGGING_WORKER_METRICS_INTERVAL_SECONDS", 1.0)
+)  # min interval between queue depth / wait time metrics per callback queue
 DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE = os.getenv(
     "DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE", "streaming.chunk.yield"
 )
@@ -1190,6 +1265,10 @@ AZURE_STORAGE_MSFT_VERSION = "2019-07-07"
 PROMETHEUS_BUDGET_METRICS_REFRESH_INTERVAL_MINUTES = int(
     os.getenv("PROMETHEUS_BUDGET_METRICS_REFRESH_INTERVAL_MINUTES", 5)
 )
+# max cached `.labels(...)` children per prometheus metric
+PROMETHEUS_LABEL_HANDLE_CACHE_SIZE = int(
+    os.getenv("PROMETHEUS_LABEL_HANDLE_CACHE_SIZE", 1000)
+)
 CLOUDZERO_EXPORT_INTERVAL_MINUTES = int(
     os.getenv("CLOUDZERO_EXPORT_INTERVAL_MINUTES", 60)
 )
@@ -1299,6 +1378,12 @@ SPEND_LOG_RUN_LOOPS = int(os.getenv("SPEND_LOG_RUN_LOOPS", 500))
 SPEND_LOG_CLEANUP_BATCH_SIZE = int(os.getenv("SPEND_LOG_CLEANUP_BATCH_SIZE", 1000))
 SPEND_LOG_QUEUE_SIZE_THRESHOLD = int(os.getenv("SPEND_LOG_QUEUE_SIZE_THRESHOLD", 100))
 SPEND_LOG_QUEUE_POLL_INTERVAL = float(os.getenv("SPEND_LOG_QUEUE_POLL_INTERVAL", 2.0))
+SPEND_LOGS_COPY_MAX_CONSECUTIVE_FAILURES = int(
+    os.getenv("SPEND_LOGS_COPY_MAX_CONSECUTIVE_FAILURES", 3)
+)
+SPEND_LOGS_COPY_FAILURE_COOLDOWN_SECONDS = float(
+    os.getenv("SPEND_LOGS_COPY_FAILURE_COOLDOWN_SECONDS", 300)
+)
 DEFAULT_CRON_JOB_LOCK_TTL_SECONDS = int(
     os.getenv("DEFAULT_CRON_JOB_LOCK_TTL_SECONDS", 60)
 )  # 1 minute
@@ -1377,6 +1462,7 @@ DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL = int(
 DEFAULT_ACCESS_GROUP_CACHE_TTL = int(
     os.getenv("DEFAULT_ACCESS_GROUP_CACHE_TTL", 600)
 )
+MODEL_ACCESS_INDEX_CACHE_SIZE = int(os.getenv("MODEL_ACCESS_INDEX_CACHE_SIZE", 1000))
 
 # Sentry Scrubbing Configuration
 SENTRY_DENYLIST = [
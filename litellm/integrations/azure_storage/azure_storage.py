@@ -14,7 +14,7 @@ from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
     httpxSpecialProvider,
 )
-from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+from litellm.litellm_core_utils.cached_logging_payload import dumps_logging_payload
 from litellm.types.utils import StandardLoggingPayload
 
 
@@ -168,7 +168,7 @@ class AzureBlobStorageLogger(CustomBatchLogger):
                     llm_provider=httpxSpecialProvider.LoggingCallback
                 )
                 json_payload = (
-                    safe_dumps(payload) + "\n"
+                    dumps_logging_payload(payload) + "\n"
                 )  # Add newline for each log entry
                 payload_bytes = json_payload.encode("utf-8")
                 filename = f"{payload.get('id') or str(uuid.uuid4())}.json"
@@ -384,7 +384,7 @@ class AzureBlobStorageLogger(CustomBatchLogger):
             await file_client.create_file()
 
             # Content to append
-            content = safe_dumps(payload).encode("utf-8")
+            content = dumps_logging_payload(payload).encode("utf-8")
 
             # Append content to the file
             await file_client.append_data(data=content, offset=0, length=len(content))
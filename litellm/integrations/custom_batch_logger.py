@@ -1,16 +1,47 @@
 """
-Custom Logger that handles batching logic 
+Custom Logger that handles batching logic
 
 Use this if you want your logs to be stored in memory and flushed periodically.
+
+Adaptive batching (`adaptive_batching=True` or `CUSTOM_BATCH_LOGGER_ADAPTIVE_BATCHING=True`)
+is used by loggers that implement `async_send_log_batch`:
+- the queue is split into batches bounded by `batch_size` and `max_batch_bytes` (size of the
+  encoded JSON array). Logs are encoded once - senders reuse it via `dumps_logging_payload`
+- batches are sent concurrently, up to `DEFAULT_BATCH_MAX_CONCURRENT_FLUSHES` in flight
+- failed batches are retried `DEFAULT_BATCH_MAX_FLUSH_RETRIES` times with exponential backoff.
+  A batch rejected as too large (413) is split in half, other 4xx errors aren't retried
+- `batch_size` shrinks when the sink is slow or failing and grows back when it's fast
 """
 
 import asyncio
+import gzip
 import time
-from typing import List, Optional
+from typing import List, Literal, Optional, Tuple
+
+import httpx
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.constants import (
+    CUSTOM_BATCH_LOGGER_ADAPTIVE_BATCHING,
+    DEFAULT_BATCH_MAX_BYTES,
+    DEFAULT_BATCH_MAX_CONCURRENT_FLUSHES,
+    DEFAULT_BATCH_MAX_FLUSH_RETRIES,
+    DEFAULT_BATCH_MIN_SIZE,
+    DEFAULT_BATCH_TARGET_FLUSH_LATENCY_SECONDS,
+)
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.cached_logging_payload import (
+    CachedJSONLoggingPayload,
+    dumps_logging_payload,
+)
+
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None  # type: ignore
+
+BATCH_COMPRESSION_TYPES = Literal["gzip", "zstd"]
 
 
 class CustomBatchLogger(CustomLogger):
@@ -19,11 +50,17 @@ class CustomBatchLogger(CustomLogger):
         flush_lock: Optional[asyncio.Lock] = None,
         batch_size: Optional[int] = None,
         flush_interval: Optional[int] = None,
+        adaptive_batching: Optional[bool] = None,
+        max_batch_bytes: Optional[int] = None,
+        batch_compression: Optional[BATCH_COMPRESSION_TYPES] = None,
         **kwargs,
     ) -> None:
         """
         Args:
             flush_lock (Optional[asyncio.Lock], optional): Lock to use when flushing the queue. Defaults to None. Only used for custom loggers that do batching
+            adaptive_batching (Optional[bool], optional): Split flushes into size and byte bounded batches sent concurrently with retries. Defaults to CUSTOM_BATCH_LOGGER_ADAPTIVE_BATCHING. Only used for loggers that implement `async_send_log_batch`
+            max_batch_bytes (Optional[int], optional): Max encoded JSON size of an adaptive batch. Defaults to DEFAULT_BATCH_MAX_BYTES
+            batch_compression (Optional[str], optional): "gzip" or "zstd" - compression applied by `compress_log_batch`
         """
         self.log_queue: List = []
         self.flush_interval = flush_interval or litellm.DEFAULT_FLUSH_INTERVAL_SECONDS
@@ -31,6 +68,26 @@ class CustomBatchLogger(CustomLogger):
         self.last_flush_time = time.time()
         self.flush_lock = flush_lock
 
+        # adaptive batching
+        self.adaptive_batching: bool = (
+            adaptive_batching
+            if adaptive_batching is not None
+            else CUSTOM_BATCH_LOGGER_ADAPTIVE_BATCHING
+        )
+        self.max_batch_bytes: int = max_batch_bytes or DEFAULT_BATCH_MAX_BYTES
+        self.max_batch_size: int = self.batch_size
+        self.min_batch_size: int = min(DEFAULT_BATCH_MIN_SIZE, self.batch_size)
+        self.max_flush_retries: int = DEFAULT_BATCH_MAX_FLUSH_RETRIES
+        self.target_flush_latency: float = DEFAULT_BATCH_TARGET_FLUSH_LATENCY_SECONDS
+        self._flush_semaphore: Optional[asyncio.Semaphore] = None
+
+        if batch_compression == "zstd" and zstandard is None:
+            verbose_logger.warning(
+                "CustomBatchLogger: zstd compression requires `pip install zstandard`, using gzip"
+            )
+            batch_compression = "gzip"
+        self.batch_compression: Optional[BATCH_COMPRESSION_TYPES] = batch_compression
+
         super().__init__(**kwargs)
 
     async def periodic_flush(self):
@@ -45,6 +102,10 @@ class CustomBatchLogger(CustomLogger):
         if self.flush_lock is None:
             return
 
+        if self._use_adaptive_batching():
+            await self._adaptive_flush_queue()
+            return
+
         async with self.flush_lock:
             if self.log_queue:
                 verbose_logger.debug(
@@ -56,3 +117,163 @@ class CustomBatchLogger(CustomLogger):
 
     async def async_send_batch(self, *args, **kwargs):
         pass
+
+    async def async_send_log_batch(self, logs: List) -> None:
+        """
+        Send one batch of logs. Raise on failure so the batch is retried.
+
+        Override this to support adaptive batching - `flush_queue` only calls it when
+        `supports_async_send_log_batch` is True.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement async_send_log_batch"
+        )
+
+    @classmethod
+    def supports_async_send_log_batch(cls) -> bool:
+        """
+        True if `cls` (or a parent below CustomBatchLogger) overrides
+        `async_send_log_batch`.
+        """
+        return cls.async_send_log_batch is not CustomBatchLogger.async_send_log_batch
+
+    def _use_adaptive_batching(self) -> bool:
+        return self.adaptive_batching and self.supports_async_send_log_batch()
+
+    async def _adaptive_flush_queue(self):
+        """
+        Take the queue and send it as size and byte bounded batches, concurrently.
+
+        The lock is only held while taking the queue, so a slow sink doesn't block the next
+        flush - in-flight batches are bounded by the flush semaphore instead.
+        """
+        async with self.flush_lock:  # type: ignore[union-attr]
+            if not self.log_queue:
+                return
+            logs = self.log_queue
+            self.log_queue = []
+            self.last_flush_time = time.time()
+
+        if self._flush_semaphore is None:
+            self._flush_semaphore = asyncio.Semaphore(
+                DEFAULT_BATCH_MAX_CONCURRENT_FLUSHES
+            )
+        batches = self._split_log_batches(logs)
+        verbose_logger.debug(
+            "CustomLogger: Flushing %s events in %s batches", len(logs), len(batches)
+        )
+        await asyncio.gather(
+            *[self._send_log_batch_with_retries(batch) for batch in batches]
+        )
+
+    @staticmethod
+    def _get_encoded_log(log):
+        """
+        The log as a `CachedJSONLoggingPayload`, so that it's only encoded once - for
+        its size here, and by the sender's `dumps_logging_payload`.
+        """
+        if isinstance(log, dict) and not isinstance(log, CachedJSONLoggingPayload):
+            return CachedJSONLoggingPayload(log)
+        return log
+
+    def _get_log_size(self, log) -> int:
+        return len(dumps_logging_payload(log).encode("utf-8"))
+
+    def _split_log_batches(self, logs: List) -> List[List]:
+        """
+        Split `logs` into batches whose JSON array - `[`, `]` and a `,` between the logs
+        (or a newline, for ndjson) - is at most `max_batch_bytes`.
+        """
+        batches: List[List] = []
+        batch: List = []
+        batch_bytes = 1  # `[`
+        for log in logs:
+            log = self._get_encoded_log(log)
+            log_bytes = self._get_log_size(log) + 1  # `,` or `]`
+            if batch and (
+                len(batch) >= self.batch_size
+                or batch_bytes + log_bytes > self.max_batch_bytes
+            ):
+                batches.append(batch)
+                batch = []
+                batch_bytes = 1
+            batch.append(log)
+            batch_bytes += log_bytes
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _get_error_status_code(e: Exception) -> Optional[int]:
+        if isinstance(e, httpx.HTTPStatusError):
+            return e.response.status_code
+        return getattr(e, "status_code", None)
+
+    @staticmethod
+    def _is_retryable_status_code(status_code: Optional[int]) -> bool:
+        """
+        Connection errors, 5xx, 408 and 429 are retried - other 4xx would fail again.
+        """
+        return status_code is None or status_code >= 500 or status_code in (408, 429)
+
+    async def _send_log_batch_with_retries(self, logs: List) -> None:
+        too_large = False
+        async with self._flush_semaphore:  # type: ignore[union-attr]
+            for attempt in range(self.max_flush_retries + 1):
+                start_time = time.perf_counter()
+                try:
+                    await self.async_send_log_batch(logs)
+                except Exception as e:
+                    status_code = self._get_error_status_code(e)
+                    if status_code == 413 and len(logs) > 1:
+                        self._adjust_batch_size(latency=None)
+                        too_large = True
+                        break
+                    retryable = self._is_retryable_status_code(status_code)
+                    if retryable:
+                        self._adjust_batch_size(latency=None)
+                    if attempt == self.max_flush_retries or not retryable:
+                        verbose_logger.exception(
+                            "CustomLogger: dropping batch of %s events after %s attempts - %s",
+                            len(logs),
+                            attempt + 1,
+                            str(e),
+                        )
+                        return
+                    await asyncio.sleep(0.1 * 2**attempt)
+                else:
+                    self._adjust_batch_size(latency=time.perf_counter() - start_time)
+                    return
+
+        if too_large:
+            # send the halves on their own, after releasing the semaphore
+            middle = len(logs) // 2
+            await asyncio.gather(
+                self._send_log_batch_with_retries(logs[:middle]),
+                self._send_log_batch_with_retries(logs[middle:]),
+            )
+
+    def _adjust_batch_size(self, latency: Optional[float]) -> None:
+        """
+        Halve the batch size when a send fails or is slower than the target latency, grow
+        it back by a tenth of the max when it's under half the target.
+        """
+        if latency is None or latency > self.target_flush_latency:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif latency < self.target_flush_latency / 2:
+            self.batch_size = min(
+                self.max_batch_size,
+                self.batch_size + max(1, self.max_batch_size // 10),
+            )
+
+    def compress_log_batch(self, data: bytes) -> Tuple[bytes, Optional[str]]:
+        """
+        Compress a request body with `batch_compression`.
+
+        Returns the body and its Content-Encoding (None when uncompressed).
+        """
+        if self.batch_compression == "gzip":
+            return gzip.compress(data), "gzip"
+        if self.batch_compression == "zstd" and zstandard is not None:
+            return zstandard.ZstdCompressor().compress(data), "zstd"
+        return data, None
@@ -376,6 +376,15 @@ class CustomGuardrail(CustomLogger):
 
         return result
 
+    def should_run_post_call_streaming_iterator_hook(self) -> bool:
+        """
+        Guardrails implementing `apply_guardrail` also check the streamed chunks.
+        """
+        return (
+            super().should_run_post_call_streaming_iterator_hook()
+            or "apply_guardrail" in type(self).__dict__
+        )
+
     def should_run_guardrail(
         self,
         data,
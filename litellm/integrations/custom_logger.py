@@ -450,6 +450,18 @@ class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callbac
     ) -> Any:
         pass
 
+    def should_run_post_call_streaming_hook(self) -> bool:
+        """
+        Whether `async_post_call_streaming_hook` should be called for each streamed chunk.
+
+        The proxy only accumulates the streamed text if at least one callback returns True.
+        Defaults to True if `async_post_call_streaming_hook` is overridden.
+        """
+        return (
+            type(self).async_post_call_streaming_hook
+            is not CustomLogger.async_post_call_streaming_hook
+        )
+
     async def async_post_call_streaming_iterator_hook(
         self,
         user_api_key_dict: UserAPIKeyAuth,
@@ -459,6 +471,19 @@ class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callbac
         async for item in response:
             yield item
 
+    def should_run_post_call_streaming_iterator_hook(self) -> bool:
+        """
+        Whether this callback processes the streamed chunks via
+        `async_post_call_streaming_iterator_hook`.
+
+        The proxy only forwards raw upstream frames if no callback returns True.
+        Defaults to True if `async_post_call_streaming_iterator_hook` is overridden.
+        """
+        return (
+            type(self).async_post_call_streaming_iterator_hook
+            is not CustomLogger.async_post_call_streaming_iterator_hook
+        )
+
     #### SINGLE-USE #### - https://docs.litellm.ai/docs/observability/custom_callback#using-your-custom-callback-function
 
     def log_input_event(self, model, messages, kwargs, print_verbose, callback_func):
@@ -47,6 +47,7 @@ from litellm.llms.custom_httpx.http_handler import (
 from litellm.types.integrations.base_health_check import IntegrationHealthCheckStatus
 from litellm.types.integrations.datadog import (
     DD_ERRORS,
+    DD_MAX_BATCH_BYTES,
     DD_MAX_BATCH_SIZE,
     DataDogStatus,
     DatadogInitParams,
@@ -127,7 +128,11 @@ class DataDogLogger(
             asyncio.create_task(self.periodic_flush())
             self.flush_lock = asyncio.Lock()
             super().__init__(
-                **kwargs, flush_lock=self.flush_lock, batch_size=DD_MAX_BATCH_SIZE
+                **kwargs,
+                flush_lock=self.flush_lock,
+                batch_size=DD_MAX_BATCH_SIZE,
+                max_batch_bytes=DD_MAX_BATCH_BYTES,
+                batch_compression="gzip",
             )
         except Exception as e:
             verbose_logger.exception(
@@ -301,7 +306,7 @@ class DataDogLogger(
             self.log_queue.append(dd_payload)
 
             if len(self.log_queue) >= self.batch_size:
-                await self.async_send_batch()
+                await self.flush_queue()
         except Exception as e:
             verbose_logger.exception(
                 f"Datadog: async_post_call_failure_hook - {str(e)}\n{traceback.format_exc()}"
@@ -330,37 +335,41 @@ class DataDogLogger(
                 self.intake_url,
             )
 
-            if self.is_mock_mode:
-                verbose_logger.debug(
-                    "[DATADOG MOCK] Mock mode enabled - API calls will be intercepted"
-                )
-
-            response = await self.async_send_compressed_data(self.log_queue)
-            if response.status_code == 413:
-                verbose_logger.exception(DD_ERRORS.DATADOG_413_ERROR.value)
-                return
-
-            response.raise_for_status()
-            if response.status_code != 202:
-                raise Exception(
-                    f"Response from datadog API status_code: {response.status_code}, text: {response.text}"
-                )
-
-            if self.is_mock_mode:
-                verbose_logger.debug(
-                    f"[DATADOG MOCK] Batch of {len(self.log_queue)} events successfully mocked"
-                )
-            else:
-                verbose_logger.debug(
-                    "Datadog: Response from datadog API status_code: %s, text: %s",
-                    response.status_code,
-                    response.text,
-                )
+            await self.async_send_log_batch(self.log_queue)
         except Exception as e:
             verbose_logger.exception(
                 f"Datadog Error sending batch API - {str(e)}\n{traceback.format_exc()}"
             )
 
+    async def async_send_log_batch(self, logs: List) -> None:
+        """
+        Sends a batch of logs to datadog api. Raises if the batch was not accepted.
+        """
+        if self.is_mock_mode:
+            verbose_logger.debug(
+                "[DATADOG MOCK] Mock mode enabled - API calls will be intercepted"
+            )
+
+        response = await self.async_send_compressed_data(logs)
+        if response.status_code == 413:
+            verbose_logger.warning(DD_ERRORS.DATADOG_413_ERROR.value)
+        response.raise_for_status()
+        if response.status_code != 202:
+            raise Exception(
+                f"Response from datadog API status_code: {response.status_code}, text: {response.text}"
+            )
+
+        if self.is_mock_mode:
+            verbose_logger.debug(
+                f"[DATADOG MOCK] Batch of {len(logs)} events successfully mocked"
+            )
+        else:
+            verbose_logger.debug(
+                "Datadog: Response from datadog API status_code: %s, text: %s",
+                response.status_code,
+                response.text,
+            )
+
     def log_success_event(self, kwargs, response_obj, start_time, end_time):
         """
         Sync Log success events to Datadog
@@ -429,16 +438,18 @@ class DataDogLogger(
         )
 
         if len(self.log_queue) >= self.batch_size:
-            await self.async_send_batch()
+            await self.flush_queue()
 
     def _create_datadog_logging_payload_helper(
         self,
         standard_logging_object: StandardLoggingPayload,
         status: DataDogStatus,
     ) -> DatadogPayload:
-        from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+        from litellm.litellm_core_utils.cached_logging_payload import (
+            dumps_logging_payload,
+        )
 
-        json_payload = safe_dumps(standard_logging_object)
+        json_payload = dumps_logging_payload(standard_logging_object)
         verbose_logger.debug("Datadog: Logger - Logging payload = %s", json_payload)
         dd_payload = DatadogPayload(
             ddsource=get_datadog_source(),
@@ -500,15 +511,19 @@ class DataDogLogger(
         "Datadog recommends sending your logs compressed. Add the Content-Encoding: gzip header to the request when sending"
         """
 
-        import gzip
-
-        from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+        from litellm.litellm_core_utils.cached_logging_payload import (
+            dumps_logging_payload,
+        )
 
-        compressed_data = gzip.compress(safe_dumps(data).encode("utf-8"))
+        # reuses the encoding of logs measured by adaptive batching
+        body = "[" + ",".join(dumps_logging_payload(log) for log in data) + "]"
+        compressed_data, content_encoding = self.compress_log_batch(
+            body.encode("utf-8")
+        )
 
         # Build headers
         headers = {
-            "Content-Encoding": "gzip",
+            "Content-Encoding": content_encoding or "identity",
             "Content-Type": "application/json",
         }
 
@@ -12,6 +12,7 @@ from litellm._logging import verbose_logger
 from litellm.constants import LITELLM_ASYNCIO_QUEUE_MAXSIZE
 from litellm.integrations.additional_logging_utils import AdditionalLoggingUtils
 from litellm.integrations.gcs_bucket.gcs_bucket_base import GCSBucketBase
+from litellm.litellm_core_utils.cached_logging_payload import CachedJSONLoggingPayload
 from litellm.proxy._types import CommonProxyErrors
 from litellm.types.integrations.base_health_check import IntegrationHealthCheckStatus
 from litellm.types.integrations.gcs_bucket import *
@@ -182,7 +183,12 @@ class GCSBucketLogger(GCSBucketBase, AdditionalLoggingUtils):
         lines = []
         for item in items:
             logging_payload = item["payload"]
-            json_line = json.dumps(logging_payload, default=str, ensure_ascii=False)
+            if isinstance(logging_payload, CachedJSONLoggingPayload):
+                json_line = logging_payload.json_str()
+            else:
+                json_line = json.dumps(
+                    logging_payload, default=str, ensure_ascii=False
+                )
             lines.append(json_line)
         return "\n".join(lines)
 
@@ -17,7 +17,7 @@ import litellm
 from litellm._logging import verbose_logger
 from litellm._uuid import uuid
 from litellm.integrations.custom_batch_logger import CustomBatchLogger
-from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+from litellm.litellm_core_utils.cached_logging_payload import dumps_logging_payload
 from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
     httpxSpecialProvider,
@@ -114,6 +114,7 @@ class GenericAPILogger(CustomBatchLogger):
             event_types: Optional[List[API_EVENT_TYPES]] = None,
             callback_name: Optional[str] = None - If provided, loads config from generic_api_compatible_callbacks.json
             log_format: Optional[LOG_FORMAT_TYPES] = None - Format for log output: "json_array" (default), "ndjson", or "single"
+            batch_compression: Optional[str] = None - "gzip" or "zstd", compresses "json_array" and "ndjson" batches
         """
         #########################################################
         # Check if callback_name is provided and load config
@@ -257,7 +258,7 @@ class GenericAPILogger(CustomBatchLogger):
                 self.log_queue.append(standard_logging_payload)
 
             if len(self.log_queue) >= self.batch_size:
-                await self.async_send_batch()
+                await self.flush_queue()
 
         except Exception as e:
             verbose_logger.exception(
@@ -293,7 +294,7 @@ class GenericAPILogger(CustomBatchLogger):
                 self.log_queue.append(standard_logging_payload)
 
             if len(self.log_queue) >= self.batch_size:
-                await self.async_send_batch()
+                await self.flush_queue()
 
         except Exception as e:
             verbose_logger.exception(
@@ -316,59 +317,72 @@ class GenericAPILogger(CustomBatchLogger):
             verbose_logger.debug(
                 f"Generic API Logger - about to flush {len(self.log_queue)} events in '{self.log_format}' format"
             )
+            await self.async_send_log_batch(self.log_queue)
+        except Exception as e:
+            verbose_logger.exception(
+                f"Generic API Logger Error sending batch - {str(e)}\n{traceback.format_exc()}"
+            )
+        finally:
+            self.log_queue.clear()
 
-            if self.log_format == "single":
-                # Send each log as individual HTTP request in parallel
-                tasks = []
-                for log_entry in self.log_queue:
-                    task = self.async_httpx_client.post(
-                        url=self.endpoint,
-                        headers=self.headers,
-                        data=safe_dumps(log_entry),
-                    )
-                    tasks.append(task)
-
-                # Execute all requests in parallel
-                responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Log results
-                for idx, result in enumerate(responses):
-                    if isinstance(result, Exception):
-                        verbose_logger.exception(
-                            f"Generic API Logger - Error sending log {idx}: {result}"
-                        )
-                    else:
-                        # result is a Response object
-                        verbose_logger.debug(
-                            f"Generic API Logger - sent log {idx}, status: {result.status_code}"  # type: ignore
-                        )
-            else:
-                # Format the payload based on log_format
-                if self.log_format == "json_array":
-                    data = safe_dumps(self.log_queue)
-                elif self.log_format == "ndjson":
-                    data = "\n".join(safe_dumps(log) for log in self.log_queue)
-                else:
-                    raise ValueError(f"Unknown log_format: {self.log_format}")
+    async def async_send_log_batch(self, logs: List) -> None:
+        """
+        Sends a batch of logs to the Generic API Endpoint in `log_format`.
 
-                # Make POST request
-                response = await self.async_httpx_client.post(
+        Raises if the batch request fails. With "single", failed logs are logged, not raised.
+        """
+        if self.log_format == "single":
+            # Send each log as individual HTTP request in parallel
+            tasks = []
+            for log_entry in logs:
+                task = self.async_httpx_client.post(
                     url=self.endpoint,
                     headers=self.headers,
-                    data=data,
+                    data=dumps_logging_payload(log_entry),
                 )
+                tasks.append(task)
 
-                verbose_logger.debug(
-                    f"Generic API Logger - sent batch to {self.endpoint}, "
-                    f"status: {response.status_code}, format: {self.log_format}"
-                )
+            # Execute all requests in parallel
+            responses = await asyncio.gather(*tasks, return_exceptions=True)
 
-        except Exception as e:
-            verbose_logger.exception(
-                f"Generic API Logger Error sending batch - {str(e)}\n{traceback.format_exc()}"
-            )
-        finally:
-            self.log_queue.clear()
+            # Log results
+            for idx, result in enumerate(responses):
+                if isinstance(result, Exception):
+                    verbose_logger.exception(
+                        f"Generic API Logger - Error sending log {idx}: {result}"
+                    )
+                else:
+                    # result is a Response object
+                    verbose_logger.debug(
+                        f"Generic API Logger - sent log {idx}, status: {result.status_code}"  # type: ignore
+                    )
+            return
+
+        # Format the payload based on log_format
+        if self.log_format == "json_array":
+            data = "[" + ",".join(dumps_logging_payload(log) for log in logs) + "]"
+        elif self.log_format == "ndjson":
+            data = "\n".join(dumps_logging_payload(log) for log in logs)
+        else:
+            raise ValueError(f"Unknown log_format: {self.log_format}")
+
+        headers = self.headers
+        body: Union[str, bytes] = data
+        if self.batch_compression is not None:
+            body, content_encoding = self.compress_log_batch(data.encode("utf-8"))
+            headers = {**self.headers, "Content-Encoding": content_encoding}
+
+        # Make POST request
+        response = await self.async_httpx_client.post(
+            url=self.endpoint,
+            headers=headers,
+            data=body,  # type: ignore
+        )
+
+        verbose_logger.debug(
+            f"Generic API Logger - sent batch to {self.endpoint}, "
+            f"status: {response.status_code}, format: {self.log_format}"
+        )
 
     def _get_v1_logging_payload(
         self, kwargs, response_obj, start_time, end_time
@@ -11,6 +11,7 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Optional,
@@ -22,6 +23,9 @@ from typing import (
 import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.integrations.prometheus_helpers.label_handle_cache import (
+    CachedLabelsMetric,
+)
 from litellm.proxy._types import (
     LiteLLM_DeletedVerificationToken,
     LiteLLM_TeamTable,
@@ -436,6 +440,20 @@ class PrometheusLogger(CustomLogger):
                 labelnames=[],
             )
 
+            # in-memory cache counters (LRUInMemoryCache), read at scrape time
+            from litellm.integrations.prometheus_helpers.in_memory_cache_collector import (
+                register_in_memory_cache_collector,
+            )
+
+            register_in_memory_cache_collector()
+
+            # per-deployment connection pools, read at scrape time
+            from litellm.integrations.prometheus_helpers.connection_pool_collector import (
+                register_connection_pool_collector,
+            )
+
+            register_connection_pool_collector()
+
         except Exception as e:
             print_verbose(f"Got exception on init prometheus client {str(e)}")
             raise e
@@ -849,7 +867,8 @@ class PrometheusLogger(CustomLogger):
             metric_name = args[0] if args else kwargs.get("name", "")
 
             if self._is_metric_enabled(metric_name):
-                return metric_class(*args, **kwargs)
+                # cache the `.labels(...)` children, label values repeat across requests
+                return CachedLabelsMetric(metric_class(*args, **kwargs))
             else:
                 return NoOpMetric()
 
@@ -883,7 +902,7 @@ class PrometheusLogger(CustomLogger):
         from litellm.types.utils import StandardLoggingPayload
 
         verbose_logger.debug(
-            f"prometheus Logging - Enters success logging function for kwargs {kwargs}"
+            "prometheus Logging - Enters success logging function for kwargs %s", kwargs
         )
 
         # unpack kwargs
@@ -3040,18 +3059,19 @@ def prometheus_label_factory(
 
     Ensures end_user param is not sent to prometheus if it is not supported.
     """
-    # Extract dictionary from Pydantic object
-    enum_dict = enum_values.model_dump()
+    # the same enum_values are used for every metric of a request - resolve the
+    # label values once, then pick the supported labels for each metric
+    resolved_label_values, custom_label_names = _get_resolved_labels(enum_values)
 
-    # Filter supported labels and sanitize values to prevent breaking
-    # the Prometheus text format (e.g. U+2028 Line Separator in label values)
     filtered_labels = {
-        label: _sanitize_prometheus_label_value(value)
-        for label, value in enum_dict.items()
-        if label in supported_enum_labels
+        label: resolved_label_values.get(label) for label in supported_enum_labels
     }
 
-    if UserAPIKeyLabelNames.END_USER.value in filtered_labels:
+    # custom metadata / tag labels take precedence over the end_user value
+    if (
+        UserAPIKeyLabelNames.END_USER.value in filtered_labels
+        and UserAPIKeyLabelNames.END_USER.value not in custom_label_names
+    ):
         get_end_user_id_for_cost_tracking = _get_cached_end_user_id_for_cost_tracking()
 
         filtered_labels["end_user"] = get_end_user_id_for_cost_tracking(
@@ -3059,25 +3079,45 @@ def prometheus_label_factory(
             service_type="prometheus",
         )
 
+    return filtered_labels
+
+
+def _get_resolved_labels(
+    enum_values: UserAPIKeyLabelValues,
+) -> Tuple[Dict[str, Optional[str]], FrozenSet[str]]:
+    """
+    Sanitized label values of `enum_values` with the custom metadata / tag labels
+    applied on top, and the names of those custom labels.
+
+    Computed on first use and stored on `enum_values`.
+    """
+    resolved_labels = enum_values._resolved_labels
+    if resolved_labels is not None:
+        return resolved_labels
+
+    # Sanitize values to prevent breaking the Prometheus text format
+    # (e.g. U+2028 Line Separator in label values)
+    resolved_label_values = {
+        label: _sanitize_prometheus_label_value(value)
+        for label, value in enum_values.model_dump().items()
+    }
+
+    custom_label_values: Dict[str, Optional[str]] = {}
     if enum_values.custom_metadata_labels is not None:
         for key, value in enum_values.custom_metadata_labels.items():
-            # check sanitized key
-            sanitized_key = _sanitize_prometheus_label_name(key)
-            if sanitized_key in supported_enum_labels:
-                filtered_labels[sanitized_key] = _sanitize_prometheus_label_value(value)
+            custom_label_values[
+                _sanitize_prometheus_label_name(key)
+            ] = _sanitize_prometheus_label_value(value)
 
     # Add custom tags if configured
     if enum_values.tags is not None:
-        custom_tag_labels = get_custom_labels_from_tags(enum_values.tags)
-        for key, value in custom_tag_labels.items():
-            if key in supported_enum_labels:
-                filtered_labels[key] = _sanitize_prometheus_label_value(value)
+        for key, value in get_custom_labels_from_tags(enum_values.tags).items():
+            custom_label_values[key] = _sanitize_prometheus_label_value(value)
 
-    for label in supported_enum_labels:
-        if label not in filtered_labels:
-            filtered_labels[label] = None
-
-    return filtered_labels
+    resolved_label_values.update(custom_label_values)
+    resolved_labels = (resolved_label_values, frozenset(custom_label_values))
+    enum_values._resolved_labels = resolved_labels
+    return resolved_labels
 
 
 def get_custom_labels_from_metadata(metadata: dict) -> Dict[str, str]:
@@ -0,0 +1,54 @@
+"""
+Prometheus collector for per-deployment connection pools.
+
+Reads the pools registered on `connection_pool_manager` at scrape time, so the
+request hot path doesn't update any metrics.
+"""
+
+from typing import Iterator
+
+from litellm.llms.custom_httpx.connection_pool_manager import connection_pool_manager
+
+_collector_registered = False
+
+
+class ConnectionPoolCollector:
+    def collect(self) -> Iterator:
+        from prometheus_client.core import GaugeMetricFamily
+
+        gauges = {
+            "active": GaugeMetricFamily(
+                "litellm_deployment_connection_pool_active_connections",
+                "Connections in the deployment's pool serving a request",
+                labels=["api_base"],
+            ),
+            "idle": GaugeMetricFamily(
+                "litellm_deployment_connection_pool_idle_connections",
+                "Keepalive connections in the deployment's pool waiting for a request",
+                labels=["api_base"],
+            ),
+            "waiting": GaugeMetricFamily(
+                "litellm_deployment_connection_pool_waiting_requests",
+                "Requests waiting for a free connection in the deployment's pool",
+                labels=["api_base"],
+            ),
+        }
+
+        for api_base, stats in connection_pool_manager.get_pool_stats().items():
+            for stat_name, metric in gauges.items():
+                metric.add_metric([api_base], stats[stat_name])
+
+        yield from gauges.values()
+
+
+def register_connection_pool_collector() -> None:
+    """
+    Register the collector on the default prometheus registry (once per process).
+    """
+    global _collector_registered
+    if _collector_registered:
+        return
+    from prometheus_client import REGISTRY
+
+    REGISTRY.register(ConnectionPoolCollector())  # type: ignore
+    _collector_registered = True
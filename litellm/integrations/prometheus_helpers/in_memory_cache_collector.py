@@ -0,0 +1,80 @@
+"""
+Prometheus collector for LRUInMemoryCache counters.
+
+Reads the counters of every named `LRUInMemoryCache` at scrape time, so the
+cache hot path only increments plain integers.
+"""
+
+from typing import Iterator
+
+from litellm.caching.lru_in_memory_cache import get_registered_lru_caches
+
+_collector_registered = False
+
+
+class InMemoryCacheCollector:
+    def collect(self) -> Iterator:
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        counters = {
+            "hits": CounterMetricFamily(
+                "litellm_in_memory_cache_hits",
+                "Total in-memory cache hits",
+                labels=["cache_name"],
+            ),
+            "misses": CounterMetricFamily(
+                "litellm_in_memory_cache_misses",
+                "Total in-memory cache misses",
+                labels=["cache_name"],
+            ),
+            "evictions": CounterMetricFamily(
+                "litellm_in_memory_cache_evictions",
+                "Total items evicted from the in-memory cache to stay within size/memory limits",
+                labels=["cache_name"],
+            ),
+            "expirations": CounterMetricFamily(
+                "litellm_in_memory_cache_expirations",
+                "Total expired items removed from the in-memory cache",
+                labels=["cache_name"],
+            ),
+            "rejected_admissions": CounterMetricFamily(
+                "litellm_in_memory_cache_rejected_admissions",
+                "Total new items rejected by the TinyLFU admission policy",
+                labels=["cache_name"],
+            ),
+        }
+        gauges = {
+            "items": GaugeMetricFamily(
+                "litellm_in_memory_cache_items",
+                "Number of items in the in-memory cache",
+                labels=["cache_name"],
+            ),
+            "memory_bytes": GaugeMetricFamily(
+                "litellm_in_memory_cache_memory_bytes",
+                "Estimated bytes held by the in-memory cache",
+                labels=["cache_name"],
+            ),
+        }
+
+        for cache_name, cache in get_registered_lru_caches().items():
+            stats = cache.get_stats()
+            for stat_name, metric in counters.items():
+                metric.add_metric([cache_name], stats[stat_name])
+            for stat_name, metric in gauges.items():
+                metric.add_metric([cache_name], stats[stat_name])
+
+        yield from counters.values()
+        yield from gauges.values()
+
+
+def register_in_memory_cache_collector() -> None:
+    """
+    Register the collector on the default prometheus registry (once per process).
+    """
+    global _collector_registered
+    if _collector_registered:
+        return
+    from prometheus_client import REGISTRY
+
+    REGISTRY.register(InMemoryCacheCollector())  # type: ignore
+    _collector_registered = True
@@ -0,0 +1,64 @@
+"""
+Cache the children returned by `metric.labels(...)`.
+
+`labels()` validates and stringifies every label value and takes the metric's lock
+on each call. The same label values repeat across requests (same key, team, model),
+so `CachedLabelsMetric` keeps the bound child per label-value tuple in a bounded LRU
+and returns it directly on the next call.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from litellm.constants import PROMETHEUS_LABEL_HANDLE_CACHE_SIZE
+
+
+class CachedLabelsMetric:
+    """
+    Wraps a prometheus_client Counter / Gauge / Histogram.
+
+    `labels(...)` returns a cached child, everything else is forwarded to the metric.
+    """
+
+    def __init__(self, metric: Any, max_size: int = PROMETHEUS_LABEL_HANDLE_CACHE_SIZE):
+        self._metric = metric
+        self._max_size = max_size
+        self._children: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def labels(self, *labelvalues: Any, **labelkwargs: Any) -> Any:
+        key = (labelvalues, tuple(labelkwargs.items()))
+        try:
+            child = self._children[key]
+        except KeyError:
+            child = None
+        except TypeError:  # unhashable label value
+            return self._metric.labels(*labelvalues, **labelkwargs)
+
+        if child is not None:
+            try:
+                self._children.move_to_end(key)
+            except KeyError:  # evicted by another thread
+                pass
+            return child
+
+        child = self._metric.labels(*labelvalues, **labelkwargs)
+        self._children[key] = child
+        while len(self._children) > self._max_size:
+            try:
+                self._children.popitem(last=False)
+            except KeyError:
+                break
+        return child
+
+    def remove(self, *labelvalues: Any) -> None:
+        self._children.clear()
+        self._metric.remove(*labelvalues)
+
+    def clear(self) -> None:
+        self._children.clear()
+        self._metric.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_metric":  # not initialized yet, e.g. while unpickling
+            raise AttributeError(name)
+        return getattr(self._metric, name)
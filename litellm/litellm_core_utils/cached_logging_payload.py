@@ -0,0 +1,118 @@
+"""
+StandardLoggingPayload that caches its JSON encoding.
+
+`get_standard_logging_object_payload` builds the payload once per request and every
+callback receives the same object. Loggers that ship the whole payload serialize it with
+`dumps_logging_payload`, so it's encoded once - with orjson, when installed - no matter
+how many of them are enabled.
+"""
+
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+
+try:
+    import orjson
+except ImportError:  # orjson is installed with the proxy extras
+    orjson = None  # type: ignore
+
+
+def _orjson_default(obj: Any) -> Any:
+    # same output as safe_dumps - e.g. datetimes as str(), not ISO 8601
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _encode(payload: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload, default=_orjson_default, option=_ORJSON_OPTIONS
+            )
+        except TypeError:
+            # e.g. circular references or non-str keys - safe_dumps handles these
+            pass
+    return safe_dumps(payload).encode("utf-8")
+
+
+class CachedJSONLoggingPayload(dict):
+    """
+    dict that caches its compact JSON encoding.
+
+    Setting or deleting a top-level key drops the cached encoding. Nested values must not
+    be changed in place once the payload is encoded - the cached encoding doesn't see the
+    change. Reassign the top-level key instead.
+    """
+
+    _json_bytes: Optional[bytes] = None
+    _json_str: Optional[str] = None
+
+    def json_bytes(self) -> bytes:
+        if self._json_bytes is None:
+            self._json_bytes = _encode(self)
+        return self._json_bytes
+
+    def json_str(self) -> str:
+        if self._json_str is None:
+            self._json_str = self.json_bytes().decode("utf-8")
+        return self._json_str
+
+    def _invalidate(self) -> None:
+        self._json_bytes = None
+        self._json_str = None
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._invalidate()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._invalidate()
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "CachedJSONLoggingPayload":  # type: ignore[override]
+        self._invalidate()
+        return super().__ior__(other)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._invalidate()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._invalidate()
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        self._invalidate()
+        return super().pop(*args)
+
+    def popitem(self) -> Any:
+        self._invalidate()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def __copy__(self) -> "CachedJSONLoggingPayload":
+        return type(self)(self)
+
+
+def dumps_logging_payload(payload: Any) -> str:
+    """
+    JSON of a logging payload - the cached encoding of a `CachedJSONLoggingPayload`.
+    """
+    if isinstance(payload, CachedJSONLoggingPayload):
+        return payload.json_str()
+    return safe_dumps(payload)
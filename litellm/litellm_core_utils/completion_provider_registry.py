@@ -0,0 +1,263 @@
+"""
+Registry of providers whose `litellm.completion` call is:
+1. resolve api_key / api_base (and headers)
+2. load the provider's `get_config()` defaults, if any
+3. call `base_llm_http_handler.completion` with the provider's chat config
+
+`completion` finds these providers with one dict lookup, instead of walking the
+`custom_llm_provider == ...` chain. Credentials are still resolved on every call, so
+changes to `litellm.api_key` / env vars at runtime are picked up as before.
+
+This covers a subset of providers only - the ones served by `base_llm_http_handler`
+with the provider's default chat config and needing nothing beyond api_key /
+api_base / headers. Everything else keeps its branch in `completion`, including:
+- providers with their own handler (openai + `openai_compatible_providers`, azure,
+  anthropic, bedrock, vertex_ai, gemini, ...)
+- extra per-deployment credentials (organization, api_version, AWS / GCP credentials)
+- providers matched by model name as well (ovhcloud, snowflake, petals, ...) or
+  called with a non-default config / arguments (lemonade, triton, gradient_ai, ...)
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, NamedTuple, Optional, Type
+
+import litellm
+from litellm.llms.base_llm.chat.transformation import BaseConfig
+from litellm.llms.groq.chat.transformation import GroqChatConfig
+from litellm.secret_managers.main import get_secret_str
+
+
+class ProviderCredentials(NamedTuple):
+    api_key: Optional[str]
+    api_base: Optional[str]
+    headers: Optional[dict]
+
+
+def _passthrough_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    # api_key / api_base already resolved by `get_llm_provider`
+    return ProviderCredentials(api_key=api_key, api_base=api_base, headers=headers)
+
+
+def _gigachat_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key
+        or litellm.api_key
+        or litellm.gigachat_key
+        or get_secret_str("GIGACHAT_API_KEY")
+        or get_secret_str("GIGACHAT_CREDENTIALS"),
+        api_base=api_base,
+        headers=headers or litellm.headers or {},
+    )
+
+
+def _huggingface_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key
+        or litellm.huggingface_key
+        or os.environ.get("HF_TOKEN")
+        or os.environ.get("HUGGINGFACE_API_KEY")
+        or litellm.api_key,
+        api_base=api_base,
+        headers=headers or litellm.headers,
+    )
+
+
+def _compactifai_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key or get_secret_str("COMPACTIFAI_API_KEY") or litellm.api_key,
+        api_base=api_base or "https://api.compactif.ai/v1",
+        headers=headers,
+    )
+
+
+def _bytez_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key
+        or litellm.bytez_key
+        or get_secret_str("BYTEZ_API_KEY")
+        or litellm.api_key,
+        api_base=api_base,
+        headers=headers,
+    )
+
+
+def _ollama_headers(api_key: Optional[str], headers: Optional[dict]) -> dict:
+    headers = headers or {}
+    if api_key is not None and "Authorization" not in headers:
+        headers["Authorization"] = f"Bearer {api_key}"
+    return headers
+
+
+def _ollama_api_base(api_base: Optional[str]) -> str:
+    # litellm.api_base wins over the deployment's api_base for ollama
+    return (
+        litellm.api_base
+        or api_base
+        or get_secret_str("OLLAMA_API_BASE")
+        or "http://localhost:11434"
+    )
+
+
+def _ollama_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key,
+        api_base=_ollama_api_base(api_base),
+        headers=_ollama_headers(api_key, headers),
+    )
+
+
+def _ollama_chat_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    api_key = (
+        api_key
+        or litellm.ollama_key
+        or os.environ.get("OLLAMA_API_KEY")
+        or litellm.api_key
+    )
+    return ProviderCredentials(
+        api_key=api_key,
+        api_base=_ollama_api_base(api_base),
+        headers=_ollama_headers(api_key, headers),
+    )
+
+
+def _groq_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key
+        or litellm.api_key
+        or litellm.groq_key
+        or get_secret_str("GROQ_API_KEY"),
+        api_base=api_base
+        or litellm.api_base
+        or get_secret_str("GROQ_API_BASE")
+        or "https://api.groq.com/openai/v1",
+        headers=headers or litellm.headers,
+    )
+
+
+def _mistral_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key or litellm.api_key or get_secret_str("MISTRAL_API_KEY"),
+        api_base=api_base
+        or litellm.api_base
+        or get_secret_str("MISTRAL_API_BASE")
+        or "https://api.mistral.ai/v1",
+        headers=headers,
+    )
+
+
+def _cometapi_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key
+        or litellm.cometapi_key
+        or get_secret_str("COMETAPI_KEY")
+        or litellm.api_key,
+        api_base=api_base
+        or litellm.api_base
+        or get_secret_str("COMETAPI_API_BASE")
+        or "https://api.cometapi.com/v1",
+        headers=headers,
+    )
+
+
+def _minimax_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key or get_secret_str("MINIMAX_API_KEY") or litellm.api_key,
+        api_base=api_base
+        or litellm.api_base
+        or get_secret_str("MINIMAX_API_BASE")
+        or "https://api.minimax.io/v1",
+        headers=headers,
+    )
+
+
+def _hosted_vllm_credentials(
+    api_key: Optional[str], api_base: Optional[str], headers: Optional[dict]
+) -> ProviderCredentials:
+    return ProviderCredentials(
+        api_key=api_key,
+        api_base=api_base
+        or litellm.api_base
+        or get_secret_str("HOSTED_VLLM_API_BASE"),
+        headers=headers,
+    )
+
+
+@dataclass(frozen=True)
+class CompletionProviderRoute:
+    resolve_credentials: Callable[
+        [Optional[str], Optional[str], Optional[dict]], ProviderCredentials
+    ]
+    # config whose `get_config()` defaults are merged into optional_params
+    default_params_config: Optional[Type[BaseConfig]] = None
+    # log the response with `logging.post_call` once the call returns
+    post_call_on_success: bool = False
+
+
+_COMPLETION_PROVIDER_ROUTES: Dict[str, CompletionProviderRoute] = {
+    "deepseek": CompletionProviderRoute(resolve_credentials=_passthrough_credentials),
+    "fireworks_ai": CompletionProviderRoute(
+        resolve_credentials=_passthrough_credentials
+    ),
+    "heroku": CompletionProviderRoute(resolve_credentials=_passthrough_credentials),
+    "ragflow": CompletionProviderRoute(resolve_credentials=_passthrough_credentials),
+    "xai": CompletionProviderRoute(resolve_credentials=_passthrough_credentials),
+    "groq": CompletionProviderRoute(
+        resolve_credentials=_groq_credentials,
+        default_params_config=GroqChatConfig,
+    ),
+    "mistral": CompletionProviderRoute(resolve_credentials=_mistral_credentials),
+    "cometapi": CompletionProviderRoute(
+        resolve_credentials=_cometapi_credentials, post_call_on_success=True
+    ),
+    "minimax": CompletionProviderRoute(
+        resolve_credentials=_minimax_credentials, post_call_on_success=True
+    ),
+    "hosted_vllm": CompletionProviderRoute(
+        resolve_credentials=_hosted_vllm_credentials, post_call_on_success=True
+    ),
+    "gigachat": CompletionProviderRoute(resolve_credentials=_gigachat_credentials),
+    "huggingface": CompletionProviderRoute(
+        resolve_credentials=_huggingface_credentials
+    ),
+    "oci": CompletionProviderRoute(resolve_credentials=_passthrough_credentials),
+    "compactifai": CompletionProviderRoute(
+        resolve_credentials=_compactifai_credentials
+    ),
+    "datarobot": CompletionProviderRoute(resolve_credentials=_passthrough_credentials),
+    "bytez": CompletionProviderRoute(resolve_credentials=_bytez_credentials),
+    "ollama": CompletionProviderRoute(resolve_credentials=_ollama_credentials),
+    "ollama_chat": CompletionProviderRoute(
+        resolve_credentials=_ollama_chat_credentials
+    ),
+}
+
+
+def get_completion_provider_route(
+    custom_llm_provider: Optional[str],
+) -> Optional[CompletionProviderRoute]:
+    if custom_llm_provider is None:
+        return None
+    return _COMPLETION_PROVIDER_ROUTES.get(custom_llm_provider)
@@ -89,6 +89,7 @@ def get_litellm_params(
     async_call: Optional[bool] = None,
     ssl_verify: Optional[bool] = None,
     merge_reasoning_content_in_choices: Optional[bool] = None,
+    raw_sse_passthrough: Optional[bool] = None,
     use_litellm_proxy: Optional[bool] = None,
     api_version: Optional[str] = None,
     max_retries: Optional[int] = None,
@@ -141,6 +142,7 @@ def get_litellm_params(
         "async_call": async_call,
         "ssl_verify": ssl_verify,
         "merge_reasoning_content_in_choices": merge_reasoning_content_in_choices,
+        "raw_sse_passthrough": raw_sse_passthrough,
         "api_version": api_version,
         "max_retries": max_retries,
         "use_litellm_proxy": use_litellm_proxy,
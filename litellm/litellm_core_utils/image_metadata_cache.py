@@ -0,0 +1,448 @@
+"""
+Image dimension cache, shared by token counting and prompt conversion.
+
+- dimensions are parsed from the image header: base64 images are only partially decoded,
+  URLs are streamed until the header is complete
+- keyed by a hash of the URL, bounded LRU
+- concurrent lookups of the same image share one fetch, fetches are bounded per process
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import struct
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_IMAGE_HEIGHT,
+    DEFAULT_IMAGE_WIDTH,
+    IMAGE_FETCH_MAX_CONCURRENCY,
+    IMAGE_HEADER_MAX_BYTES,
+    IMAGE_METADATA_CACHE_SIZE,
+)
+
+ImageDimensions = Tuple[int, int]
+
+T = TypeVar("T")
+
+_BASE64_HEADER_CHARS = 4096  # first read of a data URI, ~3KB decoded
+
+
+def get_image_type(image_data: Union[bytes, bytearray]) -> Union[str, None]:
+    """take an image (really only the first ~100 bytes max are needed)
+    and return 'png' 'gif' 'jpeg' 'webp' 'heic' or None. method added to
+    allow deprecation of imghdr in 3.13"""
+
+    if image_data[0:8] == b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a":
+        return "png"
+
+    if image_data[0:4] == b"GIF8" and image_data[5:6] == b"a":
+        return "gif"
+
+    if image_data[0:3] == b"\xff\xd8\xff":
+        return "jpeg"
+
+    if image_data[4:8] == b"ftyp":
+        return "heic"
+
+    if image_data[0:4] == b"RIFF" and image_data[8:12] == b"WEBP":
+        return "webp"
+
+    return None
+
+
+def _parse_jpeg_dimensions(image_data: Union[bytes, bytearray]) -> Optional[ImageDimensions]:
+    """
+    Walk the JPEG segments up to the first start-of-frame marker.
+
+    Returns None if the data ends before it.
+    """
+    index = 2
+    data_length = len(image_data)
+    while index < data_length:
+        if image_data[index] != 0xFF:
+            return None
+        while index < data_length and image_data[index] == 0xFF:
+            index += 1
+        if index + 3 > data_length:
+            return None
+        marker = image_data[index]
+        segment_length = struct.unpack(">H", image_data[index + 1 : index + 3])[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if index + 8 > data_length:
+                return None
+            h, w = struct.unpack(">HH", image_data[index + 4 : index + 8])
+            return w, h
+        index += 1 + segment_length
+    return None
+
+
+def parse_image_dimensions(
+    image_header: Union[bytes, bytearray],
+) -> Optional[ImageDimensions]:
+    """
+    Parse the width and height from the first bytes of a png / gif / jpeg / webp image.
+
+    Returns None if the format is unsupported or the header is incomplete.
+    """
+    img_type = get_image_type(image_header)
+    try:
+        if img_type == "png" and len(image_header) >= 24:
+            w, h = struct.unpack(">LL", image_header[16:24])
+            return w, h
+        elif img_type == "gif" and len(image_header) >= 10:
+            w, h = struct.unpack("<HH", image_header[6:10])
+            return w, h
+        elif img_type == "jpeg":
+            return _parse_jpeg_dimensions(image_header)
+        elif img_type == "webp" and len(image_header) >= 30:
+            # For WebP, the dimensions are stored at different offsets depending on the format
+            # Check for VP8X (extended format)
+            if image_header[12:16] == b"VP8X":
+                w = struct.unpack("<I", image_header[24:27] + b"\x00")[0] + 1
+                h = struct.unpack("<I", image_header[27:30] + b"\x00")[0] + 1
+                return w, h
+            # Check for VP8 (lossy format)
+            elif image_header[12:16] == b"VP8 ":
+                w = struct.unpack("<H", image_header[26:28])[0] & 0x3FFF
+                h = struct.unpack("<H", image_header[28:30])[0] & 0x3FFF
+                return w, h
+            # Check for VP8L (lossless format)
+            elif image_header[12:16] == b"VP8L":
+                bits = struct.unpack("<I", image_header[21:25])[0]
+                w = (bits & 0x3FFF) + 1
+                h = ((bits >> 14) & 0x3FFF) + 1
+                return w, h
+    except struct.error:
+        return None
+    return None
+
+
+def _is_header_complete(image_header: Union[bytes, bytearray]) -> bool:
+    """
+    True once the dimensions can be parsed, or reading more bytes won't help.
+    """
+    if len(image_header) >= IMAGE_HEADER_MAX_BYTES:
+        return True
+    if len(image_header) >= 16 and get_image_type(image_header) is None:
+        return True  # unsupported format
+    return parse_image_dimensions(image_header) is not None
+
+
+def _get_dimensions_from_data_uri(data: str) -> ImageDimensions:
+    """
+    Decode only as much of a base64 data URI as is needed for its dimensions.
+    """
+    _header, encoded = data.split(",", 1)
+    num_chars = _BASE64_HEADER_CHARS
+    while True:
+        if num_chars >= len(encoded):
+            image_header = base64.b64decode(encoded)
+        else:
+            try:
+                image_header = base64.b64decode(encoded[:num_chars])
+            except binascii.Error:  # e.g. line breaks shifted the padding
+                num_chars = len(encoded)
+                continue
+        if num_chars >= len(encoded) or _is_header_complete(image_header):
+            break
+        num_chars *= 4
+    return parse_image_dimensions(image_header) or (
+        DEFAULT_IMAGE_WIDTH,
+        DEFAULT_IMAGE_HEIGHT,
+    )
+
+
+class _AsyncInFlightRequests:
+    """
+    Concurrent calls with the same key await the same task.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, "asyncio.Task[Any]"] = {}
+
+    async def run(self, key: str, coroutine_factory: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(coroutine_factory())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._remove_task(key, done))
+        # a cancelled caller must not cancel the fetch for the other callers
+        return await asyncio.shield(task)
+
+    def _remove_task(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+
+class ImageMetadataCache:
+    """
+    Bounded LRU of image dimensions, keyed by a hash of the image URL.
+    """
+
+    def __init__(
+        self,
+        max_size: int = IMAGE_METADATA_CACHE_SIZE,
+        max_concurrent_fetches: int = IMAGE_FETCH_MAX_CONCURRENCY,
+    ):
+        self.max_size = max_size
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self._dimensions: "OrderedDict[str, ImageDimensions]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, "Future[ImageDimensions]"] = {}
+        self.async_in_flight = _AsyncInFlightRequests()
+        self._fetch_semaphore = threading.BoundedSemaphore(max_concurrent_fetches)
+        self._async_fetch_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+
+    @staticmethod
+    def get_cache_key(data: str) -> str:
+        return hashlib.blake2b(
+            data.encode("utf-8", "surrogatepass"), digest_size=16
+        ).hexdigest()
+
+    def get_cached_dimensions(self, data: str) -> Optional[ImageDimensions]:
+        return self._get(self.get_cache_key(data))
+
+    def _get(self, key: str) -> Optional[ImageDimensions]:
+        with self._lock:
+            dimensions = self._dimensions.get(key)
+            if dimensions is None:
+                self.misses += 1
+                return None
+            self._dimensions.move_to_end(key)
+            self.hits += 1
+            return dimensions
+
+    def _set(self, key: str, dimensions: ImageDimensions) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._dimensions[key] = dimensions
+            self._dimensions.move_to_end(key)
+            while len(self._dimensions) > self.max_size:
+                self._dimensions.popitem(last=False)
+
+    def set_image_bytes(self, data: str, image_bytes: Union[bytes, bytearray]) -> None:
+        """
+        Record the dimensions of an image that was downloaded anyway (e.g. for prompt conversion).
+        """
+        dimensions = parse_image_dimensions(image_bytes)
+        if dimensions is not None:
+            self._set(self.get_cache_key(data), dimensions)
+
+    def fetch_limit(self) -> threading.BoundedSemaphore:
+        """
+        Bounds concurrent image downloads across threads.
+        """
+        return self._fetch_semaphore
+
+    def async_fetch_limit(self) -> asyncio.Semaphore:
+        """
+        Bounds concurrent image downloads on the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_fetch_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+            self._async_fetch_semaphores[loop] = semaphore
+        return semaphore
+
+    def get_dimensions(self, data: str) -> ImageDimensions:
+        """
+        Get the dimensions of an image from a URL or base64 encoded string.
+
+        Threads asking for the same uncached image wait for a single fetch.
+        Data URIs aren't cached - decoding their header is cheaper than hashing them.
+        """
+        if data.startswith("data:"):
+            return _get_dimensions_from_data_uri(data)
+        key = self.get_cache_key(data)
+        dimensions = self._get(key)
+        if dimensions is not None:
+            return dimensions
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+        if not is_owner:
+            return future.result()
+
+        try:
+            resolved_dimensions = self._resolve_dimensions(data)
+            if resolved_dimensions is not None:
+                self._set(key, resolved_dimensions)
+            dimensions = resolved_dimensions or (
+                DEFAULT_IMAGE_WIDTH,
+                DEFAULT_IMAGE_HEIGHT,
+            )
+            future.set_result(dimensions)
+            return dimensions
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    async def async_get_dimensions(self, data: str) -> ImageDimensions:
+        """
+        Async version of `get_dimensions` - URLs are fetched with the async client.
+        """
+        if data.startswith("data:"):
+            return _get_dimensions_from_data_uri(data)
+        key = self.get_cache_key(data)
+        dimensions = self._get(key)
+        if dimensions is not None:
+            return dimensions
+
+        async def _resolve() -> ImageDimensions:
+            dimensions = await self._async_resolve_dimensions(data)
+            if dimensions is None:
+                return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+            self._set(key, dimensions)
+            return dimensions
+
+        return await self.async_in_flight.run(key, _resolve)
+
+    def _resolve_dimensions(self, data: str) -> Optional[ImageDimensions]:
+        """
+        None if the image couldn't be fetched or parsed - the default dimensions are used,
+        but not cached.
+        """
+        from litellm.llms.custom_httpx.http_handler import _get_httpx_client
+
+        image_header = bytearray()
+        with self.fetch_limit():
+            self.fetches += 1
+            client = _get_httpx_client()
+            with client.client.stream("GET", data, follow_redirects=True) as response:
+                if response.status_code != 200:
+                    return None
+                for chunk in response.iter_bytes():
+                    image_header.extend(chunk)
+                    if _is_header_complete(image_header):
+                        break
+        return self._parse_fetched_dimensions(data, image_header)
+
+    async def _async_resolve_dimensions(self, data: str) -> Optional[ImageDimensions]:
+
+        import litellm
+
+        image_header = bytearray()
+        async with self.async_fetch_limit():
+            self.fetches += 1
+            client = litellm.module_level_aclient
+            async with client.client.stream(
+                "GET", data, follow_redirects=True
+            ) as response:
+                if response.status_code != 200:
+                    return None
+                async for chunk in response.aiter_bytes():
+                    image_header.extend(chunk)
+                    if _is_header_complete(image_header):
+                        break
+        return self._parse_fetched_dimensions(data, image_header)
+
+    @staticmethod
+    def _parse_fetched_dimensions(
+        url: str, image_header: Union[bytes, bytearray]
+    ) -> Optional[ImageDimensions]:
+        """
+        None if the fetched header couldn't be parsed - the caller falls back to the
+        default dimensions, but doesn't cache them.
+        """
+        dimensions = parse_image_dimensions(image_header)
+        if dimensions is None:
+            verbose_logger.debug(
+                "Unable to get image dimensions, using defaults. url=%s", url
+            )
+        return dimensions
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dimensions.clear()
+            self.hits = 0
+            self.misses = 0
+            self.fetches = 0
+
+
+image_metadata_cache = ImageMetadataCache()
+
+
+def _get_high_detail_image_urls(messages: Iterable[Any]) -> List[str]:
+    image_urls: List[str] = []
+    seen: Set[str] = set()
+    for message in messages:
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, list):
+            continue
+        for content_block in content:
+            if not isinstance(content_block, dict):
+                continue
+            image_url = content_block.get("image_url")
+            if (
+                isinstance(image_url, dict)
+                and image_url.get("detail") == "high"
+                and isinstance(image_url.get("url"), str)
+                and image_url["url"] not in seen
+            ):
+                seen.add(image_url["url"])
+                image_urls.append(image_url["url"])
+    return image_urls
+
+
+async def async_prefetch_image_dimensions(messages: Optional[Iterable[Any]]) -> None:
+    """
+    Resolve the dimensions of all high-detail images in `messages` concurrently, so
+    that a following (sync) `token_counter` call doesn't block the event loop on downloads.
+
+    Best effort - errors are left for the token counter to handle.
+    """
+    if not messages:
+        return
+    image_urls = [
+        url
+        for url in _get_high_detail_image_urls(messages)
+        if not url.startswith("data:")
+        and image_metadata_cache.get_cached_dimensions(url) is None
+    ]
+    if not image_urls:
+        return
+    results = await asyncio.gather(
+        *(image_metadata_cache.async_get_dimensions(url) for url in image_urls),
+        return_exceptions=True,
+    )
+    for url, result in zip(image_urls, results):
+        if isinstance(result, BaseException):
+            verbose_logger.debug(
+                "Failed to prefetch image dimensions for url=%s: %s", url[:100], result
+            )
@@ -1,6 +1,8 @@
 # What is this?
 ## Common Utility file for Logging handler
 # Logging function -> log the exact model details + what's being sent | Non-Blocking
+import asyncio
+import contextvars
 import copy
 import datetime
 import json
@@ -11,7 +13,7 @@ import sys
 import time
 import traceback
 from datetime import datetime as dt_object
-from functools import lru_cache
+from functools import lru_cache, partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -44,6 +46,7 @@ from litellm.caching.caching_handler import LLMCachingHandler
 from litellm.constants import (
     DEFAULT_MOCK_RESPONSE_COMPLETION_TOKEN_COUNT,
     DEFAULT_MOCK_RESPONSE_PROMPT_TOKEN_COUNT,
+    LOGGING_WORKER_OFFLOAD_PAYLOAD_BUILD,
     SENTRY_DENYLIST,
     SENTRY_PII_DENYLIST,
 )
@@ -59,11 +62,13 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.integrations.deepeval.deepeval import DeepEvalLogger
 from litellm.integrations.mlflow import MlflowLogger
 from litellm.integrations.sqs import SQSLogger
+from litellm.litellm_core_utils.cached_logging_payload import CachedJSONLoggingPayload
 from litellm.litellm_core_utils.core_helpers import reconstruct_model_name
 from litellm.litellm_core_utils.get_litellm_params import get_litellm_params
 from litellm.litellm_core_utils.llm_cost_calc.tool_call_cost_tracking import (
     StandardBuiltInToolCostTracking,
 )
+from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
 from litellm.litellm_core_utils.model_param_helper import ModelParamHelper
 from litellm.litellm_core_utils.redact_messages import (
     redact_message_input_output_from_custom_logger,
@@ -207,6 +212,29 @@ _STANDARD_LOGGING_METADATA_KEYS: frozenset = frozenset(
     StandardLoggingMetadata.__annotations__.keys()
 )
 
+# Callbacks that keep running inline when the LoggingWorker is sharded - a full shard
+# drops logs, and these carry spend, budget and rate limit state.
+# (module, class) pairs - a class is only checked once its module is loaded, since
+# no instance of it can exist before that.
+_UNSHARDED_CALLBACK_CLASSES: Tuple[Tuple[str, str], ...] = (
+    ("litellm.proxy.hooks.proxy_track_cost_callback", "_ProxyDBLogger"),
+    ("litellm._service_logger", "ServiceLogging"),
+    ("litellm.router_strategy.budget_limiter", "RouterBudgetLimiting"),
+    (
+        "litellm.proxy.hooks.parallel_request_limiter",
+        "_PROXY_MaxParallelRequestsHandler",
+    ),
+    (
+        "litellm.proxy.hooks.parallel_request_limiter_v3",
+        "_PROXY_MaxParallelRequestsHandler_v3",
+    ),
+    ("litellm.proxy.hooks.dynamic_rate_limiter_v3", "_PROXY_DynamicRateLimitHandlerV3"),
+)
+_UNSHARDED_ROUTER_CALLBACKS: Tuple[str, ...] = (
+    "deployment_callback_on_success",
+    "sync_deployment_callback_on_success",
+)
+
 ### GLOBAL VARIABLES ###
 
 # Cache custom pricing keys as frozenset for O(1) lookups instead of looping through 49 keys
@@ -2380,7 +2408,8 @@ class Logging(LiteLLMLoggingBaseClass):
                 result._hidden_params["batch_models"] = batch_models
                 result.usage = batch_usage
 
-        start_time, end_time, result = self._success_handler_helper_fn(
+        start_time, end_time, result = await self._run_logging_payload_build(
+            self._success_handler_helper_fn,
             start_time=start_time,
             end_time=end_time,
             result=result,
@@ -2419,8 +2448,9 @@ class Logging(LiteLLMLoggingBaseClass):
                     # base_model defaults to None if not set on model_info
                     self.model_call_details[
                         "response_cost"
-                    ] = self._response_cost_calculator(
-                        result=complete_streaming_response
+                    ] = await self._run_logging_payload_build(
+                        self._response_cost_calculator,
+                        result=complete_streaming_response,
                     )
 
                 verbose_logger.debug(
@@ -2435,7 +2465,8 @@ class Logging(LiteLLMLoggingBaseClass):
             ## STANDARDIZED LOGGING PAYLOAD
             self.model_call_details[
                 "standard_logging_object"
-            ] = get_standard_logging_object_payload(
+            ] = await self._run_logging_payload_build(
+                get_standard_logging_object_payload,
                 kwargs=self.model_call_details,
                 init_response_obj=complete_streaming_response,
                 start_time=start_time,
@@ -2536,135 +2567,171 @@ class Logging(LiteLLMLoggingBaseClass):
             )
             if not should_run:
                 continue
-            try:
-                if callback == "openmeter" and openMeterLogger is not None:
-                    if self.stream is True:
-                        if (
-                            "async_complete_streaming_response"
-                            in self.model_call_details
-                        ):
-                            await openMeterLogger.async_log_success_event(
-                                kwargs=self.model_call_details,
-                                response_obj=self.model_call_details[
-                                    "async_complete_streaming_response"
-                                ],
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
-                        else:
-                            await openMeterLogger.async_log_stream_event(  # [TODO]: move this to being an async log stream event function
-                                kwargs=self.model_call_details,
-                                response_obj=result,
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
-                    else:
+            if GLOBAL_LOGGING_WORKER.sharded and self._should_shard_callback(callback):
+                # each callback on its own queue - a slow callback doesn't delay the others
+                GLOBAL_LOGGING_WORKER.ensure_initialized_and_enqueue(
+                    async_coroutine=self._async_success_callback(
+                        callback=callback,
+                        result=result,
+                        start_time=start_time,
+                        end_time=end_time,
+                    ),
+                    shard=self._get_callback_name(callback),
+                )
+            else:
+                await self._async_success_callback(
+                    callback=callback,
+                    result=result,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+
+    async def _run_logging_payload_build(self, func: Callable, **kwargs) -> Any:
+        """
+        Run CPU-heavy logging work - response cost, standard logging payload - on the
+        thread pool if LOGGING_WORKER_OFFLOAD_PAYLOAD_BUILD is set, off the event loop.
+        """
+        if not LOGGING_WORKER_OFFLOAD_PAYLOAD_BUILD:
+            return func(**kwargs)
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, partial(context.run, func, **kwargs)
+        )
+
+    async def _async_success_callback(  # noqa: PLR0915
+        self, callback: Any, result: Any, start_time: Any, end_time: Any
+    ) -> None:
+        """
+        Run one async success callback. Errors are logged, never raised.
+        """
+        try:
+            if callback == "openmeter" and openMeterLogger is not None:
+                if self.stream is True:
+                    if (
+                        "async_complete_streaming_response"
+                        in self.model_call_details
+                    ):
                         await openMeterLogger.async_log_success_event(
+                            kwargs=self.model_call_details,
+                            response_obj=self.model_call_details[
+                                "async_complete_streaming_response"
+                            ],
+                            start_time=start_time,
+                            end_time=end_time,
+                        )
+                    else:
+                        await openMeterLogger.async_log_stream_event(  # [TODO]: move this to being an async log stream event function
                             kwargs=self.model_call_details,
                             response_obj=result,
                             start_time=start_time,
                             end_time=end_time,
                         )
-
-                if isinstance(callback, CustomLogger):  # custom logger class
-                    model_call_details: Dict = self.model_call_details
-                    ##################################
-                    # call redaction hook for custom logger
-                    model_call_details = callback.redact_standard_logging_payload_from_model_call_details(
-                        model_call_details=model_call_details
+                else:
+                    await openMeterLogger.async_log_success_event(
+                        kwargs=self.model_call_details,
+                        response_obj=result,
+                        start_time=start_time,
+                        end_time=end_time,
                     )
-                    ##################################
-                    if self.stream is True:
-                        if "async_complete_streaming_response" in model_call_details:
-                            await callback.async_log_success_event(
-                                kwargs=model_call_details,
-                                response_obj=model_call_details[
-                                    "async_complete_streaming_response"
-                                ],
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
-                        else:
-                            await callback.async_log_stream_event(  # [TODO]: move this to being an async log stream event function
-                                kwargs=model_call_details,
-                                response_obj=result,
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
-                    else:
+
+            if isinstance(callback, CustomLogger):  # custom logger class
+                model_call_details: Dict = self.model_call_details
+                ##################################
+                # call redaction hook for custom logger
+                model_call_details = callback.redact_standard_logging_payload_from_model_call_details(
+                    model_call_details=model_call_details
+                )
+                ##################################
+                if self.stream is True:
+                    if "async_complete_streaming_response" in model_call_details:
                         await callback.async_log_success_event(
                             kwargs=model_call_details,
-                            response_obj=result,
+                            response_obj=model_call_details[
+                                "async_complete_streaming_response"
+                            ],
                             start_time=start_time,
                             end_time=end_time,
                         )
-                if callable(callback):  # custom logger functions
-                    global customLogger
-                    if customLogger is None:
-                        customLogger = CustomLogger()
-                    if self.stream:
-                        if (
-                            "async_complete_streaming_response"
-                            in self.model_call_details
-                        ):
-                            await customLogger.async_log_event(
-                                kwargs=self.model_call_details,
-                                response_obj=self.model_call_details[
-                                    "async_complete_streaming_response"
-                                ],
-                                start_time=start_time,
-                                end_time=end_time,
-                                print_verbose=print_verbose,
-                                callback_func=callback,
-                            )
                     else:
+                        await callback.async_log_stream_event(  # [TODO]: move this to being an async log stream event function
+                            kwargs=model_call_details,
+                            response_obj=result,
+                            start_time=start_time,
+                            end_time=end_time,
+                        )
+                else:
+                    await callback.async_log_success_event(
+                        kwargs=model_call_details,
+                        response_obj=result,
+                        start_time=start_time,
+                        end_time=end_time,
+                    )
+            if callable(callback):  # custom logger functions
+                global customLogger
+                if customLogger is None:
+                    customLogger = CustomLogger()
+                if self.stream:
+                    if (
+                        "async_complete_streaming_response"
+                        in self.model_call_details
+                    ):
                         await customLogger.async_log_event(
                             kwargs=self.model_call_details,
-                            response_obj=result,
+                            response_obj=self.model_call_details[
+                                "async_complete_streaming_response"
+                            ],
                             start_time=start_time,
                             end_time=end_time,
                             print_verbose=print_verbose,
                             callback_func=callback,
                         )
-                if callback == "dynamodb":
-                    global dynamoLogger
-                    if dynamoLogger is None:
-                        dynamoLogger = DyanmoDBLogger()
-                    if self.stream:
-                        if (
-                            "async_complete_streaming_response"
-                            in self.model_call_details
-                        ):
-                            print_verbose(
-                                "DynamoDB Logger: Got Stream Event - Completed Stream Response"
-                            )
-                            await dynamoLogger._async_log_event(
-                                kwargs=self.model_call_details,
-                                response_obj=self.model_call_details[
-                                    "async_complete_streaming_response"
-                                ],
-                                start_time=start_time,
-                                end_time=end_time,
-                                print_verbose=print_verbose,
-                            )
-                        else:
-                            print_verbose(
-                                "DynamoDB Logger: Got Stream Event - No complete stream response as yet"
-                            )
-                    else:
+                else:
+                    await customLogger.async_log_event(
+                        kwargs=self.model_call_details,
+                        response_obj=result,
+                        start_time=start_time,
+                        end_time=end_time,
+                        print_verbose=print_verbose,
+                        callback_func=callback,
+                    )
+            if callback == "dynamodb":
+                global dynamoLogger
+                if dynamoLogger is None:
+                    dynamoLogger = DyanmoDBLogger()
+                if self.stream:
+                    if (
+                        "async_complete_streaming_response"
+                        in self.model_call_details
+                    ):
+                        print_verbose(
+                            "DynamoDB Logger: Got Stream Event - Completed Stream Response"
+                        )
                         await dynamoLogger._async_log_event(
                             kwargs=self.model_call_details,
-                            response_obj=result,
+                            response_obj=self.model_call_details[
+                                "async_complete_streaming_response"
+                            ],
                             start_time=start_time,
                             end_time=end_time,
                             print_verbose=print_verbose,
                         )
-            except Exception:
-                verbose_logger.error(
-                    f"LiteLLM.LoggingError: [Non-Blocking] Exception occurred while success logging {traceback.format_exc()}"
-                )
-                self._handle_callback_failure(callback=callback)
-                pass
+                    else:
+                        print_verbose(
+                            "DynamoDB Logger: Got Stream Event - No complete stream response as yet"
+                        )
+                else:
+                    await dynamoLogger._async_log_event(
+                        kwargs=self.model_call_details,
+                        response_obj=result,
+                        start_time=start_time,
+                        end_time=end_time,
+                        print_verbose=print_verbose,
+                    )
+        except Exception:
+            verbose_logger.error(
+                f"LiteLLM.LoggingError: [Non-Blocking] Exception occurred while success logging {traceback.format_exc()}"
+            )
+            self._handle_callback_failure(callback=callback)
 
     def _handle_callback_failure(self, callback: Any):
         """
@@ -3188,6 +3255,30 @@ class Logging(LiteLLMLoggingBaseClass):
         cb_name = self._get_callback_name(cb)
         return any(prefix in cb_name for prefix in INTERNAL_PREFIXES)
 
+    def _should_shard_callback(self, cb) -> bool:
+        """
+        Whether a callback can run on its own LoggingWorker shard, where its logs are
+        dropped once the shard is full.
+
+        Spend tracking (`_ProxyDBLogger`), budget / rate limiters, service logging and
+        the router's deployment callbacks keep running inline - see
+        `_UNSHARDED_CALLBACK_CLASSES`.
+        """
+        if isinstance(cb, str):
+            return True
+        for module_name, class_name in _UNSHARDED_CALLBACK_CLASSES:
+            module = sys.modules.get(module_name)
+            callback_class = getattr(module, class_name, None)
+            if callback_class is not None and isinstance(cb, callback_class):
+                return False
+        router_module = sys.modules.get("litellm.router")
+        if router_module is not None:
+            cb_func = getattr(cb, "__func__", None)
+            for method_name in _UNSHARDED_ROUTER_CALLBACKS:
+                if cb_func is getattr(router_module.Router, method_name):
+                    return False
+        return True
+
     def _remove_internal_custom_logger_callbacks(self, callbacks: List) -> List:
         """
         Removes internal custom logger callbacks from the list.
@@ -5234,7 +5325,8 @@ def get_standard_logging_object_payload(
 
         # emit_standard_logging_payload(payload) - Moved to success_handler to prevent double emitting
 
-        return payload
+        # shared by all callbacks - loggers reuse its cached JSON encoding
+        return cast(StandardLoggingPayload, CachedJSONLoggingPayload(payload))
     except Exception as e:
         verbose_logger.exception(
             "Error creating standard logging object - {}".format(str(e))
@@ -3,10 +3,12 @@
 
 import asyncio
 import contextvars
-from typing import Coroutine, Optional
+import time
+from typing import Any, Coroutine, Dict, List, Optional
 import atexit
 from typing_extensions import TypedDict
 
+import litellm
 from litellm._logging import verbose_logger
 from litellm.constants import (
     LOGGING_WORKER_CONCURRENCY,
@@ -14,9 +16,14 @@ from litellm.constants import (
     LOGGING_WORKER_MAX_TIME_PER_COROUTINE,
     LOGGING_WORKER_CLEAR_PERCENTAGE,
     LOGGING_WORKER_AGGRESSIVE_CLEAR_COOLDOWN_SECONDS,
+    LOGGING_WORKER_METRICS_INTERVAL_SECONDS,
+    LOGGING_WORKER_PER_CALLBACK_CONCURRENCY,
+    LOGGING_WORKER_PER_CALLBACK_MAX_QUEUE_SIZE,
+    LOGGING_WORKER_SHARDED,
     MAX_ITERATIONS_TO_CLEAR_QUEUE,
     MAX_TIME_TO_CLEAR_QUEUE,
 )
+from litellm.types.services import ServiceTypes
 
 
 class LoggingTask(TypedDict):
@@ -29,6 +36,30 @@ class LoggingTask(TypedDict):
     context: contextvars.Context
 
 
+class ShardedLoggingTask(LoggingTask):
+    enqueued_at: float  # time.monotonic()
+
+
+class LoggingShard:
+    """
+    The queue of one callback in a sharded LoggingWorker, with its own concurrency limit.
+    """
+
+    def __init__(self, name: str, max_queue_size: int, concurrency: int):
+        self.name = name
+        self.queue: asyncio.Queue[ShardedLoggingTask] = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self.sem = asyncio.Semaphore(concurrency)
+        self.worker_task: Optional[asyncio.Task] = None
+        self.running_tasks: set[asyncio.Task] = set()
+        self.processed = 0
+        self.dropped = 0
+        self.last_wait_time = 0.0
+        self.last_queue_depth_metric_time = 0.0
+        self.last_wait_time_metric_time = 0.0
+
+
 class LoggingWorker:
     """
     A simple, async logging worker that processes log coroutines in the background.
@@ -36,6 +67,11 @@ class LoggingWorker:
 
     This leads to a +200 RPS performance improvement when using LiteLLM Python SDK or Proxy Server.
     - Use this to queue coroutine tasks that are not critical to the main flow of the application. e.g Success/Error callbacks, logging, etc.
+
+    Sharded mode (`LOGGING_WORKER_SHARDED=true`): coroutines enqueued with a `shard` - the callback
+    name - run on that shard's own queue, with its own concurrency limit. A slow callback only fills
+    its own queue; once full, its new logs are dropped and counted instead of delaying other callbacks.
+    Queue depth, wait time and drops are emitted via `ServiceLogging` (e.g. `prometheus_system`).
     """
 
     def __init__(
@@ -43,10 +79,18 @@ class LoggingWorker:
         timeout: float = LOGGING_WORKER_MAX_TIME_PER_COROUTINE,
         max_queue_size: int = LOGGING_WORKER_MAX_QUEUE_SIZE,
         concurrency: int = LOGGING_WORKER_CONCURRENCY,
+        sharded: bool = LOGGING_WORKER_SHARDED,
+        per_shard_max_queue_size: int = LOGGING_WORKER_PER_CALLBACK_MAX_QUEUE_SIZE,
+        per_shard_concurrency: int = LOGGING_WORKER_PER_CALLBACK_CONCURRENCY,
     ):
         self.timeout = timeout
         self.max_queue_size = max_queue_size
         self.concurrency = concurrency
+        self.sharded = sharded
+        self.per_shard_max_queue_size = per_shard_max_queue_size
+        self.per_shard_concurrency = per_shard_concurrency
+        self._shards: Dict[str, LoggingShard] = {}
+        self._service_logger_obj: Optional[Any] = None
         self._queue: Optional[asyncio.Queue[LoggingTask]] = None
         self._worker_task: Optional[asyncio.Task] = None
         self._running_tasks: set[asyncio.Task] = set()
@@ -76,6 +120,7 @@ class LoggingWorker:
             self._sem = None
             self._worker_task = None
             self._running_tasks.clear()
+            self._shards = {}
 
         if self._queue is None:
             self._queue = asyncio.Queue(maxsize=self.max_queue_size)
@@ -135,11 +180,16 @@ class LoggingWorker:
             # Attempt to clear remaining items to prevent "never awaited" warnings
             await self.clear_queue()
 
-    def enqueue(self, coroutine: Coroutine) -> None:
+    def enqueue(self, coroutine: Coroutine, shard: Optional[str] = None) -> None:
         """
         Add a coroutine to the logging queue.
         Hot path: never blocks, aggressively clears queue if full.
+
+        In sharded mode, a coroutine with a `shard` goes to that shard's queue instead.
         """
+        if self.sharded and shard is not None:
+            self._enqueue_to_shard(coroutine=coroutine, shard_name=shard)
+            return
         if self._queue is None:
             return
 
@@ -153,6 +203,167 @@ class LoggingWorker:
             verbose_logger.exception("LoggingWorker queue is full")
             self._handle_queue_full(task)
 
+    def _get_shard(self, shard_name: str) -> Optional[LoggingShard]:
+        """Get or create the shard and start its worker loop. None if no event loop is running."""
+        self._ensure_queue()
+        if self._queue is None:
+            return None
+        shard = self._shards.get(shard_name)
+        if shard is None:
+            shard = LoggingShard(
+                name=shard_name,
+                max_queue_size=self.per_shard_max_queue_size,
+                concurrency=self.per_shard_concurrency,
+            )
+            self._shards[shard_name] = shard
+        if shard.worker_task is None or shard.worker_task.done():
+            shard.worker_task = asyncio.create_task(self._shard_worker_loop(shard))
+        return shard
+
+    def _enqueue_to_shard(self, coroutine: Coroutine, shard_name: str) -> None:
+        shard = self._get_shard(shard_name)
+        if shard is None:
+            coroutine.close()
+            return
+        task = ShardedLoggingTask(
+            coroutine=coroutine,
+            context=contextvars.copy_context(),
+            enqueued_at=time.monotonic(),
+        )
+        try:
+            shard.queue.put_nowait(task)
+            # also on enqueue - a stalled shard doesn't dequeue
+            self._maybe_emit_shard_queue_depth(shard)
+        except asyncio.QueueFull:
+            # only this callback is backed up - drop its log, don't delay the others
+            coroutine.close()
+            shard.dropped += 1
+            verbose_logger.warning(
+                "LoggingWorker: queue for callback=%s is full, dropped log (total dropped=%s)",
+                shard_name,
+                shard.dropped,
+            )
+            self._emit_shard_drop_metric(shard)
+
+    async def _shard_worker_loop(self, shard: LoggingShard) -> None:
+        """Worker loop of one shard - same as `_worker_loop`, with the shard's queue and limit."""
+        try:
+            while True:
+                await shard.sem.acquire()
+                try:
+                    task = await shard.queue.get()
+                    shard.last_wait_time = time.monotonic() - task["enqueued_at"]
+                    self._maybe_emit_shard_queue_depth(shard)
+                    self._maybe_emit_shard_wait_time(shard)
+                    processing_task = asyncio.create_task(
+                        self._process_shard_task(shard, task)
+                    )
+                    shard.running_tasks.add(processing_task)
+                    processing_task.add_done_callback(shard.running_tasks.discard)
+                except Exception:
+                    shard.sem.release()
+                    raise
+        except asyncio.CancelledError:
+            verbose_logger.debug(
+                "LoggingWorker shard=%s cancelled during shutdown", shard.name
+            )
+
+    async def _process_shard_task(
+        self, shard: LoggingShard, task: ShardedLoggingTask
+    ) -> None:
+        try:
+            await asyncio.wait_for(
+                task["context"].run(asyncio.create_task, task["coroutine"]),
+                timeout=self.timeout,
+            )
+        except Exception as e:
+            verbose_logger.exception(
+                f"LoggingWorker error for callback={shard.name}: {e}"
+            )
+        finally:
+            shard.processed += 1
+            shard.queue.task_done()
+            shard.sem.release()
+
+    def get_shard_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, processed and dropped logs, and the last queue wait time per shard."""
+        return {
+            name: {
+                "queue_depth": shard.queue.qsize(),
+                "processed": shard.processed,
+                "dropped": shard.dropped,
+                "last_wait_time": shard.last_wait_time,
+            }
+            for name, shard in self._shards.items()
+        }
+
+    def _get_service_logger_obj(self) -> Optional[Any]:
+        """ServiceLogging instance, if any service callback (e.g. prometheus_system) is set."""
+        if not litellm.service_callback:
+            return None
+        if self._service_logger_obj is None:
+            from litellm._service_logger import ServiceLogging
+
+            self._service_logger_obj = ServiceLogging()
+        return self._service_logger_obj
+
+    def _maybe_emit_shard_queue_depth(self, shard: LoggingShard) -> None:
+        """Emit the shard's queue depth, at most once per LOGGING_WORKER_METRICS_INTERVAL_SECONDS."""
+        now = time.monotonic()
+        if (
+            now - shard.last_queue_depth_metric_time
+            < LOGGING_WORKER_METRICS_INTERVAL_SECONDS
+        ):
+            return
+        service_logger_obj = self._get_service_logger_obj()
+        if service_logger_obj is None:
+            return
+        shard.last_queue_depth_metric_time = now
+        asyncio.create_task(
+            service_logger_obj.async_service_success_hook(
+                service=ServiceTypes.LOGGING_WORKER_QUEUE,
+                duration=0,
+                call_type=shard.name,
+                event_metadata={
+                    "gauge_labels": shard.name,
+                    "gauge_value": shard.queue.qsize(),
+                },
+            )
+        )
+
+    def _maybe_emit_shard_wait_time(self, shard: LoggingShard) -> None:
+        """Emit the shard's last queue wait time, at most once per LOGGING_WORKER_METRICS_INTERVAL_SECONDS."""
+        now = time.monotonic()
+        if (
+            now - shard.last_wait_time_metric_time
+            < LOGGING_WORKER_METRICS_INTERVAL_SECONDS
+        ):
+            return
+        service_logger_obj = self._get_service_logger_obj()
+        if service_logger_obj is None:
+            return
+        shard.last_wait_time_metric_time = now
+        asyncio.create_task(
+            service_logger_obj.async_service_success_hook(
+                service=ServiceTypes.LOGGING_WORKER,
+                duration=shard.last_wait_time,
+                call_type=shard.name,
+            )
+        )
+
+    def _emit_shard_drop_metric(self, shard: LoggingShard) -> None:
+        service_logger_obj = self._get_service_logger_obj()
+        if service_logger_obj is None:
+            return
+        asyncio.create_task(
+            service_logger_obj.async_service_failure_hook(
+                service=ServiceTypes.LOGGING_WORKER,
+                duration=0,
+                error=asyncio.QueueFull(),
+                call_type=shard.name,
+            )
+        )
+
     def _should_start_aggressive_clear(self) -> bool:
         """
         Check if we should start a new aggressive clear operation.
@@ -340,16 +551,18 @@ class LoggingWorker:
         # Process all tasks concurrently for maximum speed
         await asyncio.gather(*[self._process_single_task(task) for task in tasks])
 
-    def ensure_initialized_and_enqueue(self, async_coroutine: Coroutine):
+    def ensure_initialized_and_enqueue(
+        self, async_coroutine: Coroutine, shard: Optional[str] = None
+    ):
         """
         Ensure the logging worker is initialized and enqueue the coroutine.
         """
         self.start()
-        self.enqueue(async_coroutine)
+        self.enqueue(async_coroutine, shard=shard)
 
     async def stop(self) -> None:
         """Stop the logging worker and clean up resources."""
-        if self._worker_task is None and not self._running_tasks:
+        if self._worker_task is None and not self._running_tasks and not self._shards:
             # No worker launched and no in-flight tasks to drain.
             return
 
@@ -357,6 +570,11 @@ class LoggingWorker:
         if self._worker_task:
             # Include the main worker loop so it stops fetching work.
             tasks_to_cancel.append(self._worker_task)
+        for shard in self._shards.values():
+            tasks_to_cancel.extend(shard.running_tasks)
+            if shard.worker_task:
+                tasks_to_cancel.append(shard.worker_task)
+            shard.worker_task = None
 
         for task in tasks_to_cancel:
             # Propagate cancellation to every pending task.
@@ -368,6 +586,8 @@ class LoggingWorker:
         self._worker_task = None
         # Drop references to completed tasks so we can restart cleanly.
         self._running_tasks.clear()
+        for shard in self._shards.values():
+            shard.running_tasks.clear()
 
     async def flush(self) -> None:
         """Flush the logging queue."""
@@ -375,6 +595,9 @@ class LoggingWorker:
             return
         while not self._queue.empty():
             await self._queue.join()
+        # main queue tasks may have enqueued per-callback tasks
+        for shard in list(self._shards.values()):
+            await shard.queue.join()
 
     async def clear_queue(self):
         """
@@ -466,11 +689,14 @@ class LoggingWorker:
             self._safe_log("debug", "[LoggingWorker] atexit: No queue initialized")
             return
 
-        if self._queue.empty():
+        queues: List[asyncio.Queue] = [self._queue] + [
+            shard.queue for shard in self._shards.values()
+        ]
+        if all(queue.empty() for queue in queues):
             self._safe_log("debug", "[LoggingWorker] atexit: Queue is empty")
             return
 
-        queue_size = self._queue.qsize()
+        queue_size = sum(queue.qsize() for queue in queues)
         self._safe_log(
             "info", f"[LoggingWorker] atexit: Flushing {queue_size} remaining events..."
         )
@@ -478,13 +704,18 @@ class LoggingWorker:
         # Create a new event loop since the original is closed
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        # run callbacks inline from here on, the shard worker loops are gone
+        self.sharded = False
 
         try:
             # Process remaining queue items with time limit
             processed = 0
             start_time = loop.time()
 
-            while not self._queue.empty() and processed < MAX_ITERATIONS_TO_CLEAR_QUEUE:
+            while (
+                any(not queue.empty() for queue in queues)
+                and processed < MAX_ITERATIONS_TO_CLEAR_QUEUE
+            ):
                 if loop.time() - start_time >= MAX_TIME_TO_CLEAR_QUEUE:
                     self._safe_log(
                         "warning",
@@ -492,8 +723,10 @@ class LoggingWorker:
                     )
                     break
 
+                # main queue first - its tasks may enqueue per-callback tasks
+                queue = next(queue for queue in queues if not queue.empty())
                 try:
-                    task = self._queue.get_nowait()
+                    task = queue.get_nowait()
                 except asyncio.QueueEmpty:
                     break
 
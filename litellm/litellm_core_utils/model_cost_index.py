@@ -0,0 +1,47 @@
+"""
+Precomputed lookup index over `litellm.model_cost`.
+
+The model cost map is a flat `{model_key: model_info}` dict. Questions like
+"which keys belong to provider X" or "what is the canonical key for this
+case-insensitive alias" otherwise need a scan of every entry. `ModelCostIndex`
+answers them with single dict lookups.
+
+- `keys_by_provider` is used by `litellm.add_known_models` at import
+- `key_by_lowercase` backs the case-insensitive lookups of `get_model_info`
+  (see `litellm.utils._get_model_cost_key`)
+
+The index is a snapshot: rebuild it whenever `litellm.model_cost` is modified
+(see `litellm.utils._invalidate_model_cost_lowercase_map`).
+"""
+
+from typing import Dict, List, Mapping, Tuple
+
+
+class ModelCostIndex:
+    """
+    Immutable index built in a single pass over a model cost map.
+
+    - `keys_by_provider`: litellm_provider -> model keys, in map order
+    - `key_by_lowercase`: lowercased key -> key (case-insensitive alias lookup)
+    """
+
+    __slots__ = ("keys_by_provider", "key_by_lowercase")
+
+    def __init__(self, model_cost: Mapping[str, dict]):
+        keys_by_provider: Dict[str, List[str]] = {}
+        key_by_lowercase: Dict[str, str] = {}
+
+        for key, value in model_cost.items():
+            key_by_lowercase[key.lower()] = key
+
+            provider = value.get("litellm_provider") if isinstance(value, dict) else None
+            if isinstance(provider, str):
+                keys_by_provider.setdefault(provider, []).append(key)
+
+        self.keys_by_provider: Dict[str, Tuple[str, ...]] = {
+            provider: tuple(keys) for provider, keys in keys_by_provider.items()
+        }
+        self.key_by_lowercase = key_by_lowercase
+
+    def __len__(self) -> int:
+        return len(self.key_by_lowercase)
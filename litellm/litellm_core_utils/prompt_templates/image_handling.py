@@ -10,6 +10,7 @@ import litellm
 from litellm import verbose_logger
 from litellm.caching.caching import InMemoryCache
 from litellm.constants import MAX_IMAGE_URL_DOWNLOAD_SIZE_MB
+from litellm.litellm_core_utils.image_metadata_cache import image_metadata_cache
 
 MAX_IMGS_IN_MEMORY = 10
 
@@ -45,6 +46,8 @@ def _process_image_response(response: Response, url: str) -> str:
             )
         image_bytes.extend(chunk)
     
+    # token counting of the same image reuses the download
+    image_metadata_cache.set_image_bytes(url, image_bytes)
     base64_image = base64.b64encode(image_bytes).decode("utf-8")
 
     image_type = response.headers.get("Content-Type")
@@ -81,11 +84,19 @@ async def async_convert_url_to_base64(url: str) -> str:
     if cached_result:
         return cached_result
 
+    # concurrent requests with the same image share one download
+    return await image_metadata_cache.async_in_flight.run(
+        f"download:{url}", lambda: _async_download_image(url)
+    )
+
+
+async def _async_download_image(url: str) -> str:
     client = litellm.module_level_aclient
     for _ in range(3):
         try:
-            response = await client.get(url, follow_redirects=True)
-            return _process_image_response(response, url)
+            async with image_metadata_cache.async_fetch_limit():
+                response = await client.get(url, follow_redirects=True)
+                return _process_image_response(response, url)
         except litellm.ImageFetchError:
             raise
         except Exception:
@@ -109,8 +120,9 @@ def convert_url_to_base64(url: str) -> str:
     client = litellm.module_level_client
     for _ in range(3):
         try:
-            response = client.get(url, follow_redirects=True)
-            return _process_image_response(response, url)
+            with image_metadata_cache.fetch_limit():
+                response = client.get(url, follow_redirects=True)
+                return _process_image_response(response, url)
         except litellm.ImageFetchError:
             raise
         except Exception as e:
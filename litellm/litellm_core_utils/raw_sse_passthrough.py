@@ -0,0 +1,149 @@
+"""
+Raw SSE passthrough for OpenAI-compatible streaming responses.
+
+Enabled per deployment with `raw_sse_passthrough: true`. The returned stream is a regular
+`CustomStreamWrapper` - iterating it parses every chunk as usual - but callers that forward
+the stream as-is (the proxy's /chat/completions endpoint, when no callback processes the
+streamed chunks) can read the upstream SSE frames unchanged with `aiter_frames()`. The frames
+are teed into a `StreamingChunkAccumulator` for logging and cost tracking.
+"""
+
+import asyncio
+import datetime
+import json
+import re
+import traceback
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+    StreamingChunkAccumulator,
+)
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.types.utils import Usage
+
+# first `"model": "..."` of the frame - the top-level one for OpenAI-compatible chunks,
+# which put it before `choices`
+_MODEL_FIELD_PATTERN = re.compile(r'"model"\s*:\s*"(?:[^"\\]|\\.)*"')
+
+
+def patch_sse_frame_model(frame: str, model: str) -> str:
+    """
+    Replace the `model` of a streamed chunk's JSON without parsing it.
+    """
+    return _MODEL_FIELD_PATTERN.sub(
+        lambda _: '"model":' + json.dumps(model), frame, count=1
+    )
+
+
+class RawSSEPassthroughStream(CustomStreamWrapper):
+    def __init__(
+        self,
+        completion_stream: Any,
+        raw_response: httpx.Response,
+        model: str,
+        logging_obj: Any,
+        custom_llm_provider: Optional[str] = None,
+        stream_options: Optional[dict] = None,
+        _response_headers: Optional[dict] = None,
+    ):
+        """
+        completion_stream: the parsed chunk iterator, used when iterating the stream.
+        raw_response: the streaming upstream response, read by `aiter_frames()`.
+        """
+        super().__init__(
+            completion_stream=completion_stream,
+            model=model,
+            logging_obj=logging_obj,
+            custom_llm_provider=custom_llm_provider,
+            stream_options=stream_options,
+            _response_headers=_response_headers,
+        )
+        self.raw_response = raw_response
+
+    async def aiter_frames(self) -> AsyncIterator[str]:
+        """
+        Yield the JSON payload of each upstream `data:` frame unchanged, until `[DONE]`.
+
+        Logs the complete response once the stream ends. Upstream error frames are
+        forwarded as-is.
+        """
+        # the stream isn't iterated as well - reuse the accumulator of
+        # `litellm.incremental_streaming_assembly`, if any
+        accumulator: Optional[
+            StreamingChunkAccumulator
+        ] = self.chunk_accumulator or StreamingChunkAccumulator(
+            messages=self.messages, count_prompt_tokens_in_background=True
+        )
+        try:
+            async for line in self.raw_response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue  # blank separators, comments, keep-alives
+                payload = line[5:].strip()
+                if payload == "[DONE]":
+                    break
+                if self.logging_obj.completion_start_time is None:
+                    self.logging_obj._update_completion_start_time(
+                        completion_start_time=datetime.datetime.now()
+                    )
+                if accumulator is not None:
+                    accumulator = self._tee_frame(accumulator, payload)
+                yield payload
+        except Exception as e:
+            traceback_exception = traceback.format_exc()
+            executor.submit(self.logging_obj.failure_handler, e, traceback_exception)
+            asyncio.create_task(
+                self.logging_obj.async_failure_handler(e, traceback_exception)
+            )
+            raise e
+
+        complete_streaming_response = (
+            accumulator.build_response(logging_obj=self.logging_obj)
+            if accumulator is not None
+            else None
+        )
+        if complete_streaming_response is None:
+            return
+        asyncio.create_task(
+            self.logging_obj.async_success_handler(
+                complete_streaming_response,
+                cache_hit=False,
+                start_time=None,
+                end_time=None,
+            )
+        )
+        executor.submit(
+            self.logging_obj.success_handler,
+            complete_streaming_response,
+            cache_hit=False,
+            start_time=None,
+            end_time=None,
+        )
+
+    @staticmethod
+    def _tee_frame(
+        accumulator: StreamingChunkAccumulator, payload: str
+    ) -> Optional[StreamingChunkAccumulator]:
+        """
+        Add a frame to the accumulator.
+
+        Returns None - stop accumulating - if the frame can't be folded.
+        """
+        try:
+            chunk: Dict[str, Any] = json.loads(payload)
+            if "choices" not in chunk:
+                return accumulator
+            if chunk.get("usage") is not None:
+                chunk["usage"] = Usage(**chunk["usage"])
+            accumulator.add_chunk(chunk)
+            return accumulator
+        except Exception as e:
+            verbose_logger.debug(
+                "RawSSEPassthroughStream: can't accumulate frame, "
+                "response won't be logged - %s",
+                str(e),
+            )
+            return None
@@ -1,7 +1,10 @@
 import base64
 import time
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 
+import litellm
+from litellm._logging import verbose_logger
 from litellm.types.llms.openai import (
     ChatCompletionAssistantContentValue,
     ChatCompletionAudioDelta,
@@ -20,6 +23,8 @@ from litellm.types.utils import (
     ServerToolUse,
     Usage,
 )
+from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.litellm_core_utils.token_counter import IncrementalTokenCounter
 from litellm.utils import print_verbose, token_counter
 
 if TYPE_CHECKING:
@@ -30,6 +35,74 @@ if TYPE_CHECKING:
         ChatCompletionRedactedThinkingBlock,
         ChatCompletionThinkingBlock,
     )
+    from litellm.types.utils import TextCompletionResponse
+
+
+class ThinkingBlockCombiner:
+    """
+    Combines streamed `thinking_blocks` deltas into complete thinking blocks.
+
+    Thinking text is collected until a signature arrives; redacted blocks are kept as-is.
+    """
+
+    def __init__(self):
+        self.thinking_blocks: List[
+            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
+        ] = []
+        self.current_thinking_text_parts: List[str] = []
+        self.current_signature: Optional[str] = None
+
+    def _flush_thinking_block(self) -> None:
+        from litellm.types.llms.openai import ChatCompletionThinkingBlock
+
+        if len(self.current_thinking_text_parts) > 0 and self.current_signature:
+            self.thinking_blocks.append(
+                ChatCompletionThinkingBlock(
+                    type="thinking",
+                    thinking="".join(self.current_thinking_text_parts),
+                    signature=self.current_signature,
+                )
+            )
+        self.current_thinking_text_parts = []
+        self.current_signature = None
+
+    def add_thinking_blocks(self, thinking: Optional[List[Any]]) -> None:
+        from litellm.types.llms.openai import ChatCompletionRedactedThinkingBlock
+
+        if not thinking or not isinstance(thinking, list):
+            return
+        for thinking_block in thinking:
+            thinking_type = thinking_block.get("type", None)
+            if thinking_type and thinking_type == "redacted_thinking":
+                self._flush_thinking_block()
+                redacted_data = thinking_block.get("data", None)
+                if redacted_data:
+                    self.thinking_blocks.append(
+                        ChatCompletionRedactedThinkingBlock(
+                            type="redacted_thinking",
+                            data=redacted_data,
+                        )
+                    )
+            else:
+                thinking_text = thinking_block.get("thinking", None)
+                if thinking_text:
+                    self.current_thinking_text_parts.append(thinking_text)
+                signature = thinking_block.get("signature", None)
+                if signature:
+                    self.current_signature = signature
+                    self._flush_thinking_block()
+
+    def get_thinking_blocks(
+        self,
+    ) -> Optional[
+        List[
+            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
+        ]
+    ]:
+        self._flush_thinking_block()
+        if len(self.thinking_blocks) > 0:
+            return list(self.thinking_blocks)
+        return None
 
 
 class ChunkProcessor:
@@ -41,7 +114,7 @@ class ChunkProcessor:
     def _sort_chunks(self, chunks: list) -> list:
         if not chunks:
             return []
-        if chunks[0]._hidden_params.get("created_at"):
+        if getattr(chunks[0], "_hidden_params", {}).get("created_at"):
             return sorted(
                 chunks, key=lambda x: x._hidden_params.get("created_at", float("inf"))
             )
@@ -132,10 +205,9 @@ class ChunkProcessor:
         )
         return response
 
-    def get_combined_tool_content( # noqa: PLR0915
+    def get_combined_tool_content(
         self, tool_call_chunks: List[Dict[str, Any]]
     ) -> List[ChatCompletionMessageToolCall]:
-        tool_calls_list: List[ChatCompletionMessageToolCall] = []
         tool_call_map: Dict[int, Dict[str, Any]] = (
             {}
         )  # Map to store tool calls by index
@@ -147,95 +219,111 @@ class ChunkProcessor:
                 tool_calls = delta.get("tool_calls", [])
 
                 for tool_call in tool_calls:
-                    # Handle both dict and object formats
-                    if not tool_call:
-                        continue
-                    
-                    # Check if tool_call has function (either as attribute or dict key)
-                    has_function = False
-                    if isinstance(tool_call, dict):
-                        has_function = "function" in tool_call and tool_call["function"] is not None
-                    else:
-                        has_function = hasattr(tool_call, "function") and tool_call.function is not None
-                    
-                    if not has_function:
-                        continue
-
-                    # Get index (handle both dict and object)
-                    if isinstance(tool_call, dict):
-                        index = tool_call.get("index", 0)
-                    else:
-                        index = getattr(tool_call, "index", 0)
-                    
-                    if index not in tool_call_map:
-                        tool_call_map[index] = {
-                            "id": None,
-                            "name": None,
-                            "type": None,
-                            "arguments": [],
-                            "provider_specific_fields": None,
-                        }
-
-                    # Extract id, type, and function data (handle both dict and object)
-                    if isinstance(tool_call, dict):
-                        if tool_call.get("id"):
-                            tool_call_map[index]["id"] = tool_call["id"]
-                        if tool_call.get("type"):
-                            tool_call_map[index]["type"] = tool_call["type"]
-                        
-                        function = tool_call.get("function", {})
-                        if isinstance(function, dict):
-                            if function.get("name"):
-                                tool_call_map[index]["name"] = function["name"]
-                            if function.get("arguments"):
-                                tool_call_map[index]["arguments"].append(function["arguments"])
-                        else:
-                            # function is an object
-                            if hasattr(function, "name") and function.name:
-                                tool_call_map[index]["name"] = function.name
-                            if hasattr(function, "arguments") and function.arguments:
-                                tool_call_map[index]["arguments"].append(function.arguments)
-                    else:
-                        # tool_call is an object
-                        if hasattr(tool_call, "id") and tool_call.id:
-                            tool_call_map[index]["id"] = tool_call.id
-                        if hasattr(tool_call, "type") and tool_call.type:
-                            tool_call_map[index]["type"] = tool_call.type
-                        if hasattr(tool_call, "function"):
-                            if (
-                                hasattr(tool_call.function, "name")
-                                and tool_call.function.name
-                            ):
-                                tool_call_map[index]["name"] = tool_call.function.name
-                            if (
-                                hasattr(tool_call.function, "arguments")
-                                and tool_call.function.arguments
-                            ):
-                                tool_call_map[index]["arguments"].append(
-                                    tool_call.function.arguments
-                                )
-                    
-                    # Preserve provider_specific_fields from streaming chunks
-                    provider_fields = None
-                    if isinstance(tool_call, dict):
-                        provider_fields = tool_call.get("provider_specific_fields")
-                        if not provider_fields and isinstance(tool_call.get("function"), dict):
-                            provider_fields = tool_call["function"].get("provider_specific_fields")
-                    else:
-                        if hasattr(tool_call, "provider_specific_fields") and tool_call.provider_specific_fields:
-                            provider_fields = tool_call.provider_specific_fields
-                        elif hasattr(tool_call, "function") and hasattr(tool_call.function, "provider_specific_fields") and tool_call.function.provider_specific_fields:
-                            provider_fields = tool_call.function.provider_specific_fields
-                    
-                    if provider_fields:
-                        # Merge provider_specific_fields if multiple chunks have them
-                        if tool_call_map[index]["provider_specific_fields"] is None:
-                            tool_call_map[index]["provider_specific_fields"] = {}
-                        if isinstance(provider_fields, dict):
-                            tool_call_map[index]["provider_specific_fields"].update(
-                                provider_fields
-                            )
+                    ChunkProcessor._add_tool_call_to_map(tool_call_map, tool_call)
 
+        return ChunkProcessor._build_tool_calls_from_map(tool_call_map)
+
+    @staticmethod
+    def _add_tool_call_to_map(  # noqa: PLR0915
+        tool_call_map: Dict[int, Dict[str, Any]], tool_call: Any
+    ) -> None:
+        """
+        Merge one streamed tool call delta into `tool_call_map` (index -> partial tool call).
+        """
+        # Handle both dict and object formats
+        if not tool_call:
+            return
+
+        # Check if tool_call has function (either as attribute or dict key)
+        has_function = False
+        if isinstance(tool_call, dict):
+            has_function = "function" in tool_call and tool_call["function"] is not None
+        else:
+            has_function = hasattr(tool_call, "function") and tool_call.function is not None
+
+        if not has_function:
+            return
+
+        # Get index (handle both dict and object)
+        if isinstance(tool_call, dict):
+            index = tool_call.get("index", 0)
+        else:
+            index = getattr(tool_call, "index", 0)
+
+        if index not in tool_call_map:
+            tool_call_map[index] = {
+                "id": None,
+                "name": None,
+                "type": None,
+                "arguments": [],
+                "provider_specific_fields": None,
+            }
+
+        # Extract id, type, and function data (handle both dict and object)
+        if isinstance(tool_call, dict):
+            if tool_call.get("id"):
+                tool_call_map[index]["id"] = tool_call["id"]
+            if tool_call.get("type"):
+                tool_call_map[index]["type"] = tool_call["type"]
+
+            function = tool_call.get("function", {})
+            if isinstance(function, dict):
+                if function.get("name"):
+                    tool_call_map[index]["name"] = function["name"]
+                if function.get("arguments"):
+                    tool_call_map[index]["arguments"].append(function["arguments"])
+            else:
+                # function is an object
+                if hasattr(function, "name") and function.name:
+                    tool_call_map[index]["name"] = function.name
+                if hasattr(function, "arguments") and function.arguments:
+                    tool_call_map[index]["arguments"].append(function.arguments)
+        else:
+            # tool_call is an object
+            if hasattr(tool_call, "id") and tool_call.id:
+                tool_call_map[index]["id"] = tool_call.id
+            if hasattr(tool_call, "type") and tool_call.type:
+                tool_call_map[index]["type"] = tool_call.type
+            if hasattr(tool_call, "function"):
+                if (
+                    hasattr(tool_call.function, "name")
+                    and tool_call.function.name
+                ):
+                    tool_call_map[index]["name"] = tool_call.function.name
+                if (
+                    hasattr(tool_call.function, "arguments")
+                    and tool_call.function.arguments
+                ):
+                    tool_call_map[index]["arguments"].append(
+                        tool_call.function.arguments
+                    )
+
+        # Preserve provider_specific_fields from streaming chunks
+        provider_fields = None
+        if isinstance(tool_call, dict):
+            provider_fields = tool_call.get("provider_specific_fields")
+            if not provider_fields and isinstance(tool_call.get("function"), dict):
+                provider_fields = tool_call["function"].get("provider_specific_fields")
+        else:
+            if hasattr(tool_call, "provider_specific_fields") and tool_call.provider_specific_fields:
+                provider_fields = tool_call.provider_specific_fields
+            elif hasattr(tool_call, "function") and hasattr(tool_call.function, "provider_specific_fields") and tool_call.function.provider_specific_fields:
+                provider_fields = tool_call.function.provider_specific_fields
+
+        if provider_fields:
+            # Merge provider_specific_fields if multiple chunks have them
+            if tool_call_map[index]["provider_specific_fields"] is None:
+                tool_call_map[index]["provider_specific_fields"] = {}
+            if isinstance(provider_fields, dict):
+                tool_call_map[index]["provider_specific_fields"].update(
+                    provider_fields
+                )
+
+    @staticmethod
+    def _build_tool_calls_from_map(
+        tool_call_map: Dict[int, Dict[str, Any]]
+    ) -> List[ChatCompletionMessageToolCall]:
+        tool_calls_list: List[ChatCompletionMessageToolCall] = []
         # Convert the map to a list of tool calls
         for index in sorted(tool_call_map.keys()):
             tool_call_data = tool_call_map[index]
@@ -264,7 +352,6 @@ class ChunkProcessor:
 
         return tool_calls_list
 
-
     def get_combined_function_call_content(
         self, function_call_chunks: List[Dict[str, Any]]
     ) -> FunctionCall:
@@ -318,62 +405,16 @@ class ChunkProcessor:
             Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
         ]
     ]:
-        from litellm.types.llms.openai import (
-            ChatCompletionRedactedThinkingBlock,
-            ChatCompletionThinkingBlock,
-        )
-
-        thinking_blocks: List[
-            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
-        ] = []
-        current_thinking_text_parts: List[str] = []
-        current_signature: Optional[str] = None
-
-        def _flush_thinking_block() -> None:
-            nonlocal current_thinking_text_parts, current_signature
-            if len(current_thinking_text_parts) > 0 and current_signature:
-                thinking_blocks.append(
-                    ChatCompletionThinkingBlock(
-                        type="thinking",
-                        thinking="".join(current_thinking_text_parts),
-                        signature=current_signature,
-                    )
-                )
-            current_thinking_text_parts = []
-            current_signature = None
-
+        thinking_block_combiner = ThinkingBlockCombiner()
         for chunk in chunks:
             choices = chunk["choices"]
             for choice in choices:
                 delta = choice.get("delta", {})
-                thinking = delta.get("thinking_blocks", None)
-                if thinking and isinstance(thinking, list):
-                    for thinking_block in thinking:
-                        thinking_type = thinking_block.get("type", None)
-                        if thinking_type and thinking_type == "redacted_thinking":
-                            _flush_thinking_block()
-                            redacted_data = thinking_block.get("data", None)
-                            if redacted_data:
-                                thinking_blocks.append(
-                                    ChatCompletionRedactedThinkingBlock(
-                                        type="redacted_thinking",
-                                        data=redacted_data,
-                                    )
-                                )
-                        else:
-                            thinking_text = thinking_block.get("thinking", None)
-                            if thinking_text:
-                                current_thinking_text_parts.append(thinking_text)
-                            signature = thinking_block.get("signature", None)
-                            if signature:
-                                current_signature = signature
-                                _flush_thinking_block()
-
-        _flush_thinking_block()
-
-        if len(thinking_blocks) > 0:
-            return thinking_blocks
-        return None
+                thinking_block_combiner.add_thinking_blocks(
+                    delta.get("thinking_blocks", None)
+                )
+
+        return thinking_block_combiner.get_thinking_blocks()
 
     def get_combined_reasoning_content(
         self, chunks: List[Dict[str, Any]]
@@ -471,93 +512,107 @@ class ChunkProcessor:
 
         return reasoning_tokens
 
-    def _calculate_usage_per_chunk(
-        self,
-        chunks: List[Union[Dict[str, Any], ModelResponse]],
-    ) -> "UsagePerChunk":
+    @staticmethod
+    def _get_usage_from_chunk(
+        chunk: Union[Dict[str, Any], ModelResponse, ModelResponseStream]
+    ) -> Optional[Usage]:
+        usage_chunk: Optional[Usage] = None
+        if "usage" in chunk:
+            usage_chunk = chunk["usage"]
+        elif (
+            isinstance(chunk, ModelResponse) or isinstance(chunk, ModelResponseStream)
+        ) and hasattr(chunk, "_hidden_params"):
+            usage_chunk = chunk._hidden_params.get("usage", None)
+        return usage_chunk
+
+    @staticmethod
+    def _get_empty_usage_per_chunk() -> "UsagePerChunk":
         from litellm.types.litellm_core_utils.streaming_chunk_builder_utils import (
             UsagePerChunk,
         )
 
+        return UsagePerChunk(
+            prompt_tokens=0,
+            completion_tokens=0,
+            ## anthropic prompt caching information ##
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=None,
+            server_tool_use=None,
+            web_search_requests=None,
+            completion_tokens_details=None,
+            prompt_tokens_details=None,
+        )
+
+    def _update_usage_per_chunk(
+        self, usage_per_chunk: "UsagePerChunk", usage_chunk: Usage
+    ) -> None:
+        """
+        Fold one chunk's usage into `usage_per_chunk` (in place).
+        """
+        usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
+        if (
+            usage_chunk_dict["prompt_tokens"] is not None
+            and usage_chunk_dict["prompt_tokens"] > 0
+        ):
+            usage_per_chunk["prompt_tokens"] = usage_chunk_dict["prompt_tokens"]
+        if (
+            usage_chunk_dict["completion_tokens"] is not None
+            and usage_chunk_dict["completion_tokens"] > 0
+        ):
+            usage_per_chunk["completion_tokens"] = usage_chunk_dict["completion_tokens"]
+        if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
+            usage_chunk_dict["cache_creation_input_tokens"] > 0
+            or usage_per_chunk["cache_creation_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_creation_input_tokens"] = usage_chunk_dict[
+                "cache_creation_input_tokens"
+            ]
+        if usage_chunk_dict["cache_read_input_tokens"] is not None and (
+            usage_chunk_dict["cache_read_input_tokens"] > 0
+            or usage_per_chunk["cache_read_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_read_input_tokens"] = usage_chunk_dict[
+                "cache_read_input_tokens"
+            ]
+        if usage_chunk_dict["completion_tokens_details"] is not None:
+            usage_per_chunk["completion_tokens_details"] = usage_chunk_dict[
+                "completion_tokens_details"
+            ]
+        if (
+            hasattr(usage_chunk, "server_tool_use")
+            and usage_chunk.server_tool_use is not None
+        ):
+            usage_per_chunk["server_tool_use"] = usage_chunk.server_tool_use
+        if (
+            usage_chunk_dict["prompt_tokens_details"] is not None
+            and getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+                None,
+            )
+            is not None
+        ):
+            usage_per_chunk["web_search_requests"] = getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+            )
+
+        usage_per_chunk["prompt_tokens_details"] = usage_chunk_dict[
+            "prompt_tokens_details"
+        ]
+
+    def _calculate_usage_per_chunk(
+        self,
+        chunks: List[Union[Dict[str, Any], ModelResponse]],
+    ) -> "UsagePerChunk":
         # # Update usage information if needed
-        prompt_tokens = 0
-        completion_tokens = 0
-        ## anthropic prompt caching information ##
-        cache_creation_input_tokens: Optional[int] = None
-        cache_read_input_tokens: Optional[int] = None
-        
-        server_tool_use: Optional[ServerToolUse] = None
-        web_search_requests: Optional[int] = None
-        completion_tokens_details: Optional[CompletionTokensDetails] = None
-        prompt_tokens_details: Optional[PromptTokensDetailsWrapper] = None
+        usage_per_chunk = self._get_empty_usage_per_chunk()
         for chunk in chunks:
-            usage_chunk: Optional[Usage] = None
-            if "usage" in chunk:
-                usage_chunk = chunk["usage"]
-            elif (
-                isinstance(chunk, ModelResponse)
-                or isinstance(chunk, ModelResponseStream)
-            ) and hasattr(chunk, "_hidden_params"):
-                usage_chunk = chunk._hidden_params.get("usage", None)
-
+            usage_chunk = self._get_usage_from_chunk(chunk)
             if usage_chunk is not None:
-                usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
-                if (
-                    usage_chunk_dict["prompt_tokens"] is not None
-                    and usage_chunk_dict["prompt_tokens"] > 0
-                ):
-                    prompt_tokens = usage_chunk_dict["prompt_tokens"]
-                if (
-                    usage_chunk_dict["completion_tokens"] is not None
-                    and usage_chunk_dict["completion_tokens"] > 0
-                ):
-                    completion_tokens = usage_chunk_dict["completion_tokens"]
-                if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_creation_input_tokens"] > 0
-                    or cache_creation_input_tokens is None
-                ):
-                    cache_creation_input_tokens = usage_chunk_dict[
-                        "cache_creation_input_tokens"
-                    ]
-                if usage_chunk_dict["cache_read_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_read_input_tokens"] > 0
-                    or cache_read_input_tokens is None
-                ):
-                    cache_read_input_tokens = usage_chunk_dict[
-                        "cache_read_input_tokens"
-                    ]
-                if usage_chunk_dict["completion_tokens_details"] is not None:
-                    completion_tokens_details = usage_chunk_dict[
-                        "completion_tokens_details"
-                    ]
-                if hasattr(usage_chunk, 'server_tool_use') and usage_chunk.server_tool_use is not None:
-                    server_tool_use = usage_chunk.server_tool_use
-                if (
-                    usage_chunk_dict["prompt_tokens_details"] is not None
-                    and getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                        None,
-                    )
-                    is not None
-                ):
-                    web_search_requests = getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                    )
+                self._update_usage_per_chunk(usage_per_chunk, usage_chunk)
 
-                prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
-
-        return UsagePerChunk(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cache_creation_input_tokens=cache_creation_input_tokens,
-            cache_read_input_tokens=cache_read_input_tokens,
-            server_tool_use=server_tool_use,
-            web_search_requests=web_search_requests,
-            completion_tokens_details=completion_tokens_details,
-            prompt_tokens_details=prompt_tokens_details,
-        )
+        return usage_per_chunk
 
     def calculate_usage(
         self,
@@ -566,14 +621,21 @@ class ChunkProcessor:
         completion_output: str,
         messages: Optional[List] = None,
         reasoning_tokens: Optional[int] = None,
+        calculated_usage_per_chunk: Optional["UsagePerChunk"] = None,
+        prompt_tokens_count: Optional[int] = None,
+        completion_tokens_count: Optional[int] = None,
     ) -> Usage:
         """
         Calculate usage for the given chunks.
+
+        calculated_usage_per_chunk: usage already folded from the chunks (e.g. by `StreamingChunkAccumulator`). Skips the pass over `chunks`.
+        prompt_tokens_count / completion_tokens_count: precomputed token counts, used instead of `token_counter` if the chunks have no usage.
         """
         returned_usage = Usage()
         # # Update usage information if needed
 
-        calculated_usage_per_chunk = self._calculate_usage_per_chunk(chunks=chunks)
+        if calculated_usage_per_chunk is None:
+            calculated_usage_per_chunk = self._calculate_usage_per_chunk(chunks=chunks)
         prompt_tokens = calculated_usage_per_chunk["prompt_tokens"]
         completion_tokens = calculated_usage_per_chunk["completion_tokens"]
         ## anthropic prompt caching information ##
@@ -598,18 +660,24 @@ class ChunkProcessor:
         )
 
         try:
-            returned_usage.prompt_tokens = prompt_tokens or token_counter(
-                model=model, messages=messages
+            returned_usage.prompt_tokens = prompt_tokens or (
+                prompt_tokens_count
+                if prompt_tokens_count is not None
+                else token_counter(model=model, messages=messages)
             )
         except (
             Exception
         ):  # don't allow this failing to block a complete streaming response from being returned
             print_verbose("token_counter failed, assuming prompt tokens is 0")
             returned_usage.prompt_tokens = 0
-        returned_usage.completion_tokens = completion_tokens or token_counter(
-            model=model,
-            text=completion_output,
-            count_response_tokens=True,  # count_response_tokens is a Flag to tell token counter this is a response, No need to add extra tokens we do for input messages
+        returned_usage.completion_tokens = completion_tokens or (
+            completion_tokens_count
+            if completion_tokens_count is not None
+            else token_counter(
+                model=model,
+                text=completion_output,
+                count_response_tokens=True,  # count_response_tokens is a Flag to tell token counter this is a response, No need to add extra tokens we do for input messages
+            )
         )
         returned_usage.total_tokens = (
             returned_usage.prompt_tokens + returned_usage.completion_tokens
@@ -669,6 +737,395 @@ class ChunkProcessor:
         return returned_usage
 
 
+class StreamingChunkAccumulator:
+    """
+    Builds the complete response of a stream while the stream is consumed.
+
+    `litellm.stream_chunk_builder` needs every chunk and combines them in several
+    passes after the last chunk. The accumulator folds each chunk into running
+    buffers (content, reasoning, per-index tool calls, usage, ...) as it arrives,
+    so only the combined output is kept in memory and `build_response` doesn't
+    iterate over the chunks again.
+
+    The latest chunk is folded when the next one arrives (or in `build_response`),
+    so in-place updates made to a chunk before it's returned to the caller are kept.
+    """
+
+    def __init__(
+        self,
+        messages: Optional[list] = None,
+        count_prompt_tokens_in_background: bool = False,
+    ):
+        """
+        count_prompt_tokens_in_background: count the prompt tokens on a worker thread once the first chunk arrives, in case the provider doesn't return usage. Avoids tokenizing the prompt after the last chunk.
+        """
+        self.messages = messages
+        self.count_prompt_tokens_in_background = count_prompt_tokens_in_background
+        self.chunk_count = 0
+        self._pending_chunk: Optional[Any] = None
+        self._processor: Optional[ChunkProcessor] = None
+        # text completion chunks are combined by `stream_chunk_builder_text_completion`
+        self._text_completion_chunks: Optional[List[Any]] = None
+
+        ## base response ##
+        self.id = ""
+        self.object: Optional[str] = None
+        self.created: Optional[int] = None
+        self.first_chunk_model: Optional[str] = None
+        self.model: Optional[str] = None
+        self.system_fingerprint: Optional[str] = None
+        self.role: Optional[str] = None
+        self.finish_reason: Optional[str] = "stop"
+        self.hidden_params: Dict[str, Any] = {}
+        self.hidden_provider_specific_fields: Optional[Dict[str, Any]] = None
+
+        ## message ##
+        self.content_parts: Optional[List[str]] = None
+        self.reasoning_content_parts: Optional[List[str]] = None
+        self.tool_call_map: Optional[Dict[int, Dict[str, Any]]] = None
+        self.function_call_name: Optional[str] = None
+        self.function_call_arguments: Optional[List[str]] = None
+        self.thinking_block_combiner: Optional[ThinkingBlockCombiner] = None
+        self.annotations: Optional[List[Any]] = None
+        self.audio_data: Optional[bytearray] = None
+        self.audio_transcript_parts: List[str] = []
+        self.audio_expires_at: Optional[int] = None
+        self.audio_id: Optional[str] = None
+        self.images: Optional[List[Any]] = None
+        self.provider_specific_fields: Optional[Dict[str, Any]] = None
+
+        ## usage ##
+        self.usage_per_chunk: "UsagePerChunk" = ChunkProcessor._get_empty_usage_per_chunk()
+        self.total_prompt_tokens = 0
+        self.total_completion_tokens = 0
+        # fallback when the provider doesn't return usage - tokens are counted as the deltas arrive
+        self.completion_token_counter = IncrementalTokenCounter()
+        self.reasoning_token_counter = IncrementalTokenCounter()
+        self.prompt_token_count: Optional["Future[int]"] = None
+
+    def _get_prompt_token_count(self) -> Optional[int]:
+        if self.prompt_token_count is None:
+            return None
+        try:
+            return self.prompt_token_count.result()
+        except Exception:
+            return None
+
+    def add_chunk(self, chunk: Union[ModelResponseStream, Dict[str, Any]]) -> None:
+        if self._pending_chunk is not None:
+            self._fold_chunk(self._pending_chunk)
+        self._pending_chunk = chunk
+        self.chunk_count += 1
+
+    def _flush_pending_chunk(self) -> None:
+        if self._pending_chunk is not None:
+            self._fold_chunk(self._pending_chunk)
+            self._pending_chunk = None
+
+    def _fold_chunk(self, chunk: Any) -> None:  # noqa: PLR0915
+        from litellm.utils import TextChoices
+
+        if self._processor is None:
+            self._processor = ChunkProcessor(chunks=[chunk], messages=self.messages)
+            self.object = chunk["object"]
+            self.created = chunk["created"]
+            self.first_chunk_model = self.model = chunk["model"]
+            self.completion_token_counter.model = self.first_chunk_model or ""
+            if (
+                self.count_prompt_tokens_in_background
+                and self.messages
+                and litellm.disable_token_counter is not True
+            ):
+                self.prompt_token_count = executor.submit(
+                    token_counter, model=self.first_chunk_model, messages=self.messages
+                )
+            self.system_fingerprint = chunk.get("system_fingerprint", None)
+            if len(chunk["choices"]) > 0:
+                if isinstance(chunk["choices"][0], TextChoices):
+                    self._text_completion_chunks = []
+                else:
+                    self.role = chunk["choices"][0]["delta"].get("role")
+        if self._text_completion_chunks is not None:
+            self._text_completion_chunks.append(chunk)
+            return
+
+        if not self.id and chunk.get("id"):
+            self.id = chunk["id"]
+        chunk_model = chunk.get("model")
+        if (
+            self.model == self.first_chunk_model
+            and chunk_model
+            and chunk_model != self.first_chunk_model
+        ):
+            # Azure Model Router - the first chunk has the request model, later chunks the actual model
+            self.model = chunk_model
+        self.hidden_params = chunk.get("_hidden_params", {})
+        hidden = getattr(chunk, "_hidden_params", None)
+        if hidden and "provider_specific_fields" in hidden:
+            self.hidden_provider_specific_fields = hidden["provider_specific_fields"]
+
+        usage_chunk = ChunkProcessor._get_usage_from_chunk(chunk)
+        if usage_chunk is not None:
+            self._processor._update_usage_per_chunk(self.usage_per_chunk, usage_chunk)
+        if "usage" in chunk and chunk["usage"] is not None:
+            if "prompt_tokens" in chunk["usage"]:
+                self.total_prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
+            if "completion_tokens" in chunk["usage"]:
+                self.total_completion_tokens = (
+                    chunk["usage"].get("completion_tokens", 0) or 0
+                )
+
+        choices = chunk["choices"]
+        if len(choices) == 0:
+            return
+        first_choice = choices[0]
+        if hasattr(first_choice, "finish_reason"):
+            self.finish_reason = first_choice.finish_reason
+        elif "finish_reason" in first_choice:
+            self.finish_reason = first_choice["finish_reason"]
+        delta = first_choice["delta"]
+
+        if delta.get("tool_calls") is not None:
+            if self.tool_call_map is None:
+                self.tool_call_map = {}
+            for choice in choices:
+                for tool_call in choice.get("delta", {}).get("tool_calls") or []:
+                    ChunkProcessor._add_tool_call_to_map(self.tool_call_map, tool_call)
+
+        if delta.get("function_call") is not None:
+            if self.function_call_arguments is None:
+                self.function_call_name = delta["function_call"].name
+                self.function_call_arguments = []
+            for choice in choices:
+                function_call = choice.get("delta", {}).get("function_call", "")
+                if function_call:
+                    self.function_call_arguments.append(function_call.arguments)
+
+        if delta.get("content") is not None:
+            self.content_parts = self._extend_text_parts(
+                self.content_parts, choices, "content", self.completion_token_counter
+            )
+
+        if delta.get("thinking_blocks") is not None:
+            if self.thinking_block_combiner is None:
+                self.thinking_block_combiner = ThinkingBlockCombiner()
+            for choice in choices:
+                self.thinking_block_combiner.add_thinking_blocks(
+                    choice.get("delta", {}).get("thinking_blocks", None)
+                )
+
+        if delta.get("reasoning_content") is not None:
+            self.reasoning_content_parts = self._extend_text_parts(
+                self.reasoning_content_parts,
+                choices,
+                "reasoning_content",
+                self.reasoning_token_counter,
+            )
+
+        if self.annotations is None and delta.get("annotations") is not None:
+            self.annotations = delta["annotations"]
+
+        if delta.get("audio") is not None:
+            self._add_audio(choices)
+
+        if delta.get("images") is not None:
+            if self.images is None:
+                self.images = []
+            self.images.extend(delta["images"])
+
+        if delta.get("provider_specific_fields") is not None:
+            if self.provider_specific_fields is None:
+                self.provider_specific_fields = {}
+            if isinstance(delta["provider_specific_fields"], dict):
+                # later values win, e.g. the most complete web_search_results
+                self.provider_specific_fields.update(delta["provider_specific_fields"])
+
+    @staticmethod
+    def _extend_text_parts(
+        parts: Optional[List[str]],
+        choices: List[Any],
+        delta_key: str,
+        token_counter: IncrementalTokenCounter,
+    ) -> List[str]:
+        if parts is None:
+            parts = []
+        for choice in choices:
+            text = choice.get("delta", {}).get(delta_key, "")
+            if text is None:
+                continue  # openai v1.0.0 sets content = None for chunks
+            parts.append(text)
+            token_counter.add_text(text)
+        return parts
+
+    def _add_audio(self, choices: List[Any]) -> None:
+        if self.audio_data is None:
+            self.audio_data = bytearray()
+        for choice in choices:
+            delta = choice.get("delta") or {}
+            audio: Optional[ChatCompletionAudioDelta] = delta.get("audio")
+            if audio is None:
+                continue
+            for k, v in audio.items():
+                if k == "data" and v is not None and isinstance(v, str):
+                    self.audio_data.extend(base64.b64decode(v))
+                elif k == "transcript" and v is not None and isinstance(v, str):
+                    self.audio_transcript_parts.append(v)
+                elif k == "expires_at" and v is not None and isinstance(v, int):
+                    self.audio_expires_at = v
+                elif k == "id" and v is not None and isinstance(v, str):
+                    self.audio_id = v
+
+    def get_total_usage(self) -> Usage:
+        """
+        Same as `calculate_total_usage` over all chunks added so far.
+        """
+        self._flush_pending_chunk()
+        return Usage(
+            prompt_tokens=self.total_prompt_tokens,
+            completion_tokens=self.total_completion_tokens,
+            total_tokens=self.total_prompt_tokens + self.total_completion_tokens,
+        )
+
+    def build_response(
+        self, logging_obj: Optional[Any] = None
+    ) -> Optional[Union[ModelResponse, "TextCompletionResponse"]]:
+        """
+        Return the complete response - equivalent to `litellm.stream_chunk_builder` over all added chunks.
+        """
+        try:
+            self._flush_pending_chunk()
+            if self._processor is None:
+                return None
+            if self._text_completion_chunks is not None:
+                from litellm.main import stream_chunk_builder_text_completion
+
+                return stream_chunk_builder_text_completion(
+                    chunks=self._text_completion_chunks, messages=self.messages
+                )
+            return self._build_model_response(logging_obj=logging_obj)
+        except Exception as e:
+            verbose_logger.exception(
+                "StreamingChunkAccumulator.build_response() - Exception occurred - {}".format(
+                    str(e)
+                )
+            )
+            raise litellm.APIError(
+                status_code=500,
+                message="Error building chunks for logging/streaming usage calculation",
+                llm_provider="",
+                model="",
+            )
+
+    def _build_model_response(self, logging_obj: Optional[Any]) -> ModelResponse:
+        from litellm.litellm_core_utils.prompt_templates.common_utils import (
+            get_content_from_model_response,
+        )
+
+        processor = cast(ChunkProcessor, self._processor)
+        response = ModelResponse(
+            **{
+                "id": self.id,
+                "object": self.object,
+                "created": self.created,
+                "model": self.model,
+                "system_fingerprint": self.system_fingerprint,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": self.role, "content": ""},
+                        "finish_reason": self.finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                },
+            }
+        )
+        response._hidden_params = self.hidden_params
+        _choice = cast(Choices, response.choices[0])
+
+        if self.tool_call_map is not None:
+            _choice.message.content = None
+            _choice.message.tool_calls = ChunkProcessor._build_tool_calls_from_map(
+                self.tool_call_map
+            )
+        if self.function_call_arguments is not None:
+            _choice.message.content = None
+            _choice.message.function_call = FunctionCall(
+                name=self.function_call_name,
+                arguments="".join(self.function_call_arguments),
+            )
+        if self.content_parts is not None:
+            response["choices"][0]["message"]["content"] = "".join(self.content_parts)
+        if self.thinking_block_combiner is not None:
+            response["choices"][0]["message"][
+                "thinking_blocks"
+            ] = self.thinking_block_combiner.get_thinking_blocks()
+        if self.reasoning_content_parts is not None:
+            response["choices"][0]["message"]["reasoning_content"] = "".join(
+                self.reasoning_content_parts
+            )
+        if self.annotations is not None:
+            response["choices"][0]["message"]["annotations"] = self.annotations
+        if self.audio_data is not None:
+            _choice.message.audio = ChatCompletionAudioResponse(
+                data=base64.b64encode(bytes(self.audio_data)).decode("utf-8"),
+                expires_at=self.audio_expires_at or int(time.time() + 3600),
+                transcript="".join(self.audio_transcript_parts),
+                id=self.audio_id,
+            )
+        if self.images is not None:
+            response["choices"][0]["message"]["images"] = list(self.images)
+        if self.provider_specific_fields:
+            _choice.message.provider_specific_fields = dict(
+                self.provider_specific_fields
+            )
+
+        completion_output = get_content_from_model_response(response)
+        prompt_tokens_count: Optional[int] = None
+        if not self.usage_per_chunk["prompt_tokens"]:
+            prompt_tokens_count = self._get_prompt_token_count()
+        completion_tokens_count: Optional[int] = None
+        content = _choice.message.content or ""
+        if not self.usage_per_chunk["completion_tokens"] and completion_output.startswith(
+            content
+        ):
+            # only the tool call / function call json after the content is tokenized now
+            completion_tokens_count = self.completion_token_counter.get_token_count(
+                suffix=completion_output[len(content) :]
+            )
+        usage = processor.calculate_usage(
+            chunks=[],
+            model=cast(str, self.first_chunk_model),
+            completion_output=completion_output,
+            messages=self.messages,
+            reasoning_tokens=(
+                self.reasoning_token_counter.get_token_count()
+                if getattr(_choice.message, "reasoning_content", None) is not None
+                else 0
+            ),
+            calculated_usage_per_chunk=self.usage_per_chunk,
+            prompt_tokens_count=prompt_tokens_count,
+            completion_tokens_count=completion_tokens_count,
+        )
+        setattr(response, "usage", usage)
+
+        if self.hidden_provider_specific_fields is not None:
+            response._hidden_params.setdefault("provider_specific_fields", {}).update(
+                self.hidden_provider_specific_fields
+            )
+
+        # Add cost to usage object if include_cost_in_streaming_usage is True
+        if litellm.include_cost_in_streaming_usage and logging_obj is not None:
+            setattr(
+                usage, "cost", logging_obj._response_cost_calculator(result=response)
+            )
+
+        return response
+
+
 def concatenate_base64_list(base64_strings: List[str]) -> str:
     """
     Concatenates a list of base64-encoded strings.
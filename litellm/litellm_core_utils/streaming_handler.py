@@ -5,7 +5,17 @@ import json
 import threading
 import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 
 import httpx
 from pydantic import BaseModel
@@ -29,6 +39,7 @@ from litellm.types.utils import (
     ModelResponse,
     ModelResponseStream,
     StreamingChoices,
+    TextCompletionResponse,
     Usage,
 )
 
@@ -38,6 +49,9 @@ from .exception_mapping_utils import exception_type
 from .llm_response_utils.get_api_base import get_api_base
 from .rules import Rules
 
+if TYPE_CHECKING:
+    from .streaming_chunk_builder_utils import StreamingChunkAccumulator
+
 # Constants for special delta attribute names
 AUDIO_ATTRIBUTE = "audio"
 IMAGE_ATTRIBUTE = "images"
@@ -111,7 +125,8 @@ class CustomStreamWrapper:
         ]
         self.holding_chunk = ""
         self.complete_response = ""
-        self.response_uptil_now = ""
+        # text streamed so far - joined lazily, `+=` on an attribute copies the whole string every chunk
+        self._response_uptil_now_parts: List[str] = []
         _model_info: Dict = litellm_params.model_info or {}
 
         _api_base = get_api_base(
@@ -143,12 +158,35 @@ class CustomStreamWrapper:
             True if self.check_send_stream_usage(self.stream_options) else False
         )
         self.tool_call = False
-        self.chunks: List = (
+        self.chunk_accumulator: Optional["StreamingChunkAccumulator"] = None
+        self.chunks: Union[List, Deque] = (
             []
         )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
+        if litellm.incremental_streaming_assembly:
+            from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+                StreamingChunkAccumulator,
+            )
+
+            # chunks are folded into the accumulator - only keep the last few for `safety_checker`
+            self.chunk_accumulator = StreamingChunkAccumulator(
+                messages=self.messages, count_prompt_tokens_in_background=True
+            )
+            self.chunks = collections.deque(
+                maxlen=litellm.REPEATED_STREAMING_CHUNK_LIMIT
+            )
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
         self.created: Optional[int] = None
 
+    @property
+    def response_uptil_now(self) -> str:
+        if len(self._response_uptil_now_parts) != 1:
+            self._response_uptil_now_parts = ["".join(self._response_uptil_now_parts)]
+        return self._response_uptil_now_parts[0]
+
+    @response_uptil_now.setter
+    def response_uptil_now(self, value: str) -> None:
+        self._response_uptil_now_parts = [value]
+
     def __iter__(self):
         return self
 
@@ -191,6 +229,39 @@ class CustomStreamWrapper:
         except Exception as e:
             raise e
 
+    def _add_chunk(self, chunk: ModelResponseStream) -> None:
+        self.chunks.append(chunk)
+        if self.chunk_accumulator is not None:
+            self.chunk_accumulator.add_chunk(chunk)
+
+    def _add_response_text(self, chunk: ModelResponseStream) -> None:
+        choice = chunk.choices[0]
+        if isinstance(choice, StreamingChoices):
+            self._response_uptil_now_parts.append(
+                choice.delta.get("content", "") or ""
+            )
+        if litellm.post_call_rules:
+            self.rules.post_call_rules(input=self.response_uptil_now, model=self.model)
+
+    def _calculate_total_usage(self) -> Usage:
+        if self.chunk_accumulator is not None:
+            return self.chunk_accumulator.get_total_usage()
+        return calculate_total_usage(chunks=self.chunks)
+
+    def _build_complete_streaming_response(
+        self,
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        Combine the streamed chunks into the complete response, used for logging / caching.
+        """
+        if self.chunk_accumulator is not None:
+            return self.chunk_accumulator.build_response(logging_obj=self.logging_obj)
+        return litellm.stream_chunk_builder(
+            chunks=self.chunks,
+            messages=self.messages,
+            logging_obj=self.logging_obj,
+        )
+
     def safety_checker(self) -> None:
         """
         Fixes - https://github.com/BerriAI/litellm/issues/5158
@@ -201,7 +272,11 @@ class CustomStreamWrapper:
         """
         if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
             # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
+            last_chunks = (
+                self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
+                if isinstance(self.chunks, list)
+                else list(self.chunks)
+            )
 
             # Extract the relevant content from the chunks
             last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
@@ -954,7 +1029,7 @@ class CustomStreamWrapper:
 
                 # Default - return StopIteration
                 if hasattr(model_response, "usage"):
-                    self.chunks.append(model_response)
+                    self._add_chunk(model_response)
                 raise StopIteration
             # flush any remaining holding chunk
             if len(self.holding_chunk) > 0:
@@ -984,7 +1059,7 @@ class CustomStreamWrapper:
             return self._handle_special_delta_content(model_response)
         else:
             if hasattr(model_response, "usage"):
-                self.chunks.append(model_response)
+                self._add_chunk(model_response)
             return
 
     def _optional_combine_thinking_block_in_choices(
@@ -1761,16 +1836,9 @@ class CustomStreamWrapper:
                             response,
                             cache_hit,
                         )  # log response
-                    choice = response.choices[0]
-                    if isinstance(choice, StreamingChoices):
-                        self.response_uptil_now += choice.delta.get("content", "") or ""
-                    else:
-                        self.response_uptil_now += ""
-                    self.rules.post_call_rules(
-                        input=self.response_uptil_now, model=self.model
-                    )
+                    self._add_response_text(response)
                     # HANDLE STREAM OPTIONS
-                    self.chunks.append(response)
+                    self._add_chunk(response)
                     
                     # Add mcp_list_tools to first chunk if present
                     if not self.sent_first_chunk:
@@ -1800,7 +1868,7 @@ class CustomStreamWrapper:
                             continue
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self._calculate_total_usage()
                         response._hidden_params["usage"] = usage
                         # Add MCP metadata to final chunk if present
                         response = self._add_mcp_metadata_to_final_chunk(response)
@@ -1809,11 +1877,7 @@ class CustomStreamWrapper:
 
         except StopIteration:
             if self.sent_last_chunk is True:
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
-                )
+                complete_streaming_response = self._build_complete_streaming_response()
 
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
@@ -1851,7 +1915,7 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 if self.stream_options is None:  # add usage as hidden param
-                    usage = calculate_total_usage(chunks=self.chunks)
+                    usage = self._calculate_total_usage()
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
                 executor.submit(
@@ -1935,15 +1999,8 @@ class CustomStreamWrapper:
                             completion_start_time=datetime.datetime.now()
                         )
 
-                    choice = processed_chunk.choices[0]
-                    if isinstance(choice, StreamingChoices):
-                        self.response_uptil_now += choice.delta.get("content", "") or ""
-                    else:
-                        self.response_uptil_now += ""
-                    self.rules.post_call_rules(
-                        input=self.response_uptil_now, model=self.model
-                    )
-                    self.chunks.append(processed_chunk)
+                    self._add_response_text(processed_chunk)
+                    self._add_chunk(processed_chunk)
                     
                     # Add mcp_list_tools to first chunk if present
                     if not self.sent_first_chunk:
@@ -1971,7 +2028,7 @@ class CustomStreamWrapper:
 
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self._calculate_total_usage()
                         processed_chunk._hidden_params["usage"] = usage
 
                     # Call post-call streaming deployment hook for final chunk
@@ -2006,27 +2063,14 @@ class CustomStreamWrapper:
                         if processed_chunk is None:
                             continue
 
-                        choice = processed_chunk.choices[0]
-                        if isinstance(choice, StreamingChoices):
-                            self.response_uptil_now += (
-                                choice.delta.get("content", "") or ""
-                            )
-                        else:
-                            self.response_uptil_now += ""
-                        self.rules.post_call_rules(
-                            input=self.response_uptil_now, model=self.model
-                        )
+                        self._add_response_text(processed_chunk)
                         # RETURN RESULT
-                        self.chunks.append(processed_chunk)
+                        self._add_chunk(processed_chunk)
                         return processed_chunk
         except (StopAsyncIteration, StopIteration):
             if self.sent_last_chunk is True:
                 # log the final chunk with accurate streaming values
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
-                )
+                complete_streaming_response = self._build_complete_streaming_response()
 
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
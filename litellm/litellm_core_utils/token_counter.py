@@ -1,11 +1,12 @@
 # What is this?
 ## Helper utilities for token counting
-import base64
-import io
-import struct
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import (
     Any,
     Callable,
+    Dict,
     List,
     Literal,
     Mapping,
@@ -20,16 +21,19 @@ import tiktoken
 import litellm
 from litellm import verbose_logger
 from litellm.constants import (
-    DEFAULT_IMAGE_HEIGHT,
     DEFAULT_IMAGE_TOKEN_COUNT,
-    DEFAULT_IMAGE_WIDTH,
     MAX_LONG_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_SHORT_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_TILE_HEIGHT,
     MAX_TILE_WIDTH,
+    TOKEN_COUNTER_CACHE_MIN_TEXT_LENGTH,
+    TOKEN_COUNTER_CACHE_SIZE,
 )
 from litellm.litellm_core_utils.default_encoding import encoding as default_encoding
-from litellm.llms.custom_httpx.http_handler import _get_httpx_client
+from litellm.litellm_core_utils.image_metadata_cache import (  # noqa: F401
+    get_image_type,
+    image_metadata_cache,
+)
 from litellm.types.llms.anthropic import (
     AnthropicMessagesToolResultParam,
     AnthropicMessagesToolUseParam,
@@ -174,34 +178,13 @@ def calculate_tiles_needed(
     return total_tiles
 
 
-def get_image_type(image_data: bytes) -> Union[str, None]:
-    """take an image (really only the first ~100 bytes max are needed)
-    and return 'png' 'gif' 'jpeg' 'webp' 'heic' or None. method added to
-    allow deprecation of imghdr in 3.13"""
-
-    if image_data[0:8] == b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a":
-        return "png"
-
-    if image_data[0:4] == b"GIF8" and image_data[5:6] == b"a":
-        return "gif"
-
-    if image_data[0:3] == b"\xff\xd8\xff":
-        return "jpeg"
-
-    if image_data[4:8] == b"ftyp":
-        return "heic"
-
-    if image_data[0:4] == b"RIFF" and image_data[8:12] == b"WEBP":
-        return "webp"
-
-    return None
-
-
 def get_image_dimensions(
     data: str,
 ) -> Tuple[int, int]:
     """
-    Async Function to get the dimensions of an image from a URL or base64 encoded string.
+    Get the dimensions of an image from a URL or base64 encoded string.
+
+    Only the image header is read; results are cached in `image_metadata_cache`.
 
     Args:
         data (str): The URL or base64 encoded string of the image.
@@ -209,61 +192,58 @@ def get_image_dimensions(
     Returns:
         Tuple[int, int]: The width and height of the image.
     """
-    img_data = None
-    try:
-        # Try to open as URL
-        client = _get_httpx_client()
-        response = client.get(data)
-        img_data = response.read()
-    except Exception:
-        # If not URL, assume it's base64
-        _header, encoded = data.split(",", 1)
-        img_data = base64.b64decode(encoded)
-
-    img_type = get_image_type(img_data)
-
-    if img_type == "png":
-        w, h = struct.unpack(">LL", img_data[16:24])
-        return w, h
-    elif img_type == "gif":
-        w, h = struct.unpack("<HH", img_data[6:10])
-        return w, h
-    elif img_type == "jpeg":
-        with io.BytesIO(img_data) as fhandle:
-            fhandle.seek(0)
-            size = 2
-            ftype = 0
-            while not 0xC0 <= ftype <= 0xCF or ftype in (0xC4, 0xC8, 0xCC):
-                fhandle.seek(size, 1)
-                byte = fhandle.read(1)
-                while ord(byte) == 0xFF:
-                    byte = fhandle.read(1)
-                ftype = ord(byte)
-                size = struct.unpack(">H", fhandle.read(2))[0] - 2
-            fhandle.seek(1, 1)
-            h, w = struct.unpack(">HH", fhandle.read(4))
-        return w, h
-    elif img_type == "webp":
-        # For WebP, the dimensions are stored at different offsets depending on the format
-        # Check for VP8X (extended format)
-        if img_data[12:16] == b"VP8X":
-            w = struct.unpack("<I", img_data[24:27] + b"\x00")[0] + 1
-            h = struct.unpack("<I", img_data[27:30] + b"\x00")[0] + 1
-            return w, h
-        # Check for VP8 (lossy format)
-        elif img_data[12:16] == b"VP8 ":
-            w = struct.unpack("<H", img_data[26:28])[0] & 0x3FFF
-            h = struct.unpack("<H", img_data[28:30])[0] & 0x3FFF
-            return w, h
-        # Check for VP8L (lossless format)
-        elif img_data[12:16] == b"VP8L":
-            bits = struct.unpack("<I", img_data[21:25])[0]
-            w = (bits & 0x3FFF) + 1
-            h = ((bits >> 14) & 0x3FFF) + 1
-            return w, h
-
-    # return sensible default image dimensions if unable to get dimensions
-    return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+    return image_metadata_cache.get_dimensions(data)
+
+
+class _TokenCountCache:
+    """
+    Bounded LRU of token counts, keyed by a hash of the tokenized content.
+
+    Agent traffic re-sends the same system prompt, tool schemas and history on every
+    turn - with the cache each of them is only tokenized once.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(namespace: str, content: str) -> Tuple[str, bytes]:
+        digest = hashlib.blake2b(
+            content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        return namespace, digest
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[int]:
+        with self._lock:
+            count = self._counts.get(key)
+            if count is None:
+                self.misses += 1
+                return None
+            self._counts.move_to_end(key)
+            self.hits += 1
+            return count
+
+    def set(self, key: Tuple[str, bytes], count: int) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.max_size:
+                self._counts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_token_count_cache = _TokenCountCache(max_size=TOKEN_COUNTER_CACHE_SIZE)
 
 
 def calculate_img_tokens(
@@ -312,6 +292,11 @@ TokenCounterFunction = Callable[[str], int]
 Type for a function that counts tokens in a string.
 """
 
+BatchTokenCounterFunction = Callable[[List[str]], List[int]]
+"""
+Type for a function that counts tokens in each of a list of strings.
+"""
+
 
 class _MessageCountParams:
     """
@@ -385,8 +370,9 @@ def token_counter(
     if litellm.disable_token_counter is True:
         return 0
 
+    # lazy formatting - messages may contain large base64 images
     verbose_logger.debug(
-        f"messages in token_counter: {messages}, text in token_counter: {text}"
+        "messages in token_counter: %s, text in token_counter: %s", messages, text
     )
     if text is not None and messages is not None:
         raise ValueError("text and messages cannot both be set")
@@ -408,16 +394,15 @@ def token_counter(
             List[AllMessageValues], convert_list_message_to_dict(messages)
         )
         params = _MessageCountParams(model, custom_tokenizer)
-        num_tokens = _count_messages(
-            params, new_messages, use_default_image_token_count, default_token_count
+        num_tokens = _count_messages_and_extra(
+            params,
+            new_messages,
+            count_response_tokens,
+            tools,
+            tool_choice,
+            use_default_image_token_count,
+            default_token_count,
         )
-        if count_response_tokens is False:
-            includes_system_message = any(
-                [message.get("role", None) == "system" for message in new_messages]
-            )
-            num_tokens += _count_extra(
-                params.count_function, tools, tool_choice, includes_system_message
-            )
 
     else:
         raise ValueError("Either text or messages must be provided")
@@ -425,6 +410,113 @@ def token_counter(
     return num_tokens
 
 
+def batch_token_counter(
+    model="",
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+    texts: Optional[List[str]] = None,
+    messages_list: Optional[List[List[Union[AllMessageValues, Message]]]] = None,
+    count_response_tokens: Optional[bool] = False,
+    tools: Optional[List[ChatCompletionToolParam]] = None,
+    tool_choice: Optional[ChatCompletionNamedToolChoiceParam] = None,
+    use_default_image_token_count: Optional[bool] = False,
+    default_token_count: Optional[int] = None,
+) -> List[int]:
+    """
+    Count the tokens of many texts / conversations at once.
+
+    Equivalent to calling `token_counter` for each item, but all texts are tokenized
+    with a single batch encode of the tokenizer (tiktoken's `encode_batch` runs in a
+    thread pool without the GIL), and texts shared between items - e.g. the system
+    prompt of each conversation - are only tokenized once.
+
+    Args:
+    model (str): The name of the model to use for tokenization. Default is an empty string.
+    custom_tokenizer (Optional[dict]): A custom tokenizer, see `token_counter`.
+    texts (Optional[List[str]]): The raw texts to count. Default is None.
+    messages_list (Optional[List[List[AllMessageValues]]]): Alternative to passing in texts. A list of conversations, each a list of messages. Default is None.
+    count_response_tokens (Optional[bool]): set to True to indicate we are processing stream responses.
+    tools (Optional[List[ChatCompletionToolParam]]): The available tools, applied to every conversation. Default is None.
+    tool_choice (Optional[ChatCompletionNamedToolChoiceParam]): The tool choice, applied to every conversation. Default is None.
+    use_default_image_token_count (Optional[bool]): When True, will NOT make a GET request to the image URL and instead return the default image dimensions. Default is False.
+    default_token_count (Optional[int]): The default number of tokens to return for a message block, if an error occurs. Default is None.
+
+    Returns:
+    List[int]: The number of tokens of each text / conversation, in order.
+    """
+    from litellm.utils import convert_list_message_to_dict
+
+    if texts is not None and messages_list is not None:
+        raise ValueError("texts and messages_list cannot both be set")
+    if texts is None and messages_list is None:
+        raise ValueError("Either texts or messages_list must be provided")
+    if litellm.disable_token_counter is True:
+        return [0] * len(texts if texts is not None else messages_list)  # type: ignore
+    if use_default_image_token_count is None:
+        use_default_image_token_count = False
+
+    batch_count_function = _get_batch_count_function(model, custom_tokenizer)
+    if texts is not None:
+        if tools or tool_choice:
+            raise ValueError("tools or tool_choice cannot be set if using texts")
+        return batch_count_function(texts)
+
+    conversations = [
+        cast(List[AllMessageValues], convert_list_message_to_dict(messages))
+        for messages in messages_list  # type: ignore
+    ]
+    params = _MessageCountParams(model, custom_tokenizer)
+
+    def _count_conversations() -> List[int]:
+        return [
+            _count_messages_and_extra(
+                params,
+                messages,
+                count_response_tokens,
+                tools,
+                tool_choice,
+                use_default_image_token_count,  # type: ignore
+                default_token_count,
+            )
+            for messages in conversations
+        ]
+
+    # first pass collects the texts to tokenize, second pass adds up their counts
+    text_token_counts: Dict[str, int] = {}
+
+    def _collect_text(text: str) -> int:
+        text_token_counts[text] = 0
+        return 0
+
+    params.count_function = _collect_text
+    _count_conversations()
+    unique_texts = list(text_token_counts)
+    text_token_counts = dict(zip(unique_texts, batch_count_function(unique_texts)))
+    params.count_function = text_token_counts.__getitem__
+    return _count_conversations()
+
+
+def _count_messages_and_extra(
+    params: _MessageCountParams,
+    messages: List[AllMessageValues],
+    count_response_tokens: Optional[bool],
+    tools: Optional[List[ChatCompletionToolParam]],
+    tool_choice: Optional[ChatCompletionNamedToolChoiceParam],
+    use_default_image_token_count: bool,
+    default_token_count: Optional[int],
+) -> int:
+    num_tokens = _count_messages(
+        params, messages, use_default_image_token_count, default_token_count
+    )
+    if count_response_tokens is False:
+        includes_system_message = any(
+            [message.get("role", None) == "system" for message in messages]
+        )
+        num_tokens += _count_extra(
+            params.count_function, tools, tool_choice, includes_system_message
+        )
+    return num_tokens
+
+
 def _count_messages(
     params: _MessageCountParams,
     messages: List[AllMessageValues],
@@ -515,46 +607,236 @@ def _count_extra(
     return num_tokens
 
 
+def _get_tokenizer(
+    model: Optional[str],
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+) -> Any:
+    """
+    Get the tokenizer for the model and custom tokenizer.
+
+    Returns a `tiktoken.Encoding`, or a huggingface `Tokenizer`.
+    """
+    from litellm.utils import _select_tokenizer, print_verbose
+
+    if model is None and custom_tokenizer is None:
+        return default_encoding
+    tokenizer_json = custom_tokenizer or _select_tokenizer(model)  # type: ignore
+    if tokenizer_json["type"] == "huggingface_tokenizer":
+        return tokenizer_json["tokenizer"]
+    elif tokenizer_json["type"] == "openai_tokenizer":
+        model_to_use = _fix_model_name(model)  # type: ignore
+        try:
+            if "gpt-4o" in model_to_use:
+                return tiktoken.get_encoding("o200k_base")
+            return tiktoken.encoding_for_model(model_to_use)
+        except KeyError:
+            print_verbose("Warning: model not found. Using cl100k_base encoding.")
+            return tiktoken.get_encoding("cl100k_base")
+    else:
+        raise ValueError("Unsupported tokenizer type")
+
+
+def _is_token_count_cacheable(text: str) -> bool:
+    return (
+        _token_count_cache.max_size > 0
+        and len(text) >= TOKEN_COUNTER_CACHE_MIN_TEXT_LENGTH
+    )
+
+
+def _count_tiktoken_tokens(encoding: tiktoken.Encoding, text: str) -> int:
+    """
+    Count the tokens of `text`, using the token count cache for long texts.
+    """
+    if not _is_token_count_cacheable(text):
+        return len(encoding.encode(text, disallowed_special=()))
+    cache_key = _token_count_cache.make_key(encoding.name, text)
+    num_tokens = _token_count_cache.get(cache_key)
+    if num_tokens is None:
+        num_tokens = len(encoding.encode(text, disallowed_special=()))
+        _token_count_cache.set(cache_key, num_tokens)
+    return num_tokens
+
+
+def _batch_count_tiktoken_tokens(
+    encoding: tiktoken.Encoding, texts: List[str]
+) -> List[int]:
+    """
+    Count the tokens of each text. Cached texts are skipped, duplicate texts are only encoded once.
+    """
+    counts: List[int] = [0] * len(texts)
+    indexes_to_encode: Dict[str, List[int]] = {}
+    for index, text in enumerate(texts):
+        if text in indexes_to_encode:
+            indexes_to_encode[text].append(index)
+            continue
+        if _is_token_count_cacheable(text):
+            cached_count = _token_count_cache.get(
+                _token_count_cache.make_key(encoding.name, text)
+            )
+            if cached_count is not None:
+                counts[index] = cached_count
+                continue
+        indexes_to_encode[text] = [index]
+
+    if indexes_to_encode:
+        texts_to_encode = list(indexes_to_encode)
+        encoded_texts = encoding.encode_batch(texts_to_encode, disallowed_special=())
+        for text, tokens in zip(texts_to_encode, encoded_texts):
+            for index in indexes_to_encode[text]:
+                counts[index] = len(tokens)
+            if _is_token_count_cacheable(text):
+                _token_count_cache.set(
+                    _token_count_cache.make_key(encoding.name, text), len(tokens)
+                )
+    return counts
+
+
 def _get_count_function(
     model: Optional[str],
     custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+    use_cache: bool = True,
 ) -> TokenCounterFunction:
     """
-    Get the function to count tokens based on the model and custom tokenizer."""
-    from litellm.utils import _select_tokenizer, print_verbose
+    Get the function to count tokens based on the model and custom tokenizer.
 
-    if model is not None or custom_tokenizer is not None:
-        tokenizer_json = custom_tokenizer or _select_tokenizer(model)  # type: ignore
-        if tokenizer_json["type"] == "huggingface_tokenizer":
+    Token counts of long texts are cached for tiktoken encodings, unless `use_cache` is False
+    (e.g. for texts that are never counted twice).
+    """
+    tokenizer = _get_tokenizer(model, custom_tokenizer)
+    if isinstance(tokenizer, tiktoken.Encoding):
+        if use_cache:
 
             def count_tokens(text: str) -> int:
-                enc = tokenizer_json["tokenizer"].encode(text)
-                return len(enc.ids)
-
-        elif tokenizer_json["type"] == "openai_tokenizer":
-            model_to_use = _fix_model_name(model)  # type: ignore
-            try:
-                if "gpt-4o" in model_to_use:
-                    encoding = tiktoken.get_encoding("o200k_base")
-                else:
-                    encoding = tiktoken.encoding_for_model(model_to_use)
-            except KeyError:
-                print_verbose("Warning: model not found. Using cl100k_base encoding.")
-                encoding = tiktoken.get_encoding("cl100k_base")
+                return _count_tiktoken_tokens(tokenizer, text)
+
+        else:
 
             def count_tokens(text: str) -> int:
-                return len(encoding.encode(text, disallowed_special=()))
+                return len(tokenizer.encode(text, disallowed_special=()))
 
-        else:
-            raise ValueError("Unsupported tokenizer type")
     else:
 
         def count_tokens(text: str) -> int:
-            return len(default_encoding.encode(text, disallowed_special=()))
+            enc = tokenizer.encode(text)
+            return len(enc.ids)
 
     return count_tokens
 
 
+def _get_batch_count_function(
+    model: Optional[str],
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+) -> BatchTokenCounterFunction:
+    """
+    Get the function to count tokens of many texts with the tokenizer's batch encode.
+    """
+    tokenizer = _get_tokenizer(model, custom_tokenizer)
+    if isinstance(tokenizer, tiktoken.Encoding):
+
+        def batch_count_tokens(texts: List[str]) -> List[int]:
+            return _batch_count_tiktoken_tokens(tokenizer, texts)
+
+    else:
+
+        def batch_count_tokens(texts: List[str]) -> List[int]:
+            if not texts:
+                return []
+            return [len(enc.ids) for enc in tokenizer.encode_batch(texts)]
+
+    return batch_count_tokens
+
+
+class IncrementalTokenCounter:
+    """
+    Count the tokens of a streamed text as the deltas arrive.
+
+    Equivalent to `token_counter(model=model, text="".join(deltas))`, without
+    tokenizing the whole text at the end of the stream.
+
+    Deltas are buffered and tokenized in segments of ~`flush_size` characters. A segment
+    is only cut right before a space followed by a letter - tiktoken's pre-tokenizer
+    always starts a new token there, so the per-segment counts add up to the count of
+    the whole text. Huggingface tokenizers add special tokens / prefixes per call, so for
+    them the text is only tokenized once, in `get_token_count`.
+    """
+
+    def __init__(
+        self,
+        model: str = "",
+        custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+        flush_size: int = 4096,
+    ):
+        self.model = model
+        self.custom_tokenizer = custom_tokenizer
+        self.flush_size = flush_size
+        self.token_count = 0  # tokens in the already flushed text
+        self._pending_parts: List[str] = []
+        self._pending_length = 0
+        self._next_flush_length = flush_size
+        self._count_function: Optional[TokenCounterFunction] = None
+        self._can_split: Optional[bool] = None
+
+    def _get_count_function(self) -> TokenCounterFunction:
+        if self._count_function is None:
+            # segments of a stream are never counted twice - skip the token count cache
+            self._count_function = _get_count_function(
+                self.model, self.custom_tokenizer, use_cache=False
+            )
+            self._can_split = isinstance(
+                _get_tokenizer(self.model, self.custom_tokenizer), tiktoken.Encoding
+            )
+        return self._count_function
+
+    @staticmethod
+    def _find_split_index(text: str) -> int:
+        """
+        Index of the last space followed by a letter, or -1.
+        """
+        index = len(text) - 2
+        while index > 0:
+            index = text.rfind(" ", 0, index + 1)
+            if index <= 0:
+                return -1
+            if text[index + 1].isalpha():
+                return index
+            index -= 1
+        return -1
+
+    def add_text(self, text: Optional[str]) -> None:
+        if not text or litellm.disable_token_counter is True:
+            return
+        self._pending_parts.append(text)
+        self._pending_length += len(text)
+        if self._pending_length >= self._next_flush_length:
+            self._flush()
+
+    def _flush(self) -> None:
+        count_function = self._get_count_function()
+        pending = "".join(self._pending_parts)
+        split_index = self._find_split_index(pending) if self._can_split else -1
+        if split_index <= 0:
+            # no safe split point yet - check again once the buffer doubled
+            self._pending_parts = [pending]
+            self._next_flush_length = self._pending_length * 2
+            return
+        self.token_count += count_function(pending[:split_index])
+        remainder = pending[split_index:]
+        self._pending_parts = [remainder]
+        self._pending_length = len(remainder)
+        self._next_flush_length = self._pending_length + self.flush_size
+
+    def get_token_count(self, suffix: str = "") -> int:
+        """
+        Tokens in all text added so far, followed by `suffix`.
+        """
+        if litellm.disable_token_counter is True:
+            return 0
+        pending = "".join(self._pending_parts) + suffix
+        if not pending:
+            return self.token_count
+        return self.token_count + self._get_count_function()(pending)
+
+
 def _fix_model_name(model: str) -> str:
     """We normalize some model names to others"""
     if model in litellm.azure_llms:
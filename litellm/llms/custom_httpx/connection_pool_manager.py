@@ -0,0 +1,431 @@
+"""
+Per-deployment connection pools for async httpx clients.
+
+Deployments can size their own pool in `litellm_params`:
+- `max_connections`: max open connections to the deployment
+- `max_keepalive_connections`: max idle connections kept open
+- `keepalive_expiry`: seconds an idle connection is kept open
+- `http2`: multiplex requests over HTTP/2 connections (needs the `h2` package)
+- `warmup_connections`: connections to open when the router is initialized
+
+Pools are keyed by the origin (`scheme://host:port`) of the deployment's api_base, so
+deployments on the same endpoint share one pool. Once a pool is registered, transports
+created by `AsyncHTTPHandler._create_async_transport` send requests for that origin
+through it, and all other requests through the default transport.
+"""
+
+import asyncio
+import importlib.util
+import os
+import ssl
+import weakref
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import httpcore
+import httpx
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    AIOHTTP_CONNECTOR_LIMIT,
+    AIOHTTP_KEEPALIVE_TIMEOUT,
+    CONNECTION_POOL_CLOSE_TIMEOUT,
+    CONNECTION_POOL_WARMUP_TIMEOUT,
+)
+
+OriginKey = Tuple[str, str, Optional[int]]
+SSLVerify = Union[bool, ssl.SSLContext]
+
+CONNECTION_POOL_PARAMS = (
+    "max_connections",
+    "max_keepalive_connections",
+    "keepalive_expiry",
+    "http2",
+    "warmup_connections",
+)
+
+
+class ConnectionPoolSettings(NamedTuple):
+    max_connections: Optional[int] = None
+    max_keepalive_connections: Optional[int] = None
+    keepalive_expiry: Optional[float] = None
+    http2: bool = False
+    warmup_connections: int = 0
+
+    def get_limits(self) -> httpx.Limits:
+        # same default pool size as the aiohttp transport
+        max_connections = self.max_connections or AIOHTTP_CONNECTOR_LIMIT or None
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=(
+                self.max_keepalive_connections or max_connections
+            ),
+            keepalive_expiry=(
+                self.keepalive_expiry
+                if self.keepalive_expiry is not None
+                else AIOHTTP_KEEPALIVE_TIMEOUT
+            ),
+        )
+
+
+def get_origin_key(url: Union[str, httpx.URL]) -> Optional[OriginKey]:
+    try:
+        _url = url if isinstance(url, httpx.URL) else httpx.URL(url)
+    except Exception:
+        return None
+    if not _url.host:
+        return None
+    return (_url.scheme, _url.host, _url.port)
+
+
+def _get_verify_key(origin: OriginKey, verify: SSLVerify) -> Hashable:
+    if origin[0] != "https":
+        # ssl settings don't apply, all clients share one pool
+        return None
+    # ssl contexts are cached by `get_ssl_configuration`, so equal configs share an id
+    return verify if isinstance(verify, bool) else id(verify)
+
+
+# `_get_pool_stats` reads httpcore internals (`AsyncConnectionPool._requests`,
+# `is_queued()`), which aren't part of its public API - only trust them on the major
+# version they were written against.
+HTTPCORE_POOL_STATS_SUPPORTED = httpcore.__version__.split(".")[0] == "1"
+
+
+def _get_pool_stats(
+    transport: httpx.AsyncHTTPTransport,
+) -> Optional[Dict[str, int]]:
+    """
+    Active, idle and waiting connections of a transport's pool, or None on httpcore
+    versions the pool internals weren't checked against.
+    """
+    if not HTTPCORE_POOL_STATS_SUPPORTED:
+        return None
+    pool = transport._pool
+    idle = sum(1 for connection in pool.connections if connection.is_idle())
+    return {
+        "active": len(pool.connections) - idle,
+        "idle": idle,
+        "waiting": sum(1 for request in pool._requests if request.is_queued()),
+    }
+
+
+class ConnectionPoolManager:
+    def __init__(self):
+        self._settings: Dict[OriginKey, ConnectionPoolSettings] = {}
+        # (origin, ssl config, event loop id) -> (event loop, transport)
+        self._transports: Dict[
+            Tuple[OriginKey, Hashable, int],
+            Tuple[weakref.ReferenceType, httpx.AsyncHTTPTransport],
+        ] = {}
+        self._http2_available: Optional[bool] = None
+        # keeps a reference to the tasks closing replaced pools until they finish
+        self._close_tasks: Set[asyncio.Task] = set()
+
+    def has_pools(self) -> bool:
+        return len(self._settings) > 0
+
+    def register_deployment(self, litellm_params: Dict[str, Any]) -> Optional[str]:
+        """
+        Register the pool settings in a deployment's litellm_params.
+
+        Returns the api_base the pool was registered for, or None if the deployment
+        has no pool settings.
+        """
+        if all(litellm_params.get(param) is None for param in CONNECTION_POOL_PARAMS):
+            return None
+        api_base = litellm_params.get("api_base")
+        origin = get_origin_key(api_base) if isinstance(api_base, str) else None
+        if origin is None:
+            verbose_logger.warning(
+                "Ignoring connection pool settings for model=%s, they need an api_base",
+                litellm_params.get("model"),
+            )
+            return None
+
+        http2 = litellm_params.get("http2") is True
+        if http2 and not self._is_http2_available():
+            verbose_logger.warning(
+                "http2=True for api_base=%s, but the 'h2' package is not installed. "
+                "Using HTTP/1.1 - run `pip install h2` to enable HTTP/2.",
+                api_base,
+            )
+            http2 = False
+
+        settings = ConnectionPoolSettings(
+            max_connections=litellm_params.get("max_connections"),
+            max_keepalive_connections=litellm_params.get("max_keepalive_connections"),
+            keepalive_expiry=litellm_params.get("keepalive_expiry"),
+            http2=http2,
+            warmup_connections=litellm_params.get("warmup_connections") or 0,
+        )
+        if self._settings.get(origin) != settings:
+            self._settings[origin] = settings
+            # pools created with the previous settings are replaced on next use
+            replaced = [
+                value for key, value in self._transports.items() if key[0] == origin
+            ]
+            self._transports = {
+                key: value
+                for key, value in self._transports.items()
+                if key[0] != origin
+            }
+            for loop_ref, transport in replaced:
+                self._close_transport_in_background(loop_ref, transport)
+        return api_base
+
+    def get_settings(
+        self, url: Union[str, httpx.URL]
+    ) -> Optional[ConnectionPoolSettings]:
+        origin = get_origin_key(url)
+        if origin is None:
+            return None
+        return self._settings.get(origin)
+
+    def get_transport(
+        self, origin: OriginKey, verify: SSLVerify
+    ) -> Optional[httpx.AsyncHTTPTransport]:
+        """
+        Returns the pool for an origin on the running event loop, or None if the origin
+        has no pool settings.
+        """
+        settings = self._settings.get(origin)
+        if settings is None:
+            return None
+        loop = asyncio.get_running_loop()
+        key = (origin, _get_verify_key(origin, verify), id(loop))
+        cached = self._transports.get(key)
+        if cached is not None and cached[0]() is loop:
+            return cached[1]
+
+        self._drop_closed_loop_transports()
+        transport = httpx.AsyncHTTPTransport(
+            verify=verify,
+            cert=os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate),
+            http2=settings.http2,
+            limits=settings.get_limits(),
+            local_address="0.0.0.0" if litellm.force_ipv4 else None,
+        )
+        self._transports[key] = (weakref.ref(loop), transport)
+        return transport
+
+    async def warmup(self, api_base: str, verify: Optional[SSLVerify] = None) -> int:
+        """
+        Pre-open `warmup_connections` connections to a deployment, so the first requests
+        don't pay for the TCP/TLS handshake.
+
+        Returns the number of connections opened.
+        """
+        origin = get_origin_key(api_base)
+        settings = self._settings.get(origin) if origin is not None else None
+        if origin is None or settings is None or settings.warmup_connections <= 0:
+            return 0
+        if verify is None:
+            from litellm.llms.custom_httpx.http_handler import get_ssl_configuration
+
+            _verify = get_ssl_configuration()
+            verify = _verify if isinstance(_verify, (bool, ssl.SSLContext)) else True
+        transport = self.get_transport(origin, verify)
+        if transport is None:
+            return 0
+
+        timeout = httpx.Timeout(CONNECTION_POOL_WARMUP_TIMEOUT).as_dict()
+
+        async def _open_connection() -> None:
+            request = httpx.Request("HEAD", api_base, extensions={"timeout": timeout})
+            response = await transport.handle_async_request(request)
+            # the connection only goes back to the pool once the response is read
+            await response.aread()
+            await response.aclose()
+
+        # concurrent requests, so each one needs its own connection
+        results = await asyncio.gather(
+            *[_open_connection() for _ in range(settings.warmup_connections)],
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            verbose_logger.debug(
+                "Connection pool warmup for api_base=%s: %s/%s requests failed - %s",
+                api_base,
+                len(errors),
+                len(results),
+                errors[0],
+            )
+        return len(results) - len(errors)
+
+    async def warmup_all(self) -> int:
+        """
+        Pre-open `warmup_connections` connections to every registered origin.
+        """
+        results = await asyncio.gather(
+            *[
+                self.warmup(api_base=_format_origin(origin))
+                for origin, settings in list(self._settings.items())
+                if settings.warmup_connections > 0
+            ]
+        )
+        return sum(results)
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Active, idle and waiting connections per origin, across event loops.
+
+        - active: connections serving (or setting up for) a request
+        - idle: keepalive connections available for the next request
+        - waiting: requests queued because the pool is at `max_connections`
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        if not HTTPCORE_POOL_STATS_SUPPORTED:
+            verbose_logger.debug(
+                "Connection pool stats aren't supported with httpcore==%s",
+                httpcore.__version__,
+            )
+            return stats
+        for (origin, _, _), (_, transport) in list(self._transports.items()):
+            try:
+                transport_stats = _get_pool_stats(transport)
+            except Exception as e:
+                verbose_logger.debug("Error reading connection pool stats: %s", e)
+                continue
+            if transport_stats is None:
+                continue
+            origin_stats = stats.setdefault(
+                _format_origin(origin), {"active": 0, "idle": 0, "waiting": 0}
+            )
+            for stat_name, value in transport_stats.items():
+                origin_stats[stat_name] += value
+        return stats
+
+    async def aclose(self) -> None:
+        transports = [transport for _, transport in self._transports.values()]
+        self._transports = {}
+        for transport in transports:
+            try:
+                await transport.aclose()
+            except Exception as e:
+                verbose_logger.debug("Error closing connection pool: %s", e)
+
+    def _close_transport_in_background(
+        self, loop_ref: weakref.ReferenceType, transport: httpx.AsyncHTTPTransport
+    ) -> None:
+        """
+        Close a replaced pool on the event loop it was created on, once its in-flight
+        requests finish.
+        """
+        loop = loop_ref()
+        if loop is None or loop.is_closed():
+            # its connections went away with the loop
+            return
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            running_loop = None
+
+        if loop is running_loop:
+            task = loop.create_task(self._aclose_when_idle(transport))
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._aclose_when_idle(transport), loop)
+        else:
+            verbose_logger.debug(
+                "Not closing replaced connection pool, its event loop isn't running"
+            )
+
+    @staticmethod
+    async def _aclose_when_idle(
+        transport: httpx.AsyncHTTPTransport,
+        timeout: float = CONNECTION_POOL_CLOSE_TIMEOUT,
+    ) -> None:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while asyncio.get_running_loop().time() < deadline:
+            try:
+                stats = _get_pool_stats(transport)
+            except Exception:
+                stats = None
+            if stats is not None and stats["active"] == 0 and stats["waiting"] == 0:
+                break
+            await asyncio.sleep(0.1)
+        try:
+            await transport.aclose()
+        except Exception as e:
+            verbose_logger.debug("Error closing replaced connection pool: %s", e)
+
+    def reset(self) -> None:
+        self._settings = {}
+        self._transports = {}
+
+    def _drop_closed_loop_transports(self) -> None:
+        closed_keys: List[Tuple[OriginKey, Hashable, int]] = []
+        for key, (loop_ref, _) in self._transports.items():
+            loop = loop_ref()
+            if loop is None or loop.is_closed():
+                closed_keys.append(key)
+        for key in closed_keys:
+            self._transports.pop(key, None)
+
+    def _is_http2_available(self) -> bool:
+        if self._http2_available is None:
+            self._http2_available = importlib.util.find_spec("h2") is not None
+        return self._http2_available
+
+
+def _format_origin(origin: OriginKey) -> str:
+    scheme, host, port = origin
+    return f"{scheme}://{host}" if port is None else f"{scheme}://{host}:{port}"
+
+
+connection_pool_manager = ConnectionPoolManager()
+
+
+class ConnectionPoolRoutingTransport(httpx.AsyncBaseTransport):
+    """
+    Sends requests for origins with a registered pool through that pool, and all other
+    requests through the default transport.
+    """
+
+    def __init__(
+        self,
+        default_transport: Optional[httpx.AsyncBaseTransport],
+        verify: SSLVerify,
+        pool_manager: ConnectionPoolManager = connection_pool_manager,
+    ):
+        self.default_transport = default_transport
+        self.verify = verify
+        self.pool_manager = pool_manager
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = request.url
+        transport = self.pool_manager.get_transport(
+            (url.scheme, url.host, url.port), self.verify
+        )
+        if transport is None:
+            transport = self._get_default_transport()
+        return await transport.handle_async_request(request)
+
+    def _get_default_transport(self) -> httpx.AsyncBaseTransport:
+        if self.default_transport is None:
+            # same transport httpx.AsyncClient creates when none is passed
+            self.default_transport = httpx.AsyncHTTPTransport(
+                verify=self.verify,
+                cert=os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate),
+            )
+        return self.default_transport
+
+    async def aclose(self) -> None:
+        # pools are shared across clients and closed by the pool manager
+        if self.default_transport is not None:
+            await self.default_transport.aclose()
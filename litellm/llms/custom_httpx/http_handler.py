@@ -32,6 +32,10 @@ from litellm.constants import (
     DEFAULT_SSL_CIPHERS,
 )
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
+from litellm.llms.custom_httpx.connection_pool_manager import (
+    ConnectionPoolRoutingTransport,
+    connection_pool_manager,
+)
 from litellm.types.llms.custom_http import *
 
 if TYPE_CHECKING:
@@ -733,12 +737,19 @@ class AsyncHTTPHandler:
         ssl_context: Optional[ssl.SSLContext] = None,
         ssl_verify: Optional[bool] = None,
         shared_session: Optional["ClientSession"] = None,
-    ) -> Optional[Union[LiteLLMAiohttpTransport, AsyncHTTPTransport]]:
+    ) -> Optional[
+        Union[
+            LiteLLMAiohttpTransport,
+            AsyncHTTPTransport,
+            ConnectionPoolRoutingTransport,
+        ]
+    ]:
         """
         - Creates a transport for httpx.AsyncClient
             - if litellm.force_ipv4 is True, it will return AsyncHTTPTransport with local_address="0.0.0.0"
             - [Default] It will return AiohttpTransport
             - Users can opt out of using AiohttpTransport by setting litellm.use_aiohttp_transport to False
+            - if deployments registered connection pools, the transport is wrapped to send their requests through their pools
 
 
         Notes on this handler:
@@ -748,20 +759,40 @@ class AsyncHTTPHandler:
         - Why force ipv4?
             - Some users have seen httpx ConnectionError when using ipv6 - forcing ipv4 resolves the issue for them
         """
+        transport: Optional[Union[LiteLLMAiohttpTransport, AsyncHTTPTransport]]
         #########################################################
         # AIOHTTP TRANSPORT is off by default
         #########################################################
         if AsyncHTTPHandler._should_use_aiohttp_transport():
-            return AsyncHTTPHandler._create_aiohttp_transport(
+            transport = AsyncHTTPHandler._create_aiohttp_transport(
                 ssl_context=ssl_context,
                 ssl_verify=ssl_verify,
                 shared_session=shared_session,
             )
+        else:
+            #########################################################
+            # HTTPX TRANSPORT is used when aiohttp is not installed
+            #########################################################
+            transport = AsyncHTTPHandler._create_httpx_transport()
 
         #########################################################
-        # HTTPX TRANSPORT is used when aiohttp is not installed
+        # Per-deployment connection pools (litellm_params.max_connections, http2, ...)
         #########################################################
-        return AsyncHTTPHandler._create_httpx_transport()
+        if connection_pool_manager.has_pools():
+            verify: Union[bool, ssl.SSLContext]
+            if ssl_context is not None:
+                verify = ssl_context
+            elif ssl_verify is False:
+                verify = False
+            else:
+                _ssl_config = get_ssl_configuration()
+                verify = (
+                    _ssl_config if isinstance(_ssl_config, ssl.SSLContext) else True
+                )
+            return ConnectionPoolRoutingTransport(
+                default_transport=transport, verify=verify
+            )
+        return transport
 
     @staticmethod
     def _should_use_aiohttp_transport() -> bool:
@@ -1238,6 +1269,9 @@ def get_async_httpx_client(
                 pass
 
     _cache_key_name = "async_httpx_client" + _params_key_name + llm_provider
+    if connection_pool_manager.has_pools():
+        # clients created before the first pool was registered don't route to pools
+        _cache_key_name += "_connection_pools"
 
     # Lazily initialize the global in-memory client cache to avoid relying on
     # litellm globals being fully populated during import time.
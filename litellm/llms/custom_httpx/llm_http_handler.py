@@ -25,6 +25,7 @@ from litellm.anthropic_beta_headers_manager import (
     update_headers_with_filtered_beta,
 )
 from litellm.constants import REALTIME_WEBSOCKET_MAX_MESSAGE_SIZE_BYTES
+from litellm.litellm_core_utils.raw_sse_passthrough import RawSSEPassthroughStream
 from litellm.litellm_core_utils.realtime_streaming import RealTimeStreaming
 from litellm.llms.base_llm.anthropic_messages.transformation import (
     BaseAnthropicMessagesConfig,
@@ -64,6 +65,7 @@ from litellm.llms.custom_httpx.http_handler import (
     _get_httpx_client,
     get_async_httpx_client,
 )
+from litellm.llms.openai.chat.gpt_transformation import OpenAIGPTConfig
 from litellm.responses.streaming_iterator import (
     BaseResponsesAPIStreamingIterator,
     MockResponsesAPIStreamingIterator,
@@ -688,6 +690,37 @@ class BaseLLMHTTPHandler:
                 signed_json_body=signed_json_body,
             )
 
+        if (
+            litellm_params.get("raw_sse_passthrough") is True
+            and fake_stream is not True
+            and isinstance(provider_config, OpenAIGPTConfig)
+        ):
+            completion_stream, response = await self.make_async_call_stream_helper(
+                model=model,
+                custom_llm_provider=custom_llm_provider,
+                provider_config=provider_config,
+                api_base=api_base,
+                headers=headers,
+                data=data,
+                messages=messages,
+                logging_obj=logging_obj,
+                timeout=timeout,
+                client=client,
+                litellm_params=litellm_params,
+                optional_params=optional_params,
+                json_mode=json_mode,
+                signed_json_body=signed_json_body,
+                return_raw_response=True,
+            )
+            return RawSSEPassthroughStream(
+                completion_stream=completion_stream,
+                raw_response=response,
+                model=model,
+                custom_llm_provider=custom_llm_provider,
+                logging_obj=logging_obj,
+                _response_headers=dict(response.headers),
+            )
+
         completion_stream, _response_headers = await self.make_async_call_stream_helper(
             model=model,
             custom_llm_provider=custom_llm_provider,
@@ -730,11 +763,15 @@ class BaseLLMHTTPHandler:
         client: Optional[AsyncHTTPHandler] = None,
         json_mode: Optional[bool] = None,
         signed_json_body: Optional[bytes] = None,
-    ) -> Tuple[Any, httpx.Headers]:
+        return_raw_response: bool = False,
+    ) -> Tuple[Any, Any]:
         """
         Helper function for making an async call with stream.
 
         Handles fake stream as well.
+
+        Returns the chunk iterator and the response headers - or the streaming response
+        itself if `return_raw_response` is True.
         """
         if client is None:
             async_httpx_client = get_async_httpx_client(
@@ -789,6 +826,8 @@ class BaseLLMHTTPHandler:
             additional_args={"complete_input_dict": data},
         )
 
+        if return_raw_response:
+            return completion_stream, response
         return completion_stream, response.headers
 
     def _add_stream_param_to_request_body(
@@ -34,6 +34,7 @@ from litellm._logging import verbose_logger
 from litellm.constants import DEFAULT_MAX_RETRIES
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
+from litellm.litellm_core_utils.raw_sse_passthrough import RawSSEPassthroughStream
 from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.base_llm.chat.transformation import BaseConfig, BaseLLMException
 from litellm.llms.bedrock.chat.invoke_handler import MockResponseIterator
@@ -1107,6 +1108,18 @@ class OpenAIChatCompletion(BaseLLM, BaseOpenAILLM):
                     logging_obj=logging_obj,
                 )
                 logging_obj.model_call_details["response_headers"] = headers
+                if litellm_params.get("raw_sse_passthrough") is True and isinstance(
+                    response, openai.AsyncStream
+                ):
+                    return RawSSEPassthroughStream(
+                        completion_stream=response,
+                        raw_response=response.response,
+                        model=model,
+                        custom_llm_provider="openai",
+                        logging_obj=logging_obj,
+                        stream_options=data.get("stream_options", None),
+                        _response_headers=headers,
+                    )
                 streamwrapper = CustomStreamWrapper(
                     completion_stream=response,
                     model=model,
@@ -2,7 +2,17 @@
 Dynamic configuration class generator for JSON-based providers.
 """
 
-from typing import Any, Coroutine, List, Literal, Optional, Tuple, Union, overload
+from typing import (
+    Any,
+    Coroutine,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 from litellm._logging import verbose_logger
 from litellm.litellm_core_utils.prompt_templates.common_utils import (
@@ -16,7 +26,21 @@ from litellm.types.llms.openai import AllMessageValues
 from .json_loader import SimpleProviderConfig
 
 
+# slug -> (provider config, generated class), so each provider's class is generated once
+_CONFIG_CLASSES: Dict[str, Tuple[SimpleProviderConfig, type]] = {}
+
+
 def create_config_class(provider: SimpleProviderConfig):
+    """Return the config class for a JSON provider, generating it on first use"""
+    cached = _CONFIG_CLASSES.get(provider.slug)
+    if cached is not None and cached[0] is provider:
+        return cached[1]
+    config_class = _generate_config_class(provider)
+    _CONFIG_CLASSES[provider.slug] = (provider, config_class)
+    return config_class
+
+
+def _generate_config_class(provider: SimpleProviderConfig):
     """Generate config class dynamically from JSON configuration"""
 
     # Choose base class
@@ -75,6 +75,9 @@ from litellm.litellm_core_utils.audio_utils.utils import (
     calculate_request_duration,
     get_audio_file_for_health_check,
 )
+from litellm.litellm_core_utils.completion_provider_registry import (
+    get_completion_provider_route,
+)
 from litellm.litellm_core_utils.dd_tracing import tracer
 from litellm.litellm_core_utils.get_provider_specific_headers import (
     ProviderSpecificHeaderUtils,
@@ -249,6 +252,7 @@ from .types.utils import (
     FileTypes,
     HiddenParams,
     LlmProviders,
+    LlmProvidersSet,
     PromptTokensDetails,
     ProviderSpecificHeader,
     all_litellm_params,
@@ -1394,12 +1398,11 @@ def completion(  # type: ignore # noqa: PLR0915
             )
 
         provider_config: Optional[BaseConfig] = None
-        if custom_llm_provider is not None and custom_llm_provider in [
-            provider.value for provider in LlmProviders
-        ]:
+        if custom_llm_provider is not None and custom_llm_provider in LlmProvidersSet:
             provider_config = ProviderConfigManager.get_provider_chat_config(
                 model=model, provider=LlmProviders(custom_llm_provider)
             )
+        completion_provider_route = get_completion_provider_route(custom_llm_provider)
 
         if provider_config is not None:
             messages = provider_config.translate_developer_role_to_system_role(
@@ -1517,6 +1520,7 @@ def completion(  # type: ignore # noqa: PLR0915
             merge_reasoning_content_in_choices=kwargs.get(
                 "merge_reasoning_content_in_choices", None
             ),
+            raw_sse_passthrough=kwargs.get("raw_sse_passthrough", None),
             use_litellm_proxy=kwargs.get("use_litellm_proxy", False),
             api_version=api_version,
             azure_ad_token=kwargs.get("azure_ad_token"),
@@ -1782,39 +1786,6 @@ def completion(  # type: ignore # noqa: PLR0915
                         "api_base": api_base,
                     },
                 )
-        elif custom_llm_provider == "deepseek":
-            ## COMPLETION CALL
-
-            try:
-                response = base_llm_http_handler.completion(
-                    model=model,
-                    messages=messages,
-                    headers=headers,
-                    model_response=model_response,
-                    api_key=api_key,
-                    api_base=api_base,
-                    acompletion=acompletion,
-                    logging_obj=logging,
-                    optional_params=optional_params,
-                    litellm_params=litellm_params,
-                    shared_session=shared_session,
-                    timeout=timeout,  # type: ignore
-                    client=client,
-                    custom_llm_provider=custom_llm_provider,
-                    encoding=_get_encoding(),
-                    stream=stream,
-                    provider_config=provider_config,
-                )
-            except Exception as e:
-                ## LOGGING - log the original exception returned
-                logging.post_call(
-                    input=messages,
-                    api_key=api_key,
-                    original_response=str(e),
-                    additional_args={"headers": headers},
-                )
-                raise e
-
         elif custom_llm_provider == "azure_ai":
             from litellm.llms.azure_ai.common_utils import AzureFoundryModelInfo
 
@@ -2040,7 +2011,21 @@ def completion(  # type: ignore # noqa: PLR0915
                     additional_args={"headers": headers},
                 )
             response = _response
-        elif custom_llm_provider == "fireworks_ai":
+        elif completion_provider_route is not None:
+            # providers registered in litellm_core_utils/completion_provider_registry.py
+            api_key, api_base, headers = completion_provider_route.resolve_credentials(
+                api_key, api_base, headers
+            )
+
+            ## LOAD CONFIG - if set
+            if completion_provider_route.default_params_config is not None:
+                config = completion_provider_route.default_params_config.get_config()
+                for k, v in config.items():
+                    if (
+                        k not in optional_params
+                    ):  # completion(top_k=3) > provider_config(top_k=3) <- allows for dynamic variables to be passed in
+                        optional_params[k] = v
+
             ## COMPLETION CALL
             try:
                 response = base_llm_http_handler.completion(
@@ -2071,141 +2056,12 @@ def completion(  # type: ignore # noqa: PLR0915
                     additional_args={"headers": headers},
                 )
                 raise e
-        elif custom_llm_provider == "heroku":
-            try:
-                response = base_llm_http_handler.completion(
-                    model=model,
-                    messages=messages,
-                    headers=headers,
-                    model_response=model_response,
-                    api_key=api_key,
-                    api_base=api_base,
-                    acompletion=acompletion,
-                    logging_obj=logging,
-                    optional_params=optional_params,
-                    litellm_params=litellm_params,
-                    shared_session=shared_session,
-                    timeout=timeout,
-                    client=client,
-                    custom_llm_provider=custom_llm_provider,
-                    encoding=_get_encoding(),
-                    stream=stream,
-                    provider_config=provider_config,
-                )
-            except Exception as e:
-                logging.post_call(
-                    input=messages,
-                    api_key=api_key,
-                    original_response=str(e),
-                    additional_args={"headers": headers},
-                )
-                raise e
 
-        elif custom_llm_provider == "ragflow":
-            ## COMPLETION CALL - RAGFlow uses HTTP handler to support custom URL paths
-            try:
-                response = base_llm_http_handler.completion(
-                    model=model,
-                    messages=messages,
-                    headers=headers,
-                    model_response=model_response,
-                    api_key=api_key,
-                    api_base=api_base,
-                    acompletion=acompletion,
-                    logging_obj=logging,
-                    optional_params=optional_params,
-                    litellm_params=litellm_params,
-                    shared_session=shared_session,
-                    timeout=timeout,
-                    client=client,
-                    custom_llm_provider=custom_llm_provider,
-                    encoding=_get_encoding(),
-                    stream=stream,
-                    provider_config=provider_config,
-                )
-            except Exception as e:
-                logging.post_call(
-                    input=messages,
-                    api_key=api_key,
-                    original_response=str(e),
-                    additional_args={"headers": headers},
-                )
-                raise e
-        elif custom_llm_provider == "xai":
-            ## COMPLETION CALL
-            try:
-                response = base_llm_http_handler.completion(
-                    model=model,
-                    messages=messages,
-                    headers=headers,
-                    model_response=model_response,
-                    api_key=api_key,
-                    api_base=api_base,
-                    acompletion=acompletion,
-                    logging_obj=logging,
-                    optional_params=optional_params,
-                    litellm_params=litellm_params,
-                    shared_session=shared_session,
-                    timeout=timeout,  # type: ignore
-                    client=client,
-                    custom_llm_provider=custom_llm_provider,
-                    encoding=_get_encoding(),
-                    stream=stream,
-                    provider_config=provider_config,
-                )
-            except Exception as e:
-                ## LOGGING - log the original exception returned
+            if completion_provider_route.post_call_on_success:
+                ## LOGGING
                 logging.post_call(
-                    input=messages,
-                    api_key=api_key,
-                    original_response=str(e),
-                    additional_args={"headers": headers},
+                    input=messages, api_key=api_key, original_response=response
                 )
-                raise e
-        elif custom_llm_provider == "groq":
-            api_base = (
-                api_base  # for deepinfra/perplexity/anyscale/groq/friendliai we check in get_llm_provider and pass in the api base from there
-                or litellm.api_base
-                or get_secret("GROQ_API_BASE")
-                or "https://api.groq.com/openai/v1"
-            )
-
-            # set API KEY
-            api_key = (
-                api_key
-                or litellm.api_key  # for deepinfra/perplexity/anyscale/friendliai we check in get_llm_provider and pass in the api key from there
-                or litellm.groq_key
-                or get_secret("GROQ_API_KEY")
-            )
-
-            headers = headers or litellm.headers
-
-            ## LOAD CONFIG - if set
-            config = litellm.GroqChatConfig.get_config()
-            for k, v in config.items():
-                if (
-                    k not in optional_params
-                ):  # completion(top_k=3) > openai_config(top_k=3) <- allows for dynamic variables to be passed in
-                    optional_params[k] = v
-
-            response = base_llm_http_handler.completion(
-                model=model,
-                stream=stream,
-                messages=messages,
-                acompletion=acompletion,
-                api_base=api_base,
-                model_response=model_response,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                shared_session=shared_session,
-                custom_llm_provider=custom_llm_provider,
-                timeout=timeout,
-                headers=headers,
-                encoding=_get_encoding(),
-                api_key=api_key,
-                logging_obj=logging,  # model call logging done inside the class as we make need to modify I/O to fit aleph alpha's requirements
-                client=client,
-            )
         elif custom_llm_provider == "a2a":
             # A2A (Agent-to-Agent) Protocol
             # Resolve agent configuration from registry if model format is "a2a/<agent-name>"
@@ -2248,49 +2104,6 @@ def completion(  # type: ignore # noqa: PLR0915
                 client=client,
                 provider_config=provider_config,
             )
-        elif custom_llm_provider == "gigachat":
-            # GigaChat - Sber AI's LLM (Russia)
-            api_key = (
-                api_key
-                or litellm.api_key
-                or litellm.gigachat_key
-                or get_secret("GIGACHAT_API_KEY")
-                or get_secret("GIGACHAT_CREDENTIALS")
-            )
-
-            headers = headers or litellm.headers or {}
-
-            ## COMPLETION CALL
-            try:
-                response = base_llm_http_handler.completion(
-                    model=model,
-                    messages=messages,
-                    headers=headers,
-                    model_response=model_response,
-                    api_key=api_key,
-                    api_base=api_base,
-                    acompletion=acompletion,
-                    logging_obj=logging,
-                    optional_params=optional_params,
-                    litellm_params=litellm_params,
-                    shared_session=shared_session,
-                    timeout=timeout,
-                    client=client,
-                    custom_llm_provider=custom_llm_provider,
-                    encoding=_get_encoding(),
-                    stream=stream,
-                    provider_config=provider_config,
-                )
-            except Exception as e:
-                ## LOGGING - log the original exception returned
-                logging.post_call(
-                    input=messages,
-                    api_key=api_key,
-                    original_response=str(e),
-                    additional_args={"headers": headers},
-                )
-                raise e
-
         elif custom_llm_provider == "sap":
             headers = headers or litellm.headers
             ## LOAD CONFIG - if set
@@ -2357,105 +2170,6 @@ def completion(  # type: ignore # noqa: PLR0915
                 encoding=_get_encoding(),
                 stream=stream,
             )
-        elif custom_llm_provider == "cometapi":
-            api_key = (
-                api_key
-                or litellm.cometapi_key
-                or get_secret_str("COMETAPI_KEY")
-                or litellm.api_key
-            )
-
-            api_base = (
-                api_base
-                or litellm.api_base
-                or get_secret_str("COMETAPI_API_BASE")
-                or "https://api.cometapi.com/v1"
-            )
-
-            ## COMPLETION CALL
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                headers=headers,
-                model_response=model_response,
-                api_key=api_key,
-                api_base=api_base,
-                acompletion=acompletion,
-                logging_obj=logging,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                shared_session=shared_session,
-                timeout=timeout,
-                client=client,
-                custom_llm_provider=custom_llm_provider,
-                encoding=_get_encoding(),
-                stream=stream,
-                provider_config=provider_config,
-            )
-
-            ## LOGGING
-            logging.post_call(
-                input=messages, api_key=api_key, original_response=response
-            )
-        elif custom_llm_provider == "minimax":
-            api_key = api_key or get_secret_str("MINIMAX_API_KEY") or litellm.api_key
-
-            api_base = (
-                api_base
-                or litellm.api_base
-                or get_secret_str("MINIMAX_API_BASE")
-                or "https://api.minimax.io/v1"
-            )
-
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                api_base=api_base,
-                custom_llm_provider=custom_llm_provider,
-                model_response=model_response,
-                encoding=_get_encoding(),
-                logging_obj=logging,
-                optional_params=optional_params,
-                timeout=timeout,
-                litellm_params=litellm_params,
-                shared_session=shared_session,
-                acompletion=acompletion,
-                stream=stream,
-                api_key=api_key,
-                headers=headers,
-                client=client,
-                provider_config=provider_config,
-            )
-            logging.post_call(
-                input=messages, api_key=api_key, original_response=response
-            )
-        elif custom_llm_provider == "hosted_vllm":
-            api_base = (
-                api_base or litellm.api_base or get_secret_str("HOSTED_VLLM_API_BASE")
-            )
-
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                api_base=api_base,
-                custom_llm_provider=custom_llm_provider,
-                model_response=model_response,
-                encoding=_get_encoding(),
-                logging_obj=logging,
-                optional_params=optional_params,
-                timeout=timeout,
-                litellm_params=litellm_params,
-                shared_session=shared_session,
-                acompletion=acompletion,
-                stream=stream,
-                api_key=api_key,
-                headers=headers,
-                client=client,
-                provider_config=provider_config,
-            )
-            logging.post_call(
-                input=messages, api_key=api_key, original_response=response
-            )
         elif (
             model in litellm.open_ai_chat_completion_models
             or custom_llm_provider == "custom_openai"
@@ -2602,34 +2316,6 @@ def completion(  # type: ignore # noqa: PLR0915
                     additional_args={"headers": headers},
                 )
 
-        elif custom_llm_provider == "mistral":
-            api_key = api_key or litellm.api_key or get_secret("MISTRAL_API_KEY")
-            api_base = (
-                api_base
-                or litellm.api_base
-                or get_secret("MISTRAL_API_BASE")
-                or "https://api.mistral.ai/v1"
-            )
-
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                api_base=api_base,
-                custom_llm_provider=custom_llm_provider,
-                model_response=model_response,
-                encoding=_get_encoding(),
-                logging_obj=logging,
-                optional_params=optional_params,
-                timeout=timeout,
-                litellm_params=litellm_params,
-                shared_session=shared_session,
-                acompletion=acompletion,
-                stream=stream,
-                api_key=api_key,
-                headers=headers,
-                client=client,
-                provider_config=provider_config,
-            )
         elif (
             "replicate" in model
             or custom_llm_provider == "replicate"
@@ -2995,76 +2681,6 @@ def completion(  # type: ignore # noqa: PLR0915
                 custom_llm_provider=custom_llm_provider,
                 custom_prompt_dict=custom_prompt_dict,
             )
-        elif custom_llm_provider == "huggingface":
-            huggingface_key = (
-                api_key
-                or litellm.huggingface_key
-                or os.environ.get("HF_TOKEN")
-                or os.environ.get("HUGGINGFACE_API_KEY")
-                or litellm.api_key
-            )
-            hf_headers = headers or litellm.headers
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                headers=hf_headers,
-                model_response=model_response,
-                api_key=huggingface_key,
-                api_base=api_base,
-                acompletion=acompletion,
-                logging_obj=logging,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                timeout=timeout,  # type: ignore
-                client=client,
-                custom_llm_provider=custom_llm_provider,
-                encoding=_get_encoding(),
-                stream=stream,
-            )
-        elif custom_llm_provider == "oci":
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                headers=headers,
-                model_response=model_response,
-                api_key=api_key,
-                api_base=api_base,
-                acompletion=acompletion,
-                logging_obj=logging,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                timeout=timeout,  # type: ignore
-                client=client,
-                custom_llm_provider=custom_llm_provider,
-                encoding=_get_encoding(),
-                stream=stream,
-            )
-        elif custom_llm_provider == "compactifai":
-            api_key = (
-                api_key or get_secret_str("COMPACTIFAI_API_KEY") or litellm.api_key
-            )
-
-            api_base = api_base or "https://api.compactif.ai/v1"
-
-            ## COMPLETION CALL
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                headers=headers,
-                model_response=model_response,
-                api_key=api_key,
-                api_base=api_base,
-                acompletion=acompletion,
-                logging_obj=logging,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                timeout=timeout,
-                client=client,
-                custom_llm_provider=custom_llm_provider,
-                encoding=_get_encoding(),
-                stream=stream,
-                provider_config=provider_config,
-            )
         elif custom_llm_provider == "oobabooga":
             custom_llm_provider = "oobabooga"
             model_response = oobabooga.completion(
@@ -3145,25 +2761,6 @@ def completion(  # type: ignore # noqa: PLR0915
                     additional_args={"headers": headers},
                 )
 
-        elif custom_llm_provider == "datarobot":
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                headers=headers,
-                model_response=model_response,
-                api_key=api_key,
-                api_base=api_base,
-                acompletion=acompletion,
-                logging_obj=logging,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                timeout=timeout,  # type: ignore
-                client=client,
-                custom_llm_provider=custom_llm_provider,
-                encoding=_get_encoding(),
-                stream=stream,
-                provider_config=provider_config,
-            )
         elif custom_llm_provider == "openrouter":
             api_base = (
                 api_base
@@ -3860,71 +3457,6 @@ def completion(  # type: ignore # noqa: PLR0915
 
             ## RESPONSE OBJECT
             response = model_response
-        elif custom_llm_provider == "ollama":
-            api_base = (
-                litellm.api_base
-                or api_base
-                or get_secret("OLLAMA_API_BASE")
-                or "http://localhost:11434"
-            )
-            if api_key is not None and "Authorization" not in headers:
-                headers["Authorization"] = f"Bearer {api_key}"
-
-            response = base_llm_http_handler.completion(
-                model=model,
-                stream=stream,
-                messages=messages,
-                acompletion=acompletion,
-                api_base=api_base,
-                model_response=model_response,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                shared_session=shared_session,
-                custom_llm_provider="ollama",
-                timeout=timeout,
-                headers=headers,
-                encoding=_get_encoding(),
-                api_key=api_key,
-                logging_obj=logging,  # model call logging done inside the class as we make need to modify I/O to fit aleph alpha's requirements
-                client=client,
-            )
-
-        elif custom_llm_provider == "ollama_chat":
-            api_base = (
-                litellm.api_base
-                or api_base
-                or get_secret("OLLAMA_API_BASE")
-                or "http://localhost:11434"
-            )
-
-            api_key = (
-                api_key
-                or litellm.ollama_key
-                or os.environ.get("OLLAMA_API_KEY")
-                or litellm.api_key
-            )
-            if api_key is not None and "Authorization" not in headers:
-                headers["Authorization"] = f"Bearer {api_key}"
-
-            response = base_llm_http_handler.completion(
-                model=model,
-                stream=stream,
-                messages=messages,
-                acompletion=acompletion,
-                api_base=api_base,
-                model_response=model_response,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                shared_session=shared_session,
-                custom_llm_provider="ollama_chat",
-                timeout=timeout,
-                headers=headers,
-                encoding=_get_encoding(),
-                api_key=api_key,
-                logging_obj=logging,  # model call logging done inside the class as we make need to modify I/O to fit aleph alpha's requirements
-                client=client,
-            )
-
         elif custom_llm_provider == "triton":
             api_base = litellm.api_base or api_base
             response = base_llm_http_handler.completion(
@@ -4060,34 +3592,6 @@ def completion(  # type: ignore # noqa: PLR0915
                 logging_obj=logging,
             )
 
-        elif custom_llm_provider == "bytez":
-            api_key = (
-                api_key
-                or litellm.bytez_key
-                or get_secret_str("BYTEZ_API_KEY")
-                or litellm.api_key
-            )
-
-            response = base_llm_http_handler.completion(
-                model=model,
-                messages=messages,
-                headers=headers,
-                model_response=model_response,
-                api_key=api_key,
-                api_base=api_base,
-                acompletion=acompletion,
-                logging_obj=logging,
-                optional_params=optional_params,
-                litellm_params=litellm_params,
-                timeout=timeout,  # type: ignore
-                client=client,
-                custom_llm_provider=custom_llm_provider,
-                encoding=_get_encoding(),
-                stream=stream,
-                provider_config=bytez_transformation,
-            )
-
-            pass
         elif custom_llm_provider == "lemonade":
             api_key = (
                 api_key
@@ -63,6 +63,7 @@ from litellm.utils import get_utc_datetime
 
 from .auth_checks_organization import organization_role_based_access_check
 from .auth_utils import get_model_from_request
+from .model_access_index import get_model_access_index
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -989,29 +990,18 @@ async def get_team_membership(
 def model_in_access_group(
     model: str, team_models: Optional[List[str]], llm_router: Optional[Router]
 ) -> bool:
-    from collections import defaultdict
-
     if team_models is None:
         return True
-    if model in team_models:
+
+    model_access_index = get_model_access_index(team_models)
+    if model in model_access_index.models:
         return True
 
-    access_groups: dict[str, list[str]] = defaultdict(list)
     if llm_router:
+        # check if token contains any of the model's access groups
         access_groups = llm_router.get_model_access_groups(model_name=model)
-
-    if len(access_groups) > 0:  # check if token contains any model access groups
-        for idx, m in enumerate(
-            team_models
-        ):  # loop token models, if any of them are an access group add the access group
-            if m in access_groups:
-                return True
-
-    # Filter out models that are access_groups
-    filtered_models = [m for m in team_models if m not in access_groups]
-
-    if model in filtered_models:
-        return True
+        if model_access_index.has_access_group(access_groups):
+            return True
 
     return False
 
@@ -2246,47 +2236,33 @@ def _check_model_access_helper(
     team_model_aliases: Optional[Dict[str, str]] = None,
     team_id: Optional[str] = None,
 ) -> bool:
-    ## check if model in allowed model names
-    from collections import defaultdict
-
-    access_groups: Dict[str, List[str]] = defaultdict(list)
-
-    if llm_router:
-        access_groups = llm_router.get_model_access_groups(
-            model_name=model, team_id=team_id
-        )
+    """
+    Returns True if `model` is allowed by `models`.
 
-    if (
-        len(access_groups) > 0 and llm_router is not None
-    ):  # check if token contains any model access groups
-        for idx, m in enumerate(
-            models
-        ):  # loop token models, if any of them are an access group add the access group
-            if m in access_groups:
-                return True
+    Checks run cheapest first against the compiled index for `models` - the router's
+    access groups are only looked up if the model isn't allowed by name.
+    """
+    model_access_index = get_model_access_index(models)
 
-    # Filter out models that are access_groups
-    filtered_models = [m for m in models if m not in access_groups]
+    ## check if model in allowed model names
+    if model_access_index.allows_model_name(model):
+        return True
 
     if _model_in_team_aliases(model=model, team_model_aliases=team_model_aliases):
         return True
 
-    if _model_matches_any_wildcard_pattern_in_list(
-        model=model, allowed_model_list=filtered_models
-    ):
+    if model_access_index.matches_wildcard(model):
         return True
 
-    all_model_access: bool = False
-
-    if (len(filtered_models) == 0 and len(models) == 0) or "*" in filtered_models:
-        all_model_access = True
-
-    if SpecialModelNames.all_proxy_models.value in filtered_models:
-        all_model_access = True
+    # check if token contains any of the model's access groups
+    if llm_router is not None:
+        access_groups = llm_router.get_model_access_groups(
+            model_name=model, team_id=team_id
+        )
+        if model_access_index.has_access_group(access_groups):
+            return True
 
-    if model is not None and model not in filtered_models and all_model_access is False:
-        return False
-    return True
+    return False
 
 
 def _can_object_call_model(
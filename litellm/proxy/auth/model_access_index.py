@@ -0,0 +1,135 @@
+"""
+Compiled model access index, used by `_check_model_access_helper`.
+
+Key, team, org and user model lists are checked against the requested model on every
+request. Scanning the list, building a regex per wildcard pattern and resolving the
+model's provider once per pattern gets expensive for principals with hundreds of models.
+
+Each distinct allowed-models list is compiled once into:
+- a set of allowed model names (access group names included)
+- a single regex matching every wildcard pattern in the list
+- whether the list grants access to all proxy models
+
+Indexes are keyed by the list's contents, so when the key/team cache is refilled with
+changed models a new index is compiled - a stale index is never used.
+"""
+
+import re
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple
+
+from litellm._logging import verbose_proxy_logger
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.constants import MODEL_ACCESS_INDEX_CACHE_SIZE
+from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
+from litellm.proxy._types import SpecialModelNames
+
+
+def _compile_wildcard_patterns(patterns: List[str]) -> Optional[Pattern]:
+    """
+    One regex for all wildcard patterns - same matching as `is_model_allowed_by_pattern`.
+
+    Invalid patterns are skipped, they can never match a model.
+    """
+    valid_patterns: List[str] = []
+    for pattern in sorted(patterns):
+        regex = pattern.replace("*", ".*")
+        try:
+            re.compile(regex)
+        except re.error:
+            verbose_proxy_logger.warning(
+                "Ignoring invalid wildcard model pattern: %s", pattern
+            )
+            continue
+        valid_patterns.append(regex)
+    if len(valid_patterns) == 0:
+        return None
+    return re.compile(
+        "^(?:{})$".format("|".join("(?:{})".format(p) for p in valid_patterns))
+    )
+
+
+class ModelAccessIndex:
+    """
+    Compiled form of an allowed-models list.
+    """
+
+    __slots__ = ("models", "all_model_access", "wildcard_regex")
+
+    def __init__(self, models: FrozenSet[str]):
+        self.models = models
+        self.all_model_access: bool = (
+            len(models) == 0
+            or "*" in models
+            or SpecialModelNames.all_proxy_models.value in models
+        )
+        self.wildcard_regex: Optional[Pattern] = _compile_wildcard_patterns(
+            [m for m in models if "*" in m]
+        )
+
+    def allows_model_name(self, model: str) -> bool:
+        """
+        Exact match, or the list grants access to all models.
+        """
+        return self.all_model_access or model in self.models
+
+    def has_access_group(self, access_groups: Dict[str, List[str]]) -> bool:
+        """
+        True if any access group of the model is in the list.
+        """
+        return not self.models.isdisjoint(access_groups)
+
+    def matches_wildcard(self, model: str) -> bool:
+        """
+        True if the model, or `{custom_llm_provider}/{model}`, matches a wildcard pattern.
+
+        eg. `model=gpt-4o` matches `openai/*`
+        """
+        if self.wildcard_regex is None:
+            return False
+        if self.wildcard_regex.match(model) is not None:
+            return True
+        try:
+            _model, custom_llm_provider, _, _ = get_llm_provider(model=model)
+        except Exception:
+            return False
+        return (
+            self.wildcard_regex.match(f"{custom_llm_provider}/{_model}") is not None
+        )
+
+
+_model_access_indexes: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+    max_size=MODEL_ACCESS_INDEX_CACHE_SIZE
+)
+# cached objects keep their models list between cache fills - skip hashing the list
+_model_access_indexes_by_list: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+    max_size=MODEL_ACCESS_INDEX_CACHE_SIZE
+)
+
+
+def get_model_access_index(models: List[str]) -> ModelAccessIndex:
+    """
+    Returns the compiled index for an allowed-models list, compiling it on first use.
+    """
+    list_entry: Optional[Tuple[List[str], int, ModelAccessIndex]] = (
+        _model_access_indexes_by_list.get(id(models))
+    )
+    # the entry holds a reference to the list, so its id can't be reused
+    if (
+        list_entry is not None
+        and list_entry[0] is models
+        and list_entry[1] == len(models)
+    ):
+        return list_entry[2]
+
+    key = frozenset(models)
+    index: Optional[ModelAccessIndex] = _model_access_indexes.get(key)
+    if index is None:
+        index = ModelAccessIndex(key)
+        _model_access_indexes[key] = index
+    _model_access_indexes_by_list[id(models)] = (models, len(models), index)
+    return index
+
+
+def clear_model_access_indexes() -> None:
+    _model_access_indexes.clear()
+    _model_access_indexes_by_list.clear()
@@ -38,6 +38,7 @@ from litellm.proxy.common_utils.callback_utils import (
     get_logging_caching_headers,
     get_remaining_tokens_and_requests_from_request_data,
 )
+from litellm.proxy.common_utils.streaming_text_utils import LazyStreamedText
 from litellm.proxy.route_llm_request import route_request
 from litellm.proxy.utils import ProxyLogging
 from litellm.router import Router
@@ -1236,7 +1237,8 @@ class ProxyBaseLLMRequestProcessing:
         """
         verbose_proxy_logger.debug("inside generator")
         try:
-            str_so_far = ""
+            run_streaming_hook = proxy_logging_obj.has_post_call_streaming_hooks()
+            str_so_far = LazyStreamedText()
             async for chunk in proxy_logging_obj.async_post_call_streaming_iterator_hook(
                 user_api_key_dict=user_api_key_dict,
                 response=response,
@@ -1245,25 +1247,27 @@ class ProxyBaseLLMRequestProcessing:
                 verbose_proxy_logger.debug(
                     "async_data_generator: received streaming chunk - {}".format(chunk)
                 )
-                chunk = await proxy_logging_obj.async_post_call_streaming_hook(
-                    user_api_key_dict=user_api_key_dict,
-                    response=chunk,
-                    data=request_data,
-                    str_so_far=str_so_far,
-                )
+                if run_streaming_hook:
+                    chunk = await proxy_logging_obj.async_post_call_streaming_hook(
+                        user_api_key_dict=user_api_key_dict,
+                        response=chunk,
+                        data=request_data,
+                        str_so_far=str_so_far,
+                    )
 
-                if isinstance(chunk, (ModelResponse, ModelResponseStream)):
-                    response_str = litellm.get_response_string(response_obj=chunk)
-                    str_so_far += response_str
-                elif hasattr(chunk, "model_dump"):
-                    try:
-                        d = chunk.model_dump(mode="json", exclude_none=True)
-                        if isinstance(d, dict):
-                            str_so_far += str(d.get("content", ""))
-                    except Exception:
-                        pass
-                elif isinstance(chunk, dict):
-                    str_so_far += str(chunk.get("content", ""))
+                    if isinstance(chunk, (ModelResponse, ModelResponseStream)):
+                        str_so_far.append(
+                            litellm.get_response_string(response_obj=chunk)
+                        )
+                    elif hasattr(chunk, "model_dump"):
+                        try:
+                            d = chunk.model_dump(mode="json", exclude_none=True)
+                            if isinstance(d, dict):
+                                str_so_far.append(str(d.get("content", "")))
+                        except Exception:
+                            pass
+                    elif isinstance(chunk, dict):
+                        str_so_far.append(str(chunk.get("content", "")))
 
                 model_name = request_data.get("model", "")
                 chunk = (
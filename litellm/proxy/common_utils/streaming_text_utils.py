@@ -0,0 +1,51 @@
+from typing import List
+
+
+class LazyStreamedText:
+    """
+    Text streamed so far, accumulated chunk by chunk.
+
+    Appending is O(1) - the chunks are only joined when the text is read (`str()`),
+    and the joined text is cached, so each read only joins the chunks added since
+    the previous read.
+    """
+
+    __slots__ = ("_text", "_pending_parts", "_length")
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pending_parts: List[str] = []
+        self._length = 0
+
+    def append(self, text: str) -> None:
+        if text:
+            self._pending_parts.append(text)
+            self._length += len(text)
+
+    def __str__(self) -> str:
+        if self._pending_parts:
+            self._text = "".join([self._text, *self._pending_parts])
+            self._pending_parts.clear()
+        return self._text
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __add__(self, other: str) -> str:
+        return str(self) + other
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyStreamedText):
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"LazyStreamedText({str(self)!r})"
@@ -6,7 +6,7 @@ This is to prevent deadlocks and improve reliability
 
 import asyncio
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
 from litellm._logging import verbose_proxy_logger
 from litellm.caching import RedisCache
@@ -22,6 +22,7 @@ from litellm.constants import (
 )
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
 from litellm.proxy._types import (
+    BaseDailySpendTransaction,
     DailyTagSpendTransaction,
     DailyTeamSpendTransaction,
     DailyUserSpendTransaction,
@@ -43,6 +44,48 @@ if TYPE_CHECKING:
 else:
     PrismaClient = Any
 
+# Hash buffer mode - each pod increments pre-aggregated fields of one Redis hash per buffer
+REDIS_HASH_BUFFER_KEY_SUFFIX = "_hash"
+DB_SPEND_UPDATE_TRANSACTION_FIELDS = [
+    "user_list_transactions",
+    "end_user_list_transactions",
+    "key_list_transactions",
+    "team_list_transactions",
+    "team_member_list_transactions",
+    "org_list_transactions",
+    "tag_list_transactions",
+]
+DAILY_SPEND_METRIC_FIELDS = [
+    "spend",
+    "prompt_tokens",
+    "completion_tokens",
+    "cache_read_input_tokens",
+    "cache_creation_input_tokens",
+    "api_requests",
+    "successful_requests",
+    "failed_requests",
+]
+DAILY_SPEND_METADATA_FIELD = "meta"
+
+# ARGV: number of increments, then (field, amount) increments, then (field, value) set once
+HASH_BUFFER_INCREMENT_SCRIPT = """
+local num_increments = tonumber(ARGV[1])
+for i = 0, num_increments - 1 do
+    redis.call('HINCRBYFLOAT', KEYS[1], ARGV[2 + 2 * i], ARGV[3 + 2 * i])
+end
+for i = 2 + 2 * num_increments, #ARGV, 2 do
+    redis.call('HSETNX', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return redis.call('HLEN', KEYS[1])
+"""
+
+# Read and delete the hash in one step - increments after this go to a new hash
+HASH_BUFFER_DRAIN_SCRIPT = """
+local data = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return data
+"""
+
 
 class RedisUpdateBuffer:
     """
@@ -56,6 +99,8 @@ class RedisUpdateBuffer:
         redis_cache: Optional[RedisCache] = None,
     ):
         self.redis_cache = redis_cache
+        self._hash_buffer_increment_script: Optional[Any] = None
+        self._hash_buffer_drain_script: Optional[Any] = None
 
     @staticmethod
     def _should_commit_spend_updates_to_redis() -> bool:
@@ -76,6 +121,17 @@ class RedisUpdateBuffer:
             return False
         return _use_redis_transaction_buffer
 
+    @staticmethod
+    def _use_redis_hash_buffer() -> bool:
+        """
+        Checks if spend updates are aggregated in Redis hashes instead of pushed as lists
+
+        `general_settings.redis_transaction_buffer_mode: "hash"`
+        """
+        from litellm.proxy.proxy_server import general_settings
+
+        return general_settings.get("redis_transaction_buffer_mode", "list") == "hash"
+
     async def _store_transactions_in_redis(
         self,
         transactions: Any,
@@ -93,9 +149,17 @@ class RedisUpdateBuffer:
         if transactions is None or len(transactions) == 0:
             return
 
-        list_of_transactions = [safe_dumps(transactions)]
         if self.redis_cache is None:
             return
+        if self._use_redis_hash_buffer():
+            await self._increment_transactions_in_redis_hash(
+                transactions=transactions,
+                redis_key=redis_key,
+                service_type=service_type,
+            )
+            return
+
+        list_of_transactions = [safe_dumps(transactions)]
         current_redis_buffer_size = await self.redis_cache.async_rpush(
             key=redis_key,
             values=list_of_transactions,
@@ -105,6 +169,139 @@ class RedisUpdateBuffer:
             service=service_type,
         )
 
+    async def _increment_transactions_in_redis_hash(
+        self,
+        transactions: Any,
+        redis_key: str,
+        service_type: ServiceTypes,
+    ) -> None:
+        """
+        Adds the transactions to the buffer's Redis hash with HINCRBYFLOAT, in one script call
+
+        For SpendUpdateQueue transactions the hash field is `<transaction type>:<entity id>`.
+        For DailySpendUpdateQueue transactions each metric is a `<metric>:<daily key>` field,
+        the identifying fields are set once as JSON in `meta:<daily key>`.
+        """
+        if self.redis_cache is None:
+            return
+        metadata: Dict[str, str] = {}
+        if redis_key == REDIS_UPDATE_BUFFER_KEY:
+            increments = self._db_spend_update_transactions_to_hash_increments(
+                transactions
+            )
+        else:
+            increments, metadata = self._daily_spend_transactions_to_hash_fields(
+                transactions
+            )
+        if len(increments) == 0:
+            return
+
+        if self._hash_buffer_increment_script is None:
+            self._hash_buffer_increment_script = (
+                self.redis_cache.async_register_script(HASH_BUFFER_INCREMENT_SCRIPT)
+            )
+        args: List[Any] = [len(increments)]
+        for field, amount in increments.items():
+            args.extend([field, amount])
+        for field, value in metadata.items():
+            args.extend([field, value])
+        current_redis_buffer_size = await self._hash_buffer_increment_script(
+            keys=[redis_key + REDIS_HASH_BUFFER_KEY_SUFFIX], args=args
+        )
+        await self._emit_new_item_added_to_redis_buffer_event(
+            queue_size=current_redis_buffer_size,
+            service=service_type,
+        )
+
+    async def _drain_redis_hash_buffer(self, redis_key: str) -> Dict[str, str]:
+        """
+        Reads and deletes the buffer's Redis hash atomically
+        """
+        if self.redis_cache is None:
+            return {}
+        if self._hash_buffer_drain_script is None:
+            self._hash_buffer_drain_script = self.redis_cache.async_register_script(
+                HASH_BUFFER_DRAIN_SCRIPT
+            )
+        response = await self._hash_buffer_drain_script(
+            keys=[redis_key + REDIS_HASH_BUFFER_KEY_SUFFIX], args=[]
+        )
+        if not response:
+            return {}
+        values = [
+            value.decode("utf-8") if isinstance(value, bytes) else value
+            for value in response
+        ]
+        return dict(zip(values[::2], values[1::2]))
+
+    @staticmethod
+    def _db_spend_update_transactions_to_hash_increments(
+        db_spend_update_transactions: DBSpendUpdateTransactions,
+    ) -> Dict[str, float]:
+        increments: Dict[str, float] = {}
+        for field in DB_SPEND_UPDATE_TRANSACTION_FIELDS:
+            for entity_id, amount in (
+                db_spend_update_transactions.get(field) or {}  # type: ignore
+            ).items():
+                increments[f"{field}:{entity_id}"] = amount
+        return increments
+
+    @staticmethod
+    def _daily_spend_transactions_to_hash_fields(
+        daily_spend_transactions: Dict[str, BaseDailySpendTransaction],
+    ) -> Tuple[Dict[str, float], Dict[str, str]]:
+        increments: Dict[str, float] = {}
+        metadata: Dict[str, str] = {}
+        for daily_transaction_key, transaction in daily_spend_transactions.items():
+            for metric in DAILY_SPEND_METRIC_FIELDS:
+                increments[f"{metric}:{daily_transaction_key}"] = (
+                    transaction.get(metric, 0) or 0  # type: ignore
+                )
+            metadata[f"{DAILY_SPEND_METADATA_FIELD}:{daily_transaction_key}"] = (
+                safe_dumps(
+                    {
+                        k: v
+                        for k, v in transaction.items()
+                        if k not in DAILY_SPEND_METRIC_FIELDS
+                    }
+                )
+            )
+        return increments, metadata
+
+    @staticmethod
+    def _parse_db_spend_update_hash(
+        hash_buffer: Dict[str, str],
+    ) -> DBSpendUpdateTransactions:
+        db_spend_update_transactions = RedisUpdateBuffer._combine_list_of_transactions(
+            []
+        )
+        for field, amount in hash_buffer.items():
+            transaction_type, entity_id = field.split(":", 1)
+            db_spend_update_transactions[transaction_type][entity_id] = float(  # type: ignore
+                amount
+            )
+        return db_spend_update_transactions
+
+    @staticmethod
+    def _parse_daily_spend_update_hash(
+        hash_buffer: Dict[str, str],
+    ) -> Dict[str, BaseDailySpendTransaction]:
+        daily_spend_transactions: Dict[str, Dict[str, Any]] = {}
+        for field, value in hash_buffer.items():
+            name, daily_transaction_key = field.split(":", 1)
+            transaction = daily_spend_transactions.setdefault(daily_transaction_key, {})
+            if name == DAILY_SPEND_METADATA_FIELD:
+                transaction.update(json.loads(value))
+            elif name == "spend":
+                transaction[name] = float(value)
+            else:
+                transaction[name] = int(round(float(value)))
+        return {
+            daily_transaction_key: cast(BaseDailySpendTransaction, transaction)
+            for daily_transaction_key, transaction in daily_spend_transactions.items()
+            if "date" in transaction  # skip metrics whose metadata was not written
+        }
+
     async def store_in_memory_spend_updates_in_redis(
         self,
         spend_update_queue: SpendUpdateQueue,
@@ -302,11 +499,19 @@ class RedisUpdateBuffer:
             key=REDIS_UPDATE_BUFFER_KEY,
             count=MAX_REDIS_BUFFER_DEQUEUE_COUNT,
         )
-        if list_of_transactions is None:
-            return None
 
         # Parse the list of transactions from JSON strings
-        parsed_transactions = self._parse_list_of_transactions(list_of_transactions)
+        parsed_transactions = (
+            self._parse_list_of_transactions(list_of_transactions)
+            if list_of_transactions is not None
+            else []
+        )
+        if self._use_redis_hash_buffer():
+            hash_buffer = await self._drain_redis_hash_buffer(REDIS_UPDATE_BUFFER_KEY)
+            if hash_buffer:
+                parsed_transactions.append(
+                    self._parse_db_spend_update_hash(hash_buffer)
+                )
 
         # If there are no transactions, return None
         if len(parsed_transactions) == 0:
@@ -317,27 +522,46 @@ class RedisUpdateBuffer:
 
         return combined_transaction
 
-    async def get_all_daily_spend_update_transactions_from_redis_buffer(
+    async def _get_daily_spend_update_transactions_from_redis_buffer(
         self,
-    ) -> Optional[Dict[str, DailyUserSpendTransaction]]:
+        redis_key: str,
+    ) -> Optional[Dict[str, BaseDailySpendTransaction]]:
         """
-        Gets all the daily spend update transactions from Redis
+        Gets the daily spend update transactions of a buffer from Redis, aggregated by key
         """
         if self.redis_cache is None:
             return None
         list_of_transactions = await self.redis_cache.async_lpop(
-            key=REDIS_DAILY_SPEND_UPDATE_BUFFER_KEY,
+            key=redis_key,
             count=MAX_REDIS_BUFFER_DEQUEUE_COUNT,
         )
-        if list_of_transactions is None:
+        list_of_daily_spend_update_transactions = (
+            [json.loads(transaction) for transaction in list_of_transactions]
+            if list_of_transactions is not None
+            else []
+        )
+        if self._use_redis_hash_buffer():
+            hash_buffer = await self._drain_redis_hash_buffer(redis_key)
+            if hash_buffer:
+                list_of_daily_spend_update_transactions.append(
+                    self._parse_daily_spend_update_hash(hash_buffer)
+                )
+        if len(list_of_daily_spend_update_transactions) == 0:
             return None
-        list_of_daily_spend_update_transactions = [
-            json.loads(transaction) for transaction in list_of_transactions
-        ]
+        return DailySpendUpdateQueue.get_aggregated_daily_spend_update_transactions(
+            list_of_daily_spend_update_transactions
+        )
+
+    async def get_all_daily_spend_update_transactions_from_redis_buffer(
+        self,
+    ) -> Optional[Dict[str, DailyUserSpendTransaction]]:
+        """
+        Gets all the daily spend update transactions from Redis
+        """
         return cast(
-            Dict[str, DailyUserSpendTransaction],
-            DailySpendUpdateQueue.get_aggregated_daily_spend_update_transactions(
-                list_of_daily_spend_update_transactions
+            Optional[Dict[str, DailyUserSpendTransaction]],
+            await self._get_daily_spend_update_transactions_from_redis_buffer(
+                redis_key=REDIS_DAILY_SPEND_UPDATE_BUFFER_KEY
             ),
         )
 
@@ -347,45 +571,23 @@ class RedisUpdateBuffer:
         """
         Gets all the daily team spend update transactions from Redis
         """
-        if self.redis_cache is None:
-            return None
-        list_of_transactions = await self.redis_cache.async_lpop(
-            key=REDIS_DAILY_TEAM_SPEND_UPDATE_BUFFER_KEY,
-            count=MAX_REDIS_BUFFER_DEQUEUE_COUNT,
-        )
-        if list_of_transactions is None:
-            return None
-        list_of_daily_spend_update_transactions = [
-            json.loads(transaction) for transaction in list_of_transactions
-        ]
         return cast(
-            Dict[str, DailyTeamSpendTransaction],
-            DailySpendUpdateQueue.get_aggregated_daily_spend_update_transactions(
-                list_of_daily_spend_update_transactions
+            Optional[Dict[str, DailyTeamSpendTransaction]],
+            await self._get_daily_spend_update_transactions_from_redis_buffer(
+                redis_key=REDIS_DAILY_TEAM_SPEND_UPDATE_BUFFER_KEY
             ),
         )
 
     async def get_all_daily_org_spend_update_transactions_from_redis_buffer(
         self,
-    ) -> Optional[Dict[str, DailyOrganizationSpendTransaction]]: 
+    ) -> Optional[Dict[str, DailyOrganizationSpendTransaction]]:
         """
         Gets all the daily organization spend update transactions from Redis
         """
-        if self.redis_cache is None:
-            return None
-        list_of_transactions = await self.redis_cache.async_lpop(
-            key=REDIS_DAILY_ORG_SPEND_UPDATE_BUFFER_KEY,
-            count=MAX_REDIS_BUFFER_DEQUEUE_COUNT,
-        )
-        if list_of_transactions is None:
-            return None
-        list_of_daily_spend_update_transactions = [
-            json.loads(transaction) for transaction in list_of_transactions
-        ]
         return cast(
-            Dict[str, DailyOrganizationSpendTransaction], 
-            DailySpendUpdateQueue.get_aggregated_daily_spend_update_transactions(
-                list_of_daily_spend_update_transactions
+            Optional[Dict[str, DailyOrganizationSpendTransaction]],
+            await self._get_daily_spend_update_transactions_from_redis_buffer(
+                redis_key=REDIS_DAILY_ORG_SPEND_UPDATE_BUFFER_KEY
             ),
         )
 
@@ -395,21 +597,10 @@ class RedisUpdateBuffer:
         """
         Gets all the daily end-user spend update transactions from Redis
         """
-        if self.redis_cache is None:
-            return None
-        list_of_transactions = await self.redis_cache.async_lpop(
-            key=REDIS_DAILY_END_USER_SPEND_UPDATE_BUFFER_KEY,
-            count=MAX_REDIS_BUFFER_DEQUEUE_COUNT,
-        )
-        if list_of_transactions is None:
-            return None
-        list_of_daily_spend_update_transactions = [
-            json.loads(transaction) for transaction in list_of_transactions
-        ]
         return cast(
-            Dict[str, DailyEndUserSpendTransaction],
-            DailySpendUpdateQueue.get_aggregated_daily_spend_update_transactions(
-                list_of_daily_spend_update_transactions
+            Optional[Dict[str, DailyEndUserSpendTransaction]],
+            await self._get_daily_spend_update_transactions_from_redis_buffer(
+                redis_key=REDIS_DAILY_END_USER_SPEND_UPDATE_BUFFER_KEY
             ),
         )
 
@@ -419,21 +610,10 @@ class RedisUpdateBuffer:
         """
         Gets all the daily agent spend update transactions from Redis
         """
-        if self.redis_cache is None:
-            return None
-        list_of_transactions = await self.redis_cache.async_lpop(
-            key=REDIS_DAILY_AGENT_SPEND_UPDATE_BUFFER_KEY,
-            count=MAX_REDIS_BUFFER_DEQUEUE_COUNT,
-        )
-        if list_of_transactions is None:
-            return None
-        list_of_daily_spend_update_transactions = [
-            json.loads(transaction) for transaction in list_of_transactions
-        ]
         return cast(
-            Dict[str, DailyAgentSpendTransaction],
-            DailySpendUpdateQueue.get_aggregated_daily_spend_update_transactions(
-                list_of_daily_spend_update_transactions
+            Optional[Dict[str, DailyAgentSpendTransaction]],
+            await self._get_daily_spend_update_transactions_from_redis_buffer(
+                redis_key=REDIS_DAILY_AGENT_SPEND_UPDATE_BUFFER_KEY
             ),
         )
 
@@ -443,21 +623,10 @@ class RedisUpdateBuffer:
         """
         Gets all the daily tag spend update transactions from Redis
         """
-        if self.redis_cache is None:
-            return None
-        list_of_transactions = await self.redis_cache.async_lpop(
-            key=REDIS_DAILY_TAG_SPEND_UPDATE_BUFFER_KEY,
-            count=MAX_REDIS_BUFFER_DEQUEUE_COUNT,
-        )
-        if list_of_transactions is None:
-            return None
-        list_of_daily_spend_update_transactions = [
-            json.loads(transaction) for transaction in list_of_transactions
-        ]
         return cast(
-            Dict[str, DailyTagSpendTransaction],
-            DailySpendUpdateQueue.get_aggregated_daily_spend_update_transactions(
-                list_of_daily_spend_update_transactions
+            Optional[Dict[str, DailyTagSpendTransaction]],
+            await self._get_daily_spend_update_transactions_from_redis_buffer(
+                redis_key=REDIS_DAILY_TAG_SPEND_UPDATE_BUFFER_KEY
             ),
         )
 
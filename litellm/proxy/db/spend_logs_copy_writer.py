@@ -0,0 +1,235 @@
+"""
+Writes spend logs to LiteLLM_SpendLogs with Postgres `COPY ... FROM STDIN`, using asyncpg.
+
+`create_many` sends every row through the Prisma query engine and binds each value as a
+query parameter. At a few thousand requests per second that becomes the bottleneck for
+`update_spend_logs`. COPY streams the rows in Postgres' binary format in one statement.
+
+COPY can't skip duplicate request ids, so rows are copied into a temp table and inserted
+with `ON CONFLICT DO NOTHING` - the same result as `create_many(skip_duplicates=True)`.
+
+Enable with `general_settings.use_postgres_copy_for_spend_logs: true` (requires
+`pip install asyncpg`). If asyncpg isn't installed or a COPY fails, the batch is written
+with `create_many`. After `SPEND_LOGS_COPY_MAX_CONSECUTIVE_FAILURES` failures in a row,
+batches are written with `create_many` for `SPEND_LOGS_COPY_FAILURE_COOLDOWN_SECONDS`.
+
+pgbouncer in transaction mode doesn't support prepared statements, which asyncpg caches
+by default. Set `pgbouncer=true` in DATABASE_URL - as for prisma - and the pool is
+created with `statement_cache_size=0`.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from litellm._logging import verbose_proxy_logger
+from litellm.constants import (
+    SPEND_LOGS_COPY_FAILURE_COOLDOWN_SECONDS,
+    SPEND_LOGS_COPY_MAX_CONSECUTIVE_FAILURES,
+)
+from litellm.proxy._types import SpendLogsPayload
+
+SPEND_LOGS_TABLE = "LiteLLM_SpendLogs"
+SPEND_LOGS_COLUMNS: List[str] = list(SpendLogsPayload.__annotations__.keys())
+_DATETIME_COLUMNS = {"startTime", "endTime", "completionStartTime"}
+_JSON_COLUMNS = {
+    "metadata",
+    "request_tags",
+    "messages",
+    "response",
+    "proxy_server_request",
+}
+
+# connection params asyncpg understands - prisma params (connection_limit, pool_timeout,
+# ...) would be sent to postgres as server settings and rejected
+_ASYNCPG_DSN_PARAMS = {
+    "sslmode",
+    "sslcert",
+    "sslkey",
+    "sslrootcert",
+    "sslpassword",
+    "passfile",
+    "target_session_attrs",
+}
+
+
+def _to_asyncpg_dsn(database_url: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Convert a prisma DATABASE_URL to an asyncpg dsn and server settings.
+
+    The prisma `schema` param becomes the connection's `search_path`.
+    """
+    parts = urlsplit(database_url)
+    params = parse_qsl(parts.query)
+    server_settings: Dict[str, str] = {}
+    for key, value in params:
+        if key == "schema":
+            server_settings["search_path"] = value
+    query = urlencode([(k, v) for k, v in params if k in _ASYNCPG_DSN_PARAMS])
+    return urlunsplit(parts._replace(query=query)), server_settings
+
+
+def _uses_pgbouncer(database_url: str) -> bool:
+    return any(
+        key == "pgbouncer" and value.lower() == "true"
+        for key, value in parse_qsl(urlsplit(database_url).query)
+    )
+
+
+def _to_naive_utc(value: Any) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def spend_log_to_copy_record(spend_log: dict) -> tuple:
+    """
+    Row for `copy_records_to_table`, in `SPEND_LOGS_COLUMNS` order.
+
+    Timestamps are stored as naive UTC (prisma `DateTime`), json columns as json text.
+    """
+    record = []
+    for column in SPEND_LOGS_COLUMNS:
+        value = spend_log.get(column)
+        if column in _DATETIME_COLUMNS:
+            value = _to_naive_utc(value)
+        elif column in _JSON_COLUMNS and value is not None and not isinstance(
+            value, str
+        ):
+            value = json.dumps(value, default=str)
+        record.append(value)
+    return tuple(record)
+
+
+class SpendLogsCopyWriter:
+    """
+    Bulk-writes spend logs with COPY over a small asyncpg pool.
+    """
+
+    def __init__(self, database_url: Optional[str] = None):
+        self.database_url = database_url
+        self._pool: Optional[Any] = None
+        self.disabled = False
+        self.consecutive_failures = 0
+        self.retry_after: Optional[float] = None  # time.monotonic()
+
+    async def _get_pool(self) -> Any:
+        if self._pool is None:
+            import asyncpg
+
+            database_url = self.database_url or os.getenv("DATABASE_URL")
+            if database_url is None:
+                raise ValueError("DATABASE_URL not set")
+            dsn, server_settings = _to_asyncpg_dsn(database_url)
+            connect_kwargs: Dict[str, Any] = {}
+            if _uses_pgbouncer(database_url):
+                connect_kwargs["statement_cache_size"] = 0
+            # update_spend_logs writes one batch at a time
+            self._pool = await asyncpg.create_pool(
+                dsn=dsn,
+                min_size=1,
+                max_size=2,
+                server_settings=server_settings,
+                **connect_kwargs,
+            )
+        return self._pool
+
+    def _is_cooling_down(self) -> bool:
+        if self.retry_after is None:
+            return False
+        if time.monotonic() < self.retry_after:
+            return True
+        self.retry_after = None  # try COPY again
+        return False
+
+    async def _record_failure(self) -> None:
+        """
+        After `SPEND_LOGS_COPY_MAX_CONSECUTIVE_FAILURES` failures in a row, close the
+        pool and write with `create_many` for `SPEND_LOGS_COPY_FAILURE_COOLDOWN_SECONDS`.
+        """
+        self.consecutive_failures += 1
+        if self.consecutive_failures < SPEND_LOGS_COPY_MAX_CONSECUTIVE_FAILURES:
+            return
+        verbose_proxy_logger.warning(
+            "SpendLogsCopyWriter: %s COPYs failed in a row, writing spend logs with create_many for %ss",
+            self.consecutive_failures,
+            SPEND_LOGS_COPY_FAILURE_COOLDOWN_SECONDS,
+        )
+        self.consecutive_failures = 0
+        self.retry_after = time.monotonic() + SPEND_LOGS_COPY_FAILURE_COOLDOWN_SECONDS
+        await self.close()
+
+    async def write_spend_logs(self, spend_logs: List[dict]) -> bool:
+        """
+        COPY a batch of spend logs into LiteLLM_SpendLogs.
+
+        Returns False if the batch was not written - the caller should use `create_many`.
+        """
+        if self.disabled or len(spend_logs) == 0 or self._is_cooling_down():
+            return False
+        try:
+            pool = await self._get_pool()
+        except ImportError:
+            verbose_proxy_logger.warning(
+                "use_postgres_copy_for_spend_logs requires `pip install asyncpg`. Writing spend logs with create_many."
+            )
+            self.disabled = True
+            return False
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                "SpendLogsCopyWriter: could not connect to the database, writing spend logs with create_many - %s",
+                str(e),
+            )
+            await self._record_failure()
+            return False
+
+        records = [spend_log_to_copy_record(spend_log) for spend_log in spend_logs]
+        try:
+            async with pool.acquire() as connection:
+                async with connection.transaction():
+                    await connection.execute(
+                        f'CREATE TEMP TABLE "_spend_logs_copy" (LIKE "{SPEND_LOGS_TABLE}" INCLUDING DEFAULTS) ON COMMIT DROP'
+                    )
+                    await connection.copy_records_to_table(
+                        "_spend_logs_copy",
+                        records=records,
+                        columns=SPEND_LOGS_COLUMNS,
+                    )
+                    await connection.execute(
+                        f'INSERT INTO "{SPEND_LOGS_TABLE}" SELECT * FROM "_spend_logs_copy" ON CONFLICT DO NOTHING'
+                    )
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                "SpendLogsCopyWriter: COPY of %s spend logs failed, writing them with create_many - %s",
+                len(spend_logs),
+                str(e),
+            )
+            await self._record_failure()
+            return False
+        self.consecutive_failures = 0
+        return True
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            try:
+                await pool.close()
+            except Exception:
+                pass
+
+
+_spend_logs_copy_writer: Optional[SpendLogsCopyWriter] = None
+
+
+def get_spend_logs_copy_writer() -> SpendLogsCopyWriter:
+    global _spend_logs_copy_writer
+    if _spend_logs_copy_writer is None:
+        _spend_logs_copy_writer = SpendLogsCopyWriter()
+    return _spend_logs_copy_writer
@@ -44,6 +44,9 @@ def initialize_guardrail(
         severity_threshold=getattr(litellm_params, "severity_threshold", "medium"),
         llm_router=llm_router,
         image_model=getattr(litellm_params, "image_model", None),
+        keyword_matcher=getattr(litellm_params, "keyword_matcher", None) or "regex",
+        streaming_scan_mode=getattr(litellm_params, "streaming_scan_mode", None)
+        or "full",
     )
 
     litellm.logging_callback_manager.add_litellm_callback(content_filter_guardrail)
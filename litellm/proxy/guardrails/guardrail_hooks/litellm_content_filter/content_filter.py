@@ -15,6 +15,7 @@ from typing import (
     Any,
     AsyncGenerator,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -56,6 +57,7 @@ from litellm.types.proxy.guardrails.guardrail_hooks.litellm_content_filter impor
     PatternDetection,
 )
 
+from .keyword_matcher import KeywordMatcher
 from .patterns import PATTERN_EXTRA_CONFIG, get_compiled_pattern
 
 MAX_KEYWORD_VALUE_GAP_WORDS = 1
@@ -125,6 +127,11 @@ class ContentFilterGuardrail(CustomGuardrail):
     - Custom user-defined regex patterns
     - Dictionary-based keyword matching
 
+    Keyword matching engines (`keyword_matcher`):
+    - "regex" (default): one regex search per keyword
+    - "aho_corasick": all keywords compiled into one automaton at load time,
+      every hit found in a single pass over the text
+
     Actions:
     - BLOCK: Reject the request with an error
     - MASK: Replace the sensitive content with a redacted placeholder
@@ -152,6 +159,8 @@ class ContentFilterGuardrail(CustomGuardrail):
         severity_threshold: str = "medium",
         llm_router: Optional[Router] = None,
         image_model: Optional[str] = None,
+        keyword_matcher: Literal["regex", "aho_corasick"] = "regex",
+        streaming_scan_mode: Literal["full", "incremental"] = "full",
         **kwargs,
     ):
         """
@@ -168,6 +177,9 @@ class ContentFilterGuardrail(CustomGuardrail):
             keyword_redaction_tag: Tag to use for keyword redaction
             categories: List of category configurations with enabled/action/severity settings
             severity_threshold: Minimum severity to block ("high", "medium", "low")
+            keyword_matcher: Keyword matching engine ("regex" or "aho_corasick")
+            streaming_scan_mode: "full" re-scans the accumulated stream on every chunk,
+                "incremental" only scans the not-yet-emitted window
         """
 
         super().__init__(
@@ -192,6 +204,8 @@ class ContentFilterGuardrail(CustomGuardrail):
         self.severity_threshold = severity_threshold
         self.llm_router = llm_router
         self.image_model = image_model
+        self.keyword_matcher = keyword_matcher or "regex"
+        self.streaming_scan_mode = streaming_scan_mode or "full"
         # Store loaded categories
         self.loaded_categories: Dict[str, CategoryConfig] = {}
         self.category_keywords: Dict[str, Tuple[str, str, ContentFilterAction]] = (
@@ -259,6 +273,16 @@ class ContentFilterGuardrail(CustomGuardrail):
         if blocked_words_file:
             self._load_blocked_words_file(blocked_words_file)
 
+        # Compiled keyword automatons (only built for keyword_matcher="aho_corasick")
+        self._category_keyword_matcher: Optional[KeywordMatcher] = None
+        self._blocked_word_matcher: Optional[KeywordMatcher] = None
+        self._blocked_word_substring_matcher: Optional[KeywordMatcher] = None
+        self._conditional_category_matchers: Dict[
+            str, Tuple[KeywordMatcher, KeywordMatcher]
+        ] = {}
+        if self.keyword_matcher == "aho_corasick":
+            self._build_keyword_matchers()
+
         verbose_proxy_logger.debug(
             f"ContentFilterGuardrail initialized with {len(self.compiled_patterns)} patterns "
             f"and {len(self.blocked_words)} blocked words"
@@ -268,6 +292,39 @@ class ContentFilterGuardrail(CustomGuardrail):
             f"{len(self.category_keywords)} keywords"
         )
 
+    def _build_keyword_matchers(self) -> None:
+        """
+        Compile blocked words, category keywords and conditional category words into
+        keyword automatons. Match semantics mirror the regex checks they replace.
+        """
+        category_keywords = list(self.category_keywords.keys())
+        self._category_keyword_matcher = KeywordMatcher(
+            category_keywords,
+            word_boundaries=[" " not in keyword for keyword in category_keywords],
+            allow_regex=True,
+        )
+
+        blocked_words = list(self.blocked_words.keys())
+        self._blocked_word_matcher = KeywordMatcher(blocked_words, allow_regex=True)
+        self._blocked_word_substring_matcher = KeywordMatcher(blocked_words)
+
+        self._conditional_category_matchers = {}
+        for category_name, config in self.conditional_categories.items():
+            block_words = config["block_words"]
+            self._conditional_category_matchers[category_name] = (
+                KeywordMatcher(config["identifier_words"]),
+                KeywordMatcher(
+                    block_words,
+                    word_boundaries=[" " not in word for word in block_words],
+                ),
+            )
+
+        verbose_proxy_logger.debug(
+            f"ContentFilterGuardrail compiled keyword automatons: "
+            f"{len(category_keywords)} category keywords, {len(blocked_words)} blocked words, "
+            f"{len(self._conditional_category_matchers)} conditional categories"
+        )
+
     @staticmethod
     def _resolve_category_file_path(file_path: str) -> str:
         """
@@ -902,12 +959,31 @@ class ContentFilterGuardrail(CustomGuardrail):
                 if exception_found:
                     continue
 
+            matchers = self._conditional_category_matchers.get(category_name)
+
             # Check each sentence for identifier + block word combination
             for sentence in sentences:
                 sentence_lower = sentence.lower().strip()
                 if not sentence_lower:
                     continue
 
+                if matchers is not None:
+                    identifier_matcher, block_word_matcher = matchers
+                    identifier_index = identifier_matcher.first_match(sentence_lower)
+                    if identifier_index is None:
+                        continue
+                    block_word_index = block_word_matcher.first_match(sentence_lower)
+                    if block_word_index is not None:
+                        matched_phrase = (
+                            f"{identifier_words[identifier_index]} + "
+                            f"{block_words[block_word_index]}"
+                        )
+                        verbose_proxy_logger.warning(
+                            f"Conditional match in {category_name}: '{matched_phrase}' in sentence"
+                        )
+                        return (matched_phrase, category_name, severity, action)
+                    continue
+
                 # Check if sentence contains ANY identifier word
                 identifier_found = None
                 for identifier in identifier_words:
@@ -967,7 +1043,45 @@ class ContentFilterGuardrail(CustomGuardrail):
                 return None
 
         # Check category keywords
-        for keyword, (category, severity, action) in self.category_keywords.items():
+        for keyword, (category, severity, action) in self._iter_found_category_keywords(
+            text_lower
+        ):
+            # Check if this keyword has exceptions
+            category_obj = self.loaded_categories.get(category)
+            if category_obj:
+                # Check category-specific exceptions
+                exception_found = False
+                for exception in category_obj.exceptions:
+                    if exception in text_lower:
+                        verbose_proxy_logger.debug(
+                            f"Category exception '{exception}' found for keyword '{keyword}', skipping"
+                        )
+                        exception_found = True
+                        break
+                if exception_found:
+                    continue
+
+            verbose_proxy_logger.debug(
+                f"Category keyword '{keyword}' found in category '{category}' with severity {severity}"
+            )
+            return (keyword, category, severity, action)
+        return None
+
+    def _iter_found_category_keywords(
+        self, text_lower: str
+    ) -> Iterator[Tuple[str, Tuple[str, str, ContentFilterAction]]]:
+        """
+        Yield the category keywords present in text_lower, in category_keywords order.
+        """
+        if self._category_keyword_matcher is not None:
+            category_keyword_items = list(self.category_keywords.items())
+            for keyword_index in self._category_keyword_matcher.matching_indices(
+                text_lower
+            ):
+                yield category_keyword_items[keyword_index]
+            return
+
+        for keyword, keyword_config in self.category_keywords.items():
             # Convert asterisks (*) in keywords to regex wildcards
             # Asterisks are used in the source data to obfuscate profanity (e.g., "fu*c*k" -> "fuck")
             # We treat * as a wildcard matching zero or one character
@@ -979,33 +1093,12 @@ class ContentFilterGuardrail(CustomGuardrail):
             if " " in keyword:
                 # Multi-word phrase - use substring matching with wildcards
                 keyword_pattern = keyword_pattern_str
-                keyword_found = bool(re.search(keyword_pattern, text_lower))
             else:
                 # Single word - use word boundary matching to match whole words only
                 keyword_pattern = r"\b" + keyword_pattern_str + r"\b"
-                keyword_found = bool(re.search(keyword_pattern, text_lower))
-
-            if keyword_found:
-                # Check if this keyword has exceptions
-                category_obj = self.loaded_categories.get(category)
-                if category_obj:
-                    # Check category-specific exceptions
-                    exception_found = False
-                    for exception in category_obj.exceptions:
-                        if exception in text_lower:
-                            verbose_proxy_logger.debug(
-                                f"Category exception '{exception}' found for keyword '{keyword}', skipping"
-                            )
-                            exception_found = True
-                            break
-                    if exception_found:
-                        continue
 
-                verbose_proxy_logger.debug(
-                    f"Category keyword '{keyword}' found in category '{category}' with severity {severity}"
-                )
-                return (keyword, category, severity, action)
-        return None
+            if re.search(keyword_pattern, text_lower):
+                yield keyword, keyword_config
 
     def _check_blocked_words(
         self, text: str
@@ -1039,6 +1132,17 @@ class ContentFilterGuardrail(CustomGuardrail):
             return None
 
         text_lower = text.lower()
+        if self._blocked_word_substring_matcher is not None:
+            keyword_index = self._blocked_word_substring_matcher.first_match(text_lower)
+            if keyword_index is None:
+                return None
+            keyword = self._blocked_word_substring_matcher.keywords[keyword_index]
+            action, description = self.blocked_words[keyword]
+            verbose_proxy_logger.debug(
+                f"Blocked word '{keyword}' found with action {action}"
+            )
+            return (keyword, action, description)
+
         for keyword, (action, description) in self.blocked_words.items():
             if keyword in text_lower:
                 verbose_proxy_logger.debug(
@@ -1271,6 +1375,10 @@ class ContentFilterGuardrail(CustomGuardrail):
 
         # Check blocked words - iterate through ALL blocked words
         text_lower = text.lower()
+        if self._blocked_word_matcher is not None:
+            return self._filter_blocked_words_with_matcher(
+                text, text_lower, self._blocked_word_matcher, detections
+            )
         for keyword, (action, description) in self.blocked_words.items():
             keyword_pattern_str = keyword.replace("*", ".?")
             if re.search(keyword_pattern_str, text_lower):
@@ -1281,6 +1389,27 @@ class ContentFilterGuardrail(CustomGuardrail):
 
         return text
 
+    def _filter_blocked_words_with_matcher(
+        self,
+        text: str,
+        text_lower: str,
+        matcher: KeywordMatcher,
+        detections: Optional[List[ContentFilterDetection]],
+    ) -> str:
+        """
+        Apply blocked words in priority order using one automaton pass per masking step.
+        """
+        keyword_index = matcher.first_match(text_lower)
+        while keyword_index is not None:
+            keyword = matcher.keywords[keyword_index]
+            action, description = self.blocked_words[keyword]
+            text = self._handle_blocked_word_match(
+                keyword, action, description, text, detections
+            )
+            text_lower = text.lower()  # Update after masking
+            keyword_index = matcher.first_match(text_lower, min_index=keyword_index + 1)
+        return text
+
     def _mask_content(self, text: str, pattern_name: str) -> str:
         """
         Mask sensitive content in text.
@@ -1612,6 +1741,13 @@ class ContentFilterGuardrail(CustomGuardrail):
         For BLOCK action: Raises HTTPException immediately when blocked content is detected.
         For MASK action: Content is buffered to handle patterns split across chunks.
         """
+        if self.streaming_scan_mode == "incremental":
+            async for item in self._incremental_streaming_iterator(
+                response=response, request_data=request_data
+            ):
+                yield item
+            return
+
         accumulated_full_text = ""
         yielded_masked_text_len = 0
         buffer_size = 50  # Increased buffer to catch patterns split across many chunks
@@ -1689,6 +1825,169 @@ class ContentFilterGuardrail(CustomGuardrail):
             # We already reached the end of the generator
             pass
 
+    def _get_longest_keyword_len(self) -> int:
+        """Length of the longest blocked word, category keyword or conditional word."""
+        keywords: List[str] = list(self.blocked_words.keys())
+        keywords.extend(self.category_keywords.keys())
+        for config in self.conditional_categories.values():
+            keywords.extend(config["identifier_words"])
+            keywords.extend(config["block_words"])
+        return max((len(keyword) for keyword in keywords), default=0)
+
+    @staticmethod
+    def _find_stream_commit_point(text: str, buffer_size: int) -> int:
+        """
+        Return the end of the last whitespace-terminated prefix of text that is at
+        least buffer_size characters before the end, or 0 if there is none.
+        """
+        limit = len(text) - buffer_size
+        if limit <= 0:
+            return 0
+        cut = max(text.rfind(" ", 0, limit), text.rfind("\n", 0, limit))
+        return cut + 1 if cut >= 0 else 0
+
+    def _find_match_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Merged spans of `text` that masking may replace - pattern matches, and every
+        occurrence of a blocked word or category keyword.
+        """
+        spans: List[Tuple[int, int]] = []
+        for pattern_entry in self.compiled_patterns:
+            spans.extend(self._find_pattern_spans(text, pattern_entry))
+        text_lower = text.lower()
+        for keywords, matcher in (
+            (self.blocked_words, self._blocked_word_matcher),
+            (self.category_keywords, self._category_keyword_matcher),
+        ):
+            if matcher is not None:
+                spans.extend(matcher.find_spans(text_lower))
+                continue
+            for keyword in keywords:
+                spans.extend(
+                    match.span()
+                    for match in re.finditer(keyword.replace("*", ".?"), text_lower)
+                )
+        return self._merge_spans(spans)
+
+    def _force_flush_stream_window(
+        self, pending_text: str, masked_window: str, cut: int
+    ) -> Tuple[str, str]:
+        """
+        Commit the text before `cut` of a window that outgrew its maximum size.
+
+        The match spans of the window are found once, and the cut moves in front of
+        the match that crosses it, if any.
+
+        Returns:
+            Tuple of (masked text to yield, text still pending)
+        """
+        for start, end in self._find_match_spans(pending_text):
+            if start >= cut:
+                break
+            if end > cut:
+                cut = start
+                break
+        if cut <= 0:
+            return "", pending_text
+
+        tail = pending_text[cut:]
+        if masked_window.endswith(tail):
+            # no match touches the tail, commit the prefix as it was filtered
+            # within the whole window
+            return masked_window[: -len(tail)], tail
+        return self._filter_single_text(pending_text[:cut]), tail
+
+    async def _incremental_streaming_iterator(
+        self,
+        response: Any,
+        request_data: dict,
+    ) -> AsyncGenerator[ModelResponseStream, None]:
+        """
+        Streaming filter that only scans the window of text not yet emitted.
+
+        Each chunk is appended to a pending window which is filtered on its own.
+        Once the window holds more than `buffer_size` characters past a whitespace
+        boundary, the prefix up to that boundary is committed if filtering it alone
+        gives the same result as filtering the whole window (i.e. no match spans the
+        boundary). Work per chunk is bounded by the window size rather than by the
+        length of the whole stream. Category exception phrases are only honoured
+        within the current window.
+
+        At least `longest keyword - 1` characters stay uncommitted, also when a
+        window without whitespace is flushed, so any keyword that starts in the
+        committed text ends within the window that was filtered.
+        """
+        pending_text = ""
+        buffer_size = 50
+        hold_size = max(buffer_size, self._get_longest_keyword_len() - 1)
+        max_window_size = hold_size * 8
+
+        verbose_proxy_logger.info(
+            f"ContentFilterGuardrail: Starting incremental streaming masking for model {request_data.get('model')}"
+        )
+
+        async for item in response:
+            if not (isinstance(item, ModelResponseStream) and item.choices):
+                yield item
+                continue
+
+            delta_content = ""
+            is_final = False
+            for choice in item.choices:
+                if hasattr(choice, "delta") and choice.delta:
+                    content = getattr(choice.delta, "content", None)
+                    if content and isinstance(content, str):
+                        delta_content += content
+                if getattr(choice, "finish_reason", None):
+                    is_final = True
+
+            pending_text += delta_content
+            content_to_yield = ""
+
+            try:
+                if is_final:
+                    # trailing space triggers word boundaries (\b) at the end of the stream
+                    masked_text = self._filter_single_text(pending_text + " ")
+                    content_to_yield = (
+                        masked_text[:-1] if masked_text.endswith(" ") else masked_text
+                    )
+                    pending_text = ""
+                else:
+                    masked_window = self._filter_single_text(pending_text)
+                    cut = self._find_stream_commit_point(pending_text, hold_size)
+                    committed = False
+                    if cut > 0:
+                        masked_prefix = self._filter_single_text(pending_text[:cut])
+                        if masked_window.startswith(masked_prefix):
+                            content_to_yield = masked_prefix
+                            pending_text = pending_text[cut:]
+                            committed = True
+                    if not committed and len(pending_text) > max_window_size:
+                        (
+                            content_to_yield,
+                            pending_text,
+                        ) = self._force_flush_stream_window(
+                            pending_text=pending_text,
+                            masked_window=masked_window,
+                            cut=cut or len(pending_text) - hold_size,
+                        )
+            except HTTPException:
+                raise
+            except Exception as e:
+                verbose_proxy_logger.error(
+                    f"ContentFilterGuardrail: Error in masking: {e}"
+                )
+                content_to_yield = pending_text  # Fallback to current text
+                pending_text = ""
+
+            if (
+                item.choices
+                and hasattr(item.choices[0], "delta")
+                and item.choices[0].delta
+            ):
+                item.choices[0].delta.content = content_to_yield
+            yield item
+
     @staticmethod
     def get_config_model():
         from litellm.types.proxy.guardrails.guardrail_hooks.litellm_content_filter import (
@@ -0,0 +1,200 @@
+"""
+Multi-keyword matching engine for the Content Filter Guardrail.
+
+Compiles a keyword list into a single Aho-Corasick automaton at load time, so
+every keyword hit in a text is found in one linear pass instead of running one
+`re.search` per keyword.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Sequence, Set, Tuple
+
+from litellm._logging import verbose_proxy_logger
+
+# Characters that make a keyword behave as a regex when it is passed to re.search
+REGEX_META_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_word_char(char: str) -> bool:
+    """Same definition of a word character as the `\\b` regex anchor."""
+    return char.isalnum() or char == "_"
+
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick automaton over a fixed list of literal keywords.
+
+    `find_all` returns (start, keyword_index) for every occurrence, including
+    overlapping ones, in a single pass over the text.
+    """
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords: List[str] = list(keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for keyword_index, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append(keyword_index)
+
+        # breadth-first pass to wire failure links
+        queue: List[int] = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                fallback = self._goto[fail_state].get(char, 0)
+                self._fail[next_state] = fallback if fallback != next_state else 0
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def find_all(self, text: str) -> List[tuple]:
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        keywords = self.keywords
+
+        matches: List[tuple] = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for keyword_index in output[state]:
+                    matches.append(
+                        (position - len(keywords[keyword_index]) + 1, keyword_index)
+                    )
+        return matches
+
+
+class KeywordMatcher:
+    """
+    Finds which keywords of an ordered keyword list occur in a text.
+
+    Literal keywords are compiled into one `AhoCorasickAutomaton`. Keywords that
+    would be interpreted as regexes by the regex engine (e.g. `*` wildcards used
+    to obfuscate profanity) are kept as precompiled regexes, so results stay
+    identical to the per-keyword `re.search` path.
+
+    Args:
+        keywords: keywords in priority order (the index is returned on match)
+        word_boundaries: per keyword, whether the match must sit on `\\b` boundaries
+        allow_regex: if True, keywords containing regex metacharacters are matched as
+            regexes, with `*` treated as a zero-or-one character wildcard
+    """
+
+    def __init__(
+        self,
+        keywords: Sequence[str],
+        word_boundaries: Optional[Sequence[bool]] = None,
+        allow_regex: bool = False,
+    ):
+        self.keywords: List[str] = list(keywords)
+        self.word_boundaries: List[bool] = (
+            list(word_boundaries)
+            if word_boundaries is not None
+            else [False] * len(self.keywords)
+        )
+        self.regex_keywords: Dict[int, Optional[Pattern]] = {}
+        # same regexes without `\b` anchors, for `find_spans`
+        self._unanchored_regex_keywords: Dict[int, Pattern] = {}
+
+        literal_keywords: List[str] = []
+        self._literal_to_keyword_index: List[int] = []
+        for keyword_index, keyword in enumerate(self.keywords):
+            if allow_regex and any(char in REGEX_META_CHARS for char in keyword):
+                word_boundary = self.word_boundaries[keyword_index]
+                compiled = self._compile_regex_keyword(keyword, word_boundary)
+                self.regex_keywords[keyword_index] = compiled
+                if compiled is not None:
+                    self._unanchored_regex_keywords[keyword_index] = (
+                        re.compile(keyword.replace("*", ".?"))
+                        if word_boundary
+                        else compiled
+                    )
+                continue
+            literal_keywords.append(keyword)
+            self._literal_to_keyword_index.append(keyword_index)
+
+        self.automaton = AhoCorasickAutomaton(literal_keywords)
+
+    @staticmethod
+    def _compile_regex_keyword(keyword: str, word_boundary: bool) -> Optional[Pattern]:
+        pattern = keyword.replace("*", ".?")
+        if word_boundary:
+            pattern = r"\b" + pattern + r"\b"
+        try:
+            return re.compile(pattern)
+        except re.error as e:
+            verbose_proxy_logger.warning(
+                f"ContentFilterGuardrail: keyword '{keyword}' is not a valid regex and will never match: {e}"
+            )
+            return None
+
+    def _on_word_boundaries(self, text: str, start: int, keyword: str) -> bool:
+        end = start + len(keyword)
+        before = _is_word_char(text[start - 1]) if start > 0 else False
+        after = _is_word_char(text[end]) if end < len(text) else False
+        return before != _is_word_char(keyword[0]) and after != _is_word_char(
+            keyword[-1]
+        )
+
+    def matching_indices(self, text: str) -> List[int]:
+        """
+        Return the sorted indices of all keywords found in `text`.
+        """
+        found: Set[int] = set()
+        for start, literal_index in self.automaton.find_all(text):
+            keyword_index = self._literal_to_keyword_index[literal_index]
+            if keyword_index in found:
+                continue
+            if self.word_boundaries[keyword_index] and not self._on_word_boundaries(
+                text, start, self.keywords[keyword_index]
+            ):
+                continue
+            found.add(keyword_index)
+
+        for keyword_index, compiled in self.regex_keywords.items():
+            if compiled is not None and compiled.search(text):
+                found.add(keyword_index)
+
+        return sorted(found)
+
+    def first_match(self, text: str, min_index: int = 0) -> Optional[int]:
+        """
+        Return the lowest keyword index >= `min_index` found in `text`.
+        """
+        for keyword_index in self.matching_indices(text):
+            if keyword_index >= min_index:
+                return keyword_index
+        return None
+
+    def find_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Return the (start, end) of every keyword occurrence in `text`, ignoring word
+        boundaries - the occurrences a masking `re.sub` of the keyword replaces.
+        """
+        literal_keywords = self.automaton.keywords
+        spans: List[Tuple[int, int]] = [
+            (start, start + len(literal_keywords[literal_index]))
+            for start, literal_index in self.automaton.find_all(text)
+        ]
+        for compiled in self._unanchored_regex_keywords.values():
+            spans.extend(match.span() for match in compiled.finditer(text))
+        return spans
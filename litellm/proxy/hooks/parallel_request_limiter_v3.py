@@ -4,6 +4,7 @@ This is a rate limiter implementation based on a similar one by Envoy proxy.
 This is currently in development and not yet ready for production.
 """
 
+import asyncio
 import binascii
 import os
 from datetime import datetime
@@ -107,6 +108,53 @@ end
 return results
 """
 
+LEASE_RATE_LIMITER_SCRIPT = """
+local results = {}
+local now = tonumber(ARGV[1])
+local window_size = tonumber(ARGV[2])
+
+-- Process each window/counter pair, with a lease_size/limit/fallback_increment
+-- triplet per pair
+for i = 1, #KEYS, 2 do
+    local window_key = KEYS[i]
+    local counter_key = KEYS[i + 1]
+    local arg_index = 3 + ((i - 1) / 2) * 3
+    local lease_size = tonumber(ARGV[arg_index])
+    local limit = tonumber(ARGV[arg_index + 1])
+    local fallback_increment = tonumber(ARGV[arg_index + 2])
+
+    local window_start = redis.call('GET', window_key)
+    local counter = 0
+    if not window_start or (now - tonumber(window_start)) >= window_size then
+        window_start = tostring(now)
+        redis.call('SET', window_key, window_start)
+        redis.call('EXPIRE', window_key, window_size)
+        redis.call('SET', counter_key, 0)
+    else
+        counter = tonumber(redis.call('GET', counter_key) or '0')
+    end
+
+    -- Grant a full lease while there is room for it, otherwise count this request
+    -- exactly (or nothing, for a background renewal)
+    local granted = 0
+    if lease_size > 0 and limit - counter >= lease_size then
+        granted = lease_size
+        counter = redis.call('INCRBY', counter_key, lease_size)
+    elseif fallback_increment > 0 then
+        counter = redis.call('INCRBY', counter_key, fallback_increment)
+    end
+    if redis.call('TTL', counter_key) < 0 then
+        redis.call('EXPIRE', counter_key, window_size)
+    end
+
+    table.insert(results, window_start) -- window_start
+    table.insert(results, counter) -- counter
+    table.insert(results, granted) -- granted lease
+end
+
+return results
+"""
+
 # Redis cluster slot count
 REDIS_CLUSTER_SLOTS = 16384
 REDIS_NODE_HASHTAG_NAME = "all_keys"
@@ -143,6 +191,14 @@ class RateLimitResponseWithDescriptors(TypedDict):
     response: RateLimitResponse
 
 
+class RequestLease(TypedDict):
+    """Block of request capacity this instance has taken from a Redis counter."""
+
+    window_start: int
+    counter: int  # Redis counter value after the last grant
+    remaining: int  # requests left to spend locally
+
+
 class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
     def __init__(
         self,
@@ -168,6 +224,24 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
 
         self.window_size = int(os.getenv("LITELLM_RATE_LIMIT_WINDOW_SIZE", 60))
 
+        # Lease mode: take blocks of `lease_fraction * rpm_limit` requests from Redis
+        # and spend them locally, instead of a Redis call per request
+        self.lease_fraction = float(os.getenv("LITELLM_RATE_LIMIT_LEASE_FRACTION", 0))
+        if (
+            self.lease_fraction > 0
+            and self.internal_usage_cache.dual_cache.redis_cache is not None
+        ):
+            self.lease_rate_limiter_script: Optional[Any] = (
+                self.internal_usage_cache.dual_cache.redis_cache.async_register_script(
+                    LEASE_RATE_LIMITER_SCRIPT
+                )
+            )
+        else:
+            self.lease_rate_limiter_script = None
+        self._request_leases: Dict[str, RequestLease] = {}
+        self._lease_renewal_tasks: Dict[str, asyncio.Task] = {}
+        self._last_lease_prune_time = 0
+
         # Batch rate limiter (lazy loaded)
         self._batch_rate_limiter: Optional[Any] = None
 
@@ -445,6 +519,227 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
 
         return all_cache_values
 
+    def _get_lease_size(self, requests_limit: Optional[int]) -> int:
+        """
+        Number of requests to take from Redis per lease, 0 if the limit is too small
+        for leasing to save any Redis calls.
+        """
+        if requests_limit is None:
+            return 0
+        lease_size = int(requests_limit * self.lease_fraction)
+        return lease_size if lease_size >= 2 else 0
+
+    async def _execute_redis_lease_script(
+        self,
+        keys: List[str],
+        lease_args: List[int],
+        now_int: int,
+    ) -> List[Any]:
+        """
+        Run the lease script, grouped by hash tag for cluster compatibility.
+
+        Args:
+            keys: List[str] - window/counter key pairs
+            lease_args: List[int] - lease_size/limit/fallback_increment per pair
+            now_int: int - Current timestamp
+
+        Returns:
+            List[Any] - window_start/counter/granted per pair, in the order of `keys`
+        """
+        if self.lease_rate_limiter_script is None:
+            return []
+
+        pair_groups: Dict[str, List[int]] = {}
+        for i in range(0, len(keys), 2):
+            if self._is_redis_cluster():
+                group = f"slot_{self.keyslot_for_redis_cluster(keys[i])}"
+            else:
+                group = REDIS_NODE_HASHTAG_NAME
+            pair_groups.setdefault(group, []).append(i // 2)
+
+        results: List[Any] = [None] * (len(keys) // 2 * 3)
+        for hash_tag, pair_indices in pair_groups.items():
+            group_keys: List[str] = []
+            group_args: List[int] = [now_int, self.window_size]
+            for pair_index in pair_indices:
+                group_keys.extend(keys[pair_index * 2 : pair_index * 2 + 2])
+                group_args.extend(lease_args[pair_index * 3 : pair_index * 3 + 3])
+            try:
+                group_values = await self.lease_rate_limiter_script(
+                    keys=group_keys, args=group_args
+                )
+            except Exception as e:
+                verbose_proxy_logger.warning(
+                    f"Redis lease script failed for hash tag {hash_tag}: {str(e)}"
+                )
+                # Fallback to an exact in-memory check for this group, without leases
+                in_memory_values = await self.in_memory_cache_sliding_window(
+                    keys=group_keys,
+                    now_int=now_int,
+                    window_size=self.window_size,
+                )
+                group_values = []
+                for j in range(0, len(in_memory_values), 2):
+                    group_values.extend(in_memory_values[j : j + 2] + [0])
+            for j, pair_index in enumerate(pair_indices):
+                results[pair_index * 3 : pair_index * 3 + 3] = group_values[
+                    j * 3 : j * 3 + 3
+                ]
+        return results
+
+    async def _renew_request_lease(
+        self,
+        window_key: str,
+        counter_key: str,
+        lease_size: int,
+        requests_limit: int,
+    ) -> None:
+        """
+        Take another block for a lease that is running low. Near the limit nothing
+        is granted, the lease runs out and requests go back to exact checks.
+        """
+        if self.lease_rate_limiter_script is None:
+            return
+        now_int = int(self._get_current_time().timestamp())
+        try:
+            window_start, counter, granted = await self.lease_rate_limiter_script(
+                keys=[window_key, counter_key],
+                args=[now_int, self.window_size, lease_size, requests_limit, 0],
+            )
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                f"Redis lease renewal failed for {counter_key}: {str(e)}"
+            )
+            return
+        if int(granted) <= 0:
+            return
+
+        lease = self._request_leases.get(counter_key)
+        if lease is not None and lease["window_start"] == int(window_start):
+            lease["remaining"] += int(granted)
+            lease["counter"] = int(counter)
+        else:
+            self._request_leases[counter_key] = RequestLease(
+                window_start=int(window_start),
+                counter=int(counter),
+                remaining=int(granted),
+            )
+
+    def _prune_expired_request_leases(self, now_int: int) -> None:
+        """
+        Drop leases whose window has ended, so keys that stop sending requests
+        don't keep an entry forever. Runs at most once per window.
+        """
+        if now_int - self._last_lease_prune_time < self.window_size:
+            return
+        self._last_lease_prune_time = now_int
+        expired_keys = [
+            counter_key
+            for counter_key, lease in self._request_leases.items()
+            if now_int - lease["window_start"] >= self.window_size
+        ]
+        for counter_key in expired_keys:
+            del self._request_leases[counter_key]
+
+    def _schedule_lease_renewal(
+        self,
+        window_key: str,
+        counter_key: str,
+        lease_size: int,
+        requests_limit: int,
+    ) -> None:
+        if counter_key in self._lease_renewal_tasks:
+            return
+        task = asyncio.create_task(
+            self._renew_request_lease(
+                window_key=window_key,
+                counter_key=counter_key,
+                lease_size=lease_size,
+                requests_limit=requests_limit,
+            )
+        )
+        self._lease_renewal_tasks[counter_key] = task
+        task.add_done_callback(
+            lambda _: self._lease_renewal_tasks.pop(counter_key, None)
+        )
+
+    async def _execute_lease_rate_limiter(
+        self,
+        keys_to_fetch: List[str],
+        key_metadata: Dict[str, Any],
+        now_int: int,
+    ) -> List[Any]:
+        """
+        Count requests against local leases, and everything else in Redis.
+
+        `:requests` counters are spent from a lease when this instance holds one for
+        the current window, with a renewal in the background once half of it is
+        used. All other counters, and requests without a lease, go to Redis in one
+        script call that also grants a new lease if the limit has room for it.
+
+        Returns:
+            List[Any] - window_start/counter pairs, like the batch script
+        """
+        self._prune_expired_request_leases(now_int=now_int)
+        cache_values: List[Any] = [None] * len(keys_to_fetch)
+        redis_keys: List[str] = []
+        redis_lease_args: List[int] = []
+        redis_pair_indices: List[int] = []
+        for i in range(0, len(keys_to_fetch), 2):
+            window_key = keys_to_fetch[i]
+            counter_key = keys_to_fetch[i + 1]
+            lease_size = 0
+            requests_limit = 0
+            if counter_key.endswith(":requests"):
+                requests_limit = key_metadata[window_key]["requests_limit"]
+                lease_size = self._get_lease_size(requests_limit)
+
+            lease = self._request_leases.get(counter_key) if lease_size else None
+            if (
+                lease is not None
+                and lease["remaining"] > 0
+                and now_int - lease["window_start"] < self.window_size
+            ):
+                lease["remaining"] -= 1
+                cache_values[i] = str(lease["window_start"])
+                cache_values[i + 1] = lease["counter"] - lease["remaining"]
+                if lease["remaining"] <= lease_size // 2:
+                    self._schedule_lease_renewal(
+                        window_key=window_key,
+                        counter_key=counter_key,
+                        lease_size=lease_size,
+                        requests_limit=requests_limit,
+                    )
+                continue
+
+            redis_keys.extend([window_key, counter_key])
+            redis_lease_args.extend([lease_size, requests_limit, 1])
+            redis_pair_indices.append(i)
+
+        if not redis_pair_indices:
+            return cache_values
+
+        results = await self._execute_redis_lease_script(
+            keys=redis_keys, lease_args=redis_lease_args, now_int=now_int
+        )
+        for j, i in enumerate(redis_pair_indices):
+            window_start, counter, granted = results[j * 3 : j * 3 + 3]
+            counter_key = keys_to_fetch[i + 1]
+            granted = int(granted)
+            if granted > 0:
+                # this request spends the first request of the new lease
+                self._request_leases[counter_key] = RequestLease(
+                    window_start=int(window_start),
+                    counter=int(counter),
+                    remaining=granted - 1,
+                )
+                counter = int(counter) - (granted - 1)
+            else:
+                self._request_leases.pop(counter_key, None)
+            cache_values[i] = window_start
+            cache_values[i + 1] = counter
+        return cache_values
+
     async def should_rate_limit(
         self,
         descriptors: List[RateLimitDescriptor],
@@ -549,11 +844,19 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
                     cache_values.append(str(now_int) if _.endswith(":window") else 0)
         elif self.batch_rate_limiter_script is not None:
             # NORMAL MODE: Increment counters in Redis
-            # Group keys by hash tag for Redis cluster compatibility
-            cache_values = await self._execute_redis_batch_rate_limiter_script(
-                keys_to_fetch=keys_to_fetch,
-                now_int=now_int,
-            )
+            if self.lease_rate_limiter_script is not None:
+                # LEASE MODE: Spend requests from local leases where possible
+                cache_values = await self._execute_lease_rate_limiter(
+                    keys_to_fetch=keys_to_fetch,
+                    key_metadata=key_metadata,
+                    now_int=now_int,
+                )
+            else:
+                # Group keys by hash tag for Redis cluster compatibility
+                cache_values = await self._execute_redis_batch_rate_limiter_script(
+                    keys_to_fetch=keys_to_fetch,
+                    now_int=now_int,
+                )
 
             # update in-memory cache with new values
             for i in range(0, len(cache_values), 2):
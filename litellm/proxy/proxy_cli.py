@@ -307,6 +307,24 @@ class ProxyInitializationHelpers:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             return s.connect_ex(("localhost", port)) == 0
 
+    @staticmethod
+    def _init_shared_memory_cache_namespace():
+        """
+        Scope the shared memory cache to this proxy instance - its workers share the
+        tables, other proxies on the host don't. The tables are removed on shutdown.
+
+        Skipped if `LITELLM_SHARED_MEMORY_CACHE_NAMESPACE` is already set.
+        """
+        if os.getenv("LITELLM_SHARED_MEMORY_CACHE_NAMESPACE"):
+            return
+        import atexit
+
+        from litellm.caching.shared_memory_cache import remove_shared_memory_files
+
+        namespace = str(os.getpid())
+        os.environ["LITELLM_SHARED_MEMORY_CACHE_NAMESPACE"] = namespace
+        atexit.register(remove_shared_memory_files, namespace)
+
     @staticmethod
     def _get_loop_type():
         """Helper function to determine the event loop type based on platform"""
@@ -831,6 +849,7 @@ def run_server(  # noqa: PLR0915
             )
             return
 
+        ProxyInitializationHelpers._init_shared_memory_cache_namespace()
         uvicorn_args = ProxyInitializationHelpers._get_default_unvicorn_init_args(
             host=host,
             port=port,
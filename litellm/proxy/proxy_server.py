@@ -52,6 +52,10 @@ from litellm.constants import (
 from litellm.litellm_core_utils.litellm_logging import (
     _init_custom_logger_compatible_class,
 )
+from litellm.litellm_core_utils.raw_sse_passthrough import (
+    RawSSEPassthroughStream,
+    patch_sse_frame_model,
+)
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
 from litellm.proxy._types import (
     CallbackDelete,
@@ -196,6 +200,7 @@ import litellm
 from litellm import Router
 from litellm._logging import verbose_proxy_logger, verbose_router_logger
 from litellm.caching.caching import DualCache, RedisCache
+from litellm.caching.lru_in_memory_cache import create_in_memory_cache
 from litellm.caching.redis_cluster_cache import RedisClusterCache
 from litellm.constants import (
     _REALTIME_BODY_CACHE_SIZE,
@@ -304,6 +309,7 @@ from litellm.proxy.common_utils.openai_endpoint_utils import (
 )
 from litellm.proxy.common_utils.proxy_state import ProxyState
 from litellm.proxy.common_utils.reset_budget_job import ResetBudgetJob
+from litellm.proxy.common_utils.streaming_text_utils import LazyStreamedText
 from litellm.proxy.common_utils.swagger_utils import ERROR_RESPONSES
 from litellm.proxy.container_endpoints.endpoints import router as container_router
 from litellm.proxy.credential_endpoints.endpoints import router as credential_router
@@ -1444,7 +1450,8 @@ shared_aiohttp_session: Optional[
     "ClientSession"
 ] = None  # Global shared session for connection reuse
 user_api_key_cache = DualCache(
-    default_in_memory_ttl=UserAPIKeyCacheTTLEnum.in_memory_cache_ttl.value
+    in_memory_cache=create_in_memory_cache(cache_name="user_api_key_cache"),
+    default_in_memory_ttl=UserAPIKeyCacheTTLEnum.in_memory_cache_ttl.value,
 )
 model_max_budget_limiter = _PROXY_VirtualKeyModelMaxBudgetLimiter(
     dual_cache=user_api_key_cache
@@ -5062,13 +5069,29 @@ async def async_data_generator(
 ):
     verbose_proxy_logger.debug("inside generator")
     try:
-        # Use a list to accumulate response segments to avoid O(n^2) string concatenation
-        str_so_far_parts: list[str] = []
+        # only accumulate the streamed text if a callback reads it - it's joined lazily
+        run_streaming_hook = proxy_logging_obj.has_post_call_streaming_hooks()
+        str_so_far = LazyStreamedText()
         error_message: Optional[str] = None
         requested_model_from_client = _get_client_requested_model_for_streaming(
             request_data=request_data
         )
         model_mismatch_logged = False
+        if (
+            isinstance(response, RawSSEPassthroughStream)
+            and not run_streaming_hook
+            and not proxy_logging_obj.has_streaming_iterator_hooks(
+                request_data=request_data
+            )
+        ):
+            # forward the upstream frames as-is, only restamping `model`
+            async for frame in response.aiter_frames():
+                if requested_model_from_client:
+                    frame = patch_sse_frame_model(frame, requested_model_from_client)
+                yield f"data: {frame}\n\n"
+            yield "data: [DONE]\n\n"
+            return
+
         async for chunk in proxy_logging_obj.async_post_call_streaming_iterator_hook(
             user_api_key_dict=user_api_key_dict,
             response=response,
@@ -5079,16 +5102,16 @@ async def async_data_generator(
             )
 
             ### CALL HOOKS ### - modify outgoing data
-            chunk = await proxy_logging_obj.async_post_call_streaming_hook(
-                user_api_key_dict=user_api_key_dict,
-                response=chunk,
-                data=request_data,
-                str_so_far="".join(str_so_far_parts),
-            )
+            if run_streaming_hook:
+                chunk = await proxy_logging_obj.async_post_call_streaming_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    response=chunk,
+                    data=request_data,
+                    str_so_far=str_so_far,
+                )
 
-            if isinstance(chunk, (ModelResponse, ModelResponseStream)):
-                response_str = litellm.get_response_string(response_obj=chunk)
-                str_so_far_parts.append(response_str)
+                if isinstance(chunk, (ModelResponse, ModelResponseStream)):
+                    str_so_far.append(litellm.get_response_string(response_obj=chunk))
 
             chunk, model_mismatch_logged = _restamp_streaming_chunk_model(
                 chunk=chunk,
@@ -77,6 +77,7 @@ from litellm._logging import verbose_proxy_logger
 from litellm._service_logger import ServiceLogging, ServiceTypes
 from litellm.caching.caching import DualCache, RedisCache
 from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.caching.shared_memory_cache import create_shared_memory_cache
 from litellm.exceptions import RejectedRequestError
 from litellm.integrations.custom_guardrail import (
     CustomGuardrail,
@@ -97,6 +98,7 @@ from litellm.proxy._types import (
     UserAPIKeyAuth,
 )
 from litellm.proxy.auth.route_checks import RouteChecks
+from litellm.proxy.common_utils.streaming_text_utils import LazyStreamedText
 from litellm.proxy.db.create_views import (
     create_missing_views,
     should_create_missing_views,
@@ -129,6 +131,7 @@ if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
 
     from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+    from litellm.proxy.db.spend_logs_copy_writer import SpendLogsCopyWriter
 
     Span = Union[_Span, Any]
 else:
@@ -423,6 +426,10 @@ class ProxyLogging:
 
         if redis_cache is not None:
             self.internal_usage_cache.dual_cache.redis_cache = redis_cache
+            if self.internal_usage_cache.dual_cache.shared_memory_cache is None:
+                self.internal_usage_cache.dual_cache.shared_memory_cache = (
+                    create_shared_memory_cache(cache_name="internal_usage_cache")
+                )
             self.db_spend_update_writer.redis_update_buffer.redis_cache = redis_cache
             self.db_spend_update_writer.pod_lock_manager.redis_cache = redis_cache
 
@@ -1994,6 +2001,50 @@ class ProxyLogging:
         expected_keys = ["jsonrpc", "id", "result"]
         return all(key in response for key in expected_keys)
 
+    def _get_custom_logger(self, callback: Any) -> Optional[CustomLogger]:
+        if isinstance(callback, str):
+            return litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
+                cast(_custom_logger_compatible_callbacks_literal, callback)
+            )
+        if isinstance(callback, CustomLogger):
+            return callback
+        return None
+
+    def has_post_call_streaming_hooks(self) -> bool:
+        """
+        True if any callback wants `async_post_call_streaming_hook` to run per chunk.
+
+        Streaming generators check this once per request, and skip the per-chunk hook
+        (and accumulating the streamed text) otherwise.
+        """
+        for callback in litellm.callbacks:
+            _callback = self._get_custom_logger(callback)
+            if (
+                _callback is not None
+                and _callback.should_run_post_call_streaming_hook()
+            ):
+                return True
+        return False
+
+    def has_streaming_iterator_hooks(self, request_data: dict) -> bool:
+        """
+        True if a callback processes the streamed chunks of this request via
+        `async_post_call_streaming_iterator_hook` - e.g. a streaming guardrail.
+        """
+        for callback in litellm.callbacks:
+            _callback = self._get_custom_logger(callback)
+            if _callback is None:
+                continue
+            if isinstance(
+                _callback, CustomGuardrail
+            ) and not _callback.should_run_guardrail(
+                data=request_data, event_type=GuardrailEventHooks.post_call
+            ):
+                continue
+            if _callback.should_run_post_call_streaming_iterator_hook():
+                return True
+        return False
+
     async def async_post_call_streaming_hook(
         self,
         data: dict,
@@ -2001,11 +2052,14 @@ class ProxyLogging:
             ModelResponse, EmbeddingResponse, ImageResponse, ModelResponseStream
         ],
         user_api_key_dict: UserAPIKeyAuth,
-        str_so_far: Optional[str] = None,
+        str_so_far: Optional[Union[str, LazyStreamedText]] = None,
     ):
         """
         Allow user to modify outgoing streaming data -> per chunk
 
+        `str_so_far` is the text streamed before this chunk. It is only materialized
+        if a callback runs.
+
         Covers:
         1. /chat/completions
         """
@@ -2019,10 +2073,16 @@ class ProxyLogging:
 
             response_str = extract_text_from_a2a_response(response)
         if response_str is not None:
+            complete_response: Optional[str] = None
             for callback in litellm.callbacks:
                 try:
-                    _callback: Optional[CustomLogger] = None
-                    if isinstance(callback, CustomGuardrail):
+                    _callback = self._get_custom_logger(callback)
+                    if (
+                        _callback is None
+                        or not _callback.should_run_post_call_streaming_hook()
+                    ):
+                        continue
+                    if isinstance(_callback, CustomGuardrail):
                         # Main - V2 Guardrails implementation
                         from litellm.types.guardrails import GuardrailEventHooks
 
@@ -2032,32 +2092,24 @@ class ProxyLogging:
                         )
 
                         if (
-                            callback.should_run_guardrail(
+                            _callback.should_run_guardrail(
                                 data=modified_data,
                                 event_type=GuardrailEventHooks.post_call,
                             )
                             is not True
                         ):
                             continue
-                    if isinstance(callback, str):
-                        _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                            cast(_custom_logger_compatible_callbacks_literal, callback)
-                        )
-                    else:
-                        _callback = callback  # type: ignore
-                    if _callback is not None and isinstance(_callback, CustomLogger):
+                    if complete_response is None:
                         if str_so_far is not None:
-                            complete_response = str_so_far + response_str
+                            complete_response = str(str_so_far) + response_str
                         else:
                             complete_response = response_str
-                        callback_response = (
-                            await _callback.async_post_call_streaming_hook(
-                                user_api_key_dict=user_api_key_dict,
-                                response=complete_response,
-                            )
-                        )
-                        if callback_response is not None:
-                            response = callback_response
+                    callback_response = await _callback.async_post_call_streaming_hook(
+                        user_api_key_dict=user_api_key_dict,
+                        response=complete_response,
+                    )
+                    if callback_response is not None:
+                        response = callback_response
                 except Exception as e:
                     raise e
         return response
@@ -3957,8 +4009,22 @@ class ProxyUpdateSpend:
                             # Items already removed from queue at start of function
                             pass
                     else:
+                        spend_logs_copy_writer = (
+                            ProxyUpdateSpend.get_spend_logs_copy_writer()
+                        )
                         for j in range(0, len(logs_to_process), BATCH_SIZE):
                             batch = logs_to_process[j : j + BATCH_SIZE]
+                            if (
+                                spend_logs_copy_writer is not None
+                                and await spend_logs_copy_writer.write_spend_logs(
+                                    batch
+                                )
+                            ):
+                                verbose_proxy_logger.debug(
+                                    f"Copied {len(batch)} logs to the DB."
+                                )
+                                del batch
+                                continue
                             batch_with_dates = [
                                 prisma_client.jsonify_object({**entry})
                                 for entry in batch
@@ -3995,6 +4061,19 @@ class ProxyUpdateSpend:
             # Clean up logs_to_process after all processing is complete
             del logs_to_process
 
+    @staticmethod
+    def get_spend_logs_copy_writer() -> Optional["SpendLogsCopyWriter"]:
+        """
+        returns the COPY writer for spend logs if `use_postgres_copy_for_spend_logs` is set
+        """
+        from litellm.proxy.proxy_server import general_settings
+
+        if general_settings.get("use_postgres_copy_for_spend_logs") is not True:
+            return None
+        from litellm.proxy.db.spend_logs_copy_writer import get_spend_logs_copy_writer
+
+        return get_spend_logs_copy_writer()
+
     @staticmethod
     def disable_spend_updates() -> bool:
         """
@@ -51,7 +51,11 @@ from litellm.caching.caching import (
     RedisCache,
     RedisClusterCache,
 )
-from litellm.constants import DEFAULT_MAX_LRU_CACHE_SIZE
+from litellm.caching.lru_in_memory_cache import create_in_memory_cache
+from litellm.constants import (
+    DEFAULT_MAX_LRU_CACHE_SIZE,
+    HEALTHY_DEPLOYMENTS_SNAPSHOT_TTL_SECONDS,
+)
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.asyncify import run_async_function
 from litellm.litellm_core_utils.core_helpers import (
@@ -61,8 +65,16 @@ from litellm.litellm_core_utils.core_helpers import (
 from litellm.litellm_core_utils.coroutine_checker import coroutine_checker
 from litellm.litellm_core_utils.credential_accessor import CredentialAccessor
 from litellm.litellm_core_utils.dd_tracing import tracer
+from litellm.litellm_core_utils.image_metadata_cache import (
+    async_prefetch_image_dimensions,
+)
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
+from litellm.litellm_core_utils.raw_sse_passthrough import RawSSEPassthroughStream
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
+from litellm.llms.custom_httpx.connection_pool_manager import (
+    CONNECTION_POOL_PARAMS,
+    connection_pool_manager,
+)
 from litellm.llms.openai_like.json_loader import JSONProviderRegistry
 from litellm.router_strategy.budget_limiter import RouterBudgetLimiting
 from litellm.router_strategy.least_busy import LeastBusyLoggingHandler
@@ -103,6 +115,9 @@ from litellm.router_utils.fallback_event_handlers import (
     get_fallback_model_group,
     run_async_fallback,
 )
+from litellm.router_utils.healthy_deployments_snapshot import (
+    HealthyDeploymentsSnapshotCache,
+)
 from litellm.router_utils.get_retry_from_policy import (
     get_num_retries_from_retry_policy as _get_num_retries_from_retry_policy,
 )
@@ -236,6 +251,7 @@ class Router:
         ## SCHEDULER ##
         polling_interval: Optional[float] = None,
         default_priority: Optional[int] = None,
+        scheduler_backend: Optional[Literal["dual_cache", "in_memory", "redis"]] = None,
         ## RELIABILITY ##
         num_retries: Optional[int] = None,
         max_fallbacks: Optional[
@@ -311,6 +327,7 @@ class Router:
             client_ttl (int): Time-to-live for cached clients in seconds. Defaults to 3600.
             polling_interval: (Optional[float]): frequency of polling queue. Only for '.scheduler_acompletion()'. Default is 3ms.
             default_priority: (Optional[int]): the default priority for a request. Only for '.scheduler_acompletion()'. Default is None.
+            scheduler_backend: (Optional[str]): queue backend for '.scheduler_acompletion()' - "dual_cache" (default), "in_memory" or "redis" (sorted sets shared across instances).
             num_retries (Optional[int]): Number of retries for failed requests. Defaults to 2.
             timeout (Optional[float]): Timeout for requests. Defaults to None.
             default_litellm_params (dict): Default parameters for Router.chat.completion.create. Defaults to {}.
@@ -392,6 +409,7 @@ class Router:
             []
         )  # names of models under litellm_params. ex. azure/chatgpt-v-2
         self.deployment_latency_map = {}
+        self._connection_pool_warmup_tasks: Dict[str, asyncio.Task] = {}
         ### CACHING ###
         cache_type: Literal[
             "local", "redis", "redis-semantic", "s3", "disk"
@@ -431,12 +449,17 @@ class Router:
                 litellm.cache = litellm.Cache(type=cache_type, **cache_config)  # type: ignore
             self.cache_responses = cache_responses
         self.cache = DualCache(
-            redis_cache=redis_cache, in_memory_cache=InMemoryCache()
+            redis_cache=redis_cache,
+            in_memory_cache=create_in_memory_cache(
+                cache_name="router_cache", stateful=True
+            ),
         )  # use a dual cache (Redis+In-Memory) for tracking cooldowns, usage, etc.
 
         ### SCHEDULER ###
         self.scheduler = Scheduler(
-            polling_interval=polling_interval, redis_cache=redis_cache
+            polling_interval=polling_interval,
+            redis_cache=redis_cache,
+            backend=scheduler_backend,
         )
         self.default_priority = default_priority
         self.default_deployment = None  # use this to track the users default deployment, when they want to use model = *
@@ -453,6 +476,10 @@ class Router:
             model_group_alias or {}
         )  # dict to store aliases for router, ex. {"gpt-4": "gpt-3.5-turbo"}, all requests with gpt-4 -> get routed to gpt-3.5-turbo group
 
+        # per model group deployments not in cooldown, see async_get_healthy_deployments
+        self.healthy_deployments_snapshot_cache = HealthyDeploymentsSnapshotCache(
+            ttl=HEALTHY_DEPLOYMENTS_SNAPSHOT_TTL_SECONDS
+        )
         # Initialize model ID to deployment index mapping for O(1) lookups
         self.model_id_to_deployment_index_map: Dict[str, int] = {}
         # Initialize model name to deployment indices mapping for O(1) lookups
@@ -1554,11 +1581,15 @@ class Router:
                 async for item in model_response:
                     yield item
             except MidStreamFallbackError as e:
-                from litellm.main import stream_chunk_builder
+                chunk_accumulator = getattr(model_response, "chunk_accumulator", None)
+                if chunk_accumulator is not None:
+                    complete_response_object = chunk_accumulator.build_response()
+                else:
+                    from litellm.main import stream_chunk_builder
 
-                complete_response_object = stream_chunk_builder(
-                    chunks=model_response.chunks
-                )
+                    complete_response_object = stream_chunk_builder(
+                        chunks=model_response.chunks
+                    )
                 complete_response_object_usage = cast(
                     Optional[Usage],
                     getattr(complete_response_object, "usage", None),
@@ -1821,7 +1852,9 @@ class Router:
                 parent_otel_span=parent_otel_span,
             )
 
-            if isinstance(response, CustomStreamWrapper):
+            if isinstance(response, CustomStreamWrapper) and not isinstance(
+                response, RawSSEPassthroughStream
+            ):  # raw passthrough streams are forwarded as-is, without mid-stream fallbacks
                 return await self._acompletion_streaming_iterator(
                     model_response=response,
                     messages=messages,
@@ -2412,7 +2445,6 @@ class Router:
         ## POLL QUEUE
         end_time = time.monotonic() + self.timeout
         curr_time = time.monotonic()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
         make_request = False
 
         while curr_time < end_time:
@@ -2427,7 +2459,7 @@ class Router:
             if make_request:  ## IF TRUE -> MAKE REQUEST
                 break
             else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
+                await self.scheduler.wait_for_queue_update(model_name=item.model_name)
                 curr_time = time.monotonic()
 
         if make_request:
@@ -2443,6 +2475,8 @@ class Router:
             except Exception as e:
                 setattr(e, "priority", priority)
                 raise e
+            finally:
+                await self.scheduler.notify_request_finished(model_name=item.model_name)
         else:
             # Clean up the request from the scheduler queue also before raising the timeout exception
             await self.scheduler.remove_request(
@@ -2478,7 +2512,6 @@ class Router:
         ## POLL QUEUE
         end_time = time.monotonic() + self.timeout
         curr_time = time.monotonic()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
         make_request = False
 
         while curr_time < end_time:
@@ -2493,7 +2526,7 @@ class Router:
             if make_request:  ## IF TRUE -> MAKE REQUEST
                 break
             else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
+                await self.scheduler.wait_for_queue_update(model_name=item.model_name)
                 curr_time = time.monotonic()
 
         if make_request:
@@ -2508,6 +2541,8 @@ class Router:
             except Exception as e:
                 setattr(e, "priority", priority)
                 raise e
+            finally:
+                await self.scheduler.notify_request_finished(model_name=item.model_name)
         else:
             # Clean up the request from the scheduler queue also before raising the timeout exception
             await self.scheduler.remove_request(
@@ -6327,6 +6362,7 @@ class Router:
         return False
 
     def set_model_list(self, model_list: list):
+        self.healthy_deployments_snapshot_cache.invalidate()
         original_model_list = copy.deepcopy(model_list)
         self.model_list = []
         self.model_id_to_deployment_index_map = {}  # Reset the index
@@ -6489,6 +6525,10 @@ class Router:
                 model=deployment.litellm_params.model,
             )
 
+        self._initialize_deployment_connection_pool(
+            deployment=deployment, api_base=api_base
+        )
+
         #########################################################
         # Check if this is an auto-router deployment
         #########################################################
@@ -6497,6 +6537,47 @@ class Router:
 
         return deployment
 
+    def _initialize_deployment_connection_pool(
+        self, deployment: Deployment, api_base: Optional[str]
+    ):
+        """
+        Optional: Register a connection pool for the deployment's api_base if `max_connections`, `http2`, `warmup_connections`, etc. are set in `deployment.litellm_params`
+
+        If `warmup_connections` is set and an event loop is running, the connections are opened in the background.
+        """
+        pool_params = {
+            param: deployment.litellm_params.get(param)
+            for param in CONNECTION_POOL_PARAMS
+        }
+        if all(value is None for value in pool_params.values()):
+            return
+        registered_api_base = connection_pool_manager.register_deployment(
+            litellm_params={
+                **pool_params,
+                "model": deployment.litellm_params.model,
+                "api_base": deployment.litellm_params.api_base or api_base,
+            }
+        )
+        if registered_api_base is None or not pool_params.get("warmup_connections"):
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            verbose_router_logger.debug(
+                "No running event loop, skipping connection pool warmup for api_base=%s",
+                registered_api_base,
+            )
+            return
+        if registered_api_base in self._connection_pool_warmup_tasks:
+            return
+        task = asyncio.create_task(
+            connection_pool_manager.warmup(api_base=registered_api_base)
+        )
+        self._connection_pool_warmup_tasks[registered_api_base] = task
+        task.add_done_callback(
+            lambda _: self._connection_pool_warmup_tasks.pop(registered_api_base, None)
+        )
+
     def _initialize_deployment_for_pass_through(
         self, deployment: Deployment, custom_llm_provider: str, model: str
     ):
@@ -6594,6 +6675,7 @@ class Router:
         - model_id: str - the id of the deployment that was removed
         - removal_idx: int - the index where the deployment was removed from model_list
         """
+        self.healthy_deployments_snapshot_cache.invalidate()
         # Update indices for all models after the removed one
         for deployment_id, idx in self.model_id_to_deployment_index_map.items():
             if idx > removal_idx:
@@ -6632,6 +6714,7 @@ class Router:
         - model: dict - the model to add to the list
         - model_id: Optional[str] - the model ID to use for indexing. If None, will try to get from model["model_info"]["id"]
         """
+        self.healthy_deployments_snapshot_cache.invalidate()
         idx = len(self.model_list)
         self.model_list.append(model)
 
@@ -7431,6 +7514,7 @@ class Router:
         This index allows us to find all deployments for a given model_name in O(1) time
         instead of O(n) linear scan through the entire model_list.
         """
+        self.healthy_deployments_snapshot_cache.invalidate()
         self.model_name_to_deployment_indices.clear()
 
         for idx, model in enumerate(model_list):
@@ -7446,6 +7530,7 @@ class Router:
         This is called during initialization to avoid the race condition where
         requests arrive before model_id_to_deployment_index_map is populated.
         """
+        self.healthy_deployments_snapshot_cache.invalidate()
         # First populate the model_list
         self.model_list = []
         for _, model in enumerate(model_list):
@@ -8329,6 +8414,68 @@ class Router:
 
         return model, healthy_deployments
 
+    async def _async_get_deployments_not_in_cooldown(
+        self,
+        model: str,
+        request_kwargs: Dict,
+        messages: Optional[List[Dict[str, str]]] = None,
+        input: Optional[Union[str, List]] = None,
+        specific_deployment: Optional[bool] = False,
+        parent_otel_span: Optional[Span] = None,
+    ) -> Tuple[str, Union[List, Dict]]:
+        """
+        Run the common checks and filter out deployments in cooldown.
+
+        The result for a model group is stored in `healthy_deployments_snapshot_cache`.
+        """
+        model_list_version = self.healthy_deployments_snapshot_cache.model_list_version
+        cooldown_version = self.cooldown_cache.version
+        requested_model = model
+        model, healthy_deployments = self._common_checks_available_deployment(
+            model=model,
+            messages=messages,
+            input=input,
+            specific_deployment=specific_deployment,
+            request_kwargs=request_kwargs,
+        )  # type: ignore
+
+        if isinstance(healthy_deployments, dict):
+            return model, healthy_deployments
+
+        cooldown_models = await _async_get_cooldown_deployments_with_debug_info(
+            litellm_router_instance=self, parent_otel_span=parent_otel_span
+        )
+        cooldown_deployments = [cv[0] for cv in cooldown_models]
+        if verbose_router_logger.isEnabledFor(logging.DEBUG):
+            verbose_router_logger.debug(
+                f"cooldown deployments: {cooldown_deployments}"
+            )
+        model_group_deployments = healthy_deployments
+        healthy_deployments = self._filter_cooldown_deployments(
+            healthy_deployments=model_group_deployments,
+            cooldown_deployments=cooldown_deployments,
+        )
+
+        # only snapshot plain model group lookups - not aliases, wildcards or fallbacks
+        if model == requested_model and model in self.model_names:
+            model_ids = {
+                deployment["model_info"]["id"] for deployment in model_group_deployments
+            }
+            cooldown_expiry_times = [
+                cooldown_value["timestamp"] + cooldown_value["cooldown_time"]
+                for model_id, cooldown_value in cooldown_models
+                if model_id in model_ids
+            ]
+            self.healthy_deployments_snapshot_cache.set(
+                model_group=model,
+                deployments=healthy_deployments,
+                model_list_version=model_list_version,
+                cooldown_version=cooldown_version,
+                cooldown_expires_at=min(cooldown_expiry_times, default=None),
+            )
+            healthy_deployments = list(healthy_deployments)
+        return model, healthy_deployments
+
     async def async_get_healthy_deployments(
         self,
         model: str,
@@ -8347,13 +8494,23 @@ class Router:
         - Dict, if specific model chosen
         """
 
-        model, healthy_deployments = self._common_checks_available_deployment(
-            model=model,
-            messages=messages,
-            input=input,
-            specific_deployment=specific_deployment,
-            request_kwargs=request_kwargs,
-        )  # type: ignore
+        # deployments of the model group not in cooldown - cached per model group
+        healthy_deployments: Optional[Union[List, Dict]] = None
+        if specific_deployment is not True:
+            healthy_deployments = self.healthy_deployments_snapshot_cache.get(
+                model_group=model, cooldown_version=self.cooldown_cache.version
+            )
+        if healthy_deployments is None:
+            model, healthy_deployments = (
+                await self._async_get_deployments_not_in_cooldown(
+                    model=model,
+                    messages=messages,
+                    input=input,
+                    specific_deployment=specific_deployment,
+                    request_kwargs=request_kwargs,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
 
         # IF TEAM ID SPECIFIED ON MODEL, AND REQUEST CONTAINS USER_API_KEY_TEAM_ID, FILTER OUT MODELS THAT ARE NOT IN THE TEAM
         ## THIS PREVENTS WRITING FILES OF OTHER TEAMS TO MODELS THAT ARE TEAM-ONLY MODELS
@@ -8380,18 +8537,6 @@ class Router:
         if isinstance(healthy_deployments, dict):
             return healthy_deployments
 
-        cooldown_deployments = await _async_get_cooldown_deployments(
-            litellm_router_instance=self, parent_otel_span=parent_otel_span
-        )
-        if verbose_router_logger.isEnabledFor(logging.DEBUG):
-            verbose_router_logger.debug(
-                f"cooldown deployments: {cooldown_deployments}"
-            )
-        healthy_deployments = self._filter_cooldown_deployments(
-            healthy_deployments=healthy_deployments,
-            cooldown_deployments=cooldown_deployments,
-        )
-
         healthy_deployments = await self.async_callback_filter_deployments(
             model=model,
             healthy_deployments=healthy_deployments,
@@ -8403,6 +8548,8 @@ class Router:
         )
 
         if self.enable_pre_call_checks and messages is not None:
+            # fetch image dimensions without blocking the event loop in token counting
+            await async_prefetch_image_dimensions(messages)
             healthy_deployments = self._pre_call_checks(
                 model=model,
                 healthy_deployments=cast(List[Dict], healthy_deployments),
@@ -0,0 +1,210 @@
+"""
+Time-decayed latency sketches for latency-based routing.
+
+A deployment's latency (and time to first token) is summarised by sums that are only
+ever incremented:
+
+- `{metric}:w` / `{metric}:sum`: decayed count / sum of samples -> exponentially weighted mean
+- `{metric}:b{i}`: decayed count of samples in log-bucket `i` -> quantiles, ~5% relative error
+
+Samples are weighted with forward decay - weight = 2 ** ((t - landmark) / half_life) - so
+older samples count less without rewriting stored values. As the state is a set of sums,
+it can live in a Redis hash updated with HINCRBYFLOAT, and replicas writing to the same
+hash converge. Weights restart at 1 in a new hash every `EPOCH_HALF_LIVES` half-lives;
+the previous epoch's hash is read as well, scaled down to the new landmark.
+"""
+
+import asyncio
+import math
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from litellm._logging import verbose_router_logger
+from litellm.types.caching import RedisPipelineHashIncrementOperation
+
+if TYPE_CHECKING:
+    from litellm.caching.redis_cache import RedisCache
+else:
+    RedisCache = None
+
+EPOCH_HALF_LIVES = 8
+BUCKET_GAMMA = 1.1
+_LOG_BUCKET_GAMMA = math.log(BUCKET_GAMMA)
+_MIN_LATENCY = 1e-6
+_PURGE_EVERY_N_INCREMENTS = 1000
+
+
+def get_epoch(now: float, half_life: float) -> int:
+    return int(now // (half_life * EPOCH_HALF_LIVES))
+
+
+def get_sample_increments(
+    metric: str, value: float, now: float, half_life: float
+) -> Dict[str, float]:
+    """
+    Hash field increments that add one latency sample to the sketch of `metric`.
+    """
+    landmark = get_epoch(now, half_life) * half_life * EPOCH_HALF_LIVES
+    weight = 2 ** ((now - landmark) / half_life)
+    bucket = math.floor(math.log(max(value, _MIN_LATENCY)) / _LOG_BUCKET_GAMMA)
+    return {
+        f"{metric}:w": weight,
+        f"{metric}:sum": weight * value,
+        f"{metric}:b{bucket}": weight,
+    }
+
+
+def merge_epochs(
+    current: Dict[str, float], previous: Dict[str, float]
+) -> Dict[str, float]:
+    scale = 2.0**-EPOCH_HALF_LIVES
+    merged = {field: value * scale for field, value in previous.items()}
+    for field, value in current.items():
+        merged[field] = merged.get(field, 0.0) + value
+    return merged
+
+
+def get_latency_statistic(
+    fields: Dict[str, float], metric: str, statistic: str
+) -> Optional[float]:
+    """
+    "ewma" -> exponentially weighted mean, "p50" / "p95" / "p99" -> quantile.
+
+    Returns None if there are no samples of `metric`.
+    """
+    total_weight = fields.get(f"{metric}:w", 0.0)
+    if total_weight <= 0:
+        return None
+    if statistic == "ewma":
+        return fields.get(f"{metric}:sum", 0.0) / total_weight
+
+    quantile = float(statistic[1:]) / 100
+    prefix = f"{metric}:b"
+    buckets = sorted(
+        (int(field[len(prefix) :]), weight)
+        for field, weight in fields.items()
+        if field.startswith(prefix)
+    )
+    if not buckets:
+        return None
+    threshold = quantile * total_weight
+    cumulative_weight = 0.0
+    for bucket, weight in buckets:
+        cumulative_weight += weight
+        if cumulative_weight >= threshold:
+            return BUCKET_GAMMA ** (bucket + 0.5)
+    return BUCKET_GAMMA ** (buckets[-1][0] + 0.5)
+
+
+class RedisHashMirror:
+    """
+    Local copy of Redis hashes of counters.
+
+    Increments are applied locally right away and written to Redis (if configured) with
+    HINCRBYFLOAT. `async_refresh_if_stale` replaces the local copy with the Redis totals,
+    which include the increments of all instances.
+    """
+
+    def __init__(
+        self,
+        redis_cache: Optional[RedisCache],
+        ttl: int,
+        refresh_interval: float,
+    ):
+        self.redis_cache = redis_cache
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self._hashes: Dict[str, Dict[str, float]] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._last_refresh: Dict[str, float] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._increments_since_purge = 0
+
+    def get(self, key: str) -> Dict[str, float]:
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and expires_at < time.time():
+            self._hashes.pop(key, None)
+            self._expires_at.pop(key, None)
+        return self._hashes.get(key, {})
+
+    def increment(
+        self, key: str, increments: Dict[str, float]
+    ) -> RedisPipelineHashIncrementOperation:
+        """
+        Apply `increments` locally. Returns the operation to write to Redis.
+        """
+        fields = self._hashes.setdefault(key, {})
+        for field, value in increments.items():
+            fields[field] = fields.get(field, 0.0) + value
+        self._expires_at[key] = time.time() + self.ttl
+
+        self._increments_since_purge += 1
+        if self._increments_since_purge >= _PURGE_EVERY_N_INCREMENTS:
+            self._purge_expired()
+        return RedisPipelineHashIncrementOperation(
+            key=key, increments=increments, ttl=self.ttl
+        )
+
+    def _purge_expired(self) -> None:
+        self._increments_since_purge = 0
+        now = time.time()
+        expired_keys = [
+            key for key, expires_at in self._expires_at.items() if expires_at < now
+        ]
+        for key in expired_keys:
+            self._hashes.pop(key, None)
+            self._expires_at.pop(key, None)
+
+    async def async_write(
+        self, increment_list: List[RedisPipelineHashIncrementOperation]
+    ) -> None:
+        if self.redis_cache is not None:
+            await self.redis_cache.async_increment_hash_pipeline(increment_list)
+
+    def write(self, increment_list: List[RedisPipelineHashIncrementOperation]) -> None:
+        """
+        Sync version of `async_write`, so that the increments survive the next refresh.
+        """
+        if self.redis_cache is not None:
+            self.redis_cache.increment_hash_pipeline(increment_list)
+
+    async def async_refresh_if_stale(self, group: str, keys: List[str]) -> None:
+        """
+        Refresh `keys` from Redis at most every `refresh_interval` seconds per group.
+
+        The first refresh of a group is awaited, later ones run in the background.
+        """
+        if self.redis_cache is None:
+            return
+        last_refresh = self._last_refresh.get(group)
+        if (
+            last_refresh is not None
+            and time.time() - last_refresh < self.refresh_interval
+        ):
+            return
+        self._last_refresh[group] = time.time()
+        if last_refresh is None:
+            await self._async_refresh(keys)
+        elif group not in self._refresh_tasks:
+            task = asyncio.create_task(self._async_refresh(keys))
+            self._refresh_tasks[group] = task
+            task.add_done_callback(lambda _: self._refresh_tasks.pop(group, None))
+
+    async def _async_refresh(self, keys: List[str]) -> None:
+        if self.redis_cache is None:
+            return
+        try:
+            results = await self.redis_cache.async_batch_get_hash(keys)
+        except Exception as e:
+            verbose_router_logger.debug(
+                "RedisHashMirror: failed to refresh from redis - %s", str(e)
+            )
+            return
+        expires_at = time.time() + self.ttl
+        for key, fields in zip(keys, results):
+            if fields:
+                self._hashes[key] = fields
+                self._expires_at.setdefault(key, expires_at)
+            else:
+                self._hashes.pop(key, None)
+                self._expires_at.pop(key, None)
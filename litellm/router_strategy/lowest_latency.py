@@ -1,8 +1,9 @@
 #### What this does ####
 #   picks based on response time (for streaming, this is time to first token)
 import random
+import time
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 
 import litellm
 from litellm import ModelResponse, token_counter, verbose_logger
@@ -10,6 +11,15 @@ from litellm.caching.caching import DualCache
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import safe_divide_seconds
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
+from litellm.router_strategy.latency_sketch import (
+    EPOCH_HALF_LIVES,
+    RedisHashMirror,
+    get_epoch,
+    get_latency_statistic,
+    get_sample_increments,
+    merge_epochs,
+)
+from litellm.types.caching import RedisPipelineHashIncrementOperation
 from litellm.types.utils import LiteLLMPydanticObjectBase
 
 if TYPE_CHECKING:
@@ -24,6 +34,11 @@ class RoutingArgs(LiteLLMPydanticObjectBase):
     ttl: float = 1 * 60 * 60  # 1 hour
     lowest_latency_buffer: float = 0
     max_latency_list_size: int = 10
+    # "average" - mean of the last `max_latency_list_size` latencies
+    # "ewma" / "p50" / "p95" / "p99" - time-decayed sketches, see latency_sketch.py
+    latency_statistic: Literal["average", "ewma", "p50", "p95", "p99"] = "average"
+    latency_half_life: float = 60  # seconds, for latency sketches
+    latency_sketch_refresh_interval: float = 1  # seconds between reads from redis
 
 
 class LowestLatencyLoggingHandler(CustomLogger):
@@ -36,6 +51,15 @@ class LowestLatencyLoggingHandler(CustomLogger):
     ):
         self.router_cache = router_cache
         self.routing_args = RoutingArgs(**routing_args)
+        self.latency_sketches: Optional[RedisHashMirror] = None
+        if self.routing_args.latency_statistic != "average":
+            self.latency_sketches = RedisHashMirror(
+                redis_cache=getattr(router_cache, "redis_cache", None),
+                # current + previous epoch, plus slack for clock skew between instances
+                ttl=int(2 * EPOCH_HALF_LIVES * self.routing_args.latency_half_life)
+                + 60,
+                refresh_interval=self.routing_args.latency_sketch_refresh_interval,
+            )
 
     def log_success_event(  # noqa: PLR0915
         self, kwargs, response_obj, start_time, end_time
@@ -118,6 +142,20 @@ class LowestLatencyLoggingHandler(CustomLogger):
                                 ttft_seconds, completion_tokens
                             )
 
+                if self.latency_sketches is not None:
+                    self.latency_sketches.write(
+                        self._update_latency_sketches(
+                            model_group=model_group,
+                            deployment_id=id,
+                            latency=final_value,
+                            time_to_first_token=time_to_first_token,
+                            total_tokens=total_tokens,
+                        )
+                    )
+                    if self.test_flag:
+                        self.logged_success += 1
+                    return
+
                 # ------------
                 # Update usage
                 # ------------
@@ -223,6 +261,19 @@ class LowestLatencyLoggingHandler(CustomLogger):
                         }
                     }
                     """
+                    if self.latency_sketches is not None:
+                        # give 1000s penalty for failing
+                        await self.latency_sketches.async_write(
+                            self._update_latency_sketches(
+                                model_group=model_group,
+                                deployment_id=id,
+                                latency=1000.0,
+                                time_to_first_token=None,
+                                total_tokens=None,
+                            )
+                        )
+                        return
+
                     latency_key = f"{model_group}_map"
                     request_count_dict = (
                         await self.router_cache.async_get_cache(key=latency_key) or {}
@@ -338,6 +389,20 @@ class LowestLatencyLoggingHandler(CustomLogger):
                             time_to_first_token = safe_divide_seconds(
                                 ttft_seconds, completion_tokens
                             )
+                if self.latency_sketches is not None:
+                    await self.latency_sketches.async_write(
+                        self._update_latency_sketches(
+                            model_group=model_group,
+                            deployment_id=id,
+                            latency=final_value,
+                            time_to_first_token=time_to_first_token,
+                            total_tokens=total_tokens,
+                        )
+                    )
+                    if self.test_flag:
+                        self.logged_success += 1
+                    return
+
                 # ------------
                 # Update usage
                 # ------------
@@ -470,18 +535,8 @@ class LowestLatencyLoggingHandler(CustomLogger):
             if _deployment is None:
                 continue  # skip to next one
 
-            _deployment_tpm = (
-                _deployment.get("tpm", None)
-                or _deployment.get("litellm_params", {}).get("tpm", None)
-                or _deployment.get("model_info", {}).get("tpm", None)
-                or float("inf")
-            )
-
-            _deployment_rpm = (
-                _deployment.get("rpm", None)
-                or _deployment.get("litellm_params", {}).get("rpm", None)
-                or _deployment.get("model_info", {}).get("rpm", None)
-                or float("inf")
+            _deployment_tpm, _deployment_rpm = self._get_deployment_tpm_rpm_limits(
+                _deployment
             )
             item_latency = item_map.get("latency", [])
             item_ttft_latency = item_map.get("time_to_first_token", [])
@@ -527,6 +582,34 @@ class LowestLatencyLoggingHandler(CustomLogger):
             else:
                 potential_deployments.append((_deployment, item_latency))
 
+        return self._pick_lowest_latency_deployment(
+            potential_deployments=potential_deployments,
+            latency_per_deployment=_latency_per_deployment,
+            request_kwargs=request_kwargs,
+        )
+
+    @staticmethod
+    def _get_deployment_tpm_rpm_limits(deployment: Dict) -> Tuple[float, float]:
+        deployment_tpm = (
+            deployment.get("tpm", None)
+            or deployment.get("litellm_params", {}).get("tpm", None)
+            or deployment.get("model_info", {}).get("tpm", None)
+            or float("inf")
+        )
+        deployment_rpm = (
+            deployment.get("rpm", None)
+            or deployment.get("litellm_params", {}).get("rpm", None)
+            or deployment.get("model_info", {}).get("rpm", None)
+            or float("inf")
+        )
+        return deployment_tpm, deployment_rpm
+
+    def _pick_lowest_latency_deployment(
+        self,
+        potential_deployments: List[Tuple[Dict, float]],
+        latency_per_deployment: Dict[str, float],
+        request_kwargs: Optional[Dict],
+    ) -> Optional[Dict]:
         if len(potential_deployments) == 0:
             return None
 
@@ -550,9 +633,151 @@ class LowestLatencyLoggingHandler(CustomLogger):
         if request_kwargs is not None and metadata_field in request_kwargs:
             request_kwargs[metadata_field][
                 "_latency_per_deployment"
-            ] = _latency_per_deployment
+            ] = latency_per_deployment
         return deployment
 
+    # ---------------
+    # Latency sketches
+    # ---------------
+
+    @staticmethod
+    def _get_latency_sketch_key(
+        model_group: str, deployment_id: str, epoch: int
+    ) -> str:
+        return f"{model_group}_latency_sketch:{deployment_id}:{epoch}"
+
+    @staticmethod
+    def _get_latency_usage_key(model_group: str, precise_minute: str) -> str:
+        return f"{model_group}_latency_usage:{precise_minute}"
+
+    @staticmethod
+    def _get_precise_minute() -> str:
+        return datetime.now().strftime("%Y-%m-%d-%H-%M")
+
+    def _update_latency_sketches(
+        self,
+        model_group: str,
+        deployment_id: str,
+        latency: Union[float, timedelta],
+        time_to_first_token: Optional[float],
+        total_tokens: Optional[int],
+    ) -> List[RedisPipelineHashIncrementOperation]:
+        """
+        Add a request to the deployment's sketches - O(1), no read-modify-write of
+        shared state.
+
+        Returns the increments to write to redis.
+        """
+        assert self.latency_sketches is not None
+        if isinstance(latency, timedelta):
+            latency = latency.total_seconds()
+        now = time.time()
+        half_life = self.routing_args.latency_half_life
+
+        sketch_increments = get_sample_increments("latency", latency, now, half_life)
+        if time_to_first_token is not None:
+            sketch_increments.update(
+                get_sample_increments("ttft", time_to_first_token, now, half_life)
+            )
+        increment_list = [
+            self.latency_sketches.increment(
+                self._get_latency_sketch_key(
+                    model_group, deployment_id, get_epoch(now, half_life)
+                ),
+                sketch_increments,
+            )
+        ]
+        if total_tokens is not None:
+            increment_list.append(
+                self.latency_sketches.increment(
+                    self._get_latency_usage_key(
+                        model_group, self._get_precise_minute()
+                    ),
+                    {f"{deployment_id}:tpm": total_tokens, f"{deployment_id}:rpm": 1},
+                )
+            )
+        return increment_list
+
+    def _get_latency_sketch_keys(
+        self, model_group: str, healthy_deployments: list
+    ) -> List[str]:
+        epoch = get_epoch(time.time(), self.routing_args.latency_half_life)
+        keys = [self._get_latency_usage_key(model_group, self._get_precise_minute())]
+        for deployment in healthy_deployments:
+            deployment_id = str(deployment["model_info"]["id"])
+            keys.append(self._get_latency_sketch_key(model_group, deployment_id, epoch))
+            keys.append(
+                self._get_latency_sketch_key(model_group, deployment_id, epoch - 1)
+            )
+        return keys
+
+    def _get_available_deployments_from_sketches(
+        self,
+        model_group: str,
+        healthy_deployments: list,
+        messages: Optional[List[Dict[str, str]]] = None,
+        input: Optional[Union[str, List]] = None,
+        request_kwargs: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        assert self.latency_sketches is not None
+        epoch = get_epoch(time.time(), self.routing_args.latency_half_life)
+        usage = self.latency_sketches.get(
+            self._get_latency_usage_key(model_group, self._get_precise_minute())
+        )
+        is_stream = request_kwargs is not None and request_kwargs.get("stream") is True
+
+        try:
+            input_tokens = token_counter(messages=messages, text=input)
+        except Exception:
+            input_tokens = 0
+
+        potential_deployments: List[Tuple[Dict, float]] = []
+        _latency_per_deployment: Dict[str, float] = {}
+        # shuffled, so that ties (e.g. unused deployments) are broken randomly
+        for deployment in random.sample(healthy_deployments, len(healthy_deployments)):
+            deployment_id = str(deployment["model_info"]["id"])
+            fields = merge_epochs(
+                self.latency_sketches.get(
+                    self._get_latency_sketch_key(model_group, deployment_id, epoch)
+                ),
+                self.latency_sketches.get(
+                    self._get_latency_sketch_key(model_group, deployment_id, epoch - 1)
+                ),
+            )
+            latency: Optional[float] = None
+            if is_stream:
+                latency = get_latency_statistic(
+                    fields, "ttft", self.routing_args.latency_statistic
+                )
+            if latency is None:
+                latency = get_latency_statistic(
+                    fields, "latency", self.routing_args.latency_statistic
+                )
+            if latency is None:
+                latency = 0.0  # not used yet
+
+            _deployment_api_base = deployment.get("litellm_params", {}).get(
+                "api_base", ""
+            )
+            if _deployment_api_base is not None:
+                _latency_per_deployment[_deployment_api_base] = latency
+
+            deployment_tpm, deployment_rpm = self._get_deployment_tpm_rpm_limits(
+                deployment
+            )
+            if (
+                usage.get(f"{deployment_id}:tpm", 0) + input_tokens > deployment_tpm
+                or usage.get(f"{deployment_id}:rpm", 0) + 1 > deployment_rpm
+            ):
+                continue
+            potential_deployments.append((deployment, latency))
+
+        return self._pick_lowest_latency_deployment(
+            potential_deployments=potential_deployments,
+            latency_per_deployment=_latency_per_deployment,
+            request_kwargs=request_kwargs,
+        )
+
     async def async_get_available_deployments(
         self,
         model_group: str,
@@ -561,6 +786,15 @@ class LowestLatencyLoggingHandler(CustomLogger):
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
     ):
+        if self.latency_sketches is not None:
+            await self.latency_sketches.async_refresh_if_stale(
+                group=model_group,
+                keys=self._get_latency_sketch_keys(model_group, healthy_deployments),
+            )
+            return self._get_available_deployments_from_sketches(
+                model_group, healthy_deployments, messages, input, request_kwargs
+            )
+
         # get list of potential deployments
         latency_key = f"{model_group}_map"
 
@@ -594,6 +828,11 @@ class LowestLatencyLoggingHandler(CustomLogger):
         """
         Returns a deployment with the lowest latency
         """
+        if self.latency_sketches is not None:
+            return self._get_available_deployments_from_sketches(
+                model_group, healthy_deployments, messages, input, request_kwargs
+            )
+
         # get list of potential deployments
         latency_key = f"{model_group}_map"
 
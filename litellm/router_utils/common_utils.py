@@ -69,6 +69,8 @@ def filter_team_based_models(
         if model_team_id != request_team_id:
             ids_to_remove.add(_model_info.get("id"))
 
+    if not ids_to_remove:
+        return healthy_deployments
     return [
         deployment
         for deployment in healthy_deployments
@@ -32,6 +32,8 @@ class CooldownCache:
     def __init__(self, cache: DualCache, default_cooldown_time: float):
         self.cache = cache
         self.default_cooldown_time = default_cooldown_time
+        # incremented when a deployment is put in cooldown - invalidates healthy deployment snapshots
+        self.version = 0
         self.in_memory_cache = InMemoryCache()
         # Initialize the masker with custom settings for exception strings
         self.exception_masker = SensitiveDataMasker(
@@ -96,6 +98,7 @@ class CooldownCache:
                 key=cooldown_key,
                 ttl=_cooldown_time,
             )
+            self.version += 1
         except Exception as e:
             verbose_logger.error(
                 "CooldownCache::add_deployment_to_cooldown - Exception occurred - {}".format(
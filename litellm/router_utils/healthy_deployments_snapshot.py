@@ -0,0 +1,74 @@
+"""
+Per model group snapshot of the deployments that are not cooling down.
+
+`async_get_healthy_deployments` used to list the group's deployments and look up the
+cooldown state of every deployment on the router on each request. The snapshot caches that
+result per model group. It's dropped when:
+- the model list changes (`invalidate`)
+- a deployment is put in cooldown (`CooldownCache.version` changes)
+- a cooldown in the snapshot expires
+- `ttl` passes - bounds how long cooldowns set by other instances (via redis) are missed
+
+Request specific filters (team, tags, pre-call checks, budgets) still run per request.
+"""
+
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+
+class _HealthyDeploymentsSnapshot(NamedTuple):
+    model_list_version: int
+    cooldown_version: int
+    expires_at: float
+    deployments: List[Dict]
+
+
+class HealthyDeploymentsSnapshotCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.model_list_version = 0
+        self._snapshots: Dict[str, _HealthyDeploymentsSnapshot] = {}
+
+    def get(self, model_group: str, cooldown_version: int) -> Optional[List[Dict]]:
+        """
+        Returns a copy of the model group's snapshot, or None if there is no valid one.
+        """
+        snapshot = self._snapshots.get(model_group)
+        if (
+            snapshot is None
+            or snapshot.model_list_version != self.model_list_version
+            or snapshot.cooldown_version != cooldown_version
+            or time.time() >= snapshot.expires_at
+        ):
+            return None
+        return list(snapshot.deployments)
+
+    def set(
+        self,
+        model_group: str,
+        deployments: List[Dict],
+        model_list_version: int,
+        cooldown_version: int,
+        cooldown_expires_at: Optional[float] = None,
+    ) -> None:
+        """
+        Store a snapshot computed at `model_list_version` / `cooldown_version`.
+
+        Pass the versions read before computing it - a snapshot computed while the model
+        list changed is never served.
+        """
+        if self.ttl <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        if cooldown_expires_at is not None:
+            expires_at = min(expires_at, cooldown_expires_at)
+        self._snapshots[model_group] = _HealthyDeploymentsSnapshot(
+            model_list_version=model_list_version,
+            cooldown_version=cooldown_version,
+            expires_at=expires_at,
+            deployments=deployments,
+        )
+
+    def invalidate(self) -> None:
+        self.model_list_version += 1
+        self._snapshots.clear()
@@ -4,7 +4,7 @@ Class to handle llm wildcard routing and regex pattern matching
 
 import copy
 import re
-from re import Match
+from re import Match, Pattern
 from typing import Dict, List, Optional, Tuple
 
 from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
@@ -48,6 +48,72 @@ class PatternUtils:
             reverse=True,
         )
 
+    @staticmethod
+    def literal_prefix(regex_pattern: str) -> str:
+        """
+        Return the literal text a regex pattern (built by `_pattern_to_regex`) must start with.
+
+        example:
+        regex: openai/(.*)  -> "openai/"
+        regex: bedrock/anthropic\\.(.*) -> "bedrock/anthropic."
+        regex: (.*)meta\\.llama3(.*) -> ""
+        """
+        prefix = regex_pattern.split("(.*)", 1)[0]
+        if not re.fullmatch(r"(?:[^\\.^$*+?{}\[\]|()]|\\[^0-9A-Za-z])*", prefix):
+            # not produced by re.escape - no safe literal prefix
+            return ""
+        return re.sub(r"\\(.)", r"\1", prefix)
+
+
+class PatternIndex:
+    """
+    Precompiled routing index over the patterns of a `PatternMatchRouter`.
+
+    Patterns are ranked once by specificity and bucketed by their literal prefix,
+    so a lookup only runs the compiled regexes of patterns whose prefix matches the
+    request, instead of re-sorting and matching every pattern.
+    """
+
+    def __init__(self, patterns: Dict[str, List[Dict]]):
+        self.ranked: List[Tuple[str, Pattern, List[Dict]]] = [
+            (pattern, re.compile(pattern), deployments)
+            for pattern, deployments in PatternUtils.sorted_patterns(patterns)
+        ]
+        self.prefix_to_ranks: Dict[str, List[int]] = {}
+        for rank, (pattern, _, _) in enumerate(self.ranked):
+            self.prefix_to_ranks.setdefault(
+                PatternUtils.literal_prefix(pattern), []
+            ).append(rank)
+        self.prefix_lengths: List[int] = sorted(
+            {len(prefix) for prefix in self.prefix_to_ranks}
+        )
+
+    def candidate_ranks(self, request: str) -> List[int]:
+        """
+        Return the ranks of every pattern whose literal prefix is a prefix of `request`, most specific first.
+        """
+        candidates: List[int] = []
+        for length in self.prefix_lengths:
+            if length > len(request):
+                break
+            ranks = self.prefix_to_ranks.get(request[:length])
+            if ranks is not None:
+                candidates.extend(ranks)
+        candidates.sort()
+        return candidates
+
+    def match(
+        self, request: str, allowed_patterns: Optional[set] = None
+    ) -> Optional[Tuple[Match, List[Dict]]]:
+        for rank in self.candidate_ranks(request):
+            pattern, compiled_pattern, deployments = self.ranked[rank]
+            if allowed_patterns is not None and pattern not in allowed_patterns:
+                continue
+            pattern_match = compiled_pattern.match(request)
+            if pattern_match:
+                return pattern_match, deployments
+        return None
+
 
 class PatternMatchRouter:
     """
@@ -60,6 +126,9 @@ class PatternMatchRouter:
 
     def __init__(self):
         self.patterns: Dict[str, List] = {}
+        self._index: Optional[PatternIndex] = None
+        self._indexed_patterns: Optional[Dict[str, List]] = None
+        self._indexed_pattern_count: int = 0
 
     def add_pattern(self, pattern: str, llm_deployment: Dict):
         """
@@ -73,8 +142,23 @@ class PatternMatchRouter:
         regex = self._pattern_to_regex(pattern)
         if regex not in self.patterns:
             self.patterns[regex] = []
+            self._index = None  # rebuilt on next route
         self.patterns[regex].append(llm_deployment)
 
+    def _get_index(self) -> PatternIndex:
+        """
+        Return the compiled pattern index, rebuilding it if patterns were added or replaced.
+        """
+        if (
+            self._index is None
+            or self._indexed_patterns is not self.patterns
+            or self._indexed_pattern_count != len(self.patterns)
+        ):
+            self._index = PatternIndex(self.patterns)
+            self._indexed_patterns = self.patterns
+            self._indexed_pattern_count = len(self.patterns)
+        return self._index
+
     def _pattern_to_regex(self, pattern: str) -> str:
         """
         Convert a wildcard pattern to a regex pattern
@@ -121,7 +205,7 @@ class PatternMatchRouter:
         """
         Route a requested model to the corresponding llm deployments based on the regex pattern
 
-        loop through all the patterns and find the matching pattern
+        look up the most specific matching pattern in the compiled pattern index
         if a pattern is found, return the corresponding llm deployments
         if no pattern is found, return None
 
@@ -135,23 +219,19 @@ class PatternMatchRouter:
             if request is None:
                 return None
 
-            sorted_patterns = PatternUtils.sorted_patterns(self.patterns)
             regex_filtered_model_names = (
-                [self._pattern_to_regex(m) for m in filtered_model_names]
+                {self._pattern_to_regex(m) for m in filtered_model_names}
                 if filtered_model_names is not None
-                else []
+                else None
+            )
+            result = self._get_index().match(
+                request, allowed_patterns=regex_filtered_model_names
             )
-            for pattern, llm_deployments in sorted_patterns:
-                if (
-                    filtered_model_names is not None
-                    and pattern not in regex_filtered_model_names
-                ):
-                    continue
-                pattern_match = re.match(pattern, request)
-                if pattern_match:
-                    return self._return_pattern_matched_deployments(
-                        matched_pattern=pattern_match, deployments=llm_deployments
-                    )
+            if result is not None:
+                pattern_match, llm_deployments = result
+                return self._return_pattern_matched_deployments(
+                    matched_pattern=pattern_match, deployments=llm_deployments
+                )
         except Exception as e:
             verbose_router_logger.debug(f"Error in PatternMatchRouter.route: {str(e)}")
 
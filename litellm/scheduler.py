@@ -1,16 +1,25 @@
+import asyncio
 import enum
 import heapq
-from typing import Optional
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
 from pydantic import BaseModel
 
 from litellm import print_verbose
+from litellm._logging import verbose_router_logger
 from litellm.caching.caching import DualCache, RedisCache
-from litellm.constants import DEFAULT_IN_MEMORY_TTL, DEFAULT_POLLING_INTERVAL
+from litellm.constants import (
+    DEFAULT_IN_MEMORY_TTL,
+    DEFAULT_POLLING_INTERVAL,
+    SCHEDULER_QUEUE_UPDATE_TIMEOUT,
+)
 
 
 class SchedulerCacheKeys(enum.Enum):
     queue = "scheduler:queue"
+    sorted_set_queue = "scheduler:zqueue"
+    queue_updates_channel = "scheduler:updates"
     default_in_memory_ttl = (
         DEFAULT_IN_MEMORY_TTL  # cache queue in-memory for 5s when redis cache available
     )
@@ -22,6 +31,268 @@ class FlowItem(BaseModel):
     model_name: str
 
 
+SchedulerBackend = Literal["dual_cache", "in_memory", "redis"]
+
+# Pop the request off the queue only if it is the head (lowest score) of the sorted set
+POP_IF_HEAD_SCRIPT = """
+local head = redis.call('ZRANGE', KEYS[1], 0, 0)
+if head[1] == ARGV[1] then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('PUBLISH', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Remove the request from the queue and wake up waiters if it was queued
+REMOVE_REQUEST_SCRIPT = """
+local removed = redis.call('ZREM', KEYS[1], ARGV[1])
+if removed == 1 then
+    redis.call('PUBLISH', KEYS[2], ARGV[2])
+end
+return removed
+"""
+
+
+class BaseSchedulerQueue(ABC):
+    """
+    Priority queue backend for the `Scheduler`, one queue per model group.
+
+    Lower priority values are served first; ties are ordered by request id.
+    """
+
+    @abstractmethod
+    async def add_request(self, request: FlowItem) -> None:
+        pass
+
+    @abstractmethod
+    async def pop_if_head(self, request_id: str, model_name: str) -> bool:
+        """Atomically remove the request if it is at the head of the queue."""
+        pass
+
+    @abstractmethod
+    async def is_head(self, request_id: str, model_name: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def remove_request(self, request_id: str, model_name: str) -> None:
+        pass
+
+    @abstractmethod
+    async def get_queue(self, model_name: str) -> List[Tuple[int, str]]:
+        """Return the queue as a sorted list of (priority, request_id)."""
+        pass
+
+    @abstractmethod
+    async def notify_update(self, model_name: str) -> None:
+        """Wake up requests waiting on the queue of the model group."""
+        pass
+
+    @abstractmethod
+    async def wait_for_update(self, model_name: str, timeout: float) -> None:
+        """Wait until the queue of the model group changes, or until timeout."""
+        pass
+
+
+class InMemorySchedulerQueue(BaseSchedulerQueue):
+    """
+    In-process scheduler queue.
+
+    Uses a heap per model group with lazy deletion, so add/pop/remove are O(log n),
+    and an `asyncio.Condition` to wake waiting requests when the head changes.
+    """
+
+    def __init__(self):
+        self.heaps: Dict[str, List[Tuple[int, str]]] = {}
+        self.queued_ids: Dict[str, Set[str]] = {}
+        self.conditions: Dict[str, asyncio.Condition] = {}
+
+    def _get_condition(self, model_name: str) -> asyncio.Condition:
+        condition = self.conditions.get(model_name)
+        if condition is None:
+            condition = asyncio.Condition()
+            self.conditions[model_name] = condition
+        return condition
+
+    async def _notify(self, model_name: str) -> None:
+        condition = self._get_condition(model_name)
+        async with condition:
+            condition.notify_all()
+
+    def _head(self, model_name: str) -> Optional[Tuple[int, str]]:
+        heap = self.heaps.get(model_name)
+        queued_ids = self.queued_ids.get(model_name)
+        if not heap or queued_ids is None:
+            return None
+        # drop entries removed since they were pushed
+        while heap and heap[0][1] not in queued_ids:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    async def add_request(self, request: FlowItem) -> None:
+        heapq.heappush(
+            self.heaps.setdefault(request.model_name, []),
+            (request.priority, request.request_id),
+        )
+        self.queued_ids.setdefault(request.model_name, set()).add(request.request_id)
+
+    async def pop_if_head(self, request_id: str, model_name: str) -> bool:
+        head = self._head(model_name)
+        if head is None or head[1] != request_id:
+            return False
+        heapq.heappop(self.heaps[model_name])
+        self.queued_ids[model_name].discard(request_id)
+        await self._notify(model_name)
+        return True
+
+    async def is_head(self, request_id: str, model_name: str) -> bool:
+        head = self._head(model_name)
+        return head is not None and head[1] == request_id
+
+    async def remove_request(self, request_id: str, model_name: str) -> None:
+        queued_ids = self.queued_ids.get(model_name)
+        if queued_ids is None or request_id not in queued_ids:
+            return
+        queued_ids.discard(request_id)
+        heap = self.heaps[model_name]
+        if len(heap) > 2 * len(queued_ids) + 64:
+            # compact removed entries so the heap stays proportional to the queue
+            self.heaps[model_name] = [item for item in heap if item[1] in queued_ids]
+            heapq.heapify(self.heaps[model_name])
+        await self._notify(model_name)
+
+    async def notify_update(self, model_name: str) -> None:
+        await self._notify(model_name)
+
+    async def get_queue(self, model_name: str) -> List[Tuple[int, str]]:
+        queued_ids = self.queued_ids.get(model_name, set())
+        return sorted(
+            item for item in self.heaps.get(model_name, []) if item[1] in queued_ids
+        )
+
+    async def wait_for_update(self, model_name: str, timeout: float) -> None:
+        condition = self._get_condition(model_name)
+        async with condition:
+            try:
+                await asyncio.wait_for(condition.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+class RedisSchedulerQueue(BaseSchedulerQueue):
+    """
+    Scheduler queue shared across replicas, stored as one Redis sorted set per model group.
+
+    - add: ZADD (score = priority)
+    - pop-if-head / remove: Lua scripts, atomic across replicas
+    - wakeups: changes are PUBLISHed on a channel per model group; a background
+      subscriber wakes up local waiters instead of having them poll Redis
+
+    The queue key and channel of a model group share a hash tag, so the Lua
+    scripts touching both run on Redis Cluster.
+    """
+
+    def __init__(self, redis_cache: RedisCache):
+        self.redis_cache = redis_cache
+        self.local_queue = InMemorySchedulerQueue()  # only used for local wakeups
+        self.pop_if_head_script: Optional[Any] = None
+        self.remove_request_script: Optional[Any] = None
+        self.subscriber_task: Optional[asyncio.Task] = None
+
+    def _queue_key(self, model_name: str) -> str:
+        return self.redis_cache.check_and_fix_namespace(
+            "{}:{{{}}}".format(SchedulerCacheKeys.sorted_set_queue.value, model_name)
+        )
+
+    def _channel(self, model_name: str) -> str:
+        return self.redis_cache.check_and_fix_namespace(
+            "{}:{{{}}}".format(
+                SchedulerCacheKeys.queue_updates_channel.value, model_name
+            )
+        )
+
+    def _get_scripts(self) -> Tuple[Any, Any]:
+        if self.pop_if_head_script is None or self.remove_request_script is None:
+            self.pop_if_head_script = self.redis_cache.async_register_script(
+                POP_IF_HEAD_SCRIPT
+            )
+            self.remove_request_script = self.redis_cache.async_register_script(
+                REMOVE_REQUEST_SCRIPT
+            )
+        return self.pop_if_head_script, self.remove_request_script
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+    async def add_request(self, request: FlowItem) -> None:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        await _redis_client.zadd(
+            self._queue_key(request.model_name),
+            {request.request_id: request.priority},
+        )
+
+    async def pop_if_head(self, request_id: str, model_name: str) -> bool:
+        pop_if_head_script, _ = self._get_scripts()
+        popped = await pop_if_head_script(
+            keys=[self._queue_key(model_name), self._channel(model_name)],
+            args=[request_id, model_name],
+        )
+        return bool(popped)
+
+    async def is_head(self, request_id: str, model_name: str) -> bool:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        head = await _redis_client.zrange(self._queue_key(model_name), 0, 0)
+        return bool(head) and self._decode(head[0]) == request_id
+
+    async def remove_request(self, request_id: str, model_name: str) -> None:
+        _, remove_request_script = self._get_scripts()
+        await remove_request_script(
+            keys=[self._queue_key(model_name), self._channel(model_name)],
+            args=[request_id, model_name],
+        )
+
+    async def notify_update(self, model_name: str) -> None:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        await _redis_client.publish(self._channel(model_name), model_name)
+
+    async def get_queue(self, model_name: str) -> List[Tuple[int, str]]:
+        _redis_client: Any = self.redis_cache.init_async_client()
+        response = await _redis_client.zrange(
+            self._queue_key(model_name), 0, -1, withscores=True
+        )
+        return [(int(score), self._decode(member)) for member, score in response]
+
+    async def _listen_for_updates(self) -> None:
+        """
+        Subscribe to queue updates from all replicas and wake up local waiters.
+        """
+        try:
+            _redis_client: Any = self.redis_cache.init_async_client()
+            pubsub = _redis_client.pubsub()
+            await pubsub.psubscribe(
+                self.redis_cache.check_and_fix_namespace(
+                    "{}:*".format(SchedulerCacheKeys.queue_updates_channel.value)
+                )
+            )
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                await self.local_queue._notify(self._decode(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # waiters fall back to waking up on their timeout
+            verbose_router_logger.debug(
+                f"Scheduler: queue update subscription failed - {str(e)}"
+            )
+
+    async def wait_for_update(self, model_name: str, timeout: float) -> None:
+        if self.subscriber_task is None or self.subscriber_task.done():
+            self.subscriber_task = asyncio.create_task(self._listen_for_updates())
+        await self.local_queue.wait_for_update(model_name=model_name, timeout=timeout)
+
+
 class Scheduler:
     cache: DualCache
 
@@ -29,11 +300,25 @@ class Scheduler:
         self,
         polling_interval: Optional[float] = None,
         redis_cache: Optional[RedisCache] = None,
+        backend: Optional[SchedulerBackend] = None,
     ):
         """
         polling_interval: float or null - frequency of polling queue. Default is 3ms.
+        backend: "dual_cache" (default) - whole queue stored as one list in DualCache
+                 "in_memory" - per-process heap with asyncio.Condition wakeups
+                 "redis" - Redis sorted set per model group, atomic pops via Lua, pub/sub wakeups
         """
         self.queue: list = []
+        self.backend: SchedulerBackend = backend or "dual_cache"
+        self.queue_backend: Optional[BaseSchedulerQueue] = None
+        if self.backend == "in_memory":
+            self.queue_backend = InMemorySchedulerQueue()
+        elif self.backend == "redis":
+            if redis_cache is None:
+                raise ValueError(
+                    "Scheduler backend 'redis' requires redis to be configured on the router"
+                )
+            self.queue_backend = RedisSchedulerQueue(redis_cache=redis_cache)
         default_in_memory_ttl: Optional[float] = None
         if redis_cache is not None:
             # if redis-cache available frequently poll that instead of using in-memory.
@@ -46,6 +331,9 @@ class Scheduler:
         )  # default to 3ms
 
     async def add_request(self, request: FlowItem):
+        if self.queue_backend is not None:
+            await self.queue_backend.add_request(request=request)
+            return
         # We use the priority directly, as lower values indicate higher priority
         # get the queue
         queue = await self.get_queue(model_name=request.model_name)
@@ -67,6 +355,17 @@ class Scheduler:
             * If no healthy deployments available
             * AND request not at the top of queue
         """
+        if self.queue_backend is not None:
+            if len(health_deployments) == 0:
+                return await self.queue_backend.pop_if_head(
+                    request_id=id, model_name=model_name
+                )
+            # request is dispatched - it no longer waits in the queue
+            await self.queue_backend.remove_request(
+                request_id=id, model_name=model_name
+            )
+            return True
+
         queue = await self.get_queue(model_name=model_name)
         if not queue:
             raise Exception(
@@ -97,6 +396,12 @@ class Scheduler:
         Remove a specific request from the priority queue for a model.
         Used when a request times out while waiting in the queue.
         """
+        if self.queue_backend is not None:
+            await self.queue_backend.remove_request(
+                request_id=request_id, model_name=model_name
+            )
+            return
+
         queue = await self.get_queue(model_name=model_name)
         filtered_queue = [item for item in queue if item[1] != request_id]
         heapq.heapify(filtered_queue)  # restore heap invariant after filtering
@@ -105,6 +410,9 @@ class Scheduler:
 
     async def peek(self, id: str, model_name: str, health_deployments: list) -> bool:
         """Return if the id is at the top of the queue. Don't pop the value from heap."""
+        if self.queue_backend is not None:
+            return await self.queue_backend.is_head(request_id=id, model_name=model_name)
+
         queue = await self.get_queue(model_name=model_name)
         if not queue:
             raise Exception(
@@ -129,6 +437,8 @@ class Scheduler:
         """
         Return a queue for that specific model group
         """
+        if self.queue_backend is not None:
+            return await self.queue_backend.get_queue(model_name=model_name)
         if self.cache is not None:
             _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
             response = await self.cache.async_get_cache(key=_cache_key)
@@ -146,3 +456,33 @@ class Scheduler:
             _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
             await self.cache.async_set_cache(key=_cache_key, value=queue)
         return None
+
+    async def wait_for_queue_update(self, model_name: str) -> None:
+        """
+        Wait before re-polling the queue.
+
+        dual_cache backend sleeps for polling_interval. The in_memory and redis backends
+        return as soon as the queue of the model group changes or a scheduled request
+        finishes, and otherwise re-check after SCHEDULER_QUEUE_UPDATE_TIMEOUT (e.g. for
+        deployments leaving cooldown).
+        """
+        if self.queue_backend is not None:
+            await self.queue_backend.wait_for_update(
+                model_name=model_name, timeout=SCHEDULER_QUEUE_UPDATE_TIMEOUT
+            )
+            return
+        await asyncio.sleep(self.polling_interval)
+
+    async def notify_request_finished(self, model_name: str) -> None:
+        """
+        Wake up requests waiting on the model group, a deployment may have capacity
+        again. No-op for the dual_cache backend, which polls.
+        """
+        if self.queue_backend is None:
+            return
+        try:
+            await self.queue_backend.notify_update(model_name=model_name)
+        except Exception as e:
+            verbose_router_logger.debug(
+                f"Scheduler: failed to notify queue update - {str(e)}"
+            )
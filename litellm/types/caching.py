@@ -42,6 +42,16 @@ class RedisPipelineIncrementOperation(TypedDict):
     ttl: Optional[int]
 
 
+class RedisPipelineHashIncrementOperation(TypedDict):
+    """
+    TypeDict for 1 Redis Pipeline Hash Increment Operation (HINCRBYFLOAT per field)
+    """
+
+    key: str
+    increments: Dict[str, float]
+    ttl: Optional[int]
+
+
 class RedisPipelineSetOperation(TypedDict):
     """
     TypeDict for 1 Redis Pipeline Set Operation
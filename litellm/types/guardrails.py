@@ -562,6 +562,14 @@ class ContentFilterConfigModel(BaseModel):
         default=None,
         description="Tag to use for keyword redaction",
     )
+    keyword_matcher: Optional[Literal["regex", "aho_corasick"]] = Field(
+        default=None,
+        description="Keyword matching engine. 'aho_corasick' compiles all blocked words and category keywords into one automaton and scans each text once",
+    )
+    streaming_scan_mode: Optional[Literal["full", "incremental"]] = Field(
+        default=None,
+        description="'incremental' only scans the not-yet-emitted window of a stream instead of the accumulated text on every chunk",
+    )
 
 
 class BaseLitellmParams(
@@ -6,6 +6,7 @@ from typing_extensions import NotRequired, TypedDict
 from litellm.types.integrations.custom_logger import StandardCustomLoggerInitParams
 
 DD_MAX_BATCH_SIZE = 1000
+DD_MAX_BATCH_BYTES = 5_000_000  # DD rejects uncompressed payloads over 5MB
 
 
 class DataDogStatus(str, Enum):
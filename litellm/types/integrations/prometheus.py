@@ -1,9 +1,9 @@
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing_extensions import Annotated
 
 import litellm
@@ -710,6 +710,12 @@ class UserAPIKeyLabelValues(BaseModel):
         Optional[str], Field(..., alias=UserAPIKeyLabelNames.USER_AGENT.value)
     ] = None
 
+    # (label values, custom label names) resolved once per request by
+    # `prometheus_label_factory`
+    _resolved_labels: Optional[
+        Tuple[Dict[str, Optional[str]], FrozenSet[str]]
+    ] = PrivateAttr(default=None)
+
 
 class PrometheusMetricsConfig(BaseModel):
     """Configuration for filtering Prometheus metrics"""
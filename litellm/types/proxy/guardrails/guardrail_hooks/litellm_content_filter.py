@@ -113,6 +113,16 @@ class LitellmContentFilterGuardrailConfigModel(GuardrailConfigModel):
         description="Tag to use for keyword redaction",
     )
 
+    # Matching engine
+    keyword_matcher: Literal["regex", "aho_corasick"] = Field(
+        default="regex",
+        description="Keyword matching engine. 'aho_corasick' compiles all blocked words and category keywords into one automaton and scans each text once",
+    )
+    streaming_scan_mode: Literal["full", "incremental"] = Field(
+        default="full",
+        description="'incremental' only scans the not-yet-emitted window of a stream instead of the accumulated text on every chunk",
+    )
+
     @staticmethod
     def ui_friendly_name() -> str:
         return "LiteLLM Content Filter"
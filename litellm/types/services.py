@@ -27,6 +27,9 @@ class ServiceTypes(str, enum.Enum):
     AUTH = "auth"
     PROXY_PRE_CALL = "proxy_pre_call"
     POD_LOCK_MANAGER = "pod_lock_manager"
+    # sharded LoggingWorker - queue wait time, dropped logs / queue depth per callback
+    LOGGING_WORKER = "logging_worker"
+    LOGGING_WORKER_QUEUE = "logging_worker_queue"
 
     """
     Operational metrics for DB Transaction Queues
@@ -83,6 +86,10 @@ DEFAULT_SERVICE_CONFIGS = {
     ServiceTypes.PROXY_PRE_CALL.value: {
         "metrics": [ServiceMetrics.COUNTER, ServiceMetrics.HISTOGRAM]
     },
+    ServiceTypes.LOGGING_WORKER.value: {
+        "metrics": [ServiceMetrics.COUNTER, ServiceMetrics.HISTOGRAM]
+    },
+    ServiceTypes.LOGGING_WORKER_QUEUE.value: {"metrics": [ServiceMetrics.GAUGE]},
     # Operational metrics for DB Transaction Queues
     ServiceTypes.POD_LOCK_MANAGER.value: {"metrics": [ServiceMetrics.GAUGE]},
     ServiceTypes.IN_MEMORY_DAILY_SPEND_UPDATE_QUEUE.value: {
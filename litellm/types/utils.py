@@ -2990,6 +2990,12 @@ all_litellm_params = (
         "budget_duration",
         "use_in_pass_through",
         "merge_reasoning_content_in_choices",
+        "raw_sse_passthrough",
+        "max_connections",
+        "max_keepalive_connections",
+        "keepalive_expiry",
+        "http2",
+        "warmup_connections",
         "litellm_credential_name",
         "allowed_openai_params",
         "litellm_session_id",
@@ -69,8 +69,10 @@ from litellm.constants import (
     MAX_TOKEN_TRIMMING_ATTEMPTS,
     MINIMUM_PROMPT_CACHE_TOKEN_COUNT,
     OPENAI_EMBEDDING_PARAMS,
+    PROVIDER_CHAT_CONFIG_CACHE_SIZE,
     TOOL_CHOICE_OBJECT_TOKEN_COUNT,
 )
+from litellm.litellm_core_utils.model_cost_index import ModelCostIndex
 
 _CachingHandlerResponse = None
 _LLMCachingHandler = None
@@ -3878,9 +3880,7 @@ def get_optional_params(  # noqa: PLR0915
         custom_llm_provider=custom_llm_provider,
     )
     provider_config: Optional[BaseConfig] = None
-    if custom_llm_provider is not None and custom_llm_provider in [
-        provider.value for provider in LlmProviders
-    ]:
+    if custom_llm_provider is not None and custom_llm_provider in LlmProvidersSet:
         provider_config = ProviderConfigManager.get_provider_chat_config(
             model=model, provider=LlmProviders(custom_llm_provider)
         )
@@ -5152,6 +5152,8 @@ def _strip_model_name(model: str, custom_llm_provider: Optional[str]) -> str:
 
 # Global case-insensitive lookup map for model_cost (built eagerly at module import)
 _model_cost_lowercase_map: Optional[Dict[str, str]] = None
+# Provider / alias index over model_cost, built lazily on first use
+_model_cost_index: Optional[ModelCostIndex] = None
 
 
 def _invalidate_model_cost_lowercase_map() -> None:
@@ -5160,8 +5162,9 @@ def _invalidate_model_cost_lowercase_map() -> None:
     Call this whenever litellm.model_cost is modified to ensure the map is rebuilt.
     Also clears related LRU caches that depend on model_cost data.
     """
-    global _model_cost_lowercase_map
+    global _model_cost_lowercase_map, _model_cost_index
     _model_cost_lowercase_map = None
+    _model_cost_index = None
 
     # Clear LRU caches that depend on model_cost data
     get_model_info.cache_clear()
@@ -5175,10 +5178,21 @@ def _rebuild_model_cost_lowercase_map() -> Dict[str, str]:
         The rebuilt map (guaranteed to be not None).
     """
     global _model_cost_lowercase_map
-    _model_cost_lowercase_map = {k.lower(): k for k in litellm.model_cost}
+    _model_cost_lowercase_map = get_model_cost_index(rebuild=True).key_by_lowercase
     return _model_cost_lowercase_map
 
 
+def get_model_cost_index(rebuild: bool = False) -> ModelCostIndex:
+    """Return the provider / alias index over the current litellm.model_cost.
+
+    The index is built once and reused until `_invalidate_model_cost_lowercase_map` is called.
+    """
+    global _model_cost_index
+    if _model_cost_index is None or rebuild:
+        _model_cost_index = ModelCostIndex(litellm.model_cost)
+    return _model_cost_index
+
+
 def _handle_stale_map_entry_rebuild(
     potential_key_lower: str,
 ) -> Optional[str]:
@@ -7783,6 +7797,13 @@ class ProviderConfigManager:
     # This is initialized lazily on first access to avoid circular imports
     _PROVIDER_CONFIG_MAP: Optional[dict[LlmProviders, tuple[Callable, bool]]] = None
 
+    # Chat configs hold no per-request state, so get_provider_chat_config shares one
+    # instance per config class - except for these providers, whose configs do
+    _STATEFUL_CHAT_CONFIG_PROVIDERS = frozenset(
+        {LlmProviders.GIGACHAT, LlmProviders.SAP_GENERATIVE_AI_HUB}
+    )
+    _CHAT_CONFIG_INSTANCES: dict[type, BaseConfig] = {}
+
     @staticmethod
     def _build_provider_config_map() -> dict[LlmProviders, tuple[Callable, bool]]:
         """Build the provider-to-config mapping dictionary.
@@ -7993,12 +8014,48 @@ class ProviderConfigManager:
         return LangGraphConfig()
 
     @staticmethod
-    def get_provider_chat_config(  # noqa: PLR0915
+    def get_provider_chat_config(
         model: str, provider: LlmProviders
     ) -> Optional[BaseConfig]:
         """
         Returns the provider config for a given provider.
 
+        The config chosen for a (provider, model) is memoized, and configs are shared
+        instances - don't set attributes on the returned config.
+        """
+        if provider in ProviderConfigManager._STATEFUL_CHAT_CONFIG_PROVIDERS:
+            return ProviderConfigManager._resolve_provider_chat_config(
+                model=model, provider=provider
+            )
+        return ProviderConfigManager._get_cached_provider_chat_config(model, provider)
+
+    @staticmethod
+    @lru_cache(maxsize=PROVIDER_CHAT_CONFIG_CACHE_SIZE)
+    def _get_cached_provider_chat_config(
+        model: str, provider: LlmProviders
+    ) -> Optional[BaseConfig]:
+        provider_config = ProviderConfigManager._resolve_provider_chat_config(
+            model=model, provider=provider
+        )
+        if provider_config is None:
+            return None
+        # models of the same family (e.g. all o-series models) share one instance
+        return ProviderConfigManager._CHAT_CONFIG_INSTANCES.setdefault(
+            type(provider_config), provider_config
+        )
+
+    @staticmethod
+    def clear_provider_chat_config_cache() -> None:
+        ProviderConfigManager._get_cached_provider_chat_config.cache_clear()
+        ProviderConfigManager._CHAT_CONFIG_INSTANCES.clear()
+
+    @staticmethod
+    def _resolve_provider_chat_config(  # noqa: PLR0915
+        model: str, provider: LlmProviders
+    ) -> Optional[BaseConfig]:
+        """
+        Builds the provider config for a given provider.
+
         Uses O(1) dictionary lookup for fast provider resolution.
         """
         # Check JSON providers FIRST (these override standard mappings)
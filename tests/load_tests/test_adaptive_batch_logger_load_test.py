@@ -0,0 +1,56 @@
+"""
+Benchmark batch logger throughput against the Datadog mock sink (DATADOG_MOCK=true).
+
+A burst of large logs is flushed:
+- fixed batching: one request per `batch_size` logs, sent one after another
+- adaptive batching: batches bounded by `max_batch_bytes`, sent concurrently
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+os.environ["DATADOG_MOCK"] = "true"
+os.environ["DATADOG_MOCK_LATENCY_MS"] = "50"
+
+from litellm.integrations.datadog.datadog import DataDogLogger
+
+NUM_LOGS = 5_000
+MESSAGE = "lorem ipsum " * 400
+
+
+async def _run(adaptive_batching: bool) -> float:
+    with patch.dict(
+        os.environ, {"DD_API_KEY": "fake-key", "DD_SITE": "datadoghq.com"}
+    ), patch("asyncio.create_task"):
+        dd_logger = DataDogLogger(adaptive_batching=adaptive_batching)
+    dd_logger.log_queue = [
+        {"message": f"{i} {MESSAGE}", "status": "info"} for i in range(NUM_LOGS)
+    ]
+
+    start = time.perf_counter()
+    if adaptive_batching:
+        await dd_logger.flush_queue()
+    else:
+        # what the logger does today: flush every time the queue reaches batch_size
+        logs = dd_logger.log_queue
+        for i in range(0, len(logs), dd_logger.batch_size):
+            dd_logger.log_queue = logs[i : i + dd_logger.batch_size]
+            await dd_logger.flush_queue()
+    return time.perf_counter() - start
+
+
+def test_adaptive_batch_logger_throughput():
+    fixed_time = asyncio.run(_run(adaptive_batching=False))
+    adaptive_time = asyncio.run(_run(adaptive_batching=True))
+
+    print(
+        f"{NUM_LOGS} logs of {len(MESSAGE) / 1e3:.1f} KB, 50 ms mock sink: "
+        f"fixed batching {NUM_LOGS / fixed_time:.0f} logs/s, "
+        f"adaptive batching {NUM_LOGS / adaptive_time:.0f} logs/s"
+    )
+    assert adaptive_time < fixed_time
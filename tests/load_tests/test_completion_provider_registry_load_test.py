@@ -0,0 +1,102 @@
+"""
+Benchmark the call-setup overhead of `litellm.completion` / `litellm.acompletion` for
+the providers registered in `litellm_core_utils/completion_provider_registry.py` -
+everything up to `base_llm_http_handler`, which is mocked out (no network).
+
+Only a subset of providers is registered - the rest (openai, azure, anthropic,
+bedrock, vertex_ai, gemini, ...) keep their own branch in `completion` and aren't
+measured here.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm import main as litellm_main
+from litellm.litellm_core_utils.completion_provider_registry import (
+    get_completion_provider_route,
+)
+from litellm.types.utils import ModelResponse
+
+NUM_CALLS = 200
+MESSAGES = [{"role": "user", "content": "hi"}]
+PROVIDER_CASES = [
+    ("deepseek/deepseek-chat", {}),
+    ("fireworks_ai/accounts/fireworks/models/llama-v3p1-8b-instruct", {}),
+    ("heroku/claude-3-5-haiku", {"api_base": "https://us.inference.heroku.com"}),
+    ("xai/grok-3-mini", {}),
+    ("groq/llama-3.1-8b-instant", {}),
+    ("mistral/mistral-large-latest", {}),
+    ("cometapi/gpt-4o", {}),
+    ("minimax/MiniMax-M2", {}),
+    ("hosted_vllm/meta-llama/Llama-3.1-8B-Instruct", {"api_base": "http://vllm:8000"}),
+    ("compactifai/cai-llama-3-1-8b-slim", {}),
+    ("bytez/google/gemma-3-4b-it", {}),
+    ("ollama_chat/llama3.1", {}),
+]
+
+
+def _mock_handler_completion(*args, **kwargs):
+    return kwargs.get("model_response") or ModelResponse()
+
+
+async def _mock_handler_acompletion(*args, **kwargs):
+    return kwargs.get("model_response") or ModelResponse()
+
+
+def _time_completion(model: str, kwargs: dict) -> float:
+    litellm.completion(model=model, messages=MESSAGES, api_key="sk-test", **kwargs)
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        litellm.completion(
+            model=model, messages=MESSAGES, api_key="sk-test", max_tokens=10, **kwargs
+        )
+    return (time.perf_counter() - start) / NUM_CALLS
+
+
+async def _time_acompletion(model: str, kwargs: dict) -> float:
+    await litellm.acompletion(
+        model=model, messages=MESSAGES, api_key="sk-test", **kwargs
+    )
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        await litellm.acompletion(
+            model=model, messages=MESSAGES, api_key="sk-test", max_tokens=10, **kwargs
+        )
+    return (time.perf_counter() - start) / NUM_CALLS
+
+
+def test_completion_provider_registry_load_test():
+    for model, _ in PROVIDER_CASES:
+        assert get_completion_provider_route(model.split("/")[0]) is not None
+
+    with patch.object(
+        litellm_main.base_llm_http_handler, "completion", _mock_handler_completion
+    ):
+        sync_times = {
+            model: _time_completion(model, kwargs) for model, kwargs in PROVIDER_CASES
+        }
+    # async calls return the handler's coroutine
+    with patch.object(
+        litellm_main.base_llm_http_handler, "completion", _mock_handler_acompletion
+    ):
+        async_times = {
+            model: asyncio.run(_time_acompletion(model, kwargs))
+            for model, kwargs in PROVIDER_CASES
+        }
+
+    print(f"\ncall setup per call, {NUM_CALLS} calls per provider")
+    print(f"{'model':<65} {'completion':>12} {'acompletion':>12}")
+    for model, _ in PROVIDER_CASES:
+        print(
+            f"{model:<65} {sync_times[model] * 1e6:>9.1f} us "
+            f"{async_times[model] * 1e6:>9.1f} us"
+        )
+    for model, _ in PROVIDER_CASES:
+        assert sync_times[model] < 0.01
+        assert async_times[model] < 0.01
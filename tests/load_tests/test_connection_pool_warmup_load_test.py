@@ -0,0 +1,90 @@
+"""
+Benchmark the first requests to a deployment with and without connection pool warmup
+(`warmup_connections` in litellm_params), against a local keep-alive HTTP server.
+
+Without warmup the first burst of requests opens its connections on the request path,
+with warmup they reuse the connections opened when the deployment was registered.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import httpx
+
+from litellm.llms.custom_httpx.connection_pool_manager import (
+    ConnectionPoolRoutingTransport,
+    connection_pool_manager,
+)
+
+CONCURRENT_REQUESTS = 20
+# simulated TCP/TLS handshake cost per new connection
+CONNECTION_SETUP_DELAY = 0.1
+
+
+async def _handle_http_connection(reader, writer):
+    await asyncio.sleep(CONNECTION_SETUP_DELAY)
+    try:
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            body = b"" if request.startswith(b"HEAD") else b"ok"
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n" + body)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _time_first_requests(warmup: bool) -> float:
+    server = await asyncio.start_server(_handle_http_connection, "127.0.0.1", 0)
+    api_base = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    connection_pool_manager.reset()
+    try:
+        connection_pool_manager.register_deployment(
+            {
+                "model": "openai/gpt-4o",
+                "api_base": api_base,
+                "max_connections": CONCURRENT_REQUESTS,
+                "warmup_connections": CONCURRENT_REQUESTS if warmup else None,
+            }
+        )
+        if warmup:
+            assert await connection_pool_manager.warmup(api_base) == CONCURRENT_REQUESTS
+
+        client = httpx.AsyncClient(
+            transport=ConnectionPoolRoutingTransport(default_transport=None, verify=True)
+        )
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *[
+                client.post(f"{api_base}/v1/chat/completions", json={})
+                for _ in range(CONCURRENT_REQUESTS)
+            ]
+        )
+        elapsed = time.perf_counter() - start
+        assert all(response.status_code == 200 for response in responses)
+
+        stats = connection_pool_manager.get_pool_stats()[api_base]
+        assert stats["active"] + stats["idle"] <= CONCURRENT_REQUESTS
+        await client.aclose()
+        await connection_pool_manager.aclose()
+        return elapsed
+    finally:
+        connection_pool_manager.reset()
+        server.close()
+        await server.wait_closed()
+
+
+def test_connection_pool_warmup_load_test():
+    cold = asyncio.run(_time_first_requests(warmup=False))
+    warm = asyncio.run(_time_first_requests(warmup=True))
+
+    print(f"\nfirst {CONCURRENT_REQUESTS} concurrent requests to a deployment")
+    print(f"without warmup: {cold * 1000:.2f} ms")
+    print(f"with warmup:    {warm * 1000:.2f} ms")
+    # warm requests skip the connection setup delay
+    assert warm < cold
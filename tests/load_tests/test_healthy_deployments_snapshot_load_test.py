@@ -0,0 +1,65 @@
+"""
+Benchmark the router's per-request overhead picking a deployment, for model groups of
+200 deployments:
+
+- no snapshot: every request lists the group's deployments and reads the cooldown state
+  of every deployment on the router
+- snapshot: the group's deployments not in cooldown are served from the snapshot
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+
+NUM_MODEL_GROUPS = 5
+DEPLOYMENTS_PER_GROUP = 200
+NUM_REQUESTS = 2_000
+
+
+def _router(snapshot_ttl: float) -> litellm.Router:
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": f"group-{g}",
+                "litellm_params": {
+                    "model": f"openai/gpt-4o-{i}",
+                    "api_key": "fake",
+                    "rpm": 100,
+                },
+            }
+            for g in range(NUM_MODEL_GROUPS)
+            for i in range(DEPLOYMENTS_PER_GROUP)
+        ]
+    )
+    router.healthy_deployments_snapshot_cache.ttl = snapshot_ttl
+    return router
+
+
+async def _time_routing(router: litellm.Router) -> float:
+    messages = [{"role": "user", "content": "hi"}]
+    for _ in range(100):  # warm up
+        await router.async_get_available_deployment(
+            model="group-0", request_kwargs={}, messages=messages
+        )
+    start = time.perf_counter()
+    for _ in range(NUM_REQUESTS):
+        await router.async_get_available_deployment(
+            model="group-0", request_kwargs={}, messages=messages
+        )
+    return (time.perf_counter() - start) / NUM_REQUESTS
+
+
+def test_healthy_deployments_snapshot_load_test():
+    no_snapshot = asyncio.run(_time_routing(_router(snapshot_ttl=0)))
+    snapshot = asyncio.run(_time_routing(_router(snapshot_ttl=1.0)))
+    print(
+        f"\n{NUM_MODEL_GROUPS} groups x {DEPLOYMENTS_PER_GROUP} deployments, simple-shuffle"
+    )
+    print(f"no snapshot: {no_snapshot * 1e6:.0f} us/request")
+    print(f"snapshot:    {snapshot * 1e6:.0f} us/request")
+    assert snapshot < no_snapshot
@@ -0,0 +1,64 @@
+"""
+Benchmark image token counting for a vision request with large base64 images.
+
+- full decode: what `get_image_dimensions` did before - b64decode the whole data URI
+- header only: `token_counter` only decodes the first KBs of each image
+"""
+
+import base64
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.litellm_core_utils.token_counter import token_counter
+
+NUM_IMAGES = 8
+IMAGE_SIZE_BYTES = 4 * 1024 * 1024
+
+
+def _make_messages() -> list:
+    content: list = [{"type": "text", "text": "Compare these screenshots."}]
+    for i in range(NUM_IMAGES):
+        image_bytes = (
+            b"\x89PNG\r\n\x1a\n"
+            + b"\x00\x00\x00\rIHDR"
+            + struct.pack(">LL", 1920 + i, 1080)
+            + os.urandom(IMAGE_SIZE_BYTES)
+        )
+        content.append(
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": "data:image/png;base64,"
+                    + base64.b64encode(image_bytes).decode(),
+                    "detail": "high",
+                },
+            }
+        )
+    return [{"role": "user", "content": content}]
+
+
+def test_image_token_counting_header_only():
+    messages = _make_messages()
+    image_urls = [block["image_url"]["url"] for block in messages[0]["content"][1:]]
+
+    start = time.perf_counter()
+    for url in image_urls:
+        base64.b64decode(url.split(",", 1)[1])
+    full_decode_time = time.perf_counter() - start
+
+    token_counter(model="gpt-4o", text="warm up the tokenizer")
+    start = time.perf_counter()
+    num_tokens = token_counter(model="gpt-4o", messages=messages)
+    header_only_time = time.perf_counter() - start
+
+    print(
+        f"{NUM_IMAGES} x {IMAGE_SIZE_BYTES // 1024 // 1024}MB images ({num_tokens} tokens): "
+        f"full decode {full_decode_time * 1000:.1f} ms, "
+        f"header only {header_only_time * 1000:.1f} ms"
+    )
+    assert num_tokens > NUM_IMAGES * 1000
+    assert header_only_time * 5 < full_decode_time
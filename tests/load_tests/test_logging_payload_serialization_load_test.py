@@ -0,0 +1,97 @@
+"""
+Benchmark per-request logging CPU with 5 callbacks that ship the whole
+StandardLoggingPayload (like Datadog, GCS, Azure Blob, S3 and the generic API logger).
+
+- safe_dumps: every callback serializes the payload itself
+- cached encoding: callbacks use `dumps_logging_payload`, the payload is encoded once
+
+CPU time is only reported - it's too noisy to assert on next to other load tests. The
+test asserts on the number of encodes instead.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils import cached_logging_payload
+from litellm.litellm_core_utils.cached_logging_payload import dumps_logging_payload
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+
+NUM_REQUESTS = 300
+NUM_CALLBACKS = 5
+MESSAGES = [
+    {"role": "system", "content": "You are a helpful assistant. " * 50},
+    {"role": "user", "content": "Summarize this text. " + "lorem ipsum " * 500},
+]
+MOCK_RESPONSE = "dolor sit amet " * 300
+
+
+def _make_callbacks(serialize) -> list:
+    callbacks = []
+    for i in range(NUM_CALLBACKS):
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            serialize(kwargs["standard_logging_object"])
+
+        callbacks.append(
+            type(
+                f"_SerializingLogger{i}",
+                (CustomLogger,),
+                {"async_log_success_event": async_log_success_event},
+            )()
+        )
+    return callbacks
+
+
+async def _run(serialize) -> float:
+    # fresh callback lists - callbacks of an earlier run with the same class names
+    # would otherwise keep running instead of these
+    with patch.object(
+        litellm, "callbacks", _make_callbacks(serialize)
+    ), patch.object(litellm, "_async_success_callback", []), patch.object(
+        litellm, "success_callback", []
+    ):
+        start = time.process_time()
+        for _ in range(NUM_REQUESTS):
+            await litellm.acompletion(
+                model="gpt-4o", messages=MESSAGES, mock_response=MOCK_RESPONSE
+            )
+        await asyncio.sleep(1)  # let the logging tasks finish
+        return time.process_time() - start
+
+
+def test_logging_payload_serialization_cpu_per_request():
+    serialized = []
+
+    def _safe_dumps(payload) -> str:
+        serialized.append(payload)
+        return safe_dumps(payload)
+
+    def _dumps_logging_payload(payload) -> str:
+        serialized.append(payload)
+        return dumps_logging_payload(payload)
+
+    safe_dumps_time = asyncio.run(_run(_safe_dumps))
+    assert len(serialized) == NUM_REQUESTS * NUM_CALLBACKS
+    serialized.clear()
+    with patch.object(
+        cached_logging_payload, "_encode", wraps=cached_logging_payload._encode
+    ) as mock_encode:
+        cached_time = asyncio.run(_run(_dumps_logging_payload))
+    assert len(serialized) == NUM_REQUESTS * NUM_CALLBACKS
+
+    print(
+        f"{NUM_REQUESTS} requests, {NUM_CALLBACKS} callbacks, CPU per request: "
+        f"safe_dumps {safe_dumps_time / NUM_REQUESTS * 1e3:.2f} ms, "
+        f"cached encoding {cached_time / NUM_REQUESTS * 1e3:.2f} ms"
+    )
+    # one encode per request, shared by all callbacks
+    assert mock_encode.call_count == NUM_REQUESTS
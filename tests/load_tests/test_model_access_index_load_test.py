@@ -0,0 +1,115 @@
+"""
+Benchmark key model access checks for a key with hundreds of models and wildcard
+patterns, on a router with many deployments:
+
+- list scan: the previous `_check_model_access_helper` - router access groups lookup, list
+  scans and a regex + provider lookup per wildcard pattern on every call
+- index: `_check_model_access_helper` with the compiled model access index
+"""
+
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.proxy._types import SpecialModelNames
+from litellm.proxy.auth.auth_checks import (
+    _check_model_access_helper,
+    _model_in_team_aliases,
+    _model_matches_any_wildcard_pattern_in_list,
+)
+
+NUM_KEY_MODELS = 500
+NUM_DEPLOYMENTS = 200
+NUM_CHECKS = 2_000
+
+
+def _list_scan_check_model_access(
+    model: str,
+    llm_router: Optional[litellm.Router],
+    models: List[str],
+    team_model_aliases: Optional[Dict[str, str]] = None,
+    team_id: Optional[str] = None,
+) -> bool:
+    access_groups: Dict[str, List[str]] = defaultdict(list)
+    if llm_router:
+        access_groups = llm_router.get_model_access_groups(
+            model_name=model, team_id=team_id
+        )
+    if len(access_groups) > 0 and llm_router is not None:
+        for m in models:
+            if m in access_groups:
+                return True
+    filtered_models = [m for m in models if m not in access_groups]
+    if _model_in_team_aliases(model=model, team_model_aliases=team_model_aliases):
+        return True
+    if _model_matches_any_wildcard_pattern_in_list(
+        model=model, allowed_model_list=filtered_models
+    ):
+        return True
+    all_model_access = (
+        (len(filtered_models) == 0 and len(models) == 0)
+        or "*" in filtered_models
+        or SpecialModelNames.all_proxy_models.value in filtered_models
+    )
+    if model not in filtered_models and all_model_access is False:
+        return False
+    return True
+
+
+def _time_checks(check, llm_router, models, requested_models) -> float:
+    start = time.perf_counter()
+    for i in range(NUM_CHECKS):
+        check(
+            model=requested_models[i % len(requested_models)],
+            llm_router=llm_router,
+            models=models,
+        )
+    return time.perf_counter() - start
+
+
+def test_model_access_index_load_test():
+    llm_router = litellm.Router(
+        model_list=[
+            {
+                "model_name": f"model-{i}",
+                "litellm_params": {"model": f"openai/model-{i}", "api_key": "fake"},
+                "model_info": {"access_groups": [f"group-{i % 10}"]},
+            }
+            for i in range(NUM_DEPLOYMENTS)
+        ]
+    )
+    models = [f"model-{i}" for i in range(NUM_KEY_MODELS)] + [
+        "bedrock/*",
+        "vertex_ai/*",
+        "anthropic/*",
+        "group-3",
+    ]
+    requested_models = [
+        "model-42",  # exact
+        "anthropic/claude-3-5-sonnet-20240620",  # wildcard
+        "model-13",  # exact
+        "gpt-4o-mini",  # denied
+    ]
+
+    for m in requested_models:
+        assert _list_scan_check_model_access(
+            model=m, llm_router=llm_router, models=models
+        ) == _check_model_access_helper(model=m, llm_router=llm_router, models=models)
+
+    list_scan_time = _time_checks(
+        _list_scan_check_model_access, llm_router, models, requested_models
+    )
+    index_time = _time_checks(
+        _check_model_access_helper, llm_router, models, requested_models
+    )
+    print(
+        f"\n{NUM_CHECKS} checks, {len(models)} key models, {NUM_DEPLOYMENTS} deployments"
+    )
+    print(f"list scan: {list_scan_time / NUM_CHECKS * 1e6:.1f} us/check")
+    print(f"index:     {index_time / NUM_CHECKS * 1e6:.1f} us/check")
+    assert index_time < list_scan_time
@@ -0,0 +1,49 @@
+"""
+Benchmark the model cost map startup work done with `ModelCostIndex`: building the
+index, plus the provider-grouped `add_known_models`.
+
+Only import-time work changed - per-request `get_model_info` / `cost_per_token`
+lookups are the same dict lookups as before, so they aren't measured here. To compare
+against the if/elif `add_known_models` it replaced, run this test on both commits.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.utils import get_model_cost_index
+
+NUM_RUNS = 50
+
+
+def _time(fn) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(NUM_RUNS):
+        fn()
+    return (time.perf_counter() - start) / NUM_RUNS
+
+
+def _index_startup() -> None:
+    get_model_cost_index(rebuild=True)
+    litellm.add_known_models()
+
+
+def test_model_cost_index_startup():
+    index_time = _time(_index_startup)
+
+    print(
+        f"\n{len(litellm.model_cost)} models: {index_time * 1e3:.2f}ms per startup"
+    )
+    index = get_model_cost_index()
+    assert index.key_by_lowercase == {key.lower(): key for key in litellm.model_cost}
+    assert {
+        key for keys in index.keys_by_provider.values() for key in keys
+    } == {
+        key
+        for key, value in litellm.model_cost.items()
+        if isinstance(value.get("litellm_provider"), str)
+    }
@@ -0,0 +1,117 @@
+"""
+Benchmark the CPU time `PrometheusLogger.async_log_success_event` spends per request.
+
+- uncached: every metric re-resolves the request's label values and calls
+  prometheus_client's `metric.labels(...)`
+- cached: label values are resolved once per request, and the `labels(...)` child
+  for repeated label values comes from `CachedLabelsMetric`
+
+Budget metric lookups (DB / cache reads) are patched out.
+"""
+
+import asyncio
+import datetime
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from prometheus_client import REGISTRY
+
+from litellm.integrations import prometheus as prometheus_module
+from litellm.integrations.prometheus import PrometheusLogger
+from litellm.integrations.prometheus_helpers.label_handle_cache import (
+    CachedLabelsMetric,
+)
+
+NUM_REQUESTS = 2000
+NUM_API_KEYS = 20
+
+
+def _make_kwargs(i: int) -> dict:
+    now = datetime.datetime.now()
+    standard_logging_payload = {
+        "id": f"request-{i}",
+        "call_type": "acompletion",
+        "response_cost": 0.001,
+        "total_tokens": 30,
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "cache_hit": False,
+        "model": "gpt-4o",
+        "model_id": "model-1",
+        "model_group": "gpt-4o",
+        "api_base": "https://api.openai.com",
+        "custom_llm_provider": "openai",
+        "request_tags": ["prod"],
+        "hidden_params": {"additional_headers": {}},
+        "metadata": {
+            "user_api_key_hash": f"hashed-key-{i % NUM_API_KEYS}",
+            "user_api_key_alias": "alias",
+            "user_api_key_team_id": "team",
+            "user_api_key_team_alias": "team-alias",
+            "user_api_key_user_id": "user",
+            "user_api_key_user_email": None,
+            "requester_metadata": {},
+            "user_api_key_auth_metadata": {},
+            "user_api_key_request_route": "/chat/completions",
+        },
+    }
+    return {
+        "model": "gpt-4o",
+        "standard_logging_object": standard_logging_payload,
+        "litellm_params": {"metadata": {}},
+        "api_call_start_time": now,
+        "completion_start_time": now,
+    }
+
+
+async def _log_requests(logger: PrometheusLogger, requests: list) -> None:
+    now = datetime.datetime.now()
+    for kwargs in requests:
+        await logger.async_log_success_event(kwargs, None, now, now)
+
+
+def _time_logger(logger: PrometheusLogger) -> float:
+    asyncio.run(_log_requests(logger, [_make_kwargs(i) for i in range(100)]))
+    requests = [_make_kwargs(i) for i in range(NUM_REQUESTS)]
+    start = time.process_time()
+    asyncio.run(_log_requests(logger, requests))
+    return (time.process_time() - start) / NUM_REQUESTS
+
+
+def _uncached_labels(self, *labelvalues, **labelkwargs):
+    return self._metric.labels(*labelvalues, **labelkwargs)
+
+
+def _uncached_resolved_labels(enum_values):
+    enum_values._resolved_labels = None
+    return _get_resolved_labels(enum_values)
+
+
+_get_resolved_labels = prometheus_module._get_resolved_labels
+
+
+def test_prometheus_logger_load_test():
+    for collector in list(REGISTRY._collector_to_names.keys()):
+        REGISTRY.unregister(collector)
+    logger = PrometheusLogger()
+
+    async def _skip_budget_metrics(*args, **kwargs):
+        return None
+
+    with patch.object(
+        logger, "_increment_remaining_budget_metrics", _skip_budget_metrics
+    ):
+        with patch.object(CachedLabelsMetric, "labels", _uncached_labels), patch.object(
+            prometheus_module, "_get_resolved_labels", _uncached_resolved_labels
+        ):
+            uncached = _time_logger(logger)
+        cached = _time_logger(logger)
+
+    print(f"\nasync_log_success_event CPU time, {NUM_REQUESTS} requests")
+    print(f"uncached: {uncached * 1e6:.1f} us/request")
+    print(f"cached:   {cached * 1e6:.1f} us/request")
+    assert cached < uncached
@@ -0,0 +1,63 @@
+"""
+Microbenchmark `get_optional_params` per call, with the provider chat config:
+
+- built per call: every `get_provider_chat_config` call constructs the config (and
+  generates the class for JSON providers)
+- registry: the config for a (provider, model) is resolved once and shared
+"""
+
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.utils import ProviderConfigManager, get_optional_params
+
+NUM_ITERATIONS = 500
+CASES = [
+    ("gpt-4o", "openai"),
+    ("gpt-5", "openai"),
+    ("o3-mini", "openai"),
+    ("claude-3-5-sonnet-20240620", "anthropic"),
+    ("llama-3.1-8b-instant", "groq"),
+    ("gemini-1.5-pro", "vertex_ai"),
+    ("anthropic.claude-3-sonnet-20240229-v1:0", "bedrock"),
+    ("some-model", "publicai"),  # JSON provider
+]
+
+
+def _time_get_optional_params() -> float:
+    for model, provider in CASES:  # warm up
+        get_optional_params(model=model, custom_llm_provider=provider, max_tokens=10)
+    start = time.perf_counter()
+    for _ in range(NUM_ITERATIONS):
+        for model, provider in CASES:
+            get_optional_params(
+                model=model, custom_llm_provider=provider, max_tokens=10
+            )
+    return (time.perf_counter() - start) / (NUM_ITERATIONS * len(CASES))
+
+
+def test_provider_config_registry_load_test():
+    from litellm.llms.openai_like import dynamic_config
+
+    def _build_per_call(model, provider):
+        dynamic_config._CONFIG_CLASSES.clear()
+        return ProviderConfigManager._resolve_provider_chat_config(
+            model=model, provider=provider
+        )
+
+    with patch.object(
+        ProviderConfigManager,
+        "get_provider_chat_config",
+        staticmethod(_build_per_call),
+    ):
+        built_per_call = _time_get_optional_params()
+    registry = _time_get_optional_params()
+
+    print(f"\nget_optional_params, {len(CASES)} provider/model pairs")
+    print(f"built per call: {built_per_call * 1e6:.1f} us/call")
+    print(f"registry:       {registry * 1e6:.1f} us/call")
+    assert registry < built_per_call
@@ -0,0 +1,86 @@
+"""
+Benchmark proxy CPU per streamed token for a long generation in `async_data_generator`.
+
+- join per chunk: what the generator did before - `"".join(...)` of the text so far
+  before every chunk, whether or not a callback reads it
+- no streaming hooks: the generator skips the per-chunk hook and the text
+- streaming hook: a callback receives the text so far on every chunk
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.caching.caching import DualCache
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.proxy import proxy_server
+from litellm.proxy._types import UserAPIKeyAuth
+from litellm.proxy.utils import ProxyLogging
+from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+NUM_CHUNKS = 20_000
+CHUNK_TEXT = "token "
+
+
+class _NoOpStreamingHookLogger(CustomLogger):
+    async def async_post_call_streaming_hook(self, user_api_key_dict, response):
+        return None
+
+
+def _make_chunks() -> list:
+    return [
+        ModelResponseStream(
+            id="stream",
+            choices=[StreamingChoices(delta=Delta(content=CHUNK_TEXT), index=0)],
+            model="gpt-4o",
+        )
+        for _ in range(NUM_CHUNKS)
+    ]
+
+
+async def _stream(chunks: list) -> float:
+    proxy_logging = ProxyLogging(user_api_key_cache=DualCache())
+
+    async def _iterator_hook(user_api_key_dict, response, request_data):
+        for chunk in chunks:
+            yield chunk
+
+    proxy_logging.async_post_call_streaming_iterator_hook = _iterator_hook  # type: ignore
+    with patch.object(proxy_server, "proxy_logging_obj", proxy_logging):
+        start = time.process_time()
+        async for _ in proxy_server.async_data_generator(
+            response=MagicMock(),
+            user_api_key_dict=UserAPIKeyAuth(api_key="sk-1234"),
+            request_data={"model": "gpt-4o"},
+        ):
+            pass
+        return time.process_time() - start
+
+
+def test_proxy_streaming_hook_cpu_per_token():
+    chunks = _make_chunks()
+
+    parts: list = []
+    start = time.process_time()
+    for chunk in chunks:
+        "".join(parts)
+        parts.append(litellm.get_response_string(response_obj=chunk))
+    join_per_chunk_time = time.process_time() - start
+
+    with patch("litellm.callbacks", []):
+        no_hook_time = asyncio.run(_stream(chunks))
+    with patch("litellm.callbacks", [_NoOpStreamingHookLogger()]):
+        hook_time = asyncio.run(_stream(chunks))
+
+    print(
+        f"{NUM_CHUNKS} chunks, CPU per token: "
+        f"join per chunk (text only) {join_per_chunk_time / NUM_CHUNKS * 1e6:.1f} us, "
+        f"no streaming hooks {no_hook_time / NUM_CHUNKS * 1e6:.1f} us, "
+        f"streaming hook {hook_time / NUM_CHUNKS * 1e6:.1f} us"
+    )
+    assert no_hook_time < hook_time
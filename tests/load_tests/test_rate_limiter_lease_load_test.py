@@ -0,0 +1,103 @@
+"""
+Benchmark Redis calls and latency per request in the v3 rate limiter, with and without
+lease mode (`LITELLM_RATE_LIMIT_LEASE_FRACTION`).
+
+Redis is simulated by in-memory scripts with a fixed round trip delay. Each request
+carries key, team and user RPM descriptors.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.caching.caching import DualCache
+from litellm.proxy.hooks.parallel_request_limiter_v3 import (
+    _PROXY_MaxParallelRequestsHandler_v3,
+)
+from litellm.proxy.utils import InternalUsageCache
+
+NUM_REQUESTS = 1000
+RPM_LIMIT = 100_000
+# simulated Redis round trip
+REDIS_LATENCY = 0.001
+
+DESCRIPTORS = [
+    {"key": key, "value": f"{key}-1", "rate_limit": {"requests_per_unit": RPM_LIMIT}}
+    for key in ("api_key", "team", "user")
+]
+
+
+class _SimulatedRedisScripts:
+    def __init__(self):
+        self.values: dict = {}
+        self.calls = 0
+
+    async def _call(self, keys, args, lease: bool):
+        self.calls += 1
+        await asyncio.sleep(REDIS_LATENCY)
+        now, window_size = args[0], args[1]
+        results = []
+        for i in range(0, len(keys), 2):
+            window_key, counter_key = keys[i], keys[i + 1]
+            if (now - self.values.get(window_key, now - window_size)) >= window_size:
+                self.values[window_key] = now
+                self.values[counter_key] = 0
+            increment, granted = 1, 0
+            if lease:
+                arg_index = 2 + (i // 2) * 3
+                lease_size, limit, increment = args[arg_index : arg_index + 3]
+                if lease_size > 0 and limit - self.values[counter_key] >= lease_size:
+                    increment = granted = lease_size
+            self.values[counter_key] += increment
+            results.extend([str(self.values[window_key]), self.values[counter_key]])
+            if lease:
+                results.append(granted)
+        return results
+
+    async def batch_rate_limiter_script(self, keys, args):
+        return await self._call(keys, args, lease=False)
+
+    async def lease_rate_limiter_script(self, keys, args):
+        return await self._call(keys, args, lease=True)
+
+
+async def _run_requests(lease_fraction: str):
+    os.environ["LITELLM_RATE_LIMIT_LEASE_FRACTION"] = lease_fraction
+    handler = _PROXY_MaxParallelRequestsHandler_v3(
+        internal_usage_cache=InternalUsageCache(DualCache()),
+        time_provider=datetime.now,
+    )
+    scripts = _SimulatedRedisScripts()
+    handler.batch_rate_limiter_script = scripts.batch_rate_limiter_script
+    if handler.lease_fraction > 0:
+        handler.lease_rate_limiter_script = scripts.lease_rate_limiter_script
+
+    start = time.perf_counter()
+    for _ in range(NUM_REQUESTS):
+        response = await handler.should_rate_limit(descriptors=DESCRIPTORS)
+        assert response["overall_code"] == "OK"
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*handler._lease_renewal_tasks.values())
+    return scripts.calls / NUM_REQUESTS, elapsed / NUM_REQUESTS
+
+
+def test_rate_limiter_lease_load_test():
+    original = os.environ.pop("LITELLM_RATE_LIMIT_LEASE_FRACTION", None)
+    try:
+        exact_calls, exact_latency = asyncio.run(_run_requests("0"))
+        lease_calls, lease_latency = asyncio.run(_run_requests("0.05"))
+    finally:
+        os.environ.pop("LITELLM_RATE_LIMIT_LEASE_FRACTION", None)
+        if original is not None:
+            os.environ["LITELLM_RATE_LIMIT_LEASE_FRACTION"] = original
+
+    print(f"\nshould_rate_limit, {NUM_REQUESTS} requests")
+    print(f"exact: {exact_calls:.3f} redis calls/request, {exact_latency * 1e6:.0f} us")
+    print(f"lease: {lease_calls:.3f} redis calls/request, {lease_latency * 1e6:.0f} us")
+    assert exact_calls == 1
+    assert lease_calls < 0.1
+    assert lease_latency < exact_latency
@@ -0,0 +1,86 @@
+"""
+Benchmark proxy CPU per streamed chunk for an OpenAI-compatible upstream.
+
+- parsed: `CustomStreamWrapper` parses every chunk, the proxy re-serializes it
+- raw SSE passthrough: the upstream frames are forwarded with only `model` rewritten,
+  and teed into the logging accumulator
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import httpx
+import respx
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.litellm_core_utils.raw_sse_passthrough import patch_sse_frame_model
+
+API_BASE = "https://my-vllm.example.com/v1"
+NUM_CHUNKS = 5_000
+
+
+def _sse_body() -> bytes:
+    lines = []
+    for i in range(NUM_CHUNKS):
+        frame = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "meta-llama/Llama-3.1-8B-Instruct",
+            "choices": [
+                {"index": 0, "delta": {"content": f"token{i} "}, "finish_reason": None}
+            ],
+        }
+        lines.append("data: " + json.dumps(frame) + "\n\n")
+    lines.append("data: [DONE]\n\n")
+    return "".join(lines).encode()
+
+
+async def _stream(raw_sse_passthrough: bool) -> float:
+    response = await litellm.acompletion(
+        model="hosted_vllm/meta-llama/Llama-3.1-8B-Instruct",
+        messages=[{"role": "user", "content": "hi"}],
+        api_base=API_BASE,
+        stream=True,
+        raw_sse_passthrough=raw_sse_passthrough,
+    )
+    start = time.process_time()
+    if raw_sse_passthrough:
+        async for frame in response.aiter_frames():
+            f"data: {patch_sse_frame_model(frame, 'my-llama')}\n\n"
+    else:
+        async for chunk in response:
+            chunk.model = "my-llama"
+            f"data: {chunk.model_dump_json(exclude_none=True, exclude_unset=True)}\n\n"
+    return time.process_time() - start
+
+
+def test_raw_sse_passthrough_cpu_per_chunk():
+    litellm.disable_aiohttp_transport = True
+    with respx.mock() as respx_mock, patch.object(
+        litellm.litellm_core_utils.litellm_logging.Logging, "success_handler"
+    ), patch.object(
+        litellm.litellm_core_utils.litellm_logging.Logging, "async_success_handler"
+    ):
+        respx_mock.post(f"{API_BASE}/chat/completions").mock(
+            side_effect=lambda request: httpx.Response(
+                200,
+                content=_sse_body(),
+                headers={"content-type": "text/event-stream"},
+            )
+        )
+        parsed_time = asyncio.run(_stream(raw_sse_passthrough=False))
+        raw_time = asyncio.run(_stream(raw_sse_passthrough=True))
+
+    print(
+        f"{NUM_CHUNKS} chunks, CPU per chunk: "
+        f"parsed {parsed_time / NUM_CHUNKS * 1e6:.1f} us, "
+        f"raw SSE passthrough {raw_time / NUM_CHUNKS * 1e6:.1f} us"
+    )
+    assert raw_time < parsed_time
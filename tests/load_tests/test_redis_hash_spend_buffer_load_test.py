@@ -0,0 +1,91 @@
+"""
+Benchmark the DB-writer pod's work per flush of the Redis spend update buffer, with
+many pods writing spend updates for the same keys (fakeredis, in process):
+
+- list buffer: every pod RPUSHes its JSON transactions, the writer LPOPs, parses and
+  merges them
+- hash buffer: every pod HINCRBYFLOATs into one hash, the writer reads it pre-aggregated
+
+Reports the buffered size in Redis and the writer's CPU to parse and merge one flush.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.caching.redis_cache import RedisCache
+from litellm.constants import REDIS_UPDATE_BUFFER_KEY
+from litellm.proxy.db.db_transaction_queue.redis_update_buffer import (
+    RedisUpdateBuffer,
+)
+from litellm.types.services import ServiceTypes
+
+NUM_PODS = 50
+NUM_KEYS = 500
+
+
+def _redis_cache() -> RedisCache:
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    fake_redis_client = fakeredis.FakeAsyncRedis()
+    with patch("litellm._redis.get_redis_client", return_value=fakeredis.FakeRedis()):
+        redis_cache = RedisCache(host="localhost", port=6379)
+    redis_cache.init_async_client = lambda: fake_redis_client  # type: ignore
+    return redis_cache
+
+
+async def _run(use_hash_buffer: bool):
+    redis_cache = _redis_cache()
+    buffer = RedisUpdateBuffer(redis_cache=redis_cache)
+    transactions = RedisUpdateBuffer._combine_list_of_transactions([])
+    transactions["key_list_transactions"] = {  # type: ignore
+        f"hashed-key-{i}": 0.001 * i for i in range(NUM_KEYS)
+    }
+    with patch.object(
+        RedisUpdateBuffer, "_use_redis_hash_buffer", return_value=use_hash_buffer
+    ), patch.object(
+        RedisUpdateBuffer, "_emit_new_item_added_to_redis_buffer_event", AsyncMock()
+    ):
+        for _ in range(NUM_PODS):
+            await buffer._store_transactions_in_redis(
+                transactions=transactions,
+                redis_key=REDIS_UPDATE_BUFFER_KEY,
+                service_type=ServiceTypes.REDIS_SPEND_UPDATE_QUEUE,
+            )
+        # time the writer pod's parse + merge - with a real Redis the reads run server side
+        if use_hash_buffer:
+            stored = await buffer._drain_redis_hash_buffer(REDIS_UPDATE_BUFFER_KEY)
+            stored_bytes = sum(len(k) + len(v) for k, v in stored.items())
+            start = time.process_time()
+            combined = RedisUpdateBuffer._parse_db_spend_update_hash(stored)
+        else:
+            stored = await redis_cache.async_lpop(
+                key=REDIS_UPDATE_BUFFER_KEY, count=NUM_PODS
+            )
+            stored_bytes = sum(len(v) for v in stored)
+            start = time.process_time()
+            combined = RedisUpdateBuffer._combine_list_of_transactions(
+                RedisUpdateBuffer._parse_list_of_transactions(stored)
+            )
+        flush_time = time.process_time() - start
+    assert len(combined["key_list_transactions"]) == NUM_KEYS  # type: ignore
+    return stored_bytes, flush_time
+
+
+def test_redis_hash_spend_buffer_flush():
+    list_bytes, list_time = asyncio.run(_run(use_hash_buffer=False))
+    hash_bytes, hash_time = asyncio.run(_run(use_hash_buffer=True))
+
+    print(
+        f"{NUM_PODS} pods x {NUM_KEYS} keys: "
+        f"list buffer {list_bytes / 1e3:.0f} KB buffered, {list_time * 1e3:.1f} ms flush; "
+        f"hash buffer {hash_bytes / 1e3:.0f} KB buffered, {hash_time * 1e3:.1f} ms flush"
+    )
+    assert hash_bytes < list_bytes
+    assert hash_time < list_time
@@ -0,0 +1,43 @@
+"""
+Load test for the scheduler queue backends with 10k pending requests.
+
+Prints add / poll throughput for the default dual_cache backend and the
+in_memory heap backend. The dual_cache backend reads and rewrites the whole
+queue on every operation, so it is run with fewer items.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.scheduler import FlowItem, Scheduler
+
+
+async def _run_queue(scheduler: Scheduler, num_items: int) -> float:
+    model_name = "gpt-4o"
+    start = time.perf_counter()
+    for i in range(num_items):
+        await scheduler.add_request(
+            FlowItem(priority=i % 10, request_id=f"req-{i}", model_name=model_name)
+        )
+    queue = await scheduler.get_queue(model_name=model_name)
+    for _, request_id in sorted(queue):
+        assert await scheduler.poll(
+            id=request_id, model_name=model_name, health_deployments=[]
+        )
+    duration = time.perf_counter() - start
+    return (2 * num_items) / duration
+
+
+def test_scheduler_in_memory_backend_10k_pending():
+    ops_per_second = asyncio.run(_run_queue(Scheduler(backend="in_memory"), 10_000))
+    print(f"in_memory backend, 10k pending: {ops_per_second:,.0f} ops/s")
+    assert ops_per_second > 10_000
+
+
+def test_scheduler_dual_cache_backend_baseline():
+    ops_per_second = asyncio.run(_run_queue(Scheduler(), 1_000))
+    print(f"dual_cache backend, 1k pending: {ops_per_second:,.0f} ops/s")
@@ -0,0 +1,76 @@
+"""
+Benchmark how long a fast callback waits for its logs when another callback stalls
+(e.g. a logging backend that's down and waiting on timeouts).
+
+- shared queue: callbacks run one after another, the fast one waits on the stalled one
+- sharded: every callback has its own queue, the fast one isn't delayed
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.logging_worker import LoggingWorker
+
+NUM_REQUESTS = 50
+STALL_SECONDS = 0.05
+
+
+class _StalledLogger(CustomLogger):
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        await asyncio.sleep(STALL_SECONDS)
+
+
+class _FastLogger(CustomLogger):
+    def __init__(self):
+        super().__init__()
+        self.delays = []
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self.delays.append(time.time() - end_time.timestamp())
+
+
+async def _run(sharded: bool) -> float:
+    worker = LoggingWorker(sharded=sharded)
+    fast_logger = _FastLogger()
+    with patch(
+        "litellm.litellm_core_utils.logging_worker.GLOBAL_LOGGING_WORKER", worker
+    ), patch(
+        "litellm.litellm_core_utils.litellm_logging.GLOBAL_LOGGING_WORKER", worker
+    ), patch.object(
+        litellm, "callbacks", [_StalledLogger(), fast_logger]
+    ), patch.object(
+        litellm, "_async_success_callback", []
+    ):
+        await asyncio.gather(
+            *[
+                litellm.acompletion(
+                    model="gpt-4o",
+                    messages=[{"role": "user", "content": "hi"}],
+                    mock_response="hello",
+                )
+                for _ in range(NUM_REQUESTS)
+            ]
+        )
+        while len(fast_logger.delays) < NUM_REQUESTS:
+            await asyncio.sleep(0.01)
+        await worker.stop()
+    return max(fast_logger.delays)
+
+
+def test_sharded_logging_worker_fast_callback_delay():
+    shared_delay = asyncio.run(_run(sharded=False))
+    sharded_delay = asyncio.run(_run(sharded=True))
+
+    print(
+        f"{NUM_REQUESTS} requests, one callback stalled {STALL_SECONDS * 1e3:.0f} ms, "
+        f"max fast callback delay: shared queue {shared_delay * 1e3:.1f} ms, "
+        f"sharded {sharded_delay * 1e3:.1f} ms"
+    )
+    assert sharded_delay < shared_delay
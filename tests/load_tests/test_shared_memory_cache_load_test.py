@@ -0,0 +1,98 @@
+"""
+Measure Redis GETs issued by N proxy workers reading the same keys through DualCache,
+with and without the shared memory tier.
+
+Each worker has a small per-process cache, so most reads miss it. Without the shared
+tier every miss goes to Redis in every worker; with it, one worker's Redis read is
+served to all other workers on the host. Both tiers use the 1s in-memory TTL of the
+proxy's internal_usage_cache.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+if sys.platform == "win32":
+    pytest.skip("shared memory cache requires fcntl", allow_module_level=True)
+
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.shared_memory_cache import SharedMemoryCache
+
+NUM_WORKERS = 4
+NUM_KEYS = 500
+NUM_READS = 5000
+
+
+class _CountingRedisCache:
+    """Stands in for RedisCache - every key exists, GETs are counted."""
+
+    namespace = None
+
+    def __init__(self):
+        self.get_count = 0
+
+    async def async_get_cache(self, key, **kwargs):
+        self.get_count += 1
+        return {"key": key, "spend": 1.0}
+
+
+def _run_worker(shared_memory_path, barrier, results) -> None:
+    redis_cache = _CountingRedisCache()
+    dual_cache = DualCache(
+        in_memory_cache=InMemoryCache(max_size_in_memory=50),
+        redis_cache=redis_cache,  # type: ignore
+        default_in_memory_ttl=1,  # same as the proxy's internal_usage_cache
+        shared_memory_cache=(
+            SharedMemoryCache(path=shared_memory_path, num_slots=4096)
+            if shared_memory_path
+            else None
+        ),
+    )
+    dual_cache._start_redis_invalidation_listener = lambda: None  # type: ignore
+
+    async def _read_keys():
+        for i in range(NUM_READS):
+            await dual_cache.async_get_cache(f"team:{(i * 7) % NUM_KEYS}")
+
+    barrier.wait()
+    asyncio.run(_read_keys())
+    results.put(redis_cache.get_count)
+
+
+def _total_redis_gets(shared_memory_path) -> int:
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(NUM_WORKERS)
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(target=_run_worker, args=(shared_memory_path, barrier, results))
+        for _ in range(NUM_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    total = sum(results.get(timeout=120) for _ in workers)
+    for worker in workers:
+        worker.join(timeout=60)
+    return total
+
+
+def test_shared_memory_tier_reduces_redis_gets():
+    without_shared_tier = _total_redis_gets(shared_memory_path=None)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with_shared_tier = _total_redis_gets(
+            shared_memory_path=os.path.join(tmp_dir, "shm_cache")
+        )
+
+    print(
+        f"{NUM_WORKERS} workers x {NUM_READS} reads over {NUM_KEYS} keys: "
+        f"{without_shared_tier} redis GETs without shared tier, {with_shared_tier} with"
+    )
+    # every key is fetched from redis at most a few times across all workers
+    assert with_shared_tier <= NUM_KEYS * 2
+    assert with_shared_tier * 5 < without_shared_tier
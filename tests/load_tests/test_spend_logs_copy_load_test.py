@@ -0,0 +1,108 @@
+"""
+Benchmark spend log write throughput against a local Postgres with the LiteLLM schema
+(DATABASE_URL, `prisma db push` applied):
+
+- create_many: prisma `create_many(skip_duplicates=True)`, what `update_spend_logs` uses
+- COPY: `SpendLogsCopyWriter`, binary COPY through asyncpg
+
+Skipped if DATABASE_URL isn't set, or asyncpg / the generated prisma client are missing.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.proxy.db.spend_logs_copy_writer import (
+    SPEND_LOGS_COLUMNS,
+    SPEND_LOGS_TABLE,
+    SpendLogsCopyWriter,
+)
+from litellm.proxy.utils import jsonify_object
+
+NUM_LOGS = 20_000
+BATCH_SIZE = 1000  # same as update_spend_logs
+
+
+def _spend_logs() -> list:
+    now = datetime.now(timezone.utc)
+    spend_logs = []
+    for i in range(NUM_LOGS):
+        spend_log = {column: "" for column in SPEND_LOGS_COLUMNS}
+        spend_log.update(
+            request_id=f"copy-bench-{uuid.uuid4()}",
+            call_type="acompletion",
+            spend=0.0001 * i,
+            total_tokens=30,
+            prompt_tokens=10,
+            completion_tokens=20,
+            startTime=now,
+            endTime=now,
+            completionStartTime=now,
+            metadata=json.dumps({"user_api_key_alias": "bench", "i": i}),
+            request_tags="[]",
+            messages="{}",
+            response="{}",
+            proxy_server_request="{}",
+            status="success",
+        )
+        spend_logs.append(spend_log)
+    return spend_logs
+
+
+async def _create_many(db, spend_logs: list) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(spend_logs), BATCH_SIZE):
+        await db.litellm_spendlogs.create_many(
+            data=[jsonify_object(log) for log in spend_logs[i : i + BATCH_SIZE]],
+            skip_duplicates=True,
+        )
+    return time.perf_counter() - start
+
+
+async def _copy(writer: SpendLogsCopyWriter, spend_logs: list) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(spend_logs), BATCH_SIZE):
+        assert await writer.write_spend_logs(spend_logs[i : i + BATCH_SIZE])
+    return time.perf_counter() - start
+
+
+async def _run():
+    from prisma import Prisma
+
+    db = Prisma()
+    await db.connect()
+    writer = SpendLogsCopyWriter()
+    try:
+        create_many_time = await _create_many(db, _spend_logs())
+        copy_time = await _copy(writer, _spend_logs())
+    finally:
+        await db.execute_raw(
+            f'DELETE FROM "{SPEND_LOGS_TABLE}" WHERE request_id LIKE \'copy-bench-%\''
+        )
+        await writer.close()
+        await db.disconnect()
+    return create_many_time, copy_time
+
+
+def test_spend_logs_copy_throughput():
+    if os.getenv("DATABASE_URL") is None:
+        pytest.skip("DATABASE_URL not set")
+    pytest.importorskip("asyncpg")
+    pytest.importorskip("prisma")
+
+    create_many_time, copy_time = asyncio.run(_run())
+
+    print(
+        f"{NUM_LOGS} spend logs: "
+        f"create_many {NUM_LOGS / create_many_time:.0f} rows/s, "
+        f"COPY {NUM_LOGS / copy_time:.0f} rows/s"
+    )
+    assert copy_time < create_many_time
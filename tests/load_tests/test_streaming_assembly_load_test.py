@@ -0,0 +1,115 @@
+"""
+Benchmark building the complete response of a long stream in `CustomStreamWrapper`:
+
+- chunk list (default): every chunk is kept and combined by `stream_chunk_builder` at the end
+- incremental (`litellm.incremental_streaming_assembly = True`): chunks are folded as they arrive
+
+Reports peak traced memory while streaming and the latency of the final `next()`
+call, which builds the complete response for logging / caching.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices, Usage
+
+NUM_CHUNKS = 5000
+
+
+def _generate_chunks():
+    for i in range(NUM_CHUNKS):
+        yield ModelResponseStream(
+            id="chatcmpl-123",
+            model="claude-3-5-sonnet-20240620",
+            choices=[
+                StreamingChoices(
+                    index=0,
+                    delta=Delta(
+                        content=f" token{i}", role="assistant" if i == 0 else None
+                    ),
+                    finish_reason="stop" if i == NUM_CHUNKS - 1 else None,
+                )
+            ],
+        )
+    yield ModelResponseStream(
+        id="chatcmpl-123",
+        model="claude-3-5-sonnet-20240620",
+        choices=[StreamingChoices(index=0, delta=Delta(content=""))],
+        usage=Usage(
+            prompt_tokens=10, completion_tokens=NUM_CHUNKS, total_tokens=NUM_CHUNKS + 10
+        ),
+    )
+
+
+def _run_stream(incremental: bool, monkeypatch):
+    monkeypatch.setattr(litellm, "incremental_streaming_assembly", incremental)
+    monkeypatch.setattr(litellm, "disable_streaming_logging", True)
+    logging_obj = Logging(
+        model="claude-3-5-sonnet-20240620",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="completion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    logging_obj.success_handler = lambda *args, **kwargs: None  # type: ignore
+    response = CustomStreamWrapper(
+        completion_stream=_generate_chunks(),
+        model="claude-3-5-sonnet-20240620",
+        custom_llm_provider="bedrock",
+        logging_obj=logging_obj,
+    )
+
+    tracemalloc.start()
+    stream_start = time.perf_counter()
+    last_call_latency = 0.0
+    while True:
+        call_start = time.perf_counter()
+        try:
+            next(response)
+        except StopIteration:
+            last_call_latency = time.perf_counter() - call_start
+            break
+    stream_time = time.perf_counter() - stream_start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    complete_response = response._build_complete_streaming_response()
+    return peak_memory, last_call_latency, stream_time, complete_response
+
+
+def test_incremental_streaming_assembly_memory_and_final_chunk_latency(monkeypatch):
+    if os.getenv("PYTHONTRACEMALLOC"):
+        pytest.skip("tracemalloc already active")
+
+    results = {}
+    for incremental in (False, True):
+        results[incremental] = _run_stream(incremental, monkeypatch)
+        peak_memory, last_call_latency, stream_time, _ = results[incremental]
+        print(
+            f"{'incremental' if incremental else 'chunk list'}: {NUM_CHUNKS} chunks, "
+            f"peak memory {peak_memory / 1024 / 1024:.1f} MB, "
+            f"final chunk latency {last_call_latency * 1000:.1f} ms, "
+            f"total {stream_time:.2f}s"
+        )
+
+    chunk_list_peak, chunk_list_latency, _, chunk_list_response = results[False]
+    incremental_peak, incremental_latency, _, incremental_response = results[True]
+
+    assert (
+        incremental_response.choices[0].message.content
+        == chunk_list_response.choices[0].message.content
+    )
+    assert incremental_response.usage.total_tokens == NUM_CHUNKS + 10
+    assert incremental_peak * 3 < chunk_list_peak
+    assert incremental_latency < chunk_list_latency
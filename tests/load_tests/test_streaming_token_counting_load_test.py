@@ -0,0 +1,90 @@
+"""
+Benchmark the end-of-stream usage calculation for a ~50k token conversation when
+the provider doesn't return usage.
+
+- stream_chunk_builder: prompt and completion are tokenized after the last chunk
+- StreamingChunkAccumulator: the prompt is counted in the background when the stream
+  starts, the completion while the chunks arrive
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm import stream_chunk_builder
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+    StreamingChunkAccumulator,
+)
+from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+NUM_TURNS = 24
+NUM_CHUNKS = 10000
+
+
+def _make_conversation() -> list:
+    turn = (
+        "Alexander III of Macedon, most commonly known as Alexander the Great, "
+        "was a king of the ancient Greek kingdom of Macedon. "
+    ) * 40
+    messages = []
+    for i in range(NUM_TURNS):
+        messages.append({"role": "user", "content": f"Question {i}: {turn}"})
+        messages.append({"role": "assistant", "content": f"Answer {i}: {turn}"})
+    messages.append({"role": "user", "content": "Summarize the conversation."})
+    return messages
+
+
+def _make_chunks() -> list:
+    words = [" The", " king", " of", " Macedon", " conquered", " Persia."]
+    return [
+        ModelResponseStream(
+            id="chatcmpl-123",
+            model="gpt-4o",
+            choices=[
+                StreamingChoices(
+                    index=0,
+                    delta=Delta(
+                        content=words[i % len(words)],
+                        role="assistant" if i == 0 else None,
+                    ),
+                    finish_reason="stop" if i == NUM_CHUNKS - 1 else None,
+                )
+            ],
+        )
+        for i in range(NUM_CHUNKS)
+    ]
+
+
+def test_streaming_usage_without_token_recounting():
+    messages = _make_conversation()
+    chunks = _make_chunks()
+
+    start = time.perf_counter()
+    expected = stream_chunk_builder(chunks=chunks, messages=messages)
+    chunk_list_final_latency = time.perf_counter() - start
+
+    accumulator = StreamingChunkAccumulator(
+        messages=messages, count_prompt_tokens_in_background=True
+    )
+    start = time.perf_counter()
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
+    streaming_time = time.perf_counter() - start
+    assert accumulator.prompt_token_count is not None
+    accumulator.prompt_token_count.result()  # done long before the last chunk of a real stream
+
+    start = time.perf_counter()
+    response = accumulator.build_response()
+    incremental_final_latency = time.perf_counter() - start
+
+    print(
+        f"{expected.usage.prompt_tokens} prompt / {expected.usage.completion_tokens} completion tokens: "
+        f"final chunk {chunk_list_final_latency * 1000:.1f} ms with re-counting, "
+        f"{incremental_final_latency * 1000:.1f} ms incremental "
+        f"(+{streaming_time * 1000:.1f} ms spread over {NUM_CHUNKS} chunks)"
+    )
+    assert expected.usage.prompt_tokens > 45000
+    assert response.usage.model_dump() == expected.usage.model_dump()
+    assert incremental_final_latency * 5 < chunk_list_final_latency
@@ -0,0 +1,105 @@
+"""
+Benchmark `token_counter` on an agent-style workload: every request re-sends the same
+system prompt and tool schemas plus the growing conversation history.
+
+- uncached: `TOKEN_COUNTER_CACHE_SIZE=0`, every text is re-encoded on every request
+- cached: only the newest messages of each request are encoded
+- batch: `batch_token_counter` counts all requests with one batch encode
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.litellm_core_utils import token_counter as token_counter_module
+from litellm.litellm_core_utils.token_counter import (
+    batch_token_counter,
+    token_counter,
+)
+
+NUM_TURNS = 40
+MODEL = "gpt-4o"
+
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": f"tool_{i}",
+            "description": "Look up records in the inventory database and return the matching rows. "
+            * 4,
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "The search query"},
+                    "limit": {"type": "integer", "description": "Max rows"},
+                },
+                "required": ["query"],
+            },
+        },
+    }
+    for i in range(10)
+]
+
+
+def _make_requests() -> list:
+    system_prompt = (
+        "You are an autonomous agent operating on a warehouse inventory system. "
+        "Always double check quantities before answering. "
+    ) * 60
+    history = [{"role": "system", "content": system_prompt}]
+    requests = []
+    for i in range(NUM_TURNS):
+        history = history + [
+            {
+                "role": "user",
+                "content": f"Step {i}: reconcile the stock levels of aisle {i}. " * 20,
+            }
+        ]
+        requests.append(history)
+        history = history + [
+            {
+                "role": "assistant",
+                "content": f"Aisle {i} reconciled, 3 discrepancies were fixed. " * 20,
+            }
+        ]
+    return requests
+
+
+def _count_all(requests) -> tuple:
+    start = time.perf_counter()
+    counts = [
+        token_counter(model=MODEL, messages=messages, tools=TOOLS)  # type: ignore
+        for messages in requests
+    ]
+    return counts, time.perf_counter() - start
+
+
+def test_token_counter_cache_repeated_prefix(monkeypatch):
+    requests = _make_requests()
+
+    monkeypatch.setattr(token_counter_module._token_count_cache, "max_size", 0)
+    token_counter_module._token_count_cache.clear()
+    uncached_counts, uncached_time = _count_all(requests)
+    monkeypatch.undo()
+
+    token_counter_module._token_count_cache.clear()
+    cached_counts, cached_time = _count_all(requests)
+
+    token_counter_module._token_count_cache.clear()
+    start = time.perf_counter()
+    batch_counts = batch_token_counter(
+        model=MODEL, messages_list=requests, tools=TOOLS  # type: ignore
+    )
+    batch_time = time.perf_counter() - start
+
+    print(
+        f"{NUM_TURNS} requests, {uncached_counts[-1]} tokens in the last one: "
+        f"uncached {uncached_time * 1000:.1f} ms, cached {cached_time * 1000:.1f} ms, "
+        f"batch {batch_time * 1000:.1f} ms"
+    )
+    assert cached_counts == uncached_counts
+    assert batch_counts == uncached_counts
+    assert cached_time * 3 < uncached_time
+    assert batch_time * 3 < uncached_time
@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.lru_in_memory_cache import (
+    FrequencySketch,
+    LRUInMemoryCache,
+    create_in_memory_cache,
+    estimate_size_in_bytes,
+    get_registered_lru_caches,
+)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUInMemoryCache(max_size_in_memory=3)
+    for key in ["a", "b", "c"]:
+        cache.set_cache(key, key)
+
+    cache.get_cache("a")  # a becomes most recently used
+    cache.set_cache("d", "d")
+
+    assert cache.get_cache("b") is None
+    assert cache.get_cache("a") == "a"
+    assert cache.get_cache("c") == "c"
+    assert cache.get_cache("d") == "d"
+    assert cache.evictions == 1
+    assert len(cache.cache_dict) == 3
+
+
+def test_lru_memory_budget():
+    value = "x" * 1000
+    value_size = estimate_size_in_bytes(value)
+    cache = LRUInMemoryCache(
+        max_size_in_memory=1000, max_memory_bytes=value_size * 5
+    )
+    for i in range(20):
+        cache.set_cache(f"key-{i}", value)
+
+    assert len(cache.cache_dict) == 5
+    assert cache.current_memory_bytes <= value_size * 5
+    assert list(cache.cache_dict.keys()) == [f"key-{i}" for i in range(15, 20)]
+
+    # items bigger than the whole budget are not cached
+    cache.set_cache("huge", "x" * (value_size * 10))
+    assert cache.get_cache("huge") is None
+
+
+def test_lru_update_existing_key_tracks_memory():
+    cache = LRUInMemoryCache(max_size_in_memory=10)
+    cache.set_cache("a", "x" * 10)
+    cache.set_cache("a", "x" * 1000)
+    assert cache.current_memory_bytes == estimate_size_in_bytes("x" * 1000)
+    cache.delete_cache("a")
+    assert cache.current_memory_bytes == 0
+
+
+def test_lru_ttl_expiry_counts_miss():
+    cache = LRUInMemoryCache()
+    cache.set_cache("a", "value", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get_cache("a") is None
+    assert cache.expirations == 1
+    assert cache.misses == 1
+    assert cache.current_memory_bytes == 0
+
+
+def test_lru_hit_miss_counters():
+    cache = LRUInMemoryCache()
+    cache.set_cache("a", {"key": "value"})
+    assert cache.get_cache("a") == {"key": "value"}
+    assert cache.get_cache("b") is None
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_tinylfu_keeps_frequent_keys():
+    cache = LRUInMemoryCache(max_size_in_memory=2, eviction_policy="tinylfu")
+    cache.set_cache("hot-1", 1)
+    cache.set_cache("hot-2", 2)
+    for _ in range(5):
+        cache.get_cache("hot-1")
+        cache.get_cache("hot-2")
+
+    # one-off scan of new keys must not flush the hot keys
+    for i in range(10):
+        cache.set_cache(f"scan-{i}", i)
+
+    assert cache.get_cache("hot-1") == 1
+    assert cache.get_cache("hot-2") == 2
+    assert cache.rejected_admissions == 10
+
+
+def test_frequency_sketch_ages_counts():
+    sketch = FrequencySketch(capacity=4)
+    for _ in range(10):
+        sketch.increment("a")
+    assert sketch.frequency("a") == 10
+    sketch._reset()
+    assert sketch.frequency("a") == 5
+
+
+def test_create_in_memory_cache(monkeypatch):
+    lru_module = sys.modules[LRUInMemoryCache.__module__]
+
+    monkeypatch.setattr(lru_module, "IN_MEMORY_CACHE_BACKEND", "default")
+    assert type(create_in_memory_cache(cache_name="test")) is InMemoryCache
+
+    monkeypatch.setattr(lru_module, "IN_MEMORY_CACHE_BACKEND", "tinylfu")
+    monkeypatch.setattr(lru_module, "IN_MEMORY_CACHE_MAX_MEMORY_MB", 1)
+    cache = create_in_memory_cache(cache_name="test-tinylfu")
+    assert isinstance(cache, LRUInMemoryCache)
+    assert cache.eviction_policy == "tinylfu"
+    assert cache.max_memory_bytes == 1024 * 1024
+    assert get_registered_lru_caches()["test-tinylfu"] is cache
+
+    # stateful caches (router cooldowns / usage counters) never reject writes
+    stateful_cache = create_in_memory_cache(cache_name="test-stateful", stateful=True)
+    assert isinstance(stateful_cache, LRUInMemoryCache)
+    assert stateful_cache.eviction_policy == "lru"
+    assert stateful_cache.frequency_sketch is None
+
+
+def test_in_memory_cache_collector():
+    pytest.importorskip("prometheus_client")
+    from litellm.integrations.prometheus_helpers.in_memory_cache_collector import (
+        InMemoryCacheCollector,
+    )
+
+    cache = LRUInMemoryCache(cache_name="collector-test")
+    cache.set_cache("a", 1)
+    cache.get_cache("a")
+    cache.get_cache("b")
+
+    metrics = {m.name: m for m in InMemoryCacheCollector().collect()}
+    hits = [
+        s
+        for s in metrics["litellm_in_memory_cache_hits"].samples
+        if s.labels["cache_name"] == "collector-test"
+    ]
+    assert hits[0].value == 1
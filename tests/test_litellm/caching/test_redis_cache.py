@@ -199,3 +199,17 @@ async def test_async_lpop_with_float_redis_version(
             
             # Verify the method completed without error
             assert result is not None
+
+
+def test_redis_cache_increment_hash_pipeline(redis_no_ping):
+    import fakeredis
+
+    redis_cache = RedisCache(host="my-fake-host")
+    redis_cache.redis_client = fakeredis.FakeRedis()
+    increment_op = {"key": "sketch", "increments": {"w": 1.5, "sum": 3.0}, "ttl": 60}
+
+    redis_cache.increment_hash_pipeline([increment_op])  # type: ignore
+    redis_cache.increment_hash_pipeline([increment_op])  # type: ignore
+
+    assert redis_cache.redis_client.hgetall("sketch") == {b"w": b"3", b"sum": b"6"}
+    assert 0 < redis_cache.redis_client.ttl("sketch") <= 60
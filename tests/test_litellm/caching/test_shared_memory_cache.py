@@ -0,0 +1,225 @@
+import multiprocessing
+import os
+import sys
+import uuid
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+if sys.platform == "win32":
+    pytest.skip("shared memory cache requires fcntl", allow_module_level=True)
+
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.redis_cache import RedisCache
+from litellm.caching import shared_memory_cache
+from litellm.caching.shared_memory_cache import (
+    SharedMemoryCache,
+    create_shared_memory_cache,
+    remove_shared_memory_files,
+)
+
+
+@pytest.fixture
+def shared_cache(tmp_path):
+    cache = SharedMemoryCache(path=str(tmp_path / "shm_cache"), num_slots=64)
+    yield cache
+    cache.close()
+
+
+def test_set_get_delete(shared_cache):
+    shared_cache.set_cache("key-1", {"spend": 1.5, "models": ["gpt-4o"]})
+
+    assert shared_cache.get_cache("key-1") == {"spend": 1.5, "models": ["gpt-4o"]}
+    assert shared_cache.get_cache("key-2") is None
+
+    shared_cache.delete_cache("key-1")
+    assert shared_cache.get_cache("key-1") is None
+
+
+def test_ttl_expiry(shared_cache):
+    shared_cache.set_cache("key-1", 10, ttl=0.05)
+    assert shared_cache.get_cache("key-1") == 10
+    time.sleep(0.1)
+    assert shared_cache.get_cache("key-1") is None
+
+
+def test_skips_values_that_dont_fit(shared_cache):
+    shared_cache.set_cache("large", "x" * shared_cache.slot_size)
+    shared_cache.set_cache("not-json", object())
+
+    assert shared_cache.get_cache("large") is None
+    assert shared_cache.get_cache("not-json") is None
+
+
+def test_full_bucket_evicts_entry_expiring_first(tmp_path):
+    cache = SharedMemoryCache(path=str(tmp_path / "shm_cache"), num_slots=8)
+    cache.set_cache("expires-first", 0, ttl=10)
+    for i in range(7):
+        cache.set_cache(f"key-{i}", i, ttl=100)
+    cache.set_cache("new-key", "new", ttl=100)
+
+    assert cache.get_cache("expires-first") is None
+    assert cache.get_cache("new-key") == "new"
+    assert all(cache.get_cache(f"key-{i}") == i for i in range(7))
+    cache.close()
+
+
+def test_delete_written_before_keeps_fresh_entries(shared_cache):
+    shared_cache.set_cache("key-1", 1)
+
+    shared_cache.delete_cache("key-1", written_before=time.time() - 1)
+    assert shared_cache.get_cache("key-1") == 1
+
+    shared_cache.delete_cache("key-1", written_before=time.time() + 1)
+    assert shared_cache.get_cache("key-1") is None
+
+
+def test_layout_mismatch_replaces_file(tmp_path):
+    """
+    A table with another layout is replaced, not truncated under the processes that
+    still have it mapped
+    """
+    path = str(tmp_path / "shm_cache")
+    old_cache = SharedMemoryCache(path=path, num_slots=64)
+    old_cache.set_cache("key-1", 1)
+    fd = os.open(path, os.O_RDWR)
+    os.pwrite(fd, b"XXXX", 0)
+    os.close(fd)
+
+    new_cache = SharedMemoryCache(path=path, num_slots=64)
+
+    assert os.fstat(old_cache._fd).st_ino != os.stat(path).st_ino
+    assert old_cache.get_cache("key-1") == 1
+    assert new_cache.get_cache("key-1") is None
+    new_cache.set_cache("key-2", 2)
+    assert new_cache.get_cache("key-2") == 2
+    old_cache.close()
+    new_cache.close()
+
+
+def test_create_shared_memory_cache_is_scoped_to_namespace(monkeypatch):
+    monkeypatch.setattr(shared_memory_cache, "SHARED_MEMORY_CACHE_SLOTS", 64)
+    namespace = "test-{}".format(uuid.uuid4().hex)
+    monkeypatch.setenv("LITELLM_SHARED_MEMORY_CACHE_NAMESPACE", namespace)
+
+    cache = create_shared_memory_cache(cache_name="internal_usage_cache")
+    assert cache is not None
+    assert os.path.basename(cache.path) == "litellm_{}_internal_usage_cache".format(
+        namespace
+    )
+    cache.set_cache("key-1", 1)
+
+    # shutdown - the table is removed, the mapping keeps working until close
+    remove_shared_memory_files(namespace)
+    assert not os.path.exists(cache.path)
+    assert cache.get_cache("key-1") == 1
+    cache.close()
+
+
+def test_create_shared_memory_cache_without_namespace_unlinks_on_exit(monkeypatch):
+    monkeypatch.setattr(shared_memory_cache, "SHARED_MEMORY_CACHE_SLOTS", 64)
+    monkeypatch.delenv("LITELLM_SHARED_MEMORY_CACHE_NAMESPACE", raising=False)
+    registered = []
+    monkeypatch.setattr(shared_memory_cache.atexit, "register", registered.append)
+
+    cache = create_shared_memory_cache(cache_name="test_{}".format(uuid.uuid4().hex))
+    assert cache is not None
+    assert os.path.basename(cache.path).startswith("litellm_{}_".format(os.getpid()))
+    assert registered == [cache.unlink]
+
+    cache.unlink()
+    assert not os.path.exists(cache.path)
+    cache.close()
+
+
+def _write_from_child(path: str):
+    cache = SharedMemoryCache(path=path, num_slots=64)
+    cache.set_cache("from-child", {"pid": "child"})
+    cache.close()
+
+
+def test_shared_across_processes(tmp_path):
+    path = str(tmp_path / "shm_cache")
+    cache = SharedMemoryCache(path=path, num_slots=64)
+
+    process = multiprocessing.get_context("spawn").Process(
+        target=_write_from_child, args=(path,)
+    )
+    process.start()
+    process.join(timeout=60)
+
+    assert process.exitcode == 0
+    assert cache.get_cache("from-child") == {"pid": "child"}
+    cache.close()
+
+
+def _make_worker_cache(path: str) -> DualCache:
+    redis_cache = MagicMock(spec=RedisCache)
+    redis_cache.async_get_cache = AsyncMock(return_value={"spend": 3})
+    redis_cache.async_set_cache = AsyncMock()
+    dual_cache = DualCache(
+        in_memory_cache=InMemoryCache(),
+        redis_cache=redis_cache,
+        shared_memory_cache=SharedMemoryCache(path=path, num_slots=64),
+    )
+    dual_cache._start_redis_invalidation_listener = lambda: None  # type: ignore
+    return dual_cache
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_reads_through_shared_tier(tmp_path):
+    path = str(tmp_path / "shm_cache")
+    worker_1 = _make_worker_cache(path)
+    worker_2 = _make_worker_cache(path)
+
+    assert await worker_1.async_get_cache("team:1") == {"spend": 3}
+    assert await worker_2.async_get_cache("team:1") == {"spend": 3}
+    assert await worker_2.async_batch_get_cache(["team:1"]) == [{"spend": 3}]
+
+    assert worker_1.redis_cache.async_get_cache.call_count == 1  # type: ignore
+    assert worker_2.redis_cache.async_get_cache.call_count == 0  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_keyspace_invalidation(tmp_path, monkeypatch):
+    path = str(tmp_path / "shm_cache")
+    worker_1 = _make_worker_cache(path)
+    worker_2 = _make_worker_cache(path)
+
+    await worker_1.async_set_cache("team:1", {"spend": 1})
+    worker_2.in_memory_cache.set_cache("team:1", {"spend": 0})
+
+    # notification caused by worker_1's own write - every copy stays, except worker_2's stale one
+    worker_1._invalidate_local_key("team:1")
+    worker_2._invalidate_local_key("team:1")
+    assert worker_1.in_memory_cache.get_cache("team:1") == {"spend": 1}
+    assert worker_2.in_memory_cache.get_cache("team:1") is None
+    assert await worker_2.async_get_cache("team:1") == {"spend": 1}
+
+    # later write from another host - all local copies are dropped
+    monkeypatch.setattr(
+        sys.modules[DualCache.__module__],
+        "SHARED_MEMORY_CACHE_INVALIDATION_GRACE_SECONDS",
+        0,
+    )
+    worker_1._invalidate_local_key("team:1")
+    assert worker_1.in_memory_cache.get_cache("team:1") is None
+    assert worker_1.shared_memory_cache.get_cache("team:1") is None  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_shared_tier_uses_in_memory_ttl(tmp_path):
+    """Without keyspace notifications, shared entries expire with the in-memory ttl"""
+    worker = _make_worker_cache(str(tmp_path / "shm_cache"))
+    worker.default_in_memory_ttl = 0.05
+
+    await worker.async_get_cache("team:1")  # read through from redis
+    await worker.async_set_cache("team:2", {"spend": 1}, ttl=60)
+    assert worker.shared_memory_cache.get_cache("team:1") == {"spend": 3}  # type: ignore
+    assert worker.shared_memory_cache.get_cache("team:2") == {"spend": 1}  # type: ignore
+
+    time.sleep(0.1)
+    assert worker.shared_memory_cache.get_cache("team:1") is None  # type: ignore
+    assert worker.shared_memory_cache.get_cache("team:2") is None  # type: ignore
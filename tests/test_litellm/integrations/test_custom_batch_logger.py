@@ -0,0 +1,284 @@
+import asyncio
+import gzip
+import json
+import os
+import sys
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.integrations.custom_batch_logger import CustomBatchLogger
+from litellm.litellm_core_utils.cached_logging_payload import CachedJSONLoggingPayload
+
+
+class _RecordingBatchLogger(CustomBatchLogger):
+    def __init__(self, fail_times: int = 0, latency: float = 0.0, **kwargs):
+        super().__init__(flush_lock=asyncio.Lock(), **kwargs)
+        self.batches: List[List] = []
+        self.fail_times = fail_times
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def async_send_log_batch(self, logs: List) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise Exception("sink unavailable")
+            self.batches.append(list(logs))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_flush_bounds_batches_by_count_and_bytes():
+    logger = _RecordingBatchLogger(
+        adaptive_batching=True, batch_size=4, max_batch_bytes=1_000
+    )
+    logger.target_flush_latency = 60  # keep the batch size fixed
+    logger.log_queue = [{"id": i} for i in range(10)] + [
+        {"id": "big", "message": "x" * 600},
+        {"id": "big2", "message": "x" * 600},
+    ]
+
+    await logger.flush_queue()
+
+    assert [len(batch) for batch in logger.batches] == [4, 4, 3, 1]
+    assert logger.log_queue == []
+    assert sum(len(batch) for batch in logger.batches) == 12
+
+
+@pytest.mark.asyncio
+async def test_adaptive_flush_byte_budget_counts_array_separators():
+    logger = _RecordingBatchLogger(
+        adaptive_batching=True, batch_size=100, max_batch_bytes=100
+    )
+    logger.target_flush_latency = 60
+    # 11 bytes each - 9 of them fit without separators, 8 with
+    logger.log_queue = [CachedJSONLoggingPayload(id=1000 + i) for i in range(30)]
+
+    await logger.flush_queue()
+
+    for batch in logger.batches:
+        assert len(json.dumps(batch, separators=(",", ":"))) <= 100
+    assert [len(batch) for batch in logger.batches] == [8, 8, 8, 6]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_flush_splits_batch_on_413():
+    import httpx
+
+    class _SizeLimitedBatchLogger(_RecordingBatchLogger):
+        async def async_send_log_batch(self, logs: List) -> None:
+            if len(logs) > 2:
+                request = httpx.Request("POST", "https://logs.example.com")
+                raise httpx.HTTPStatusError(
+                    "payload too large",
+                    request=request,
+                    response=httpx.Response(413, request=request),
+                )
+            await super().async_send_log_batch(logs)
+
+    logger = _SizeLimitedBatchLogger(adaptive_batching=True, batch_size=8)
+    logger.log_queue = [{"id": i} for i in range(8)]
+
+    await logger.flush_queue()
+
+    assert [len(batch) for batch in logger.batches] == [2, 2, 2, 2]
+    assert sorted(log["id"] for batch in logger.batches for log in batch) == list(
+        range(8)
+    )
+
+
+@pytest.mark.asyncio
+async def test_adaptive_flush_does_not_retry_client_errors():
+    import httpx
+
+    class _RejectingBatchLogger(_RecordingBatchLogger):
+        async def async_send_log_batch(self, logs: List) -> None:
+            self.fail_times += 1
+            request = httpx.Request("POST", "https://logs.example.com")
+            raise httpx.HTTPStatusError(
+                "forbidden",
+                request=request,
+                response=httpx.Response(403, request=request),
+            )
+
+    logger = _RejectingBatchLogger(adaptive_batching=True, batch_size=8)
+    logger.log_queue = [{"id": i} for i in range(8)]
+
+    with patch("litellm.integrations.custom_batch_logger.asyncio.sleep", AsyncMock()):
+        await logger.flush_queue()
+
+    assert logger.fail_times == 1
+    assert logger.batch_size == 8
+
+
+@pytest.mark.asyncio
+async def test_adaptive_flush_sends_batches_concurrently():
+    logger = _RecordingBatchLogger(adaptive_batching=True, batch_size=1, latency=0.05)
+    logger.log_queue = [{"id": i} for i in range(8)]
+
+    with patch(
+        "litellm.integrations.custom_batch_logger.DEFAULT_BATCH_MAX_CONCURRENT_FLUSHES",
+        3,
+    ):
+        await logger.flush_queue()
+
+    assert len(logger.batches) == 8
+    assert logger.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_adaptive_flush_retries_and_shrinks_batch_size():
+    logger = _RecordingBatchLogger(
+        adaptive_batching=True, batch_size=100, fail_times=2
+    )
+    logger.log_queue = [{"id": i} for i in range(5)]
+
+    with patch("litellm.integrations.custom_batch_logger.asyncio.sleep", AsyncMock()):
+        await logger.flush_queue()
+
+    assert logger.batches == [[{"id": i} for i in range(5)]]
+    # two failures halve the batch size twice, the fast success grows it by a tenth
+    assert logger.batch_size == 25 + 10
+
+
+@pytest.mark.asyncio
+async def test_adaptive_flush_drops_batch_after_max_retries():
+    logger = _RecordingBatchLogger(adaptive_batching=True, fail_times=10)
+    logger.max_flush_retries = 1
+    logger.log_queue = [{"id": 1}]
+
+    with patch("litellm.integrations.custom_batch_logger.asyncio.sleep", AsyncMock()):
+        await logger.flush_queue()
+
+    assert logger.batches == []
+    assert logger.fail_times == 8
+    assert logger.log_queue == []
+
+
+def test_adjust_batch_size_to_sink_latency():
+    logger = _RecordingBatchLogger(adaptive_batching=True, batch_size=100)
+    logger.target_flush_latency = 1.0
+
+    logger._adjust_batch_size(latency=2.0)
+    assert logger.batch_size == 50
+    logger._adjust_batch_size(latency=0.7)  # between half and full target: unchanged
+    assert logger.batch_size == 50
+    logger._adjust_batch_size(latency=0.1)
+    assert logger.batch_size == 60
+    for _ in range(10):
+        logger._adjust_batch_size(latency=None)
+    assert logger.batch_size == logger.min_batch_size == 10
+    for _ in range(20):
+        logger._adjust_batch_size(latency=0.1)
+    assert logger.batch_size == logger.max_batch_size == 100
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batching_ignored_without_async_send_log_batch():
+    class _LegacyBatchLogger(CustomBatchLogger):
+        def __init__(self):
+            super().__init__(flush_lock=asyncio.Lock(), adaptive_batching=True)
+            self.sent: List[List] = []
+
+        async def async_send_batch(self):
+            self.sent.append(list(self.log_queue))
+
+    logger = _LegacyBatchLogger()
+    logger.log_queue = [{"id": 1}, {"id": 2}]
+    with patch.object(
+        CustomBatchLogger, "_adaptive_flush_queue", AsyncMock()
+    ) as mock_adaptive_flush:
+        await logger.flush_queue()
+
+    mock_adaptive_flush.assert_not_called()
+    assert logger.sent == [[{"id": 1}, {"id": 2}]]
+    assert logger.log_queue == []
+
+
+def test_supports_async_send_log_batch():
+    class _InheritingBatchLogger(_RecordingBatchLogger):
+        pass
+
+    assert CustomBatchLogger.supports_async_send_log_batch() is False
+    assert _RecordingBatchLogger.supports_async_send_log_batch() is True
+    assert _InheritingBatchLogger.supports_async_send_log_batch() is True
+
+
+def test_compress_log_batch():
+    data = json.dumps([{"id": i} for i in range(100)]).encode("utf-8")
+
+    logger = _RecordingBatchLogger(batch_compression="gzip")
+    body, content_encoding = logger.compress_log_batch(data)
+    assert content_encoding == "gzip"
+    assert gzip.decompress(body) == data
+
+    assert _RecordingBatchLogger().compress_log_batch(data) == (data, None)
+
+    # zstd falls back to gzip when zstandard isn't installed
+    with patch("litellm.integrations.custom_batch_logger.zstandard", None):
+        logger = _RecordingBatchLogger(batch_compression="zstd")
+    assert logger.batch_compression == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_datadog_adaptive_flush_sends_gzipped_batches():
+    from litellm.integrations.datadog.datadog import DataDogLogger
+
+    with patch.dict(
+        os.environ, {"DD_API_KEY": "fake-key", "DD_SITE": "datadoghq.com"}
+    ), patch("asyncio.create_task"):
+        dd_logger = DataDogLogger(adaptive_batching=True)
+
+    mock_response = MagicMock(status_code=202)
+    dd_logger.async_client = MagicMock()
+    dd_logger.async_client.post = AsyncMock(return_value=mock_response)
+    dd_logger.batch_size = 2
+    dd_logger.target_flush_latency = 60
+    dd_logger.log_queue = [{"message": f"log {i}"} for i in range(5)]
+
+    await dd_logger.flush_queue()
+
+    assert dd_logger.async_client.post.call_count == 3
+    sent = []
+    for call in dd_logger.async_client.post.call_args_list:
+        assert call.kwargs["headers"]["Content-Encoding"] == "gzip"
+        sent.extend(json.loads(gzip.decompress(call.kwargs["data"])))
+    assert sorted(log["message"] for log in sent) == [f"log {i}" for i in range(5)]
+    assert dd_logger.log_queue == []
+
+
+@pytest.mark.asyncio
+async def test_datadog_adaptive_flush_encodes_each_log_once():
+    from litellm.integrations.datadog.datadog import DataDogLogger
+    from litellm.litellm_core_utils import cached_logging_payload
+
+    with patch.dict(
+        os.environ, {"DD_API_KEY": "fake-key", "DD_SITE": "datadoghq.com"}
+    ), patch("asyncio.create_task"):
+        dd_logger = DataDogLogger(adaptive_batching=True)
+
+    dd_logger.async_client = MagicMock()
+    dd_logger.async_client.post = AsyncMock(return_value=MagicMock(status_code=202))
+    dd_logger.log_queue = [{"message": f"log {i}"} for i in range(5)]
+
+    with patch.object(
+        cached_logging_payload, "_encode", wraps=cached_logging_payload._encode
+    ) as mock_encode:
+        await dd_logger.flush_queue()
+
+    assert mock_encode.call_count == 5
+    sent = json.loads(
+        gzip.decompress(dd_logger.async_client.post.call_args.kwargs["data"])
+    )
+    assert [log["message"] for log in sent] == [f"log {i}" for i in range(5)]
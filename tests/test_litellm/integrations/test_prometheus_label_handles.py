@@ -0,0 +1,126 @@
+"""
+Unit tests for cached prometheus label handles and per-request label resolution
+"""
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from prometheus_client import CollectorRegistry, Counter
+
+import litellm
+from litellm.integrations.prometheus import prometheus_label_factory
+from litellm.integrations.prometheus_helpers.label_handle_cache import (
+    CachedLabelsMetric,
+)
+from litellm.types.integrations.prometheus import UserAPIKeyLabelValues
+
+
+def _counter(labelnames=("model", "team")) -> Counter:
+    return Counter(
+        "test_counter",
+        "test counter",
+        labelnames=list(labelnames),
+        registry=CollectorRegistry(),
+    )
+
+
+def test_cached_labels_metric_reuses_child():
+    counter = _counter()
+    metric = CachedLabelsMetric(counter)
+
+    child = metric.labels(model="gpt-4o", team="a")
+    assert metric.labels(model="gpt-4o", team="a") is child
+    assert metric.labels("gpt-4o", "a") is child  # same child as prometheus_client
+
+    metric.labels(model="gpt-4o", team="a").inc(2)
+    metric.labels(model="gpt-4o", team="b").inc()
+    assert counter.labels(model="gpt-4o", team="a")._value.get() == 2
+    assert counter.labels(model="gpt-4o", team="b")._value.get() == 1
+
+
+def test_cached_labels_metric_is_bounded():
+    metric = CachedLabelsMetric(_counter(), max_size=2)
+    first = metric.labels(model="a", team="t")
+    metric.labels(model="b", team="t")
+    metric.labels(model="a", team="t")  # most recently used
+    metric.labels(model="c", team="t")
+
+    assert len(metric._children) == 2
+    assert ((), (("model", "b"), ("team", "t"))) not in metric._children
+    # evicted handles resolve to the same prometheus child again
+    assert metric.labels(model="a", team="t") is first
+
+
+def test_cached_labels_metric_remove_and_clear():
+    counter = _counter()
+    metric = CachedLabelsMetric(counter)
+    child = metric.labels(model="gpt-4o", team="a")
+    child.inc()
+
+    metric.remove("gpt-4o", "a")
+    new_child = metric.labels(model="gpt-4o", team="a")
+    assert new_child is not child
+    assert new_child._value.get() == 0
+
+    new_child.inc()
+    metric.clear()
+    assert metric.labels(model="gpt-4o", team="a")._value.get() == 0
+
+
+def test_cached_labels_metric_forwards_attributes():
+    counter = Counter("test_unlabeled", "test", registry=CollectorRegistry())
+    metric = CachedLabelsMetric(counter)
+    metric.inc(3)
+    assert counter._value.get() == 3
+    assert metric._name == "test_unlabeled"
+
+
+def test_prometheus_label_factory_resolves_labels_once():
+    enum_values = UserAPIKeyLabelValues(
+        hashed_api_key="hash",
+        team="team\nname",
+        model="gpt-4o",
+        custom_metadata_labels={"metadata.foo": "bar"},
+    )
+    with patch.object(
+        UserAPIKeyLabelValues,
+        "model_dump",
+        autospec=True,
+        side_effect=lambda self: dict(self.__dict__),
+    ) as mock_model_dump:
+        labels = prometheus_label_factory(
+            supported_enum_labels=["hashed_api_key", "team", "metadata_foo"],
+            enum_values=enum_values,
+        )
+        other_labels = prometheus_label_factory(
+            supported_enum_labels=["model", "user"], enum_values=enum_values
+        )
+
+    assert mock_model_dump.call_count == 1
+    assert labels == {
+        "hashed_api_key": "hash",
+        "team": "team name",
+        "metadata_foo": "bar",
+    }
+    assert other_labels == {"model": "gpt-4o", "user": None}
+
+
+def test_prometheus_label_factory_end_user_setting_is_read_per_call():
+    enum_values = UserAPIKeyLabelValues(end_user="end-user-1", model="gpt-4o")
+    original_setting = litellm.enable_end_user_cost_tracking_prometheus_only
+    try:
+        litellm.enable_end_user_cost_tracking_prometheus_only = None
+        labels = prometheus_label_factory(
+            supported_enum_labels=["end_user", "model"], enum_values=enum_values
+        )
+        assert labels["end_user"] is None
+
+        litellm.enable_end_user_cost_tracking_prometheus_only = True
+        labels = prometheus_label_factory(
+            supported_enum_labels=["end_user", "model"], enum_values=enum_values
+        )
+        assert labels["end_user"] == "end-user-1"
+    finally:
+        litellm.enable_end_user_cost_tracking_prometheus_only = original_setting
@@ -0,0 +1,135 @@
+import asyncio
+import copy
+import dataclasses
+import json
+import os
+import sys
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils import cached_logging_payload
+from litellm.litellm_core_utils.cached_logging_payload import (
+    CachedJSONLoggingPayload,
+    dumps_logging_payload,
+)
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+from litellm.types.utils import Usage
+
+
+def test_json_encoding_is_cached():
+    payload = CachedJSONLoggingPayload(id="1", metadata={"a": [1, 2]})
+    with patch.object(
+        cached_logging_payload, "_encode", wraps=cached_logging_payload._encode
+    ) as mock_encode:
+        first = payload.json_str()
+        assert dumps_logging_payload(payload) is first
+        assert payload.json_bytes() == first.encode("utf-8")
+    assert mock_encode.call_count == 1
+    assert json.loads(first) == {"id": "1", "metadata": {"a": [1, 2]}}
+
+
+def test_json_encoding_invalidated_on_update():
+    payload = CachedJSONLoggingPayload(id="1", error_str="boom")
+    payload.json_str()
+
+    payload["error_str"] = "truncated"
+    assert json.loads(payload.json_str())["error_str"] == "truncated"
+
+    del payload["error_str"]
+    payload.update(response={"id": "r"})
+    assert json.loads(payload.json_str()) == {"id": "1", "response": {"id": "r"}}
+
+    # copies get their own encoding
+    payload_copy = copy.copy(payload)
+    payload_copy["messages"] = []
+    assert "messages" not in json.loads(payload.json_str())
+    assert json.loads(payload_copy.json_str())["messages"] == []
+
+
+def test_json_encoding_of_non_json_values():
+    payload = CachedJSONLoggingPayload(
+        usage=Usage(prompt_tokens=1, completion_tokens=2, total_tokens=3),
+        start=datetime(2025, 1, 1),
+        tags=("a",),
+        error=ValueError("bad"),
+    )
+    decoded = json.loads(payload.json_str())
+    assert decoded["usage"]["total_tokens"] == 3
+    assert decoded["tags"] == ["a"]
+    assert decoded["error"] == "bad"
+
+    # circular references fall back to safe_dumps
+    circular = CachedJSONLoggingPayload(id="1")
+    circular["self"] = circular
+    assert json.loads(circular.json_str())["self"] == "CircularReference Detected"
+
+
+def test_json_encoding_matches_safe_dumps():
+    @dataclasses.dataclass
+    class _Info:
+        name: str
+
+    payload = CachedJSONLoggingPayload(
+        start=datetime(2025, 1, 1, 12, 30),
+        day=date(2025, 1, 1),
+        tags={"b", "a"},
+        info=_Info(name="x"),
+        metadata={"user": "u", 1: "non-str key"},
+    )
+    assert json.loads(payload.json_str()) == json.loads(safe_dumps(payload))
+
+
+def test_json_encoding_not_invalidated_by_nested_mutation():
+    """
+    Nested values changed in place aren't seen by the cached encoding - callbacks
+    reassign the top-level key instead
+    """
+    payload = CachedJSONLoggingPayload(metadata={"user": "a"})
+    payload.json_str()
+
+    payload["metadata"]["user"] = "b"
+    assert json.loads(payload.json_str())["metadata"] == {"user": "a"}
+
+    payload["metadata"] = {**payload["metadata"], "user": "c"}
+    assert json.loads(payload.json_str())["metadata"] == {"user": "c"}
+
+
+def test_dumps_logging_payload_plain_dict():
+    assert json.loads(dumps_logging_payload({"id": "1"})) == {"id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_standard_logging_object_shared_across_callbacks():
+    payloads = []
+
+    class _PayloadLogger(CustomLogger):
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            payloads.append(kwargs["standard_logging_object"])
+
+    class _OtherPayloadLogger(_PayloadLogger):
+        pass
+
+    with patch.object(
+        litellm, "callbacks", [_PayloadLogger(), _OtherPayloadLogger()]
+    ):
+        response = await litellm.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hello",
+        )
+        await asyncio.sleep(1)
+
+    assert len(payloads) == 2
+    assert payloads[0] is payloads[1]
+    assert isinstance(payloads[0], CachedJSONLoggingPayload)
+    assert json.loads(dumps_logging_payload(payloads[0]))["id"] == response.id
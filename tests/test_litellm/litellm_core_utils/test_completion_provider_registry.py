@@ -0,0 +1,112 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.completion_provider_registry import (
+    get_completion_provider_route,
+)
+from litellm.types.utils import ModelResponse
+
+
+def test_get_completion_provider_route():
+    assert get_completion_provider_route("groq") is not None
+    assert get_completion_provider_route("deepseek") is not None
+    assert get_completion_provider_route("ollama_chat") is not None
+    # providers with custom setup keep their branch in `completion`
+    assert get_completion_provider_route("openai") is None
+    assert get_completion_provider_route("bedrock") is None
+    assert get_completion_provider_route("lemonade") is None
+    assert get_completion_provider_route(None) is None
+
+
+def test_groq_route_resolves_credentials(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "env-key")
+    monkeypatch.delenv("GROQ_API_BASE", raising=False)
+    route = get_completion_provider_route("groq")
+    assert route is not None
+
+    credentials = route.resolve_credentials(None, None, None)
+    assert credentials.api_key == "env-key"
+    assert credentials.api_base == "https://api.groq.com/openai/v1"
+
+    # deployment values win over env / defaults
+    credentials = route.resolve_credentials(
+        "deployment-key", "https://groq.example.com", {"x-test": "1"}
+    )
+    assert credentials.api_key == "deployment-key"
+    assert credentials.api_base == "https://groq.example.com"
+    assert credentials.headers == {"x-test": "1"}
+
+
+@pytest.mark.parametrize(
+    "model, expected_api_base",
+    [
+        ("groq/llama-3.1-8b-instant", "https://api.groq.com/openai/v1"),
+        ("mistral/mistral-large-latest", "https://api.mistral.ai/v1"),
+        ("minimax/MiniMax-M2", "https://api.minimax.io/v1"),
+        ("deepseek/deepseek-chat", "https://api.deepseek.com/beta"),
+        ("compactifai/cai-llama-3-1-8b-slim", "https://api.compactif.ai/v1"),
+        ("ollama_chat/llama3.1", "http://localhost:11434"),
+    ],
+)
+def test_completion_dispatches_registered_providers(
+    model, expected_api_base, monkeypatch
+):
+    monkeypatch.delenv("OLLAMA_API_BASE", raising=False)
+    with patch.object(
+        litellm.main.base_llm_http_handler,
+        "completion",
+        return_value=ModelResponse(),
+    ) as mock_completion:
+        litellm.completion(
+            model=model,
+            messages=[{"role": "user", "content": "hi"}],
+            api_key="sk-test",
+        )
+
+    mock_completion.assert_called_once()
+    call_kwargs = mock_completion.call_args.kwargs
+    assert call_kwargs["custom_llm_provider"] == model.split("/")[0]
+    assert call_kwargs["api_key"] == "sk-test"
+    assert call_kwargs["api_base"] == expected_api_base
+    assert call_kwargs["provider_config"] is not None
+
+
+def test_completion_loads_groq_config_defaults():
+    litellm.GroqChatConfig(n=2)
+    try:
+        with patch.object(
+            litellm.main.base_llm_http_handler,
+            "completion",
+            return_value=ModelResponse(),
+        ) as mock_completion:
+            litellm.completion(
+                model="groq/llama-3.1-8b-instant",
+                messages=[{"role": "user", "content": "hi"}],
+                api_key="sk-test",
+            )
+    finally:
+        litellm.GroqChatConfig.n = None
+
+    assert mock_completion.call_args.kwargs["optional_params"]["n"] == 2
+
+
+def test_ollama_route_sets_bearer_header():
+    route = get_completion_provider_route("ollama")
+    assert route is not None
+
+    credentials = route.resolve_credentials("sk-test", None, {})
+    assert credentials.headers == {"Authorization": "Bearer sk-test"}
+
+    # an explicit Authorization header is kept
+    credentials = route.resolve_credentials(
+        "sk-test", None, {"Authorization": "Basic abc"}
+    )
+    assert credentials.headers == {"Authorization": "Basic abc"}
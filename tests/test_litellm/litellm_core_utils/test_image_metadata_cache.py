@@ -0,0 +1,266 @@
+import asyncio
+import base64
+import os
+import struct
+import sys
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import Request, Response
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.constants import DEFAULT_IMAGE_HEIGHT, DEFAULT_IMAGE_WIDTH
+from litellm.litellm_core_utils import image_metadata_cache as image_metadata_module
+from litellm.litellm_core_utils.image_metadata_cache import (
+    ImageMetadataCache,
+    async_prefetch_image_dimensions,
+    image_metadata_cache,
+    parse_image_dimensions,
+)
+
+
+def _png_bytes(width: int, height: int, size: int = 100) -> bytes:
+    header = (
+        b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\rIHDR" + struct.pack(">LL", width, height)
+    )
+    return header + b"\x00" * (size - len(header))
+
+
+def _jpeg_bytes(width: int, height: int, app_segment_size: int = 20000) -> bytes:
+    app_segment = b"\xff\xe1" + struct.pack(">H", app_segment_size + 2)
+    app_segment += b"\x00" * app_segment_size
+    start_of_frame = b"\xff\xc0" + struct.pack(">HBHH", 17, 8, height, width)
+    return b"\xff\xd8" + app_segment + start_of_frame + b"\x00" * 100
+
+
+def _data_uri(image_bytes: bytes, mime_type: str = "image/png") -> str:
+    return f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode()}"
+
+
+@pytest.fixture(autouse=True)
+def _clear_image_metadata_cache():
+    image_metadata_cache.clear()
+    yield
+    image_metadata_cache.clear()
+
+
+def test_parse_image_dimensions():
+    assert parse_image_dimensions(_png_bytes(640, 480)) == (640, 480)
+    assert parse_image_dimensions(b"GIF89a" + struct.pack("<HH", 32, 16)) == (32, 16)
+    assert parse_image_dimensions(_jpeg_bytes(1024, 768)) == (1024, 768)
+    # header incomplete / unsupported format
+    assert parse_image_dimensions(_jpeg_bytes(1024, 768)[:1000]) is None
+    assert parse_image_dimensions(_png_bytes(640, 480)[:20]) is None
+    assert parse_image_dimensions(b"not an image at all") is None
+
+
+def test_data_uri_only_decodes_header():
+    data = _data_uri(_png_bytes(2048, 1024, size=2 * 1024 * 1024))
+    decoded_lengths = []
+    original_b64decode = base64.b64decode
+
+    def _recording_b64decode(value, *args, **kwargs):
+        decoded_lengths.append(len(value))
+        return original_b64decode(value, *args, **kwargs)
+
+    with patch.object(image_metadata_module.base64, "b64decode", _recording_b64decode):
+        assert image_metadata_cache.get_dimensions(data) == (2048, 1024)
+
+    assert max(decoded_lengths) < 10_000
+
+
+def test_data_uri_jpeg_decodes_until_start_of_frame():
+    data = _data_uri(_jpeg_bytes(300, 200, app_segment_size=60000), "image/jpeg")
+    assert image_metadata_cache.get_dimensions(data) == (300, 200)
+
+
+def test_get_dimensions_dedups_concurrent_fetches():
+    cache = ImageMetadataCache()
+    resolve_calls = []
+
+    def _slow_resolve(data):
+        resolve_calls.append(data)
+        time.sleep(0.1)
+        return (800, 600)
+
+    results = []
+    with patch.object(cache, "_resolve_dimensions", side_effect=_slow_resolve):
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    cache.get_dimensions("https://example.com/cat.png")
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert cache.get_dimensions("https://example.com/cat.png") == (800, 600)
+
+    assert results == [(800, 600)] * 5
+    assert len(resolve_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_get_dimensions_dedups_concurrent_fetches():
+    cache = ImageMetadataCache()
+
+    async def _slow_resolve(data):
+        await asyncio.sleep(0.05)
+        return (800, 600)
+
+    with patch.object(
+        cache, "_async_resolve_dimensions", side_effect=_slow_resolve
+    ) as mock_resolve:
+        results = await asyncio.gather(
+            *(cache.async_get_dimensions("https://example.com/cat.png") for _ in range(10))
+        )
+        assert await cache.async_get_dimensions("https://example.com/cat.png") == (
+            800,
+            600,
+        )
+
+    assert results == [(800, 600)] * 10
+    assert mock_resolve.call_count == 1
+    assert len(cache.async_in_flight) == 0
+
+
+def test_failed_fetch_is_not_cached():
+    cache = ImageMetadataCache()
+    with patch.object(cache, "_resolve_dimensions", return_value=None):
+        assert cache.get_dimensions("https://example.com/missing.png") == (
+            DEFAULT_IMAGE_WIDTH,
+            DEFAULT_IMAGE_HEIGHT,
+        )
+    assert cache.get_cached_dimensions("https://example.com/missing.png") is None
+
+
+def test_unparseable_image_is_not_cached():
+    import httpx
+
+    from litellm.llms.custom_httpx import http_handler
+
+    class _Client:
+        client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: Response(status_code=200, content=b"<html></html>" * 10)
+            )
+        )
+
+    cache = ImageMetadataCache()
+    with patch.object(http_handler, "_get_httpx_client", return_value=_Client()):
+        assert cache.get_dimensions("https://example.com/not-an-image") == (
+            DEFAULT_IMAGE_WIDTH,
+            DEFAULT_IMAGE_HEIGHT,
+        )
+    assert cache.get_cached_dimensions("https://example.com/not-an-image") is None
+
+
+def test_cache_is_bounded():
+    cache = ImageMetadataCache(max_size=2)
+    for i in range(3):
+        cache.set_image_bytes(f"https://example.com/{i}.png", _png_bytes(i + 1, i + 1))
+
+    assert cache.get_cached_dimensions("https://example.com/0.png") is None
+    assert cache.get_cached_dimensions("https://example.com/2.png") == (3, 3)
+
+
+@pytest.mark.asyncio
+async def test_async_prefetch_image_dimensions_only_fetches_high_detail_images():
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "what is in these images?"},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": "https://example.com/high.png", "detail": "high"},
+                },
+                {
+                    "type": "image_url",
+                    "image_url": {"url": "https://example.com/low.png", "detail": "low"},
+                },
+                {"type": "image_url", "image_url": "https://example.com/auto.png"},
+            ],
+        }
+    ]
+    with patch.object(
+        image_metadata_cache,
+        "_async_resolve_dimensions",
+        new=AsyncMock(return_value=(1024, 1024)),
+    ) as mock_resolve:
+        await async_prefetch_image_dimensions(messages)
+
+    mock_resolve.assert_called_once_with("https://example.com/high.png")
+    assert image_metadata_cache.get_cached_dimensions(
+        "https://example.com/high.png"
+    ) == (1024, 1024)
+
+
+def test_token_counter_reuses_image_downloaded_for_prompt_conversion(monkeypatch):
+    from litellm.litellm_core_utils.prompt_templates.image_handling import (
+        convert_url_to_base64,
+        in_memory_cache,
+    )
+    from litellm.litellm_core_utils.token_counter import calculate_img_tokens
+
+    class PngClient:
+        def get(self, url, follow_redirects=True):
+            return Response(
+                status_code=200,
+                headers={"Content-Type": "image/png"},
+                content=_png_bytes(1024, 1024),
+                request=Request("GET", url),
+            )
+
+    url = "https://example.com/reused.png"
+    in_memory_cache.flush_cache()
+    monkeypatch.setattr(litellm, "module_level_client", PngClient())
+    convert_url_to_base64(url)
+
+    with patch.object(
+        image_metadata_cache, "_resolve_dimensions"
+    ) as mock_resolve_dimensions:
+        assert calculate_img_tokens(data=url, mode="high") == 765
+    mock_resolve_dimensions.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_convert_url_to_base64_dedups_downloads(monkeypatch):
+    from litellm.litellm_core_utils.prompt_templates.image_handling import (
+        async_convert_url_to_base64,
+        in_memory_cache,
+    )
+
+    class SlowPngClient:
+        def __init__(self):
+            self.calls = 0
+
+        async def get(self, url, follow_redirects=True):
+            self.calls += 1
+            await asyncio.sleep(0.05)
+            return Response(
+                status_code=200,
+                headers={"Content-Type": "image/png"},
+                content=_png_bytes(10, 10),
+                request=Request("GET", url),
+            )
+
+    in_memory_cache.flush_cache()
+    client = SlowPngClient()
+    monkeypatch.setattr(litellm, "module_level_aclient", client)
+    results = await asyncio.gather(
+        *(async_convert_url_to_base64("https://example.com/shared.png") for _ in range(5))
+    )
+
+    assert len(set(results)) == 1
+    assert results[0].startswith("data:image/png;base64,")
+    assert client.calls == 1
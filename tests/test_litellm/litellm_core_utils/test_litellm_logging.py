@@ -1355,3 +1355,175 @@ def test_get_error_information_error_code_priority():
     result = StandardLoggingPayloadSetup.get_error_information(no_code_exception)
     assert result["error_code"] == ""
     assert result["error_class"] == "NoCodeException"
+
+
+@pytest.mark.asyncio
+async def test_async_success_handler_sharded_logging_worker():
+    """
+    With a sharded logging worker, each callback runs on its own queue - a stalled
+    callback doesn't delay the others.
+    """
+    import asyncio
+
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.litellm_core_utils.logging_worker import LoggingWorker
+
+    stalled = asyncio.Event()
+    fast_logged = asyncio.Event()
+
+    class StalledLogger(CustomLogger):
+        async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+            await stalled.wait()
+
+    class FastLogger(CustomLogger):
+        async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+            fast_logged.set()
+
+    worker = LoggingWorker(sharded=True)
+    with patch(
+        "litellm.litellm_core_utils.logging_worker.GLOBAL_LOGGING_WORKER", worker
+    ), patch(
+        "litellm.litellm_core_utils.litellm_logging.GLOBAL_LOGGING_WORKER", worker
+    ), patch.object(
+        litellm, "callbacks", [StalledLogger(), FastLogger()]
+    ):
+        await litellm.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hello",
+        )
+        await asyncio.wait_for(fast_logged.wait(), timeout=5)
+
+        stats = worker.get_shard_stats()
+        assert stats["FastLogger"]["processed"] == 1
+        assert stats["StalledLogger"]["processed"] == 0
+
+        stalled.set()
+        await worker.flush()
+        assert worker.get_shard_stats()["StalledLogger"]["processed"] == 1
+        await worker.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_success_handler_sharded_runs_internal_callbacks_inline():
+    """
+    Spend tracking isn't sharded - its updates must not be dropped when a shard is
+    full.
+    """
+    import asyncio
+
+    import litellm
+    from litellm.litellm_core_utils.logging_worker import LoggingWorker
+    from litellm.proxy.hooks.proxy_track_cost_callback import _ProxyDBLogger
+
+    logged = []
+
+    async def _track_cost(kwargs, response_obj, start_time, end_time):
+        logged.append(kwargs["model"])
+
+    db_logger = _ProxyDBLogger()
+    worker = LoggingWorker(sharded=True)
+    with patch(
+        "litellm.litellm_core_utils.logging_worker.GLOBAL_LOGGING_WORKER", worker
+    ), patch(
+        "litellm.litellm_core_utils.litellm_logging.GLOBAL_LOGGING_WORKER", worker
+    ), patch.object(
+        db_logger, "async_log_success_event", _track_cost
+    ), patch.object(
+        litellm, "callbacks", [db_logger]
+    ):
+        await litellm.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hello",
+        )
+        for _ in range(50):
+            if logged:
+                break
+            await asyncio.sleep(0.05)
+
+        assert logged == ["gpt-4o"]
+        assert "_ProxyDBLogger" not in worker.get_shard_stats()
+        await worker.stop()
+
+
+def test_should_shard_callback(logging_obj):
+    import litellm
+    from litellm._service_logger import ServiceLogging
+    from litellm.caching.dual_cache import DualCache
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy.hooks.parallel_request_limiter_v3 import (
+        _PROXY_MaxParallelRequestsHandler_v3,
+    )
+    from litellm.proxy.hooks.proxy_track_cost_callback import _ProxyDBLogger
+    from litellm.proxy.utils import InternalUsageCache
+
+    router = litellm.Router(
+        model_list=[{"model_name": "gpt-4o", "litellm_params": {"model": "gpt-4o"}}]
+    )
+    for callback in [
+        _ProxyDBLogger(),
+        ServiceLogging(),
+        _PROXY_MaxParallelRequestsHandler_v3(
+            internal_usage_cache=InternalUsageCache(DualCache())
+        ),
+        router.deployment_callback_on_success,
+        router.sync_deployment_callback_on_success,
+    ]:
+        assert logging_obj._should_shard_callback(callback) is False
+
+    class UserLogger(CustomLogger):
+        pass
+
+    assert logging_obj._should_shard_callback(UserLogger()) is True
+    assert logging_obj._should_shard_callback("langfuse") is True
+
+
+@pytest.mark.asyncio
+async def test_async_success_handler_offloads_payload_build():
+    """
+    With LOGGING_WORKER_OFFLOAD_PAYLOAD_BUILD, the standard logging payload is built
+    on the thread pool, not on the event loop.
+    """
+    import asyncio
+    import threading
+
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.litellm_core_utils import litellm_logging
+
+    build_threads = []
+    payloads = []
+    get_standard_logging_object_payload = (
+        litellm_logging.get_standard_logging_object_payload
+    )
+
+    def _record_thread(*args, **kwargs):
+        build_threads.append(threading.get_ident())
+        return get_standard_logging_object_payload(*args, **kwargs)
+
+    class PayloadLogger(CustomLogger):
+        async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+            payloads.append(kwargs["standard_logging_object"])
+
+    with patch.object(
+        litellm_logging, "LOGGING_WORKER_OFFLOAD_PAYLOAD_BUILD", True
+    ), patch.object(
+        litellm_logging,
+        "get_standard_logging_object_payload",
+        side_effect=_record_thread,
+    ), patch.object(
+        litellm, "callbacks", [PayloadLogger()]
+    ):
+        await litellm.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hello",
+        )
+        await asyncio.sleep(1)
+
+    assert len(payloads) == 1
+    assert payloads[0]["response_cost"] > 0
+    assert len(build_threads) > 0
+    assert threading.get_ident() not in build_threads
@@ -10,6 +10,7 @@ import pytest
 
 from litellm.constants import LOGGING_WORKER_AGGRESSIVE_CLEAR_COOLDOWN_SECONDS
 from litellm.litellm_core_utils.logging_worker import LoggingWorker
+from litellm.types.services import ServiceTypes
 
 
 class TestLoggingWorker:
@@ -360,3 +361,103 @@ class TestLoggingWorker:
         assert worker2._bound_loop is not None
 
         await worker2.stop()
+
+    @pytest.mark.asyncio
+    async def test_sharded_slow_callback_does_not_delay_others(self):
+        """In sharded mode, a stalled callback's queue doesn't hold up other callbacks."""
+        worker = LoggingWorker(timeout=5.0, sharded=True, per_shard_concurrency=1)
+        worker.start()
+
+        stalled = asyncio.Event()
+        fast_done = asyncio.Event()
+
+        async def slow_log():
+            await stalled.wait()
+
+        async def fast_log():
+            fast_done.set()
+
+        for _ in range(3):
+            worker.enqueue(slow_log(), shard="slow_callback")
+        worker.enqueue(fast_log(), shard="fast_callback")
+
+        await asyncio.wait_for(fast_done.wait(), timeout=1.0)
+        stats = worker.get_shard_stats()
+        assert stats["slow_callback"]["queue_depth"] == 2
+        assert stats["fast_callback"]["processed"] == 1
+
+        stalled.set()
+        await worker.flush()
+        assert worker.get_shard_stats()["slow_callback"]["processed"] == 3
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_sharded_queue_full_drops_and_counts(self):
+        """A full shard drops its new logs, counts them and emits a drop metric."""
+        worker = LoggingWorker(
+            timeout=5.0, sharded=True, per_shard_max_queue_size=2, per_shard_concurrency=1
+        )
+        worker.start()
+        stalled = asyncio.Event()
+
+        async def slow_log():
+            await stalled.wait()
+
+        with patch("litellm.service_callback", ["prometheus_system"]), patch(
+            "litellm._service_logger.ServiceLogging.async_service_failure_hook",
+            new_callable=AsyncMock,
+        ) as mock_failure_hook:
+            for _ in range(4):
+                worker.enqueue(slow_log(), shard="slow_callback")
+            await asyncio.sleep(0)
+
+        assert worker.get_shard_stats()["slow_callback"]["dropped"] == 2
+        assert mock_failure_hook.call_count == 2
+        assert mock_failure_hook.call_args.kwargs["call_type"] == "slow_callback"
+
+        stalled.set()
+        await worker.flush()
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_sharded_queue_depth_emitted_on_enqueue(self):
+        """A stalled shard still reports its growing queue depth."""
+        worker = LoggingWorker(timeout=5.0, sharded=True, per_shard_concurrency=1)
+        worker.start()
+        stalled = asyncio.Event()
+
+        async def slow_log():
+            await stalled.wait()
+
+        with patch("litellm.service_callback", ["prometheus_system"]), patch(
+            "litellm._service_logger.ServiceLogging.async_service_success_hook",
+            new_callable=AsyncMock,
+        ) as mock_success_hook, patch(
+            "litellm.litellm_core_utils.logging_worker.LOGGING_WORKER_METRICS_INTERVAL_SECONDS",
+            0,
+        ):
+            for _ in range(3):
+                worker.enqueue(slow_log(), shard="slow_callback")
+            await asyncio.sleep(0)
+
+        queue_depths = [
+            call.kwargs["event_metadata"]["gauge_value"]
+            for call in mock_success_hook.call_args_list
+            if call.kwargs["service"] == ServiceTypes.LOGGING_WORKER_QUEUE
+        ]
+        stalled.set()
+        await worker.flush()
+        await worker.stop()
+        assert max(queue_depths) == 3
+
+    @pytest.mark.asyncio
+    async def test_shard_ignored_when_not_sharded(self, logging_worker):
+        """Without sharded mode, coroutines with a shard go to the main queue."""
+        logging_worker.start()
+        mock_coro = AsyncMock()
+        logging_worker.enqueue(mock_coro(), shard="some_callback")
+
+        assert logging_worker._queue.qsize() == 1
+        assert logging_worker.get_shard_stats() == {}
+        await logging_worker.flush()
+        await logging_worker.stop()
@@ -0,0 +1,88 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+import litellm
+from litellm.litellm_core_utils.model_cost_index import ModelCostIndex
+from litellm.utils import _invalidate_model_cost_lowercase_map, get_model_cost_index
+
+MODEL_COST = {
+    "gpt-4o": {"litellm_provider": "openai", "mode": "chat"},
+    "GPT-4O-Mini": {"litellm_provider": "openai", "mode": "chat"},
+    "groq/llama3-8b-8192": {"litellm_provider": "groq", "mode": "chat"},
+    "llama3-8b-8192": {"litellm_provider": "groq", "mode": "chat"},
+    "vertex_ai/claude-3-5-sonnet": {
+        "litellm_provider": "vertex_ai-anthropic_models",
+        "mode": "chat",
+    },
+    "sample_spec": {"mode": "one of: chat, embedding"},
+}
+
+
+def test_keys_by_provider_preserves_map_order():
+    index = ModelCostIndex(MODEL_COST)
+
+    assert index.keys_by_provider["openai"] == ("gpt-4o", "GPT-4O-Mini")
+    assert index.keys_by_provider["groq"] == (
+        "groq/llama3-8b-8192",
+        "llama3-8b-8192",
+    )
+    assert "unknown" not in index.keys_by_provider
+    assert len(index) == len(MODEL_COST)
+
+
+def test_key_by_lowercase_maps_aliases():
+    index = ModelCostIndex(MODEL_COST)
+
+    assert index.key_by_lowercase["gpt-4o-mini"] == "GPT-4O-Mini"
+    assert index.key_by_lowercase["gpt-4o"] == "gpt-4o"
+    assert index.key_by_lowercase["sample_spec"] == "sample_spec"
+    assert "gpt-5" not in index.key_by_lowercase
+
+
+def test_get_model_cost_index_rebuilt_after_invalidation(monkeypatch):
+    monkeypatch.setattr(litellm, "model_cost", dict(MODEL_COST))
+    _invalidate_model_cost_lowercase_map()
+    try:
+        index = get_model_cost_index()
+        assert get_model_cost_index() is index
+
+        litellm.model_cost["my-custom-model"] = {"litellm_provider": "openai"}
+        _invalidate_model_cost_lowercase_map()
+
+        rebuilt = get_model_cost_index()
+        assert rebuilt is not index
+        assert "my-custom-model" in rebuilt.keys_by_provider["openai"]
+    finally:
+        _invalidate_model_cost_lowercase_map()
+
+
+def test_add_known_models_uses_provider_index(monkeypatch):
+    monkeypatch.setattr(
+        litellm,
+        "model_cost",
+        {
+            "gpt-test-model": {"litellm_provider": "openai"},
+            "ft:gpt-test-model": {"litellm_provider": "openai"},
+            "vertex_ai/claude-test-model": {
+                "litellm_provider": "vertex_ai-anthropic_models"
+            },
+            "j2-test-chat": {"litellm_provider": "ai21", "mode": "chat"},
+            "j2-test-completion": {"litellm_provider": "ai21", "mode": "completion"},
+            "fireworks-ai-up-to-4b": {"litellm_provider": "fireworks_ai"},
+        },
+    )
+    monkeypatch.setattr(litellm, "open_ai_chat_completion_models", set())
+    monkeypatch.setattr(litellm, "vertex_anthropic_models", set())
+    monkeypatch.setattr(litellm, "ai21_chat_models", set())
+    monkeypatch.setattr(litellm, "ai21_models", set())
+    monkeypatch.setattr(litellm, "fireworks_ai_models", set())
+
+    litellm.add_known_models()
+
+    assert litellm.open_ai_chat_completion_models == {"gpt-test-model"}
+    assert litellm.vertex_anthropic_models == {"claude-test-model"}
+    assert litellm.ai21_chat_models == {"j2-test-chat"}
+    assert litellm.ai21_models == {"j2-test-completion"}
+    assert litellm.fireworks_ai_models == set()
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.raw_sse_passthrough import (
+    RawSSEPassthroughStream,
+    patch_sse_frame_model,
+)
+from litellm.types.utils import ModelResponseStream
+
+API_BASE = "https://my-vllm.example.com/v1"
+
+
+def _frame(content=None, finish_reason=None, usage=None) -> dict:
+    delta = {} if content is None else {"content": content}
+    frame = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "meta-llama/Llama-3.1-8B-Instruct",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    if usage is not None:
+        frame["choices"] = []
+        frame["usage"] = usage
+    return frame
+
+
+FRAMES = [
+    {
+        **_frame("Hello"),
+        "choices": [
+            {
+                "index": 0,
+                "delta": {"role": "assistant", "content": "Hello"},
+                "finish_reason": None,
+            }
+        ],
+    },
+    _frame(" world"),
+    _frame(finish_reason="stop"),
+    _frame(usage={"prompt_tokens": 7, "completion_tokens": 2, "total_tokens": 9}),
+]
+
+
+def _sse_body() -> bytes:
+    lines = [": keep-alive", ""]
+    for frame in FRAMES:
+        lines += ["data: " + json.dumps(frame), ""]
+    lines += ["data: [DONE]", ""]
+    return "\n".join(lines).encode()
+
+
+def test_patch_sse_frame_model():
+    frame = json.dumps(_frame('say "model": "x"'))
+    patched = json.loads(patch_sse_frame_model(frame, "my-model"))
+    assert patched["model"] == "my-model"
+    assert patched["choices"][0]["delta"]["content"] == 'say "model": "x"'
+
+    compact = '{"id":"1","model":"a\\"b","choices":[]}'
+    assert json.loads(patch_sse_frame_model(compact, "c")) == {
+        "id": "1",
+        "model": "c",
+        "choices": [],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.respx()
+async def test_hosted_vllm_raw_sse_passthrough(respx_mock):
+    litellm.disable_aiohttp_transport = True
+    respx_mock.post(f"{API_BASE}/chat/completions").respond(
+        status_code=200,
+        content=_sse_body(),
+        headers={"content-type": "text/event-stream"},
+    )
+    response = await litellm.acompletion(
+        model="hosted_vllm/meta-llama/Llama-3.1-8B-Instruct",
+        messages=[{"role": "user", "content": "hi"}],
+        api_base=API_BASE,
+        stream=True,
+        raw_sse_passthrough=True,
+    )
+    assert isinstance(response, RawSSEPassthroughStream)
+
+    with patch.object(
+        response.logging_obj, "async_success_handler", new=AsyncMock()
+    ) as mock_async_success_handler, patch.object(
+        response.logging_obj, "success_handler"
+    ):
+        frames = [frame async for frame in response.aiter_frames()]
+        await asyncio.sleep(0)
+
+    # forwarded unchanged
+    assert [json.loads(frame) for frame in frames] == FRAMES
+    assert response.logging_obj.completion_start_time is not None
+
+    complete_response = mock_async_success_handler.call_args.args[0]
+    assert complete_response.choices[0].message.content == "Hello world"
+    assert complete_response.choices[0].message.role == "assistant"
+    assert complete_response.usage.prompt_tokens == 7
+    assert complete_response.usage.completion_tokens == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.respx()
+async def test_raw_sse_passthrough_stream_can_be_iterated_as_chunks(respx_mock):
+    litellm.disable_aiohttp_transport = True
+    respx_mock.post(f"{API_BASE}/chat/completions").respond(
+        status_code=200,
+        content=_sse_body(),
+        headers={"content-type": "text/event-stream"},
+    )
+    response = await litellm.acompletion(
+        model="hosted_vllm/meta-llama/Llama-3.1-8B-Instruct",
+        messages=[{"role": "user", "content": "hi"}],
+        api_base=API_BASE,
+        stream=True,
+        raw_sse_passthrough=True,
+    )
+
+    chunks = [chunk async for chunk in response]
+    assert all(isinstance(chunk, ModelResponseStream) for chunk in chunks)
+    content = "".join(
+        chunk.choices[0].delta.content or "" for chunk in chunks if chunk.choices
+    )
+    assert content == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_async_data_generator_forwards_raw_frames():
+    from litellm.proxy import proxy_server
+    from litellm.proxy._types import UserAPIKeyAuth
+
+    stream = MagicMock(spec=RawSSEPassthroughStream)
+
+    async def _aiter_frames():
+        for frame in FRAMES[:2]:
+            yield json.dumps(frame)
+
+    stream.aiter_frames = _aiter_frames
+    mock_proxy_logging_obj = MagicMock()
+    mock_proxy_logging_obj.has_post_call_streaming_hooks.return_value = False
+    mock_proxy_logging_obj.has_streaming_iterator_hooks.return_value = False
+
+    with patch.object(proxy_server, "proxy_logging_obj", mock_proxy_logging_obj):
+        output = [
+            item
+            async for item in proxy_server.async_data_generator(
+                response=stream,
+                user_api_key_dict=UserAPIKeyAuth(api_key="sk-1234"),
+                request_data={"model": "my-llama"},
+            )
+        ]
+
+    assert output[-1] == "data: [DONE]\n\n"
+    payloads = [json.loads(item[len("data: ") :]) for item in output[:-1]]
+    assert [p["model"] for p in payloads] == ["my-llama", "my-llama"]
+    assert payloads[1]["choices"] == FRAMES[1]["choices"]
+    mock_proxy_logging_obj.async_post_call_streaming_iterator_hook.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.respx()
+async def test_raw_sse_passthrough_reuses_incremental_accumulator(
+    respx_mock, monkeypatch
+):
+    litellm.disable_aiohttp_transport = True
+    monkeypatch.setattr(litellm, "incremental_streaming_assembly", True)
+    respx_mock.post(f"{API_BASE}/chat/completions").respond(
+        status_code=200,
+        content=_sse_body(),
+        headers={"content-type": "text/event-stream"},
+    )
+    response = await litellm.acompletion(
+        model="hosted_vllm/meta-llama/Llama-3.1-8B-Instruct",
+        messages=[{"role": "user", "content": "hi"}],
+        api_base=API_BASE,
+        stream=True,
+        raw_sse_passthrough=True,
+    )
+    assert response.chunk_accumulator is not None
+
+    with patch.object(
+        response.logging_obj, "async_success_handler", new=AsyncMock()
+    ), patch.object(response.logging_obj, "success_handler"), patch(
+        "litellm.litellm_core_utils.raw_sse_passthrough.StreamingChunkAccumulator"
+    ) as mock_accumulator_cls:
+        [frame async for frame in response.aiter_frames()]
+        await asyncio.sleep(0)
+
+    # the prompt is only tokenized by one accumulator
+    mock_accumulator_cls.assert_not_called()
+    assert response.chunk_accumulator.chunk_count > 0
+
+
+def test_has_streaming_iterator_hooks_uses_opt_in():
+    from litellm.integrations.custom_guardrail import CustomGuardrail
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy.utils import ProxyLogging
+
+    class UnifiedGuardrail(CustomGuardrail):
+        async def apply_guardrail(
+            self, inputs, request_data, input_type, logging_obj=None
+        ):
+            return inputs
+
+    class RequestOnlyGuardrail(CustomGuardrail):
+        async def apply_guardrail(
+            self, inputs, request_data, input_type, logging_obj=None
+        ):
+            return inputs
+
+        def should_run_post_call_streaming_iterator_hook(self) -> bool:
+            return False
+
+    class IteratorHookLogger(CustomLogger):
+        async def async_post_call_streaming_iterator_hook(
+            self, user_api_key_dict, response, request_data
+        ):
+            async for item in response:
+                yield item
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=MagicMock())
+    for callback, expected in [
+        (CustomLogger(), False),
+        (IteratorHookLogger(), True),
+        (UnifiedGuardrail(default_on=True, event_hook="post_call"), True),
+        (RequestOnlyGuardrail(default_on=True, event_hook="post_call"), False),
+    ]:
+        with patch.object(litellm, "callbacks", [callback]):
+            assert proxy_logging_obj.has_streaming_iterator_hooks({}) is expected
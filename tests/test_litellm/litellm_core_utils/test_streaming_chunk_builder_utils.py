@@ -512,3 +512,159 @@ def test_stream_chunk_builder_anthropic_web_search():
     assert usage.completion_tokens == 27
     assert usage.total_tokens == 77    
     assert usage.server_tool_use['web_search_requests'] == 2
+
+
+def _make_stream_chunk(finish_reason=None, usage=None, model="gpt-4o", **delta_kwargs):
+    chunk = ModelResponseStream(
+        id="chatcmpl-123",
+        created=1234567890,
+        model=model,
+        object="chat.completion.chunk",
+        choices=[
+            StreamingChoices(
+                index=0,
+                delta=Delta(**delta_kwargs),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+    if usage is not None:
+        setattr(chunk, "usage", usage)
+    return chunk
+
+
+def test_streaming_chunk_accumulator_matches_stream_chunk_builder():
+    from litellm import stream_chunk_builder
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingChunkAccumulator,
+    )
+
+    messages = [{"role": "user", "content": "What's the weather in Paris?"}]
+    chunks = [
+        _make_stream_chunk(role="assistant", content=""),
+        _make_stream_chunk(
+            reasoning_content="Let me ",
+            thinking_blocks=[{"type": "thinking", "thinking": "Let me "}],
+        ),
+        _make_stream_chunk(
+            reasoning_content="check.",
+            thinking_blocks=[
+                {"type": "thinking", "thinking": "check.", "signature": "sig"}
+            ],
+        ),
+        _make_stream_chunk(content="Checking ", model="gpt-4o-2024-08-06"),
+        _make_stream_chunk(
+            content="the weather.",
+            provider_specific_fields={"citations": ["a"]},
+        ),
+        _make_stream_chunk(
+            tool_calls=[
+                ChatCompletionDeltaToolCall(
+                    id="call_1",
+                    function=Function(arguments='{"location": ', name="get_weather"),
+                    type="function",
+                    index=0,
+                )
+            ],
+        ),
+        _make_stream_chunk(
+            tool_calls=[
+                ChatCompletionDeltaToolCall(
+                    function=Function(arguments='"Paris"}'), index=0
+                )
+            ],
+            provider_specific_fields={"citations": ["a", "b"]},
+        ),
+        _make_stream_chunk(finish_reason="tool_calls"),
+        _make_stream_chunk(
+            usage=Usage(prompt_tokens=12, completion_tokens=20, total_tokens=32)
+        ),
+    ]
+
+    accumulator = StreamingChunkAccumulator(messages=messages)
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
+
+    expected = stream_chunk_builder(chunks=chunks, messages=messages)
+    response = accumulator.build_response()
+
+    assert response is not None and expected is not None
+    assert response.model_dump() == expected.model_dump()
+    assert response.choices[0].message.content == "Checking the weather."
+    assert response.choices[0].message.tool_calls[0].function.arguments == (
+        '{"location": "Paris"}'
+    )
+    assert response.model == "gpt-4o-2024-08-06"
+    assert response.usage.total_tokens == 32
+    assert accumulator.get_total_usage().total_tokens == 32
+
+
+def test_streaming_chunk_accumulator_includes_updates_to_latest_chunk():
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingChunkAccumulator,
+    )
+
+    accumulator = StreamingChunkAccumulator()
+    first_chunk = _make_stream_chunk(role="assistant", content="Hello")
+    accumulator.add_chunk(first_chunk)
+    # e.g. metadata added to the chunk after it was tracked, before it is returned
+    first_chunk.choices[0].delta.provider_specific_fields = {"mcp_list_tools": []}
+    accumulator.add_chunk(_make_stream_chunk(content=" world", finish_reason="stop"))
+
+    response = accumulator.build_response()
+
+    assert response.choices[0].message.content == "Hello world"
+    assert response.choices[0].message.provider_specific_fields == {
+        "mcp_list_tools": []
+    }
+
+
+def test_streaming_chunk_accumulator_no_chunks():
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingChunkAccumulator,
+    )
+
+    assert StreamingChunkAccumulator().build_response() is None
+
+
+def test_streaming_chunk_accumulator_counts_tokens_without_usage():
+    """
+    Provider returned no usage - prompt tokens are counted in the background,
+    completion / reasoning tokens while the chunks arrive.
+    """
+    from litellm import stream_chunk_builder
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingChunkAccumulator,
+    )
+
+    messages = [{"role": "user", "content": "Tell me a long story " * 200}]
+    words = ["Once", " upon", " a", " time", ", there", " was", " a", " story."] * 300
+    chunks = [_make_stream_chunk(role="assistant", reasoning_content="Let me think ")]
+    chunks += [_make_stream_chunk(content=word) for word in words]
+    chunks.append(
+        _make_stream_chunk(
+            tool_calls=[
+                ChatCompletionDeltaToolCall(
+                    id="call_1",
+                    function=Function(arguments='{"story": "done"}', name="save"),
+                    type="function",
+                    index=0,
+                )
+            ],
+            finish_reason="tool_calls",
+        )
+    )
+
+    accumulator = StreamingChunkAccumulator(
+        messages=messages, count_prompt_tokens_in_background=True
+    )
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
+
+    expected = stream_chunk_builder(chunks=chunks, messages=messages)
+    response = accumulator.build_response()
+
+    assert accumulator.prompt_token_count is not None
+    assert accumulator.completion_token_counter.token_count > 0
+    assert response.usage.model_dump() == expected.usage.model_dump()
+    assert response.usage.completion_tokens_details.reasoning_tokens > 0
@@ -1185,3 +1185,66 @@ def test_is_chunk_non_empty_with_valid_tool_calls(
         )
         is True
     )
+
+
+@pytest.mark.parametrize("sync_mode", [True, False])
+@pytest.mark.asyncio
+async def test_incremental_streaming_assembly(sync_mode: bool, monkeypatch):
+    """
+    With `litellm.incremental_streaming_assembly`, the complete response is built
+    from the accumulator instead of the stored chunks - the result must be the same.
+    """
+    final_chunk = ModelResponseStream(
+        id="chatcmpl-87291500-d8c5-428e-b187-36fe5a4c97ab",
+        created=1742056047,
+        model=None,
+        object="chat.completion.chunk",
+        choices=[
+            StreamingChoices(
+                finish_reason=None, index=0, delta=Delta(content="", role="assistant")
+            )
+        ],
+        usage=Usage(completion_tokens=392, prompt_tokens=1799, total_tokens=2191),
+    )
+
+    async def _stream(incremental: bool) -> CustomStreamWrapper:
+        monkeypatch.setattr(litellm, "incremental_streaming_assembly", incremental)
+        response = CustomStreamWrapper(
+            completion_stream=ModelResponseListIterator(
+                model_responses=bedrock_chunks + [final_chunk]
+            ),
+            model="bedrock/claude-3-5-sonnet-20240620-v1:0",
+            custom_llm_provider="bedrock",
+            logging_obj=Logging(
+                model="bedrock/claude-3-5-sonnet-20240620-v1:0",
+                messages=[{"role": "user", "content": "Hey"}],
+                stream=True,
+                call_type="completion",
+                start_time=time.time(),
+                litellm_call_id="12345",
+                function_id="1245",
+            ),
+        )
+        if sync_mode:
+            for _ in response:
+                pass
+        else:
+            async for _ in response:
+                pass
+        return response
+
+    chunk_list_response = await _stream(incremental=False)
+    incremental_response = await _stream(incremental=True)
+
+    assert incremental_response.chunk_accumulator is not None
+    assert len(incremental_response.chunks) <= litellm.REPEATED_STREAMING_CHUNK_LIMIT
+    assert (
+        incremental_response.response_uptil_now
+        == chunk_list_response.response_uptil_now
+    )
+    expected = chunk_list_response._build_complete_streaming_response()
+    complete_response = incremental_response._build_complete_streaming_response()
+    assert complete_response.model_dump(exclude={"id", "created"}) == expected.model_dump(
+        exclude={"id", "created"}
+    )
+    assert complete_response.usage.total_tokens == 2191
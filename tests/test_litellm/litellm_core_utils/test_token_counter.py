@@ -991,3 +991,109 @@ def test_token_counter_with_thinking_content():
     # Should only count "Response" and message overhead
     assert tokens_no_thinking < 15, f"Expected minimal token count for empty thinking block, got {tokens_no_thinking}"
 
+
+
+@pytest.mark.parametrize("model", ["gpt-3.5-turbo", "gpt-4o"])
+def test_incremental_token_counter_matches_token_counter(model):
+    from litellm.litellm_core_utils.token_counter import IncrementalTokenCounter
+
+    counter = IncrementalTokenCounter(model=model, flush_size=64)
+    # deltas cut mid-word / mid-whitespace, like provider stream chunks
+    deltas = [text[i : i + 7] for i in range(0, len(text), 7)]
+    for delta in deltas:
+        counter.add_text(delta)
+
+    assert counter.token_count > 0  # tokenized while streaming
+    assert counter.get_token_count() == token_counter_new(
+        model=model, text=text, count_response_tokens=True
+    )
+    assert counter.get_token_count(suffix='{"a": 1}') == token_counter_new(
+        model=model, text=text + '{"a": 1}', count_response_tokens=True
+    )
+
+
+def test_incremental_token_counter_without_split_points():
+    from litellm.litellm_core_utils.token_counter import IncrementalTokenCounter
+
+    counter = IncrementalTokenCounter(flush_size=8)
+    for _ in range(100):
+        counter.add_text("0123456789")
+
+    assert counter.token_count == 0
+    assert counter.get_token_count() == token_counter_new(text="0123456789" * 100)
+
+
+def test_token_counter_caches_long_texts(monkeypatch):
+    import tiktoken
+
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    token_counter_module._token_count_cache.clear()
+    system_prompt = "You are a helpful assistant. " * 50
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": "Hi"},
+    ]
+    expected = token_counter_new(model="gpt-4o", messages=messages)
+
+    encode_calls = []
+    original_encode = tiktoken.Encoding.encode
+
+    def _counting_encode(self, text, *args, **kwargs):
+        encode_calls.append(text)
+        return original_encode(self, text, *args, **kwargs)
+
+    monkeypatch.setattr(tiktoken.Encoding, "encode", _counting_encode)
+    assert token_counter_new(model="gpt-4o", messages=messages) == expected
+    # the system prompt is cached, short texts are always re-encoded
+    assert system_prompt not in encode_calls
+    assert "Hi" in encode_calls
+    assert token_counter_module._token_count_cache.hits >= 1
+
+
+def test_calculate_img_tokens_caches_high_detail_images():
+    from litellm.litellm_core_utils.image_metadata_cache import image_metadata_cache
+    from litellm.litellm_core_utils.token_counter import calculate_img_tokens
+
+    image_metadata_cache.clear()
+    with patch.object(
+        image_metadata_cache, "_resolve_dimensions", return_value=(1024, 1024)
+    ) as mock_resolve_dimensions:
+        first = calculate_img_tokens(data="https://example.com/cat.png", mode="high")
+        second = calculate_img_tokens(data="https://example.com/cat.png", mode="high")
+
+    assert first == second == 765
+    assert mock_resolve_dimensions.call_count == 1
+
+
+@pytest.mark.parametrize("model", ["gpt-4o", "gpt-3.5-turbo", ""])
+def test_batch_token_counter_matches_token_counter(model):
+    from litellm import batch_token_counter
+
+    system_message = {"role": "system", "content": "Follow the rules. " * 30}
+    conversations = [
+        [system_message, {"role": "user", "content": f"Question {i}: {text[:200]}"}]
+        for i in range(5)
+    ] + [MESSAGES_WITH_TOOLS]
+
+    assert batch_token_counter(model=model, messages_list=conversations) == [
+        token_counter_new(model=model, messages=messages)
+        for messages in conversations
+    ]
+    texts = ["hello world", text, "hello world", ""]
+    assert batch_token_counter(model=model, texts=texts) == [
+        token_counter_new(model=model, text=t) for t in texts
+    ]
+
+
+def test_batch_token_counter_huggingface_tokenizer():
+    from litellm.litellm_core_utils.token_counter import batch_token_counter
+
+    tokenizer = MagicMock()
+    tokenizer.encode_batch.return_value = [MagicMock(ids=[1, 2]), MagicMock(ids=[3])]
+    custom_tokenizer = {"type": "huggingface_tokenizer", "tokenizer": tokenizer}
+
+    assert batch_token_counter(
+        custom_tokenizer=custom_tokenizer, texts=["a b", "c"]
+    ) == [2, 1]
+    tokenizer.encode_batch.assert_called_once_with(["a b", "c"])
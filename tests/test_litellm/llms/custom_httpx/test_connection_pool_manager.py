@@ -0,0 +1,362 @@
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import httpcore
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.llms.custom_httpx.connection_pool_manager import (
+    HTTPCORE_POOL_STATS_SUPPORTED,
+    ConnectionPoolManager,
+    ConnectionPoolRoutingTransport,
+    connection_pool_manager,
+    get_origin_key,
+)
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+
+async def _handle_http_connection(reader, writer):
+    # minimal keep-alive HTTP/1.1 server, answers every request with "ok"
+    try:
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            body = b"" if request.startswith(b"HEAD") else b"ok"
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n" + body)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _start_server():
+    server = await asyncio.start_server(_handle_http_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def _start_blocking_server(release: asyncio.Event):
+    # answers each request once `release` is set, to hold requests in flight
+    async def _handle(reader, writer):
+        await release.wait()
+        await _handle_http_connection(reader, writer)
+
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_pool_manager():
+    connection_pool_manager.reset()
+    yield
+    connection_pool_manager.reset()
+
+
+def test_register_deployment():
+    manager = ConnectionPoolManager()
+    assert manager.register_deployment({"model": "openai/gpt-4o"}) is None
+    assert manager.has_pools() is False
+
+    api_base = manager.register_deployment(
+        {
+            "model": "openai/gpt-4o",
+            "api_base": "https://example.com/v1",
+            "max_connections": 20,
+            "keepalive_expiry": 30,
+        }
+    )
+    assert api_base == "https://example.com/v1"
+    assert manager.has_pools() is True
+
+    # pools are shared by all paths on the same origin
+    settings = manager.get_settings("https://example.com/v1/chat/completions")
+    assert settings is not None
+    assert settings.get_limits().max_connections == 20
+    assert settings.get_limits().keepalive_expiry == 30
+    # keepalive connections default to max_connections
+    assert settings.get_limits().max_keepalive_connections == 20
+    assert manager.get_settings("https://other.example.com/v1") is None
+
+
+def test_register_deployment_without_api_base():
+    manager = ConnectionPoolManager()
+    assert (
+        manager.register_deployment({"model": "openai/gpt-4o", "max_connections": 5})
+        is None
+    )
+    assert manager.has_pools() is False
+
+
+def test_register_deployment_http2_without_h2():
+    manager = ConnectionPoolManager()
+    with patch.object(manager, "_is_http2_available", return_value=False):
+        manager.register_deployment(
+            {"model": "openai/gpt-4o", "api_base": "https://example.com", "http2": True}
+        )
+    settings = manager.get_settings("https://example.com")
+    assert settings is not None
+    assert settings.http2 is False
+
+
+@pytest.mark.asyncio
+async def test_get_transport_is_reused_per_origin():
+    manager = ConnectionPoolManager()
+    manager.register_deployment(
+        {
+            "model": "openai/gpt-4o",
+            "api_base": "https://example.com",
+            "max_connections": 5,
+        }
+    )
+    origin = ("https", "example.com", None)
+    transport = manager.get_transport(origin, True)
+    assert transport is not None
+    assert manager.get_transport(origin, True) is transport
+    assert manager.get_transport(("https", "other.example.com", None), True) is None
+
+    # changed settings replace the pool
+    manager.register_deployment(
+        {
+            "model": "openai/gpt-4o",
+            "api_base": "https://example.com",
+            "max_connections": 10,
+        }
+    )
+    assert manager.get_transport(origin, True) is not transport
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_replaced_pool_is_closed_once_idle():
+    release = asyncio.Event()
+    server, api_base = await _start_blocking_server(release)
+    manager = ConnectionPoolManager()
+    try:
+        manager.register_deployment(
+            {"model": "openai/gpt-4o", "api_base": api_base, "max_connections": 1}
+        )
+        transport = manager.get_transport(get_origin_key(api_base), True)
+        assert transport is not None
+        client = httpx.AsyncClient(
+            transport=ConnectionPoolRoutingTransport(
+                default_transport=None, verify=True, pool_manager=manager
+            )
+        )
+        in_flight = asyncio.create_task(client.get(f"{api_base}/v1/models"))
+        await asyncio.sleep(0.05)
+
+        # changed settings replace the pool, the old one waits for its request
+        with patch.object(
+            transport, "aclose", wraps=transport.aclose
+        ) as mock_transport_aclose:
+            manager.register_deployment(
+                {"model": "openai/gpt-4o", "api_base": api_base, "max_connections": 2}
+            )
+            assert len(manager._close_tasks) == 1
+            await asyncio.sleep(0.2)
+            mock_transport_aclose.assert_not_called()
+
+            release.set()
+            response = await in_flight
+            assert response.text == "ok"
+            await asyncio.gather(*manager._close_tasks)
+            mock_transport_aclose.assert_awaited_once()
+        assert len(manager._close_tasks) == 0
+
+        await client.aclose()
+        await manager.aclose()
+    finally:
+        release.set()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_get_pool_stats_reads_httpcore_pool():
+    """
+    `get_pool_stats` reads httpcore internals - fails if a new httpcore changes them.
+    """
+    assert HTTPCORE_POOL_STATS_SUPPORTED, (
+        "connection pool stats are disabled for httpcore=="
+        f"{httpcore.__version__}, check `_get_pool_stats` against it"
+    )
+    release = asyncio.Event()
+    server, api_base = await _start_blocking_server(release)
+    try:
+        connection_pool_manager.register_deployment(
+            {"model": "openai/gpt-4o", "api_base": api_base, "max_connections": 1}
+        )
+        client = httpx.AsyncClient(
+            transport=ConnectionPoolRoutingTransport(
+                default_transport=None, verify=True
+            )
+        )
+        requests = [
+            asyncio.create_task(client.get(f"{api_base}/v1/models")) for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        assert connection_pool_manager.get_pool_stats()[api_base] == {
+            "active": 1,
+            "idle": 0,
+            "waiting": 1,
+        }
+
+        release.set()
+        await asyncio.gather(*requests)
+        assert connection_pool_manager.get_pool_stats()[api_base] == {
+            "active": 0,
+            "idle": 1,
+            "waiting": 0,
+        }
+        await client.aclose()
+        await connection_pool_manager.aclose()
+    finally:
+        release.set()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_routing_transport_uses_deployment_pool():
+    server, api_base = await _start_server()
+    try:
+        connection_pool_manager.register_deployment(
+            {"model": "openai/gpt-4o", "api_base": api_base, "max_connections": 2}
+        )
+        default_transport = httpx.MockTransport(lambda request: httpx.Response(204))
+        client = httpx.AsyncClient(
+            transport=ConnectionPoolRoutingTransport(
+                default_transport=default_transport, verify=True
+            )
+        )
+
+        response = await client.get(f"{api_base}/v1/models")
+        assert response.status_code == 200
+        assert response.text == "ok"
+        stats = connection_pool_manager.get_pool_stats()
+        assert stats[api_base] == {"active": 0, "idle": 1, "waiting": 0}
+
+        # origins without a pool use the default transport
+        response = await client.get("https://example.com/v1/models")
+        assert response.status_code == 204
+
+        await client.aclose()
+        await connection_pool_manager.aclose()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_connections():
+    server, api_base = await _start_server()
+    try:
+        connection_pool_manager.register_deployment(
+            {
+                "model": "openai/gpt-4o",
+                "api_base": f"{api_base}/v1",
+                "warmup_connections": 3,
+            }
+        )
+        opened = await connection_pool_manager.warmup(api_base=f"{api_base}/v1")
+        assert opened == 3
+        stats = connection_pool_manager.get_pool_stats()
+        assert stats[api_base]["idle"] == 3
+        await connection_pool_manager.aclose()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_warmup_unreachable_api_base():
+    connection_pool_manager.register_deployment(
+        {
+            "model": "openai/gpt-4o",
+            "api_base": "http://127.0.0.1:1",
+            "warmup_connections": 2,
+        }
+    )
+    assert await connection_pool_manager.warmup(api_base="http://127.0.0.1:1") == 0
+    await connection_pool_manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_http_handler_uses_routing_transport():
+    connection_pool_manager.register_deployment(
+        {"model": "openai/gpt-4o", "api_base": "https://example.com", "http2": False}
+    )
+    handler = AsyncHTTPHandler()
+    assert isinstance(handler.client._transport, ConnectionPoolRoutingTransport)
+    await handler.close()
+
+
+@pytest.mark.asyncio
+async def test_router_registers_deployment_pool():
+    server, api_base = await _start_server()
+    try:
+        router = litellm.Router(
+            model_list=[
+                {
+                    "model_name": "gpt-4o",
+                    "litellm_params": {
+                        "model": "openai/gpt-4o",
+                        "api_key": "sk-test",
+                        "api_base": api_base,
+                        "max_connections": 4,
+                        "warmup_connections": 2,
+                    },
+                }
+            ]
+        )
+        settings = connection_pool_manager.get_settings(api_base)
+        assert settings is not None
+        assert settings.max_connections == 4
+
+        # warmup runs in the background on the running loop, and the router
+        # holds the task until it finishes
+        warmup_task = router._connection_pool_warmup_tasks[api_base]
+        assert await warmup_task == 2
+        await asyncio.sleep(0)
+        assert api_base not in router._connection_pool_warmup_tasks
+        stats = connection_pool_manager.get_pool_stats().get(api_base)
+        assert stats == {"active": 0, "idle": 2, "waiting": 0}
+
+        # pool params are not sent to the provider
+        deployment = router.get_model_list()[0]
+        assert deployment["litellm_params"]["max_connections"] == 4
+        assert "max_connections" in litellm.types.utils.all_litellm_params
+        await connection_pool_manager.aclose()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_connection_pool_collector():
+    pytest.importorskip("prometheus_client")
+    from litellm.integrations.prometheus_helpers.connection_pool_collector import (
+        ConnectionPoolCollector,
+    )
+
+    with patch.object(
+        connection_pool_manager,
+        "get_pool_stats",
+        return_value={"https://example.com": {"active": 1, "idle": 2, "waiting": 3}},
+    ):
+        metrics = {m.name: m for m in ConnectionPoolCollector().collect()}
+
+    for name, value in [
+        ("litellm_deployment_connection_pool_active_connections", 1),
+        ("litellm_deployment_connection_pool_idle_connections", 2),
+        ("litellm_deployment_connection_pool_waiting_requests", 3),
+    ]:
+        samples = metrics[name].samples
+        assert samples[0].labels == {"api_base": "https://example.com"}
+        assert samples[0].value == value
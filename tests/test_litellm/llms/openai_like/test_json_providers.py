@@ -167,6 +167,14 @@ class TestJSONProviderLoader:
         assert config is not None
         assert config.custom_llm_provider == "publicai"
 
+    def test_create_config_class_is_memoized(self):
+        """Test that a provider's config class is generated once"""
+        from litellm.llms.openai_like.dynamic_config import create_config_class
+        from litellm.llms.openai_like.json_loader import JSONProviderRegistry
+
+        provider = JSONProviderRegistry.get("publicai")
+        assert create_config_class(provider) is create_config_class(provider)
+
 
 class TestPublicAIIntegration:
     """Integration tests for PublicAI provider"""
@@ -0,0 +1,117 @@
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.auth.auth_checks import (
+    _check_model_access_helper,
+    _model_matches_any_wildcard_pattern_in_list,
+    model_in_access_group,
+)
+from litellm.proxy.auth.model_access_index import (
+    ModelAccessIndex,
+    clear_model_access_indexes,
+    get_model_access_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes():
+    clear_model_access_indexes()
+    yield
+    clear_model_access_indexes()
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        "gpt-4o",
+        "openai/gpt-4o",
+        "bedrock/us.amazon.nova-micro-v1:0",
+        "bedrockzzzz/us.amazon.nova-micro-v1:0",
+        "claude-3-5-sonnet-20240620",
+        "vertex_ai/gemini-pro",
+        "gemini-pro",
+    ],
+)
+def test_index_wildcard_matches_pattern_list(model):
+    allowed_model_list = ["bedrock/us.*", "anthropic/*", "vertex_ai/*", "gpt-4"]
+    index = ModelAccessIndex(frozenset(allowed_model_list))
+    assert index.matches_wildcard(
+        model
+    ) == _model_matches_any_wildcard_pattern_in_list(
+        model=model, allowed_model_list=allowed_model_list
+    )
+
+
+def test_index_ignores_invalid_wildcard_pattern():
+    index = ModelAccessIndex(frozenset(["openai/(*", "anthropic/*"]))
+    assert index.matches_wildcard("anthropic/claude-3-5-sonnet-20240620") is True
+    assert index.matches_wildcard("openai/gpt-4o") is False
+
+
+@pytest.mark.parametrize(
+    "models, expected",
+    [
+        ([], True),
+        (["*"], True),
+        (["all-proxy-models"], True),
+        (["gpt-4o"], False),
+    ],
+)
+def test_index_all_model_access(models, expected):
+    assert get_model_access_index(models).allows_model_name("gpt-4") is expected
+
+
+def test_get_model_access_index_is_compiled_once_per_models_list():
+    models = ["gpt-4o", "anthropic/*"]
+    index = get_model_access_index(models)
+
+    assert get_model_access_index(models) is index
+    # an equal list (e.g. after a cache refill) shares the index
+    assert get_model_access_index(list(reversed(models))) is index
+    # a changed list gets a new index
+    models.append("gpt-4o-mini")
+    new_index = get_model_access_index(models)
+    assert new_index is not index
+    assert new_index.allows_model_name("gpt-4o-mini") is True
+
+
+def test_check_model_access_helper_skips_router_for_allowed_models():
+    llm_router = MagicMock()
+    llm_router.get_model_access_groups.return_value = {}
+
+    assert _check_model_access_helper(
+        model="gpt-4o", llm_router=llm_router, models=["gpt-3.5-turbo", "gpt-4o"]
+    )
+    llm_router.get_model_access_groups.assert_not_called()
+
+    assert not _check_model_access_helper(
+        model="gpt-4", llm_router=llm_router, models=["gpt-3.5-turbo", "gpt-4o"]
+    )
+    llm_router.get_model_access_groups.assert_called_once_with(
+        model_name="gpt-4", team_id=None
+    )
+
+
+def test_check_model_access_helper_access_groups():
+    llm_router = MagicMock()
+    llm_router.get_model_access_groups.return_value = {"beta-models": ["gpt-4"]}
+
+    assert _check_model_access_helper(
+        model="gpt-4", llm_router=llm_router, models=["beta-models"], team_id="team-1"
+    )
+    llm_router.get_model_access_groups.assert_called_once_with(
+        model_name="gpt-4", team_id="team-1"
+    )
+    assert model_in_access_group(
+        model="gpt-4", team_models=["beta-models"], llm_router=llm_router
+    )
+    assert not model_in_access_group(
+        model="gpt-4", team_models=["other-models"], llm_router=llm_router
+    )
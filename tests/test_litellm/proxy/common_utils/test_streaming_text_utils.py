@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.common_utils.streaming_text_utils import LazyStreamedText
+
+
+def test_lazy_streamed_text():
+    text = LazyStreamedText()
+    assert not text
+    assert str(text) == ""
+
+    text.append("Hello")
+    text.append("")
+    text.append(" wor")
+    assert len(text) == 9
+    assert str(text) == "Hello wor"
+    assert text + "ld" == "Hello world"
+
+    text.append("ld")
+    assert text == "Hello world"
+    assert len(text) == 11
+
+
+def test_lazy_streamed_text_only_joins_new_parts():
+    text = LazyStreamedText()
+    text.append("a" * 10)
+    str(text)
+    assert text._pending_parts == []
+
+    text.append("b")
+    assert text._pending_parts == ["b"]
+    assert str(text) == "a" * 10 + "b"
+    assert text._pending_parts == []
@@ -0,0 +1,175 @@
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.redis_cache import RedisCache
+from litellm.constants import (
+    REDIS_DAILY_TAG_SPEND_UPDATE_BUFFER_KEY,
+    REDIS_UPDATE_BUFFER_KEY,
+)
+from litellm.proxy._types import DBSpendUpdateTransactions
+from litellm.proxy.db.db_transaction_queue.redis_update_buffer import (
+    REDIS_HASH_BUFFER_KEY_SUFFIX,
+    RedisUpdateBuffer,
+)
+from litellm.types.services import ServiceTypes
+
+
+@pytest.fixture
+def redis_cache():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    fake_redis_client = fakeredis.FakeAsyncRedis()
+    with patch("litellm._redis.get_redis_client", return_value=fakeredis.FakeRedis()):
+        redis_cache = RedisCache(host="localhost", port=6379)
+    redis_cache.init_async_client = lambda: fake_redis_client  # type: ignore
+    return redis_cache
+
+
+@pytest.fixture(autouse=True)
+def no_buffer_events():
+    with patch.object(
+        RedisUpdateBuffer, "_emit_new_item_added_to_redis_buffer_event", AsyncMock()
+    ):
+        yield
+
+
+def _db_spend_update_transactions(**transactions) -> DBSpendUpdateTransactions:
+    combined = RedisUpdateBuffer._combine_list_of_transactions([])
+    combined.update(transactions)  # type: ignore
+    return combined
+
+
+def _daily_tag_transaction(spend: float, request_id: str) -> dict:
+    return {
+        "tag": "prod",
+        "date": "2025-01-01",
+        "api_key": "hashed-key",
+        "model": "gpt-4o",
+        "model_group": "gpt-4o",
+        "mcp_namespaced_tool_name": None,
+        "custom_llm_provider": "openai",
+        "endpoint": "/chat/completions",
+        "request_id": request_id,
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "cache_read_input_tokens": 0,
+        "cache_creation_input_tokens": 0,
+        "spend": spend,
+        "api_requests": 1,
+        "successful_requests": 1,
+        "failed_requests": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_hash_buffer_aggregates_spend_updates_across_pods(redis_cache):
+    pods = [RedisUpdateBuffer(redis_cache=redis_cache) for _ in range(2)]
+    with patch.object(RedisUpdateBuffer, "_use_redis_hash_buffer", return_value=True):
+        for pod in pods:
+            await pod._store_transactions_in_redis(
+                transactions=_db_spend_update_transactions(
+                    key_list_transactions={"sk-hash:1": 0.5, "sk-hash-2": 1.0},
+                    team_list_transactions={"team-1": 0.25},
+                ),
+                redis_key=REDIS_UPDATE_BUFFER_KEY,
+                service_type=ServiceTypes.REDIS_SPEND_UPDATE_QUEUE,
+            )
+
+        fake_redis_client = redis_cache.init_async_client()
+        assert await fake_redis_client.llen(REDIS_UPDATE_BUFFER_KEY) == 0
+        assert (
+            await fake_redis_client.hlen(
+                REDIS_UPDATE_BUFFER_KEY + REDIS_HASH_BUFFER_KEY_SUFFIX
+            )
+            == 3
+        )
+
+        transactions = await pods[0].get_all_update_transactions_from_redis_buffer()
+        assert transactions is not None
+        assert transactions["key_list_transactions"] == {
+            "sk-hash:1": 1.0,
+            "sk-hash-2": 2.0,
+        }
+        assert transactions["team_list_transactions"] == {"team-1": 0.5}
+        assert transactions["user_list_transactions"] == {}
+
+        # the hash is deleted when read
+        assert await pods[0].get_all_update_transactions_from_redis_buffer() is None
+
+
+@pytest.mark.asyncio
+async def test_hash_buffer_aggregates_daily_spend_updates(redis_cache):
+    pods = [RedisUpdateBuffer(redis_cache=redis_cache) for _ in range(3)]
+    with patch.object(RedisUpdateBuffer, "_use_redis_hash_buffer", return_value=True):
+        for i, pod in enumerate(pods):
+            await pod._store_transactions_in_redis(
+                transactions={
+                    "prod_2025-01-01_gpt-4o": _daily_tag_transaction(
+                        spend=0.1, request_id=f"req-{i}"
+                    )
+                },
+                redis_key=REDIS_DAILY_TAG_SPEND_UPDATE_BUFFER_KEY,
+                service_type=ServiceTypes.REDIS_DAILY_TAG_SPEND_UPDATE_QUEUE,
+            )
+
+        transactions = (
+            await pods[0].get_all_daily_tag_spend_update_transactions_from_redis_buffer()
+        )
+
+    assert transactions is not None
+    transaction = transactions["prod_2025-01-01_gpt-4o"]
+    assert transaction["spend"] == pytest.approx(0.3)
+    assert transaction["prompt_tokens"] == 30
+    assert transaction["completion_tokens"] == 60
+    assert transaction["api_requests"] == 3
+    assert transaction["failed_requests"] == 0
+    assert transaction["tag"] == "prod"
+    assert transaction["model"] == "gpt-4o"
+    assert transaction["mcp_namespaced_tool_name"] is None
+    assert transaction["request_id"] == "req-0"  # first pod's, like the list buffer
+
+
+@pytest.mark.asyncio
+async def test_hash_buffer_reads_list_buffer_entries(redis_cache):
+    """
+    Pods still on the list buffer (e.g. during a rolling deploy) aren't dropped
+    """
+    list_pod = RedisUpdateBuffer(redis_cache=redis_cache)
+    hash_pod = RedisUpdateBuffer(redis_cache=redis_cache)
+    transactions = _db_spend_update_transactions(
+        user_list_transactions={"user-1": 1.0}
+    )
+
+    with patch.object(RedisUpdateBuffer, "_use_redis_hash_buffer", return_value=False):
+        await list_pod._store_transactions_in_redis(
+            transactions=transactions,
+            redis_key=REDIS_UPDATE_BUFFER_KEY,
+            service_type=ServiceTypes.REDIS_SPEND_UPDATE_QUEUE,
+        )
+    with patch.object(RedisUpdateBuffer, "_use_redis_hash_buffer", return_value=True):
+        await hash_pod._store_transactions_in_redis(
+            transactions=transactions,
+            redis_key=REDIS_UPDATE_BUFFER_KEY,
+            service_type=ServiceTypes.REDIS_SPEND_UPDATE_QUEUE,
+        )
+        combined = await hash_pod.get_all_update_transactions_from_redis_buffer()
+
+    assert combined is not None
+    assert combined["user_list_transactions"] == {"user-1": 2.0}
+
+
+def test_use_redis_hash_buffer_setting():
+    with patch(
+        "litellm.proxy.proxy_server.general_settings",
+        {"redis_transaction_buffer_mode": "hash"},
+    ):
+        assert RedisUpdateBuffer._use_redis_hash_buffer() is True
+    with patch("litellm.proxy.proxy_server.general_settings", {}):
+        assert RedisUpdateBuffer._use_redis_hash_buffer() is False
@@ -2065,3 +2065,216 @@ class TestGetTotalTokensFromUsageCacheExclusion:
         """Should handle None usage gracefully."""
         result = handler._get_total_tokens_from_usage(None, "total")
         assert result == 0, f"Expected 0 for None usage, got {result}"
+
+
+class MockRedisRateLimiterScripts:
+    """In-memory stand-in for the batch and lease Lua scripts, shared across pods."""
+
+    def __init__(self):
+        self.values: Dict[str, int] = {}
+        self.calls = 0
+
+    def _get_window_counter(self, window_key, counter_key, now, window_size):
+        window_start = self.values.get(window_key)
+        if window_start is None or (now - window_start) >= window_size:
+            self.values[window_key] = now
+            self.values[counter_key] = 0
+        return self.values[window_key], self.values.get(counter_key, 0)
+
+    async def batch_rate_limiter_script(self, keys, args):
+        self.calls += 1
+        now, window_size = args[0], args[1]
+        results = []
+        for i in range(0, len(keys), 2):
+            window_start, counter = self._get_window_counter(
+                keys[i], keys[i + 1], now, window_size
+            )
+            self.values[keys[i + 1]] = counter + 1
+            results.extend([str(window_start), counter + 1])
+        return results
+
+    async def lease_rate_limiter_script(self, keys, args):
+        self.calls += 1
+        now, window_size = args[0], args[1]
+        results = []
+        for i in range(0, len(keys), 2):
+            arg_index = 2 + (i // 2) * 3
+            lease_size, limit, fallback_increment = args[arg_index : arg_index + 3]
+            window_start, counter = self._get_window_counter(
+                keys[i], keys[i + 1], now, window_size
+            )
+            granted = 0
+            if lease_size > 0 and limit - counter >= lease_size:
+                granted = lease_size
+                counter += lease_size
+            else:
+                counter += fallback_increment
+            self.values[keys[i + 1]] = counter
+            results.extend([str(window_start), counter, granted])
+        return results
+
+
+def _create_lease_mode_handler(
+    monkeypatch, scripts: MockRedisRateLimiterScripts, time_controller
+) -> _PROXY_MaxParallelRequestsHandler:
+    monkeypatch.setenv("LITELLM_RATE_LIMIT_LEASE_FRACTION", "0.1")
+    handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(DualCache()),
+        time_provider=time_controller.now,
+    )
+    handler.batch_rate_limiter_script = scripts.batch_rate_limiter_script
+    handler.lease_rate_limiter_script = scripts.lease_rate_limiter_script
+    return handler
+
+
+def _rpm_descriptor(rpm_limit: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "key": "api_key",
+            "value": "hashed-key",
+            "rate_limit": {"requests_per_unit": rpm_limit},
+        }
+    ]
+
+
+def test_lease_mode_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("LITELLM_RATE_LIMIT_LEASE_FRACTION", raising=False)
+    handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(DualCache())
+    )
+    assert handler.lease_fraction == 0
+    assert handler.lease_rate_limiter_script is None
+    assert handler._get_lease_size(1000) == 0
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_spends_requests_locally(monkeypatch, time_controller):
+    """
+    Requests are counted against a local lease, with renewals in the background,
+    instead of a Redis call per request
+    """
+    scripts = MockRedisRateLimiterScripts()
+    handler = _create_lease_mode_handler(monkeypatch, scripts, time_controller)
+    counter_key = handler.create_rate_limit_keys("api_key", "hashed-key", "requests")
+
+    for i in range(49):
+        response = await handler.should_rate_limit(
+            descriptors=_rpm_descriptor(rpm_limit=1000)
+        )
+        assert response["overall_code"] == "OK"
+        # lease of 100 requests, this request is reported as the (i + 1)th
+        assert response["statuses"][0]["limit_remaining"] == 1000 - (i + 1)
+        await asyncio.sleep(0)
+
+    assert scripts.calls == 1
+    assert scripts.values[counter_key] == 100
+    assert handler._request_leases[counter_key]["remaining"] == 51
+
+    # renewal kicks in once half of the lease is spent
+    await handler.should_rate_limit(descriptors=_rpm_descriptor(rpm_limit=1000))
+    await asyncio.sleep(0)
+    assert scripts.calls == 2
+    assert scripts.values[counter_key] == 200
+    assert handler._request_leases[counter_key]["remaining"] == 150
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_falls_back_to_exact_checks_near_limit(
+    monkeypatch, time_controller
+):
+    """
+    Two pods share a limit of 100 with leases of 10, and no more than 100 requests
+    are allowed in total
+    """
+    scripts = MockRedisRateLimiterScripts()
+    pods = [
+        _create_lease_mode_handler(monkeypatch, scripts, time_controller)
+        for _ in range(2)
+    ]
+
+    allowed = 0
+    for i in range(150):
+        response = await pods[i % 2].should_rate_limit(
+            descriptors=_rpm_descriptor(rpm_limit=100)
+        )
+        await asyncio.sleep(0)
+        if response["overall_code"] == "OK":
+            allowed += 1
+
+    assert allowed == 100
+    # leased blocks were only granted while the limit had room for them
+    assert scripts.calls < 150
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_drops_lease_when_window_expires(
+    monkeypatch, time_controller
+):
+    scripts = MockRedisRateLimiterScripts()
+    handler = _create_lease_mode_handler(monkeypatch, scripts, time_controller)
+    counter_key = handler.create_rate_limit_keys("api_key", "hashed-key", "requests")
+
+    for _ in range(3):
+        await handler.should_rate_limit(descriptors=_rpm_descriptor(rpm_limit=100))
+    assert scripts.calls == 1
+
+    time_controller.advance(handler.window_size)
+    response = await handler.should_rate_limit(
+        descriptors=_rpm_descriptor(rpm_limit=100)
+    )
+    assert scripts.calls == 2
+    assert response["statuses"][0]["limit_remaining"] == 99
+    assert handler._request_leases[counter_key]["remaining"] == 9
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_prunes_leases_of_idle_keys(monkeypatch, time_controller):
+    """
+    Leases of keys that stop sending requests are dropped once their window ends
+    """
+    scripts = MockRedisRateLimiterScripts()
+    handler = _create_lease_mode_handler(monkeypatch, scripts, time_controller)
+    idle_descriptors = [
+        {
+            "key": "api_key",
+            "value": "idle-key",
+            "rate_limit": {"requests_per_unit": 100},
+        }
+    ]
+    idle_counter_key = handler.create_rate_limit_keys(
+        "api_key", "idle-key", "requests"
+    )
+    active_counter_key = handler.create_rate_limit_keys(
+        "api_key", "hashed-key", "requests"
+    )
+
+    await handler.should_rate_limit(descriptors=idle_descriptors)
+    assert idle_counter_key in handler._request_leases
+
+    time_controller.advance(handler.window_size)
+    await handler.should_rate_limit(descriptors=_rpm_descriptor(rpm_limit=100))
+    assert idle_counter_key not in handler._request_leases
+    assert active_counter_key in handler._request_leases
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_keeps_exact_counters_for_tokens(monkeypatch, time_controller):
+    scripts = MockRedisRateLimiterScripts()
+    handler = _create_lease_mode_handler(monkeypatch, scripts, time_controller)
+    descriptors = [
+        {
+            "key": "api_key",
+            "value": "hashed-key",
+            "rate_limit": {"requests_per_unit": 1000, "tokens_per_unit": 1000},
+        }
+    ]
+
+    for _ in range(3):
+        await handler.should_rate_limit(descriptors=descriptors)
+
+    # the requests counter is leased once, the tokens counter goes to Redis each time
+    assert scripts.calls == 3
+    requests_key = handler.create_rate_limit_keys("api_key", "hashed-key", "requests")
+    tokens_key = handler.create_rate_limit_keys("api_key", "hashed-key", "tokens")
+    assert scripts.values[requests_key] == 100
+    assert scripts.values[tokens_key] == 3
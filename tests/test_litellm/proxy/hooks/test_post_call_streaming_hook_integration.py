@@ -271,3 +271,101 @@ async def test_streaming_hook_handles_exceptions():
                 response=original_response,
                 user_api_key_dict=user_api_key_dict,
             )
+
+
+def _make_stream_chunk(content: str) -> ModelResponseStream:
+    return ModelResponseStream(
+        id="stream",
+        choices=[StreamingChoices(delta=Delta(content=content), index=0)],
+        model="test-model",
+    )
+
+
+async def _run_async_data_generator(proxy_logging, chunks):
+    from litellm.proxy import proxy_server
+
+    async def _iterator_hook(user_api_key_dict, response, request_data):
+        for chunk in chunks:
+            yield chunk
+
+    proxy_logging.async_post_call_streaming_iterator_hook = _iterator_hook
+    with patch.object(proxy_server, "proxy_logging_obj", proxy_logging):
+        return [
+            item
+            async for item in proxy_server.async_data_generator(
+                response=MagicMock(),
+                user_api_key_dict=UserAPIKeyAuth(api_key="test-key"),
+                request_data={"model": "test-model"},
+            )
+        ]
+
+
+@pytest.mark.asyncio
+async def test_async_data_generator_passes_accumulated_text_to_hooks():
+    """
+    Each hook call receives the text streamed so far plus the current chunk.
+    """
+    received = []
+
+    class RecordingLogger(CustomLogger):
+        async def async_post_call_streaming_hook(
+            self,
+            user_api_key_dict: UserAPIKeyAuth,
+            response: str,
+        ):
+            received.append(response)
+
+    with patch("litellm.callbacks", [RecordingLogger()]):
+        from litellm.caching.caching import DualCache
+        from litellm.proxy.utils import ProxyLogging
+
+        proxy_logging = ProxyLogging(user_api_key_cache=DualCache())
+        output = await _run_async_data_generator(
+            proxy_logging,
+            [_make_stream_chunk(c) for c in ["Hello", " wor", "ld"]],
+        )
+
+    assert received == ["Hello", "Hello wor", "Hello world"]
+    assert len(output) == 4
+
+
+@pytest.mark.asyncio
+async def test_async_data_generator_skips_hook_if_no_callback_needs_it():
+    """
+    Callbacks that don't implement the streaming hook, or opt out of it, don't
+    make the proxy call it per chunk.
+    """
+
+    class OptedOutLogger(CustomLogger):
+        def __init__(self):
+            self.called = False
+
+        async def async_post_call_streaming_hook(
+            self,
+            user_api_key_dict: UserAPIKeyAuth,
+            response: str,
+        ):
+            self.called = True
+
+        def should_run_post_call_streaming_hook(self) -> bool:
+            return False
+
+    opted_out_logger = OptedOutLogger()
+    with patch("litellm.callbacks", [CustomLogger(), opted_out_logger]):
+        from litellm.caching.caching import DualCache
+        from litellm.proxy.utils import ProxyLogging
+
+        proxy_logging = ProxyLogging(user_api_key_cache=DualCache())
+        assert proxy_logging.has_post_call_streaming_hooks() is False
+
+        with patch.object(
+            proxy_logging, "async_post_call_streaming_hook"
+        ) as mock_streaming_hook:
+            output = await _run_async_data_generator(
+                proxy_logging, [_make_stream_chunk("Hello")]
+            )
+
+    mock_streaming_hook.assert_not_called()
+    assert opted_out_logger.called is False
+    assert output[0].startswith("data: ")
+    assert output[-1] == "data: [DONE]\n\n"
@@ -178,6 +178,23 @@ class TestProxyInitializationHelpers:
         with patch("sys.platform", "linux"):
             assert ProxyInitializationHelpers._get_loop_type() == "uvloop"
 
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("atexit.register")
+    def test_init_shared_memory_cache_namespace(self, mock_register):
+        from litellm.caching.shared_memory_cache import remove_shared_memory_files
+
+        ProxyInitializationHelpers._init_shared_memory_cache_namespace()
+        namespace = str(os.getpid())
+        assert os.environ["LITELLM_SHARED_MEMORY_CACHE_NAMESPACE"] == namespace
+        mock_register.assert_called_once_with(remove_shared_memory_files, namespace)
+
+        # an explicit namespace is kept, and its tables are not removed
+        mock_register.reset_mock()
+        os.environ["LITELLM_SHARED_MEMORY_CACHE_NAMESPACE"] = "shared"
+        ProxyInitializationHelpers._init_shared_memory_cache_namespace()
+        assert os.environ["LITELLM_SHARED_MEMORY_CACHE_NAMESPACE"] == "shared"
+        mock_register.assert_not_called()
+
     @patch.dict(os.environ, {}, clear=True)
     def test_database_url_construction_with_special_characters(self):
         # Setup environment variables with special characters that need escaping
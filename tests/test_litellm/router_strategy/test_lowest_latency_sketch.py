@@ -0,0 +1,264 @@
+import os
+import sys
+import time
+from typing import Dict, List
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.caching import DualCache
+from litellm.router_strategy import latency_sketch
+from litellm.router_strategy.latency_sketch import (
+    EPOCH_HALF_LIVES,
+    get_latency_statistic,
+    get_sample_increments,
+    merge_epochs,
+)
+from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
+
+MODEL_GROUP = "gpt-4o"
+HEALTHY_DEPLOYMENTS = [
+    {
+        "model_name": MODEL_GROUP,
+        "litellm_params": {"model": "gpt-4o"},
+        "model_info": {"id": deployment_id},
+    }
+    for deployment_id in ("1", "2")
+]
+
+
+def _add_samples(
+    fields: Dict[str, float],
+    metric: str,
+    values: List[float],
+    now: float,
+    half_life: float = 60,
+):
+    for value in values:
+        increments = get_sample_increments(metric, value, now, half_life)
+        for field, increment in increments.items():
+            fields[field] = fields.get(field, 0.0) + increment
+
+
+def _success_kwargs(deployment_id: str, stream: bool = False) -> dict:
+    kwargs = {
+        "litellm_params": {
+            "metadata": {"model_group": MODEL_GROUP},
+            "model_info": {"id": deployment_id},
+        }
+    }
+    if stream:
+        kwargs["stream"] = True
+    return kwargs
+
+
+class _FakeRedisHashCache:
+    """In-memory stand-in for the RedisCache hash operations."""
+
+    def __init__(self):
+        self.hashes: Dict[str, Dict[str, float]] = {}
+
+    async def async_increment_hash_pipeline(
+        self, increment_list, parent_otel_span=None
+    ):
+        self.increment_hash_pipeline(increment_list)
+
+    def increment_hash_pipeline(self, increment_list):
+        for increment_op in increment_list:
+            fields = self.hashes.setdefault(increment_op["key"], {})
+            for field, value in increment_op["increments"].items():
+                fields[field] = fields.get(field, 0.0) + value
+
+    async def async_batch_get_hash(self, keys, parent_otel_span=None):
+        return [dict(self.hashes.get(key, {})) for key in keys]
+
+
+def test_latency_statistics():
+    fields: Dict[str, float] = {}
+    _add_samples(fields, "latency", [0.1] * 90 + [2.0] * 10, now=1000.0)
+
+    assert get_latency_statistic(fields, "latency", "ewma") == pytest.approx(0.29)
+    assert get_latency_statistic(fields, "latency", "p50") == pytest.approx(
+        0.1, rel=0.05
+    )
+    assert get_latency_statistic(fields, "latency", "p95") == pytest.approx(
+        2.0, rel=0.05
+    )
+    assert get_latency_statistic(fields, "ttft", "p50") is None
+
+
+def test_latency_sketch_decays_old_samples():
+    half_life = 60
+    epoch_start = EPOCH_HALF_LIVES * half_life * 100
+    fields: Dict[str, float] = {}
+    _add_samples(fields, "latency", [1.0] * 10, epoch_start, half_life)
+    _add_samples(fields, "latency", [0.1] * 10, epoch_start + 4 * half_life, half_life)
+
+    # samples 4 half-lives old have 1/16 of the weight
+    assert get_latency_statistic(fields, "latency", "ewma") == pytest.approx(
+        (1.0 + 0.1 * 16) / 17
+    )
+
+
+def test_latency_sketch_carries_previous_epoch():
+    half_life = 60
+    epoch_length = EPOCH_HALF_LIVES * half_life
+    previous: Dict[str, float] = {}
+    current: Dict[str, float] = {}
+    _add_samples(previous, "latency", [1.0], epoch_length * 101 - 1, half_life)
+    _add_samples(current, "latency", [0.2], epoch_length * 101 + 1, half_life)
+
+    # ~1s apart - both samples have about the same weight
+    merged = merge_epochs(current, previous)
+    assert get_latency_statistic(merged, "latency", "ewma") == pytest.approx(
+        0.6, rel=0.01
+    )
+
+
+@pytest.mark.asyncio
+async def test_sketch_routing_prefers_lower_tail_latency():
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(), routing_args={"latency_statistic": "p95"}
+    )
+    # same average latency, deployment 2 has a slow tail
+    for latency in [0.5] * 20:
+        await handler.async_log_success_event(_success_kwargs("1"), None, 0.0, latency)
+    for latency in [0.2] * 15 + [1.4] * 5:
+        await handler.async_log_success_event(_success_kwargs("2"), None, 0.0, latency)
+
+    deployment = await handler.async_get_available_deployments(
+        model_group=MODEL_GROUP, healthy_deployments=HEALTHY_DEPLOYMENTS
+    )
+    assert deployment["model_info"]["id"] == "1"
+
+    handler.routing_args.latency_statistic = "p50"
+    deployment = handler.get_available_deployments(
+        model_group=MODEL_GROUP, healthy_deployments=HEALTHY_DEPLOYMENTS
+    )
+    assert deployment["model_info"]["id"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_sketch_routing_uses_ttft_for_streaming():
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(), routing_args={"latency_statistic": "ewma"}
+    )
+    response = litellm.ModelResponse(
+        usage={"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+    )
+    # deployment 1: fast first token, slow overall. deployment 2: the opposite
+    kwargs_1 = _success_kwargs("1", stream=True)
+    kwargs_1["completion_start_time"] = 0.1
+    kwargs_2 = _success_kwargs("2", stream=True)
+    kwargs_2["completion_start_time"] = 0.9
+    await handler.async_log_success_event(kwargs_1, response, 0.0, 5.0)
+    await handler.async_log_success_event(kwargs_2, response, 0.0, 1.0)
+
+    stream_deployment = await handler.async_get_available_deployments(
+        model_group=MODEL_GROUP,
+        healthy_deployments=HEALTHY_DEPLOYMENTS,
+        request_kwargs={"stream": True},
+    )
+    deployment = await handler.async_get_available_deployments(
+        model_group=MODEL_GROUP, healthy_deployments=HEALTHY_DEPLOYMENTS
+    )
+    assert stream_deployment["model_info"]["id"] == "1"
+    assert deployment["model_info"]["id"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_sketch_routing_timeout_penalty_and_rpm_limit():
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(), routing_args={"latency_statistic": "ewma"}
+    )
+    await handler.async_log_success_event(_success_kwargs("1"), None, 0.0, 0.1)
+    await handler.async_log_success_event(_success_kwargs("2"), None, 0.0, 0.5)
+    failure_kwargs = _success_kwargs("1")
+    failure_kwargs["exception"] = litellm.Timeout(
+        message="timeout", model="gpt-4o", llm_provider="openai"
+    )
+    await handler.async_log_failure_event(failure_kwargs, None, 0.0, 600.0)
+
+    deployment = await handler.async_get_available_deployments(
+        model_group=MODEL_GROUP, healthy_deployments=HEALTHY_DEPLOYMENTS
+    )
+    assert deployment["model_info"]["id"] == "2"
+
+    deployments_with_rpm = [
+        {**HEALTHY_DEPLOYMENTS[0]},
+        {**HEALTHY_DEPLOYMENTS[1], "rpm": 1},  # already served 1 request this minute
+    ]
+    deployment = await handler.async_get_available_deployments(
+        model_group=MODEL_GROUP, healthy_deployments=deployments_with_rpm
+    )
+    assert deployment["model_info"]["id"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_sketch_routing_replicas_converge_through_redis():
+    redis_cache = _FakeRedisHashCache()
+    replicas = [
+        LowestLatencyLoggingHandler(
+            router_cache=DualCache(redis_cache=redis_cache),  # type: ignore
+            routing_args={
+                "latency_statistic": "ewma",
+                "latency_sketch_refresh_interval": 0,
+            },
+        )
+        for _ in range(2)
+    ]
+    # each replica only sees traffic of one deployment
+    await replicas[0].async_log_success_event(_success_kwargs("1"), None, 0.0, 2.0)
+    await replicas[1].async_log_success_event(_success_kwargs("2"), None, 0.0, 0.5)
+    await replicas[1].async_log_success_event(_success_kwargs("1"), None, 0.0, 4.0)
+
+    for replica in replicas:
+        # first read is a blocking refresh from redis
+        deployment = await replica.async_get_available_deployments(
+            model_group=MODEL_GROUP, healthy_deployments=HEALTHY_DEPLOYMENTS
+        )
+        assert deployment["model_info"]["id"] == "2"
+        fields = replica.latency_sketches.get(  # type: ignore
+            replica._get_latency_sketch_key(
+                MODEL_GROUP,
+                "1",
+                latency_sketch.get_epoch(
+                    time.time(), replica.routing_args.latency_half_life
+                ),
+            )
+        )
+        assert get_latency_statistic(fields, "latency", "ewma") == pytest.approx(
+            3.0, rel=0.01
+        )
+
+
+@pytest.mark.asyncio
+async def test_sketch_routing_sync_success_survives_refresh():
+    redis_cache = _FakeRedisHashCache()
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(redis_cache=redis_cache),  # type: ignore
+        routing_args={
+            "latency_statistic": "ewma",
+            "latency_sketch_refresh_interval": 0,
+        },
+    )
+    handler.log_success_event(_success_kwargs("1"), None, 0.0, 4.0)
+    handler.log_success_event(_success_kwargs("2"), None, 0.0, 0.5)
+
+    # the refresh replaces the local sketches with the redis totals
+    deployment = await handler.async_get_available_deployments(
+        model_group=MODEL_GROUP, healthy_deployments=HEALTHY_DEPLOYMENTS
+    )
+    assert deployment["model_info"]["id"] == "2"
+
+
+def test_average_mode_keeps_latency_map():
+    cache = DualCache()
+    handler = LowestLatencyLoggingHandler(router_cache=cache)
+    assert handler.latency_sketches is None
+    handler.log_success_event(_success_kwargs("1"), None, 0.0, 0.1)
+    assert cache.get_cache(key=f"{MODEL_GROUP}_map")["1"]["latency"] == [0.1]
@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.router_utils.healthy_deployments_snapshot import (
+    HealthyDeploymentsSnapshotCache,
+)
+from litellm.types.router import Deployment, LiteLLM_Params
+
+
+def _router(num_deployments: int = 3) -> litellm.Router:
+    return litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o", "api_key": f"sk-{i}"},
+                "model_info": {"id": f"deployment-{i}"},
+            }
+            for i in range(num_deployments)
+        ]
+    )
+
+
+async def _get_deployment_ids(router: litellm.Router) -> list:
+    deployments = await router.async_get_healthy_deployments(
+        model="gpt-4o", request_kwargs={}
+    )
+    return sorted(d["model_info"]["id"] for d in deployments)
+
+
+def test_snapshot_cache_versions_and_ttl():
+    cache = HealthyDeploymentsSnapshotCache(ttl=60)
+    deployments = [{"model_info": {"id": "1"}}]
+    cache.set("gpt-4o", deployments, model_list_version=0, cooldown_version=0)
+
+    snapshot = cache.get("gpt-4o", cooldown_version=0)
+    assert snapshot == deployments
+    assert snapshot is not deployments  # callers can't mutate the snapshot
+    assert cache.get("gpt-4o", cooldown_version=1) is None
+
+    cache.invalidate()
+    assert cache.get("gpt-4o", cooldown_version=0) is None
+
+    # computed before the model list changed
+    cache.set("gpt-4o", deployments, model_list_version=0, cooldown_version=0)
+    assert cache.get("gpt-4o", cooldown_version=0) is None
+
+    cache.set(
+        "gpt-4o",
+        deployments,
+        model_list_version=1,
+        cooldown_version=0,
+        cooldown_expires_at=time.time() - 1,
+    )
+    assert cache.get("gpt-4o", cooldown_version=0) is None
+
+    disabled_cache = HealthyDeploymentsSnapshotCache(ttl=0)
+    disabled_cache.set("gpt-4o", deployments, model_list_version=0, cooldown_version=0)
+    assert disabled_cache.get("gpt-4o", cooldown_version=0) is None
+
+
+@pytest.mark.asyncio
+async def test_healthy_deployments_served_from_snapshot():
+    router = _router()
+    with patch(
+        "litellm.router._async_get_cooldown_deployments_with_debug_info",
+        wraps=litellm.router._async_get_cooldown_deployments_with_debug_info,
+    ) as mock_get_cooldowns:
+        for _ in range(3):
+            assert await _get_deployment_ids(router) == [
+                "deployment-0",
+                "deployment-1",
+                "deployment-2",
+            ]
+    assert mock_get_cooldowns.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_healthy_deployments_snapshot_invalidated_by_cooldown():
+    router = _router()
+    assert len(await _get_deployment_ids(router)) == 3
+
+    router.cooldown_cache.add_deployment_to_cooldown(
+        model_id="deployment-1",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=0.2,
+    )
+    assert await _get_deployment_ids(router) == ["deployment-0", "deployment-2"]
+
+    # the snapshot expires with the cooldown
+    time.sleep(0.3)
+    assert len(await _get_deployment_ids(router)) == 3
+
+
+@pytest.mark.asyncio
+async def test_healthy_deployments_snapshot_invalidated_by_model_list_change():
+    router = _router()
+    assert len(await _get_deployment_ids(router)) == 3
+
+    router.delete_deployment(id="deployment-0")
+    assert await _get_deployment_ids(router) == ["deployment-1", "deployment-2"]
+
+    router.add_deployment(
+        deployment=Deployment(
+            model_name="gpt-4o",
+            litellm_params=LiteLLM_Params(model="openai/gpt-4o", api_key="sk-3"),
+            model_info={"id": "deployment-3"},
+        )
+    )
+    assert await _get_deployment_ids(router) == [
+        "deployment-1",
+        "deployment-2",
+        "deployment-3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_healthy_deployments_snapshot_keeps_request_filters():
+    router = _router()
+    router.model_list[0]["model_info"]["team_id"] = "team-1"
+    assert await _get_deployment_ids(router) == ["deployment-1", "deployment-2"]
+
+    deployments = await router.async_get_healthy_deployments(
+        model="gpt-4o",
+        request_kwargs={"metadata": {"user_api_key_team_id": "team-1"}},
+    )
+    assert len(deployments) == 3
@@ -0,0 +1,141 @@
+"""
+Unit tests for the compiled PatternMatchRouter index
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+from litellm.router_utils.pattern_match_deployments import (
+    PatternIndex,
+    PatternMatchRouter,
+    PatternUtils,
+)
+
+
+def _deployment(model: str) -> dict:
+    return {"model_name": model, "litellm_params": {"model": model}}
+
+
+@pytest.mark.parametrize(
+    "pattern, expected_prefix",
+    [
+        ("openai/*", "openai/"),
+        ("bedrock/anthropic.*", "bedrock/anthropic."),
+        ("*meta.llama3*", ""),
+        ("llmengine/fo::*::static::*", "llmengine/fo::"),
+        ("my-team/gpt-4o*", "my-team/gpt-4o"),
+    ],
+)
+def test_literal_prefix(pattern, expected_prefix):
+    regex = PatternMatchRouter()._pattern_to_regex(pattern)
+    assert PatternUtils.literal_prefix(regex) == expected_prefix
+
+
+def test_literal_prefix_non_escaped_regex():
+    """Hand-written regexes have no safe literal prefix"""
+    assert PatternUtils.literal_prefix(r"\d+/(.*)") == ""
+
+
+def test_route_prefers_most_specific_pattern():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*"))
+    router.add_pattern("openai/gpt-4*", _deployment("openai/gpt-4-pinned"))
+    router.add_pattern("*", _deployment("catch-all/*"))
+
+    assert router.route("openai/gpt-4o")[0]["litellm_params"]["model"] == (
+        "openai/gpt-4-pinned"
+    )
+    assert router.route("openai/o1")[0]["litellm_params"]["model"] == "openai/o1"
+    assert router.route("anthropic/claude")[0]["litellm_params"]["model"] == (
+        "catch-all/anthropic/claude"
+    )
+
+
+def test_route_matches_uncompiled_behavior():
+    """The index returns the same pattern as a linear scan over sorted patterns"""
+    import re
+
+    router = PatternMatchRouter()
+    patterns = [
+        "openai/*",
+        "openai/gpt-*",
+        "bedrock/anthropic.*",
+        "bedrock/*",
+        "*meta.llama3*",
+        "llmengine/fo::*::static::*",
+        "team-a/*",
+    ]
+    for p in patterns:
+        router.add_pattern(p, _deployment(p))
+
+    requests = [
+        "openai/gpt-4",
+        "openai/o3",
+        "bedrock/anthropic.claude-3",
+        "bedrock/amazon.titan",
+        "hello-meta.llama3-70b",
+        "llmengine/foo::bar::static::baz",
+        "team-a/x",
+        "unknown/model",
+    ]
+    for request in requests:
+        expected = None
+        for pattern, deployments in PatternUtils.sorted_patterns(router.patterns):
+            if re.match(pattern, request):
+                expected = deployments
+                break
+        index_result = router._get_index().match(request)
+        assert (index_result[1] if index_result else None) == expected
+
+
+def test_route_filtered_model_names():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*"))
+    router.add_pattern("openai/gpt-*", _deployment("openai/gpt-*"))
+
+    result = router.route("openai/gpt-4", filtered_model_names=["openai/*"])
+    assert result is not None
+    assert result[0]["model_name"] == "openai/*"
+    assert router.route("openai/gpt-4", filtered_model_names=["azure/*"]) is None
+
+
+def test_index_rebuilt_only_on_new_pattern():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*"))
+    index = router._get_index()
+    assert router._get_index() is index
+
+    # new deployment for an existing pattern shares the deployment list
+    router.add_pattern("openai/*", _deployment("openai/*"))
+    assert router._get_index() is index
+    assert len(router.route("openai/gpt-4")) == 2
+
+    router.add_pattern("anthropic/*", _deployment("anthropic/*"))
+    assert router._get_index() is not index
+    assert router.route("anthropic/claude") is not None
+
+
+def test_index_rebuilt_when_patterns_replaced():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*"))
+    assert router.route("openai/gpt-4") is not None
+
+    router.patterns = {}
+    assert router.route("openai/gpt-4") is None
+
+
+def test_candidate_ranks_only_prefix_matches():
+    index = PatternIndex(
+        {
+            PatternMatchRouter()._pattern_to_regex(f"provider-{i}/*"): [
+                _deployment(f"provider-{i}/*")
+            ]
+            for i in range(100)
+        }
+    )
+    assert len(index.candidate_ranks("provider-42/model")) == 1
+    assert index.candidate_ranks("other/model") == []
@@ -0,0 +1,196 @@
+"""
+Unit tests for the scheduler queue backends (litellm/scheduler.py)
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.caching.redis_cache import RedisCache
+from litellm.scheduler import (
+    FlowItem,
+    InMemorySchedulerQueue,
+    RedisSchedulerQueue,
+    Scheduler,
+)
+
+
+def _redis_scheduler() -> Scheduler:
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    fake_redis_client = fakeredis.FakeAsyncRedis()
+    with patch("litellm._redis.get_redis_client", return_value=fakeredis.FakeRedis()):
+        redis_cache = RedisCache(host="localhost", port=6379)
+    redis_cache.init_async_client = lambda: fake_redis_client  # type: ignore
+    return Scheduler(redis_cache=redis_cache, backend="redis")
+
+
+def _scheduler(backend: str) -> Scheduler:
+    if backend == "redis":
+        return _redis_scheduler()
+    return Scheduler(backend=backend)  # type: ignore
+
+
+@pytest.mark.parametrize("backend", ["in_memory", "redis"])
+@pytest.mark.asyncio
+async def test_scheduler_backend_priority_order(backend):
+    scheduler = _scheduler(backend)
+    model_name = "gpt-4o"
+    for request_id, priority in [("c", 2), ("a", 0), ("b", 1)]:
+        await scheduler.add_request(
+            FlowItem(priority=priority, request_id=request_id, model_name=model_name)
+        )
+
+    assert [item[1] for item in await scheduler.get_queue(model_name)] == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert await scheduler.peek(id="a", model_name=model_name, health_deployments=[])
+
+    # not at the head - no healthy deployments -> must wait
+    assert not await scheduler.poll(id="b", model_name=model_name, health_deployments=[])
+    assert await scheduler.poll(id="a", model_name=model_name, health_deployments=[])
+    assert await scheduler.poll(id="b", model_name=model_name, health_deployments=[])
+
+    # healthy deployments -> request proceeds and leaves the queue
+    assert await scheduler.poll(
+        id="c", model_name=model_name, health_deployments=[{"key": "value"}]
+    )
+    assert await scheduler.get_queue(model_name) == []
+
+
+@pytest.mark.parametrize("backend", ["in_memory", "redis"])
+@pytest.mark.asyncio
+async def test_scheduler_backend_remove_request(backend):
+    scheduler = _scheduler(backend)
+    model_name = "gpt-4o"
+    for i in range(3):
+        await scheduler.add_request(
+            FlowItem(priority=i, request_id=f"req-{i}", model_name=model_name)
+        )
+
+    await scheduler.remove_request(request_id="req-0", model_name=model_name)
+    assert [item[1] for item in await scheduler.get_queue(model_name)] == [
+        "req-1",
+        "req-2",
+    ]
+    assert await scheduler.poll(id="req-1", model_name=model_name, health_deployments=[])
+
+
+@pytest.mark.asyncio
+async def test_in_memory_queue_wakes_up_waiters():
+    """Waiters return as soon as the head is popped, not after the timeout"""
+    queue = InMemorySchedulerQueue()
+    await queue.add_request(FlowItem(priority=0, request_id="a", model_name="m"))
+    await queue.add_request(FlowItem(priority=1, request_id="b", model_name="m"))
+
+    async def pop_later():
+        await asyncio.sleep(0.01)
+        await queue.pop_if_head(request_id="a", model_name="m")
+
+    start = time.monotonic()
+    asyncio.create_task(pop_later())
+    await queue.wait_for_update(model_name="m", timeout=5)
+    assert time.monotonic() - start < 1
+    assert await queue.is_head(request_id="b", model_name="m")
+
+
+@pytest.mark.asyncio
+async def test_in_memory_queue_compacts_removed_entries():
+    queue = InMemorySchedulerQueue()
+    await queue.add_request(FlowItem(priority=0, request_id="head", model_name="m"))
+    for i in range(1000):
+        await queue.add_request(
+            FlowItem(priority=1, request_id=f"req-{i}", model_name="m")
+        )
+        await queue.remove_request(request_id=f"req-{i}", model_name="m")
+
+    assert len(queue.heaps["m"]) < 200
+    assert await queue.get_queue("m") == [(0, "head")]
+
+
+def test_redis_backend_requires_redis():
+    with pytest.raises(ValueError):
+        Scheduler(backend="redis")
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_uses_sorted_set():
+    scheduler = _redis_scheduler()
+    assert isinstance(scheduler.queue_backend, RedisSchedulerQueue)
+    await scheduler.add_request(FlowItem(priority=3, request_id="x", model_name="m"))
+    client = scheduler.queue_backend.redis_cache.init_async_client()
+    assert await client.zscore(scheduler.queue_backend._queue_key("m"), "x") == 3
+
+
+@pytest.mark.asyncio
+async def test_router_schedule_acompletion_in_memory_backend():
+    from litellm import Router
+
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-3.5-turbo",
+                "litellm_params": {
+                    "model": "gpt-3.5-turbo",
+                    "mock_response": "Hello world!",
+                },
+            }
+        ],
+        scheduler_backend="in_memory",
+        timeout=10,
+    )
+
+    responses = await asyncio.gather(
+        *[
+            router.schedule_acompletion(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "hi"}],
+                priority=i % 3,
+            )
+            for i in range(10)
+        ]
+    )
+    assert all(r.choices[0].message.content == "Hello world!" for r in responses)
+    assert await router.scheduler.get_queue(model_name="gpt-3.5-turbo") == []
+
+
+def test_base_scheduler_queue_is_abstract():
+    from litellm.scheduler import BaseSchedulerQueue
+
+    with pytest.raises(TypeError):
+        BaseSchedulerQueue()  # type: ignore
+
+
+def test_redis_queue_key_and_channel_share_hash_slot():
+    """The Lua scripts touch both, which must be in one Redis Cluster slot"""
+    from redis.crc import key_slot
+
+    queue = _redis_scheduler().queue_backend
+    assert isinstance(queue, RedisSchedulerQueue)
+    for model_name in ["gpt-4o", "azure/gpt-4o-mini"]:
+        assert key_slot(queue._queue_key(model_name).encode()) == key_slot(
+            queue._channel(model_name).encode()
+        )
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_wakes_up_on_finished_request():
+    """Waiters wake up when a scheduled request finishes, without polling"""
+    scheduler = Scheduler(backend="in_memory")
+
+    async def finish_later():
+        await asyncio.sleep(0.01)
+        await scheduler.notify_request_finished(model_name="m")
+
+    start = time.monotonic()
+    asyncio.create_task(finish_later())
+    await scheduler.wait_for_queue_update(model_name="m")
+    assert time.monotonic() - start < 0.5
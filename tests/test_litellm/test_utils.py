@@ -3003,6 +3003,57 @@ def test_azure_ai_claude_provider_config():
     assert isinstance(config, AzureAIStudioConfig)
 
 
+def test_provider_chat_config_registry():
+    """Test that chat configs are memoized per (provider, model) and shared per config class."""
+    from litellm.llms.gigachat.chat.transformation import GigaChatConfig
+    from litellm.llms.openai.chat.gpt_5_transformation import OpenAIGPT5Config
+    from litellm.utils import ProviderConfigManager
+
+    ProviderConfigManager.clear_provider_chat_config_cache()
+
+    config = ProviderConfigManager.get_provider_chat_config(
+        model="gpt-5", provider=LlmProviders.OPENAI
+    )
+    assert isinstance(config, OpenAIGPT5Config)
+    assert (
+        ProviderConfigManager.get_provider_chat_config(
+            model="gpt-5", provider=LlmProviders.OPENAI
+        )
+        is config
+    )
+    # models of the same family share one instance
+    assert (
+        ProviderConfigManager.get_provider_chat_config(
+            model="gpt-5-mini", provider=LlmProviders.OPENAI
+        )
+        is config
+    )
+    assert (
+        ProviderConfigManager.get_provider_chat_config(
+            model="o3-mini", provider=LlmProviders.OPENAI
+        )
+        is litellm.openaiOSeriesConfig
+    )
+    assert (
+        ProviderConfigManager.get_provider_chat_config(
+            model="gpt-4o", provider=LlmProviders.OPENAI
+        )
+        is not config
+    )
+
+    # stateful configs are never shared
+    gigachat_config = ProviderConfigManager.get_provider_chat_config(
+        model="GigaChat-2-Max", provider=LlmProviders.GIGACHAT
+    )
+    assert isinstance(gigachat_config, GigaChatConfig)
+    assert (
+        ProviderConfigManager.get_provider_chat_config(
+            model="GigaChat-2-Max", provider=LlmProviders.GIGACHAT
+        )
+        is not gigachat_config
+    )
+
+
 # Tests for thinking blocks helper functions
 # Related to issue: https://github.com/BerriAI/litellm/issues/18926
 